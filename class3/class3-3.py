@@ -5,8 +5,7 @@ import os
 # === Initialization ===
 pygame.init()
 WINDOW_WIDTH, WINDOW_HEIGHT = 900, 600
-screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
-pygame.display.set_caption("White Background Window")
+screen = None  # Created by main() so importing the module opens no window
 clock = pygame.time.Clock()
 
 # === Constants ===
@@ -229,7 +228,7 @@ def draw_button(surface, text, x, y, width, height):
     return button_rect
 
 def show_start_and_difficulty_menu():
-    """Show the start menu and difficulty selection. Returns (two_player_mode, difficulty)."""
+    """Show the start menu and difficulty selection. Returns (two_player_mode, difficulty), or None if the window was closed."""
     while True:
         screen.fill((255, 255, 255))
         start_button_rect = draw_button(
@@ -241,8 +240,7 @@ def show_start_and_difficulty_menu():
         pygame.display.flip()
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                pygame.quit()
-                exit()
+                return None
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 mouse_pos = pygame.mouse.get_pos()
                 if start_button_rect.collidepoint(mouse_pos):
@@ -269,8 +267,7 @@ def show_start_and_difficulty_menu():
                         pygame.display.flip()
                         for event2 in pygame.event.get():
                             if event2.type == pygame.QUIT:
-                                pygame.quit()
-                                exit()
+                                return None
                             if event2.type == pygame.MOUSEBUTTONDOWN and event2.button == 1:
                                 mouse_pos2 = pygame.mouse.get_pos()
                                 if easy_rect.collidepoint(mouse_pos2):
@@ -347,7 +344,7 @@ def break_into_pieces(x, y, size, color):
         pygame.draw.rect(screen, color, (piece_x, piece_y, piece_size, piece_size))
 
 def show_game_over(winner_title):
-    """Display the game over screen and handle restart."""
+    """Display the game over screen. Returns True to restart, False to quit."""
     font_over = pygame.font.SysFont(None, 48)
     font_btn = pygame.font.SysFont(None, 32)
     while True:
@@ -368,8 +365,7 @@ def show_game_over(winner_title):
         pygame.display.flip()
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                pygame.quit()
-                exit()
+                return False
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 mouse_pos = pygame.mouse.get_pos()
                 if restart_rect.collidepoint(mouse_pos):
@@ -400,7 +396,9 @@ def generate_random_platforms():
         ):
             platforms.append(new_platform)
         attempts += 1
-    while len(platforms) < PLATFORM_COUNT:
+    # The bottom row can be full too, so this fallback is bounded as well
+    attempts = 0
+    while len(platforms) < PLATFORM_COUNT and attempts < max_attempts:
         width = random.randint(PLATFORM_MIN_WIDTH, PLATFORM_MAX_WIDTH)
         x = random.randint(0, WINDOW_WIDTH - width)
         y = WINDOW_HEIGHT - PLATFORM_HEIGHT - 10
@@ -411,442 +409,478 @@ def generate_random_platforms():
             for existing in platforms
         ):
             platforms.append(new_platform)
+        attempts += 1
     return platforms
 
 # === Main Game Loop ===
-while True:
-    running = True
-    game_over = False
-    winner_title = ""
-    player_exploded = False
-    enemy_exploded = False
-    player2_exploded = False
-
-    reset_game()
-    set_player_positions()
 
-    while running:
-        clock.tick(60)
-        # --- Reload logic ---
-        if player_reloading:
-            player_reload_timer += 1
-            if player_reload_timer >= RELOAD_FRAMES:
-                if player_weapon == WEAPON_SHOTGUN:
-                    player_magazine = SHOTGUN_MAGAZINE_SIZE
-                else:
-                    player_magazine = MAGAZINE_SIZE
-                player_reloading = False
-                player_reload_timer = 0
-
-        if two_player_mode and player2_reloading:
-            player2_reload_timer += 1
-            if player2_reload_timer >= RELOAD_FRAMES:
-                if player2_weapon == WEAPON_SHOTGUN:
-                    player2_magazine = SHOTGUN_MAGAZINE_SIZE
-                else:
-                    player2_magazine = MAGAZINE_SIZE
-                player2_reloading = False
-                player2_reload_timer = 0
-
-        # --- Cooldown logic ---
-        if player_rifle_cooldown > 0:
-            player_rifle_cooldown -= 1
-        if player_shotgun_cooldown > 0:
-            player_shotgun_cooldown -= 1
-        if two_player_mode:
-            if player2_rifle_cooldown > 0:
-                player2_rifle_cooldown -= 1
-            if player2_shotgun_cooldown > 0:
-                player2_shotgun_cooldown -= 1
+def main():
+    """Run the game until the window is closed or Quit is chosen, then return.
 
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_r:
-                break
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_1:
-                    player_weapon = WEAPON_RIFLE
-                    player_magazine = MAGAZINE_SIZE
-                if event.key == pygame.K_2:
-                    player_weapon = WEAPON_SHOTGUN
-                    player_magazine = SHOTGUN_MAGAZINE_SIZE
-                if two_player_mode:
-                    if event.key == pygame.K_KP1:
-                        player2_weapon = WEAPON_RIFLE
-                        player2_magazine = MAGAZINE_SIZE
-                    if event.key == pygame.K_KP2:
-                        player2_weapon = WEAPON_SHOTGUN
+    Returns instead of quitting pygame, so a launcher can run the game
+    in-process and keep the window.
+    """
+    global screen
+    global player_x, player_y, player_velocity_y, is_jumping, player_health, player_facing_right
+    global player_bullets, player_exploded, player_weapon, player_magazine, player_reloading, player_reload_timer
+    global player_rifle_cooldown, player_shotgun_cooldown
+    global player_knockback_timer, player_knockback_dx, player_knockback_dy
+    global enemy_x, enemy_y, enemy_velocity_y, enemy_health, enemy_exploded
+    global enemy_jump_timer, enemy_jump_interval
+    global enemy_knockback_timer, enemy_knockback_dx, enemy_knockback_dy
+    global player2_x, player2_y, player2_velocity_y, player2_is_jumping, player2_health, player2_facing_right
+    global player2_bullets, player2_exploded, player2_weapon, player2_magazine, player2_reloading, player2_reload_timer
+    global player2_rifle_cooldown, player2_shotgun_cooldown
+    global player2_knockback_timer, player2_knockback_dx, player2_knockback_dy
+    global bullets, bullet_timer
+    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    pygame.display.set_caption("White Background Window")
+
+    while True:
+        running = True
+        game_over = False
+        winner_title = ""
+        player_exploded = False
+        enemy_exploded = False
+        player2_exploded = False
+
+        reset_game()
+        set_player_positions()
+
+        while running:
+            clock.tick(60)
+            # --- Reload logic ---
+            if player_reloading:
+                player_reload_timer += 1
+                if player_reload_timer >= RELOAD_FRAMES:
+                    if player_weapon == WEAPON_SHOTGUN:
+                        player_magazine = SHOTGUN_MAGAZINE_SIZE
+                    else:
+                        player_magazine = MAGAZINE_SIZE
+                    player_reloading = False
+                    player_reload_timer = 0
+
+            if two_player_mode and player2_reloading:
+                player2_reload_timer += 1
+                if player2_reload_timer >= RELOAD_FRAMES:
+                    if player2_weapon == WEAPON_SHOTGUN:
                         player2_magazine = SHOTGUN_MAGAZINE_SIZE
-            # Player 1 controls
-            if player_health > 0 and (not two_player_mode or player2_health > 0):
+                    else:
+                        player2_magazine = MAGAZINE_SIZE
+                    player2_reloading = False
+                    player2_reload_timer = 0
+
+            # --- Cooldown logic ---
+            if player_rifle_cooldown > 0:
+                player_rifle_cooldown -= 1
+            if player_shotgun_cooldown > 0:
+                player_shotgun_cooldown -= 1
+            if two_player_mode:
+                if player2_rifle_cooldown > 0:
+                    player2_rifle_cooldown -= 1
+                if player2_shotgun_cooldown > 0:
+                    player2_shotgun_cooldown -= 1
+
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    running = False
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_r:
+                    break
                 if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_SPACE and not is_jumping:
-                        player_velocity_y = -JUMP_STRENGTH
-                        is_jumping = True
-                    # Player 1 shoot with 'E' in 2 player mode
-                    if two_player_mode and event.key == pygame.K_e:
-                        if player_weapon == WEAPON_RIFLE:
-                            if (
-                                not player_reloading
-                                and player_magazine > 0
-                                and player_rifle_cooldown == 0
-                            ):
-                                direction = 1 if player_facing_right else -1
-                                player_bullets.append(
-                                    {
-                                        "x": player_x + PLAYER_SIZE // 2,
-                                        "y": player_y + PLAYER_SIZE // 2,
-                                        "dx": direction * PLAYER_BULLET_SPEED,
-                                    }
-                                )
-                                player_magazine -= 1
-                                player_rifle_cooldown = RIFLE_COOLDOWN_FRAMES
-                                if player_magazine == 0:
-                                    player_reloading = True
-                                    player_reload_timer = 0
-                        elif player_weapon == WEAPON_SHOTGUN:
-                            if (
-                                not player_reloading
-                                and player_magazine > 0
-                                and player_shotgun_cooldown == 0
-                            ):
-                                direction = 1 if player_facing_right else -1
-                                # Shotgun fires 10 bullets in a wide spread
-                                for spread in range(-9, 10, 2):
+                    if event.key == pygame.K_1:
+                        player_weapon = WEAPON_RIFLE
+                        player_magazine = MAGAZINE_SIZE
+                    if event.key == pygame.K_2:
+                        player_weapon = WEAPON_SHOTGUN
+                        player_magazine = SHOTGUN_MAGAZINE_SIZE
+                    if two_player_mode:
+                        if event.key == pygame.K_KP1:
+                            player2_weapon = WEAPON_RIFLE
+                            player2_magazine = MAGAZINE_SIZE
+                        if event.key == pygame.K_KP2:
+                            player2_weapon = WEAPON_SHOTGUN
+                            player2_magazine = SHOTGUN_MAGAZINE_SIZE
+                # Player 1 controls
+                if player_health > 0 and (not two_player_mode or player2_health > 0):
+                    if event.type == pygame.KEYDOWN:
+                        if event.key == pygame.K_SPACE and not is_jumping:
+                            player_velocity_y = -JUMP_STRENGTH
+                            is_jumping = True
+                        # Player 1 shoot with 'E' in 2 player mode
+                        if two_player_mode and event.key == pygame.K_e:
+                            if player_weapon == WEAPON_RIFLE:
+                                if (
+                                    not player_reloading
+                                    and player_magazine > 0
+                                    and player_rifle_cooldown == 0
+                                ):
+                                    direction = 1 if player_facing_right else -1
                                     player_bullets.append(
                                         {
                                             "x": player_x + PLAYER_SIZE // 2,
-                                            "y": player_y + PLAYER_SIZE // 2 + spread,
+                                            "y": player_y + PLAYER_SIZE // 2,
                                             "dx": direction * PLAYER_BULLET_SPEED,
-                                            "shotgun": True,
                                         }
                                     )
-                                player_magazine -= 1
-                                player_shotgun_cooldown = SHOTGUN_COOLDOWN_FRAMES
-                                if player_magazine == 0:
-                                    player_reloading = True
-                                    player_reload_timer = 0
-                    # Player 2 shoot with Numpad 0 in 2 player mode
-                    if two_player_mode and event.key == pygame.K_KP0:
-                        if player2_weapon == WEAPON_RIFLE:
-                            if (
-                                not player2_reloading
-                                and player2_magazine > 0
-                                and player2_rifle_cooldown == 0
-                            ):
-                                direction2 = 1 if player2_facing_right else -1
-                                player2_bullets.append(
-                                    {
-                                        "x": player2_x + PLAYER2_SIZE // 2,
-                                        "y": player2_y + PLAYER2_SIZE // 2,
-                                        "dx": direction2 * PLAYER2_BULLET_SPEED,
-                                    }
-                                )
-                                player2_magazine -= 1
-                                player2_rifle_cooldown = RIFLE_COOLDOWN_FRAMES
-                                if player2_magazine == 0:
-                                    player2_reloading = True
-                                    player2_reload_timer = 0
-                        elif player2_weapon == WEAPON_SHOTGUN:
-                            if (
-                                not player2_reloading
-                                and player2_magazine > 0
-                                and player2_shotgun_cooldown == 0
-                            ):
-                                direction2 = 1 if player2_facing_right else -1
-                                for spread in range(-9, 10, 2):
+                                    player_magazine -= 1
+                                    player_rifle_cooldown = RIFLE_COOLDOWN_FRAMES
+                                    if player_magazine == 0:
+                                        player_reloading = True
+                                        player_reload_timer = 0
+                            elif player_weapon == WEAPON_SHOTGUN:
+                                if (
+                                    not player_reloading
+                                    and player_magazine > 0
+                                    and player_shotgun_cooldown == 0
+                                ):
+                                    direction = 1 if player_facing_right else -1
+                                    # Shotgun fires 10 bullets in a wide spread
+                                    for spread in range(-9, 10, 2):
+                                        player_bullets.append(
+                                            {
+                                                "x": player_x + PLAYER_SIZE // 2,
+                                                "y": player_y + PLAYER_SIZE // 2 + spread,
+                                                "dx": direction * PLAYER_BULLET_SPEED,
+                                                "shotgun": True,
+                                            }
+                                        )
+                                    player_magazine -= 1
+                                    player_shotgun_cooldown = SHOTGUN_COOLDOWN_FRAMES
+                                    if player_magazine == 0:
+                                        player_reloading = True
+                                        player_reload_timer = 0
+                        # Player 2 shoot with Numpad 0 in 2 player mode
+                        if two_player_mode and event.key == pygame.K_KP0:
+                            if player2_weapon == WEAPON_RIFLE:
+                                if (
+                                    not player2_reloading
+                                    and player2_magazine > 0
+                                    and player2_rifle_cooldown == 0
+                                ):
+                                    direction2 = 1 if player2_facing_right else -1
                                     player2_bullets.append(
                                         {
                                             "x": player2_x + PLAYER2_SIZE // 2,
-                                            "y": player2_y + PLAYER2_SIZE // 2 + spread,
+                                            "y": player2_y + PLAYER2_SIZE // 2,
                                             "dx": direction2 * PLAYER2_BULLET_SPEED,
-                                            "shotgun": True,
                                         }
                                     )
-                                player2_magazine -= 1
-                                player2_shotgun_cooldown = SHOTGUN_COOLDOWN_FRAMES
-                                if player2_magazine == 0:
-                                    player2_reloading = True
-                                    player2_reload_timer = 0
-                # Player 1 shoot with mouse in single player mode only
-                if not two_player_mode and event.type == pygame.MOUSEBUTTONDOWN:
-                    if event.button == 1:
-                        if player_weapon == WEAPON_RIFLE:
-                            if (
-                                not player_reloading
-                                and player_magazine > 0
-                                and player_rifle_cooldown == 0
-                            ):
-                                mouse_x, mouse_y = pygame.mouse.get_pos()
-                                direction = 1 if mouse_x > player_x else -1
-                                player_bullets.append(
-                                    {
-                                        "x": player_x + PLAYER_SIZE // 2,
-                                        "y": player_y + PLAYER_SIZE // 2,
-                                        "dx": direction * PLAYER_BULLET_SPEED,
-                                    }
-                                )
-                                player_magazine -= 1
-                                player_rifle_cooldown = RIFLE_COOLDOWN_FRAMES
-                                if player_magazine == 0:
-                                    player_reloading = True
-                                    player_reload_timer = 0
-                        elif player_weapon == WEAPON_SHOTGUN:
-                            if (
-                                not player_reloading
-                                and player_magazine > 0
-                                and player_shotgun_cooldown == 0
-                            ):
-                                mouse_x, mouse_y = pygame.mouse.get_pos()
-                                direction = 1 if mouse_x > player_x else -1
-                                for spread in range(-9, 10, 2):
+                                    player2_magazine -= 1
+                                    player2_rifle_cooldown = RIFLE_COOLDOWN_FRAMES
+                                    if player2_magazine == 0:
+                                        player2_reloading = True
+                                        player2_reload_timer = 0
+                            elif player2_weapon == WEAPON_SHOTGUN:
+                                if (
+                                    not player2_reloading
+                                    and player2_magazine > 0
+                                    and player2_shotgun_cooldown == 0
+                                ):
+                                    direction2 = 1 if player2_facing_right else -1
+                                    for spread in range(-9, 10, 2):
+                                        player2_bullets.append(
+                                            {
+                                                "x": player2_x + PLAYER2_SIZE // 2,
+                                                "y": player2_y + PLAYER2_SIZE // 2 + spread,
+                                                "dx": direction2 * PLAYER2_BULLET_SPEED,
+                                                "shotgun": True,
+                                            }
+                                        )
+                                    player2_magazine -= 1
+                                    player2_shotgun_cooldown = SHOTGUN_COOLDOWN_FRAMES
+                                    if player2_magazine == 0:
+                                        player2_reloading = True
+                                        player2_reload_timer = 0
+                    # Player 1 shoot with mouse in single player mode only
+                    if not two_player_mode and event.type == pygame.MOUSEBUTTONDOWN:
+                        if event.button == 1:
+                            if player_weapon == WEAPON_RIFLE:
+                                if (
+                                    not player_reloading
+                                    and player_magazine > 0
+                                    and player_rifle_cooldown == 0
+                                ):
+                                    mouse_x, mouse_y = pygame.mouse.get_pos()
+                                    direction = 1 if mouse_x > player_x else -1
                                     player_bullets.append(
                                         {
                                             "x": player_x + PLAYER_SIZE // 2,
-                                            "y": player_y + PLAYER_SIZE // 2 + spread,
+                                            "y": player_y + PLAYER_SIZE // 2,
                                             "dx": direction * PLAYER_BULLET_SPEED,
-                                            "shotgun": True,
                                         }
                                     )
-                                player_magazine -= 1
-                                player_shotgun_cooldown = SHOTGUN_COOLDOWN_FRAMES
-                                if player_magazine == 0:
-                                    player_reloading = True
-                                    player_reload_timer = 0
-
-        # Store previous positions for collision revert
-        prev_player_x = player_x
-        prev_player_y = player_y
-        prev_enemy_x = enemy_x
-        prev_enemy_y = enemy_y
-        prev_player2_x = player2_x
-        prev_player2_y = player2_y
-
-        # --- Knockback and shake logic ---
-        # Player knockback
-        if player_knockback_timer > 0:
-            # Apply horizontal and vertical knockback
-            player_x += player_knockback_dx
-            player_y += player_knockback_dy
-            # Apply gravity to vertical knockback
-            player_knockback_dy += GRAVITY
-            # Shake effect
-            player_x += random.randint(-2, 2)
-            player_y += random.randint(-2, 2)
-            # Constrain within window
-            player_x = max(0, min(player_x, WINDOW_WIDTH - PLAYER_SIZE))
-            player_y = max(0, min(player_y, WINDOW_HEIGHT - PLAYER_SIZE))
-            player_knockback_timer -= 1
-
-        # Enemy knockback
-        if enemy_knockback_timer > 0:
-            enemy_x += enemy_knockback_dx
-            enemy_y += enemy_knockback_dy
-            enemy_knockback_dy += GRAVITY
-            enemy_x += random.randint(-2, 2)
-            enemy_y += random.randint(-2, 2)
-            enemy_x = max(0, min(enemy_x, WINDOW_WIDTH - ENEMY_SIZE))
-            enemy_y = max(0, min(enemy_y, WINDOW_HEIGHT - ENEMY_SIZE))
-            enemy_knockback_timer -= 1
-
-        # Player 2 knockback
-        if player2_knockback_timer > 0:
-            player2_x += player2_knockback_dx
-            player2_y += player2_knockback_dy
-            player2_knockback_dy += GRAVITY
-            player2_x += random.randint(-2, 2)
-            player2_y += random.randint(-2, 2)
-            player2_x = max(0, min(player2_x, WINDOW_WIDTH - PLAYER2_SIZE))
-            player2_y = max(0, min(player2_y, WINDOW_HEIGHT - PLAYER2_SIZE))
-            player2_knockback_timer -= 1
-
-        # --- Movement only if not in knockback ---
-        if player_knockback_timer == 0:
-            # Player 1 movement
-            keys = pygame.key.get_pressed()
-            if keys[pygame.K_w]:
-                player_y -= PLAYER_SPEED
-            if keys[pygame.K_s]:
-                player_y += PLAYER_SPEED
-            if keys[pygame.K_a]:
-                player_x -= PLAYER_SPEED
-                player_facing_right = False
-            if keys[pygame.K_d]:
-                player_x += PLAYER_SPEED
-                player_facing_right = True
-
-        if two_player_mode and player2_knockback_timer == 0:
-            # 2 Player controls and physics
-            # Arrow keys for movement
-            if keys[pygame.K_UP] and not player2_is_jumping:
-                player2_velocity_y = -JUMP_STRENGTH
-                player2_is_jumping = True
-            if keys[pygame.K_LEFT]:
-                player2_x -= PLAYER2_SPEED
-                player2_facing_right = False
-            if keys[pygame.K_RIGHT]:
-                player2_x += PLAYER2_SPEED
-                player2_facing_right = True
-            if keys[pygame.K_DOWN]:
-                player2_y += PLAYER2_SPEED
-
-            # Gravity and platform collision for player 2
-            player2_y, player2_velocity_y, player2_landed = apply_gravity_and_platforms(
-                player2_x, player2_y, PLAYER2_SIZE, player2_velocity_y
-            )
-            if player2_landed:
-                player2_is_jumping = False
-            else:
-                player2_velocity_y += GRAVITY
+                                    player_magazine -= 1
+                                    player_rifle_cooldown = RIFLE_COOLDOWN_FRAMES
+                                    if player_magazine == 0:
+                                        player_reloading = True
+                                        player_reload_timer = 0
+                            elif player_weapon == WEAPON_SHOTGUN:
+                                if (
+                                    not player_reloading
+                                    and player_magazine > 0
+                                    and player_shotgun_cooldown == 0
+                                ):
+                                    mouse_x, mouse_y = pygame.mouse.get_pos()
+                                    direction = 1 if mouse_x > player_x else -1
+                                    for spread in range(-9, 10, 2):
+                                        player_bullets.append(
+                                            {
+                                                "x": player_x + PLAYER_SIZE // 2,
+                                                "y": player_y + PLAYER_SIZE // 2 + spread,
+                                                "dx": direction * PLAYER_BULLET_SPEED,
+                                                "shotgun": True,
+                                            }
+                                        )
+                                    player_magazine -= 1
+                                    player_shotgun_cooldown = SHOTGUN_COOLDOWN_FRAMES
+                                    if player_magazine == 0:
+                                        player_reloading = True
+                                        player_reload_timer = 0
+
+            # Store previous positions for collision revert
+            prev_player_x = player_x
+            prev_player_y = player_y
+            prev_enemy_x = enemy_x
+            prev_enemy_y = enemy_y
+            prev_player2_x = player2_x
+            prev_player2_y = player2_y
+
+            # --- Knockback and shake logic ---
+            # Player knockback
+            if player_knockback_timer > 0:
+                # Apply horizontal and vertical knockback
+                player_x += player_knockback_dx
+                player_y += player_knockback_dy
+                # Apply gravity to vertical knockback
+                player_knockback_dy += GRAVITY
+                # Shake effect
+                player_x += random.randint(-2, 2)
+                player_y += random.randint(-2, 2)
+                # Constrain within window
+                player_x = max(0, min(player_x, WINDOW_WIDTH - PLAYER_SIZE))
+                player_y = max(0, min(player_y, WINDOW_HEIGHT - PLAYER_SIZE))
+                player_knockback_timer -= 1
+
+            # Enemy knockback
+            if enemy_knockback_timer > 0:
+                enemy_x += enemy_knockback_dx
+                enemy_y += enemy_knockback_dy
+                enemy_knockback_dy += GRAVITY
+                enemy_x += random.randint(-2, 2)
+                enemy_y += random.randint(-2, 2)
+                enemy_x = max(0, min(enemy_x, WINDOW_WIDTH - ENEMY_SIZE))
+                enemy_y = max(0, min(enemy_y, WINDOW_HEIGHT - ENEMY_SIZE))
+                enemy_knockback_timer -= 1
+
+            # Player 2 knockback
+            if player2_knockback_timer > 0:
+                player2_x += player2_knockback_dx
+                player2_y += player2_knockback_dy
+                player2_knockback_dy += GRAVITY
+                player2_x += random.randint(-2, 2)
+                player2_y += random.randint(-2, 2)
+                player2_x = max(0, min(player2_x, WINDOW_WIDTH - PLAYER2_SIZE))
+                player2_y = max(0, min(player2_y, WINDOW_HEIGHT - PLAYER2_SIZE))
+                player2_knockback_timer -= 1
+
+            # --- Movement only if not in knockback ---
+            if player_knockback_timer == 0:
+                # Player 1 movement
+                keys = pygame.key.get_pressed()
+                if keys[pygame.K_w]:
+                    player_y -= PLAYER_SPEED
+                if keys[pygame.K_s]:
+                    player_y += PLAYER_SPEED
+                if keys[pygame.K_a]:
+                    player_x -= PLAYER_SPEED
+                    player_facing_right = False
+                if keys[pygame.K_d]:
+                    player_x += PLAYER_SPEED
+                    player_facing_right = True
+
+            if two_player_mode and player2_knockback_timer == 0:
+                # 2 Player controls and physics
+                # Arrow keys for movement
+                if keys[pygame.K_UP] and not player2_is_jumping:
+                    player2_velocity_y = -JUMP_STRENGTH
+                    player2_is_jumping = True
+                if keys[pygame.K_LEFT]:
+                    player2_x -= PLAYER2_SPEED
+                    player2_facing_right = False
+                if keys[pygame.K_RIGHT]:
+                    player2_x += PLAYER2_SPEED
+                    player2_facing_right = True
+                if keys[pygame.K_DOWN]:
+                    player2_y += PLAYER2_SPEED
+
+                # Gravity and platform collision for player 2
+                player2_y, player2_velocity_y, player2_landed = apply_gravity_and_platforms(
+                    player2_x, player2_y, PLAYER2_SIZE, player2_velocity_y
+                )
+                if player2_landed:
+                    player2_is_jumping = False
+                else:
+                    player2_velocity_y += GRAVITY
 
-            player2_x = max(0, min(player2_x, WINDOW_WIDTH - PLAYER2_SIZE))
+                player2_x = max(0, min(player2_x, WINDOW_WIDTH - PLAYER2_SIZE))
 
-        # Apply gravity and platform collision to player
-        player_y, player_velocity_y, player_landed = apply_gravity_and_platforms(
-            player_x, player_y, PLAYER_SIZE, player_velocity_y
-        )
-        if player_landed:
-            is_jumping = False
-        else:
-            player_velocity_y += GRAVITY
-
-        # Constrain player horizontally
-        player_x = max(0, min(player_x, WINDOW_WIDTH - PLAYER_SIZE))
-
-        # Constrain enemy horizontally
-        enemy_x = max(0, min(enemy_x, WINDOW_WIDTH - ENEMY_SIZE))
-
-        # Remove collision revert logic so player and NPC/player2 can pass through each other
-        # Prevent player and NPC from overlapping in both modes
-        # player_rect = pygame.Rect(player_x, player_y, PLAYER_SIZE, PLAYER_SIZE)
-        # enemy_rect = pygame.Rect(enemy_x, enemy_y, ENEMY_SIZE, ENEMY_SIZE)
-        # if player_rect.colliderect(enemy_rect):
-        #     player_x = prev_player_x
-        #     player_y = prev_player_y
-        #     enemy_x = prev_enemy_x
-        #     enemy_y = prev_enemy_y
-
-        # Prevent player 1 and player 2 from overlapping in two player mode
-        # if two_player_mode:
-        #     player2_rect = pygame.Rect(player2_x, player2_y, PLAYER2_SIZE, PLAYER2_SIZE)
-        #     if player_rect.colliderect(player2_rect):
-        #         player_x = prev_player_x
-        #         player_y = prev_player_y
-        #         player2_x = prev_player2_x
-        #         player2_y = prev_player2_y
-
-        # Skip enemy movement, gravity, and shooting in 2 player mode
-        if not two_player_mode:
-            # Set NPC jump interval based on difficulty (lower interval = more jumps)
-            if difficulty == "Easy":
-                enemy_jump_interval = 120
-            elif difficulty == "Medium":
-                enemy_jump_interval = 80
-            elif difficulty == "Hard":
-                enemy_jump_interval = 40
-            elif difficulty == "Master":
-                enemy_jump_interval = 20
-
-            # Apply gravity and platform collision to enemy
-            enemy_y, enemy_velocity_y, enemy_landed = apply_gravity_and_platforms(
-                enemy_x, enemy_y, ENEMY_SIZE, enemy_velocity_y
+            # Apply gravity and platform collision to player
+            player_y, player_velocity_y, player_landed = apply_gravity_and_platforms(
+                player_x, player_y, PLAYER_SIZE, player_velocity_y
             )
-            if not enemy_landed:
-                enemy_velocity_y += GRAVITY
+            if player_landed:
+                is_jumping = False
+            else:
+                player_velocity_y += GRAVITY
 
-            # NPC random jump logic
-            enemy_jump_timer += 1
-            if enemy_landed and enemy_jump_timer >= enemy_jump_interval:
-                if random.random() < 0.7:  # 70% chance to jump when interval reached
-                    enemy_velocity_y = -ENEMY_JUMP_STRENGTH
-                enemy_jump_timer = 0
+            # Constrain player horizontally
+            player_x = max(0, min(player_x, WINDOW_WIDTH - PLAYER_SIZE))
 
-            # Enemy movement (simple horizontal patrol with distance check)
-            prev_enemy_x = enemy_x
-            prev_enemy_y = enemy_y
-            enemy_speed = DIFFICULTY_LEVELS[difficulty]["enemy_speed"]
-            distance_x = abs(player_x - enemy_x)
-            if distance_x > 8 * BLOCK_SIZE:
-                if player_x > enemy_x:
-                    enemy_x += enemy_speed
-                elif player_x < enemy_x:
-                    enemy_x -= enemy_speed
-            # If within 8 blocks, NPC does not move horizontally
+            # Constrain enemy horizontally
             enemy_x = max(0, min(enemy_x, WINDOW_WIDTH - ENEMY_SIZE))
-            # Prevent NPC and player from overlapping after enemy moves
-            player_rect = pygame.Rect(player_x, player_y, PLAYER_SIZE, PLAYER_SIZE)
-            enemy_rect = pygame.Rect(enemy_x, enemy_y, ENEMY_SIZE, ENEMY_SIZE)
-            if player_rect.colliderect(enemy_rect):
-                enemy_x = prev_enemy_x
-                enemy_y = prev_enemy_y
-
-            # Enemy gun shooting logic (disable if either is dead)
-            if player_health > 0 and enemy_health > 0:
-                bullet_timer += 1
-                interval_min = DIFFICULTY_LEVELS[difficulty]["interval_min"]
-                interval_max = DIFFICULTY_LEVELS[difficulty]["interval_max"]
-                if bullet_timer >= random.randint(interval_min, interval_max):
-                    bullet_timer = 0
-                    # Shoot bullet towards player
-                    direction = 1 if player_x > enemy_x else -1
-                    bullets.append(
-                        {
-                            "x": enemy_x + ENEMY_SIZE // 2,
-                            "y": enemy_y + ENEMY_SIZE // 2,
-                            "dx": direction
-                            * DIFFICULTY_LEVELS[difficulty]["bullet_speed"],
-                        }
-                    )
 
-        # Update enemy bullet positions
-        for bullet in bullets:
-            bullet["x"] += bullet["dx"]
+            # Remove collision revert logic so player and NPC/player2 can pass through each other
+            # Prevent player and NPC from overlapping in both modes
+            # player_rect = pygame.Rect(player_x, player_y, PLAYER_SIZE, PLAYER_SIZE)
+            # enemy_rect = pygame.Rect(enemy_x, enemy_y, ENEMY_SIZE, ENEMY_SIZE)
+            # if player_rect.colliderect(enemy_rect):
+            #     player_x = prev_player_x
+            #     player_y = prev_player_y
+            #     enemy_x = prev_enemy_x
+            #     enemy_y = prev_enemy_y
+
+            # Prevent player 1 and player 2 from overlapping in two player mode
+            # if two_player_mode:
+            #     player2_rect = pygame.Rect(player2_x, player2_y, PLAYER2_SIZE, PLAYER2_SIZE)
+            #     if player_rect.colliderect(player2_rect):
+            #         player_x = prev_player_x
+            #         player_y = prev_player_y
+            #         player2_x = prev_player2_x
+            #         player2_y = prev_player2_y
+
+            # Skip enemy movement, gravity, and shooting in 2 player mode
+            if not two_player_mode:
+                # Set NPC jump interval based on difficulty (lower interval = more jumps)
+                if difficulty == "Easy":
+                    enemy_jump_interval = 120
+                elif difficulty == "Medium":
+                    enemy_jump_interval = 80
+                elif difficulty == "Hard":
+                    enemy_jump_interval = 40
+                elif difficulty == "Master":
+                    enemy_jump_interval = 20
+
+                # Apply gravity and platform collision to enemy
+                enemy_y, enemy_velocity_y, enemy_landed = apply_gravity_and_platforms(
+                    enemy_x, enemy_y, ENEMY_SIZE, enemy_velocity_y
+                )
+                if not enemy_landed:
+                    enemy_velocity_y += GRAVITY
+
+                # NPC random jump logic
+                enemy_jump_timer += 1
+                if enemy_landed and enemy_jump_timer >= enemy_jump_interval:
+                    if random.random() < 0.7:  # 70% chance to jump when interval reached
+                        enemy_velocity_y = -ENEMY_JUMP_STRENGTH
+                    enemy_jump_timer = 0
+
+                # Enemy movement (simple horizontal patrol with distance check)
+                prev_enemy_x = enemy_x
+                prev_enemy_y = enemy_y
+                enemy_speed = DIFFICULTY_LEVELS[difficulty]["enemy_speed"]
+                distance_x = abs(player_x - enemy_x)
+                if distance_x > 8 * BLOCK_SIZE:
+                    if player_x > enemy_x:
+                        enemy_x += enemy_speed
+                    elif player_x < enemy_x:
+                        enemy_x -= enemy_speed
+                # If within 8 blocks, NPC does not move horizontally
+                enemy_x = max(0, min(enemy_x, WINDOW_WIDTH - ENEMY_SIZE))
+                # Prevent NPC and player from overlapping after enemy moves
+                player_rect = pygame.Rect(player_x, player_y, PLAYER_SIZE, PLAYER_SIZE)
+                enemy_rect = pygame.Rect(enemy_x, enemy_y, ENEMY_SIZE, ENEMY_SIZE)
+                if player_rect.colliderect(enemy_rect):
+                    enemy_x = prev_enemy_x
+                    enemy_y = prev_enemy_y
+
+                # Enemy gun shooting logic (disable if either is dead)
+                if player_health > 0 and enemy_health > 0:
+                    bullet_timer += 1
+                    interval_min = DIFFICULTY_LEVELS[difficulty]["interval_min"]
+                    interval_max = DIFFICULTY_LEVELS[difficulty]["interval_max"]
+                    if bullet_timer >= random.randint(interval_min, interval_max):
+                        bullet_timer = 0
+                        # Shoot bullet towards player
+                        direction = 1 if player_x > enemy_x else -1
+                        bullets.append(
+                            {
+                                "x": enemy_x + ENEMY_SIZE // 2,
+                                "y": enemy_y + ENEMY_SIZE // 2,
+                                "dx": direction
+                                * DIFFICULTY_LEVELS[difficulty]["bullet_speed"],
+                            }
+                        )
 
-        # Remove enemy bullets that go off screen
-        bullets = [b for b in bullets if 0 <= b["x"] <= WINDOW_WIDTH]
+            # Update enemy bullet positions
+            for bullet in bullets:
+                bullet["x"] += bullet["dx"]
 
-        # Update player bullet positions
-        for bullet in player_bullets:
-            bullet["x"] += bullet["dx"]
+            # Remove enemy bullets that go off screen
+            bullets = [b for b in bullets if 0 <= b["x"] <= WINDOW_WIDTH]
 
-        # Remove player bullets that go off screen
-        player_bullets = [b for b in player_bullets if 0 <= b["x"] <= WINDOW_WIDTH]
+            # Update player bullet positions
+            for bullet in player_bullets:
+                bullet["x"] += bullet["dx"]
 
-        # Update player 2 bullet positions
-        for bullet in player2_bullets:
-            bullet["x"] += bullet["dx"]
+            # Remove player bullets that go off screen
+            player_bullets = [b for b in player_bullets if 0 <= b["x"] <= WINDOW_WIDTH]
 
-        # Remove player 2 bullets that go off screen
-        player2_bullets = [b for b in player2_bullets if 0 <= b["x"] <= WINDOW_WIDTH]
+            # Update player 2 bullet positions
+            for bullet in player2_bullets:
+                bullet["x"] += bullet["dx"]
 
-        # --- Bullet collision and knockback trigger ---
-        # Check for collisions between enemy bullets and player
-        player_rect = pygame.Rect(player_x, player_y, PLAYER_SIZE, PLAYER_SIZE)
-        for bullet in bullets:
-            bullet_rect = pygame.Rect(
-                bullet["x"], bullet["y"], BULLET_WIDTH, BULLET_HEIGHT
-            )
-            if bullet_rect.colliderect(player_rect):
-                player_health = max(0, player_health - ENEMY_BULLET_DAMAGE)
-                player_knockback_dx = (
-                    KNOCKBACK_DISTANCE if bullet["dx"] > 0 else -KNOCKBACK_DISTANCE
-                )
-                player_knockback_dy = -KNOCKBACK_VERTICAL
-                player_knockback_timer = KNOCKBACK_DURATION
-                bullets.remove(bullet)
-
-        # Check for collisions between player bullets and enemy (single player mode)
-        if not two_player_mode:
-            enemy_rect = pygame.Rect(enemy_x, enemy_y, ENEMY_SIZE, ENEMY_SIZE)
-            for bullet in player_bullets[:]:
+            # Remove player 2 bullets that go off screen
+            player2_bullets = [b for b in player2_bullets if 0 <= b["x"] <= WINDOW_WIDTH]
+
+            # --- Bullet collision and knockback trigger ---
+            # Check for collisions between enemy bullets and player
+            player_rect = pygame.Rect(player_x, player_y, PLAYER_SIZE, PLAYER_SIZE)
+            for bullet in bullets:
                 bullet_rect = pygame.Rect(
-                    bullet["x"], bullet["y"], PLAYER_BULLET_WIDTH, PLAYER_BULLET_HEIGHT
+                    bullet["x"], bullet["y"], BULLET_WIDTH, BULLET_HEIGHT
                 )
-                # Shotgun: only hit if within 5 blocks horizontally
-                if bullet_rect.colliderect(enemy_rect):
-                    if bullet.get("shotgun"):
-                        if abs((bullet["x"] - enemy_x)) <= 5 * BLOCK_SIZE:
+                if bullet_rect.colliderect(player_rect):
+                    player_health = max(0, player_health - ENEMY_BULLET_DAMAGE)
+                    player_knockback_dx = (
+                        KNOCKBACK_DISTANCE if bullet["dx"] > 0 else -KNOCKBACK_DISTANCE
+                    )
+                    player_knockback_dy = -KNOCKBACK_VERTICAL
+                    player_knockback_timer = KNOCKBACK_DURATION
+                    bullets.remove(bullet)
+
+            # Check for collisions between player bullets and enemy (single player mode)
+            if not two_player_mode:
+                enemy_rect = pygame.Rect(enemy_x, enemy_y, ENEMY_SIZE, ENEMY_SIZE)
+                for bullet in player_bullets[:]:
+                    bullet_rect = pygame.Rect(
+                        bullet["x"], bullet["y"], PLAYER_BULLET_WIDTH, PLAYER_BULLET_HEIGHT
+                    )
+                    # Shotgun: only hit if within 5 blocks horizontally
+                    if bullet_rect.colliderect(enemy_rect):
+                        if bullet.get("shotgun"):
+                            if abs((bullet["x"] - enemy_x)) <= 5 * BLOCK_SIZE:
+                                enemy_health = max(0, enemy_health - PLAYER_BULLET_DAMAGE)
+                                enemy_knockback_dx = (
+                                    KNOCKBACK_DISTANCE
+                                    if bullet["dx"] > 0
+                                    else -KNOCKBACK_DISTANCE
+                                )
+                                enemy_knockback_dy = -KNOCKBACK_VERTICAL
+                                enemy_knockback_timer = KNOCKBACK_DURATION
+                                player_bullets.remove(bullet)
+                            else:
+                                continue
+                        else:
                             enemy_health = max(0, enemy_health - PLAYER_BULLET_DAMAGE)
                             enemy_knockback_dx = (
                                 KNOCKBACK_DISTANCE
@@ -856,32 +890,32 @@ while True:
                             enemy_knockback_dy = -KNOCKBACK_VERTICAL
                             enemy_knockback_timer = KNOCKBACK_DURATION
                             player_bullets.remove(bullet)
+
+            # Check for collisions between player 2 bullets and enemy (single player mode)
+            if not two_player_mode:
+                enemy_rect = pygame.Rect(enemy_x, enemy_y, ENEMY_SIZE, ENEMY_SIZE)
+                for bullet in player2_bullets[:]:
+                    bullet_rect = pygame.Rect(
+                        bullet["x"],
+                        bullet["y"],
+                        PLAYER2_BULLET_WIDTH,
+                        PLAYER2_BULLET_HEIGHT,
+                    )
+                    if bullet_rect.colliderect(enemy_rect):
+                        if bullet.get("shotgun"):
+                            if abs((bullet["x"] - enemy_x)) <= 5 * BLOCK_SIZE:
+                                enemy_health = max(0, enemy_health - PLAYER2_BULLET_DAMAGE)
+                                enemy_knockback_dx = (
+                                    KNOCKBACK_DISTANCE
+                                    if bullet["dx"] > 0
+                                    else -KNOCKBACK_DISTANCE
+                                )
+                                enemy_knockback_dy = -KNOCKBACK_VERTICAL
+                                enemy_knockback_timer = KNOCKBACK_DURATION
+                                player2_bullets.remove(bullet)
+                            else:
+                                continue
                         else:
-                            continue
-                    else:
-                        enemy_health = max(0, enemy_health - PLAYER_BULLET_DAMAGE)
-                        enemy_knockback_dx = (
-                            KNOCKBACK_DISTANCE
-                            if bullet["dx"] > 0
-                            else -KNOCKBACK_DISTANCE
-                        )
-                        enemy_knockback_dy = -KNOCKBACK_VERTICAL
-                        enemy_knockback_timer = KNOCKBACK_DURATION
-                        player_bullets.remove(bullet)
-
-        # Check for collisions between player 2 bullets and enemy (single player mode)
-        if not two_player_mode:
-            enemy_rect = pygame.Rect(enemy_x, enemy_y, ENEMY_SIZE, ENEMY_SIZE)
-            for bullet in player2_bullets[:]:
-                bullet_rect = pygame.Rect(
-                    bullet["x"],
-                    bullet["y"],
-                    PLAYER2_BULLET_WIDTH,
-                    PLAYER2_BULLET_HEIGHT,
-                )
-                if bullet_rect.colliderect(enemy_rect):
-                    if bullet.get("shotgun"):
-                        if abs((bullet["x"] - enemy_x)) <= 5 * BLOCK_SIZE:
                             enemy_health = max(0, enemy_health - PLAYER2_BULLET_DAMAGE)
                             enemy_knockback_dx = (
                                 KNOCKBACK_DISTANCE
@@ -891,32 +925,32 @@ while True:
                             enemy_knockback_dy = -KNOCKBACK_VERTICAL
                             enemy_knockback_timer = KNOCKBACK_DURATION
                             player2_bullets.remove(bullet)
+
+            # Check for collisions between player bullets and player 2 (2 player mode)
+            if two_player_mode:
+                player2_rect = pygame.Rect(player2_x, player2_y, PLAYER2_SIZE, PLAYER2_SIZE)
+                for bullet in player_bullets[:]:
+                    bullet_rect = pygame.Rect(
+                        bullet["x"], bullet["y"], PLAYER_BULLET_WIDTH, PLAYER_BULLET_HEIGHT
+                    )
+                    if bullet_rect.colliderect(player2_rect):
+                        if bullet.get("shotgun"):
+                            if abs((bullet["x"] - player2_x)) <= 5 * BLOCK_SIZE:
+                                player2_health = max(
+                                    0, player2_health - PLAYER_BULLET_DAMAGE
+                                )
+                                player2_knockback_dx = (
+                                    KNOCKBACK_DISTANCE
+                                    if bullet["dx"] > 0
+                                    else -KNOCKBACK_DISTANCE
+                                )
+                                player2_knockback_dy = -KNOCKBACK_VERTICAL
+                                player2_knockback_timer = KNOCKBACK_DURATION
+                                player_bullets.remove(bullet)
+                            else:
+                                continue
                         else:
-                            continue
-                    else:
-                        enemy_health = max(0, enemy_health - PLAYER2_BULLET_DAMAGE)
-                        enemy_knockback_dx = (
-                            KNOCKBACK_DISTANCE
-                            if bullet["dx"] > 0
-                            else -KNOCKBACK_DISTANCE
-                        )
-                        enemy_knockback_dy = -KNOCKBACK_VERTICAL
-                        enemy_knockback_timer = KNOCKBACK_DURATION
-                        player2_bullets.remove(bullet)
-
-        # Check for collisions between player bullets and player 2 (2 player mode)
-        if two_player_mode:
-            player2_rect = pygame.Rect(player2_x, player2_y, PLAYER2_SIZE, PLAYER2_SIZE)
-            for bullet in player_bullets[:]:
-                bullet_rect = pygame.Rect(
-                    bullet["x"], bullet["y"], PLAYER_BULLET_WIDTH, PLAYER_BULLET_HEIGHT
-                )
-                if bullet_rect.colliderect(player2_rect):
-                    if bullet.get("shotgun"):
-                        if abs((bullet["x"] - player2_x)) <= 5 * BLOCK_SIZE:
-                            player2_health = max(
-                                0, player2_health - PLAYER_BULLET_DAMAGE
-                            )
+                            player2_health = max(0, player2_health - PLAYER_BULLET_DAMAGE)
                             player2_knockback_dx = (
                                 KNOCKBACK_DISTANCE
                                 if bullet["dx"] > 0
@@ -925,35 +959,35 @@ while True:
                             player2_knockback_dy = -KNOCKBACK_VERTICAL
                             player2_knockback_timer = KNOCKBACK_DURATION
                             player_bullets.remove(bullet)
-                        else:
-                            continue
-                    else:
-                        player2_health = max(0, player2_health - PLAYER_BULLET_DAMAGE)
-                        player2_knockback_dx = (
-                            KNOCKBACK_DISTANCE
-                            if bullet["dx"] > 0
-                            else -KNOCKBACK_DISTANCE
-                        )
-                        player2_knockback_dy = -KNOCKBACK_VERTICAL
-                        player2_knockback_timer = KNOCKBACK_DURATION
-                        player_bullets.remove(bullet)
 
-        # Check for collisions between player 2 bullets and player 1 (2 player mode)
-        if two_player_mode:
-            player_rect = pygame.Rect(player_x, player_y, PLAYER_SIZE, PLAYER_SIZE)
-            for bullet in player2_bullets[:]:
-                bullet_rect = pygame.Rect(
-                    bullet["x"],
-                    bullet["y"],
-                    PLAYER2_BULLET_WIDTH,
-                    PLAYER2_BULLET_HEIGHT,
-                )
-                if bullet_rect.colliderect(player_rect):
-                    if bullet.get("shotgun"):
-                        if abs((bullet["x"] - player_x)) <= 5 * BLOCK_SIZE:
-                            player_health = max(
-                                0, player_health - PLAYER2_BULLET_DAMAGE
-                            )
+            # Check for collisions between player 2 bullets and player 1 (2 player mode)
+            if two_player_mode:
+                player_rect = pygame.Rect(player_x, player_y, PLAYER_SIZE, PLAYER_SIZE)
+                for bullet in player2_bullets[:]:
+                    bullet_rect = pygame.Rect(
+                        bullet["x"],
+                        bullet["y"],
+                        PLAYER2_BULLET_WIDTH,
+                        PLAYER2_BULLET_HEIGHT,
+                    )
+                    if bullet_rect.colliderect(player_rect):
+                        if bullet.get("shotgun"):
+                            if abs((bullet["x"] - player_x)) <= 5 * BLOCK_SIZE:
+                                player_health = max(
+                                    0, player_health - PLAYER2_BULLET_DAMAGE
+                                )
+                                player_knockback_dx = (
+                                    KNOCKBACK_DISTANCE
+                                    if bullet["dx"] > 0
+                                    else -KNOCKBACK_DISTANCE
+                                )
+                                player_knockback_dy = -KNOCKBACK_VERTICAL
+                                player_knockback_timer = KNOCKBACK_DURATION
+                                player2_bullets.remove(bullet)
+                            else:
+                                continue
+                        else:
+                            player_health = max(0, player_health - PLAYER2_BULLET_DAMAGE)
                             player_knockback_dx = (
                                 KNOCKBACK_DISTANCE
                                 if bullet["dx"] > 0
@@ -962,176 +996,167 @@ while True:
                             player_knockback_dy = -KNOCKBACK_VERTICAL
                             player_knockback_timer = KNOCKBACK_DURATION
                             player2_bullets.remove(bullet)
-                        else:
-                            continue
-                    else:
-                        player_health = max(0, player_health - PLAYER2_BULLET_DAMAGE)
-                        player_knockback_dx = (
-                            KNOCKBACK_DISTANCE
-                            if bullet["dx"] > 0
-                            else -KNOCKBACK_DISTANCE
-                        )
-                        player_knockback_dy = -KNOCKBACK_VERTICAL
-                        player_knockback_timer = KNOCKBACK_DURATION
-                        player2_bullets.remove(bullet)
 
-        # Fill the background with white
-        screen.fill((255, 255, 255))
+            # Fill the background with white
+            screen.fill((255, 255, 255))
 
-        # Draw platforms
-        for platform in PLATFORMS:
-            pygame.draw.rect(screen, PLATFORM_COLOR, platform)
+            # Draw platforms
+            for platform in PLATFORMS:
+                pygame.draw.rect(screen, PLATFORM_COLOR, platform)
 
-        # Draw the player square (black)
-        pygame.draw.rect(
-            screen, PLAYER_COLOR, (player_x, player_y, PLAYER_SIZE, PLAYER_SIZE)
-        )
-
-        # Draw the enemy square (red) and health bar only if not in 2 player mode
-        if not two_player_mode:
+            # Draw the player square (black)
             pygame.draw.rect(
-                screen, ENEMY_COLOR, (enemy_x, enemy_y, ENEMY_SIZE, ENEMY_SIZE)
-            )
-            draw_health_bar(
-                screen, WINDOW_WIDTH - 110, 10, enemy_health, ENEMY_MAX_HEALTH
+                screen, PLAYER_COLOR, (player_x, player_y, PLAYER_SIZE, PLAYER_SIZE)
             )
-            if enemy_health <= 0:
-                draw_x_above(screen, enemy_x, enemy_y, ENEMY_SIZE)
 
-        # Draw enemy bullets
-        for bullet in bullets:
-            pygame.draw.rect(
-                screen,
-                BULLET_COLOR,
-                (bullet["x"], bullet["y"], BULLET_WIDTH, BULLET_HEIGHT),
-            )
+            # Draw the enemy square (red) and health bar only if not in 2 player mode
+            if not two_player_mode:
+                pygame.draw.rect(
+                    screen, ENEMY_COLOR, (enemy_x, enemy_y, ENEMY_SIZE, ENEMY_SIZE)
+                )
+                draw_health_bar(
+                    screen, WINDOW_WIDTH - 110, 10, enemy_health, ENEMY_MAX_HEALTH
+                )
+                if enemy_health <= 0:
+                    draw_x_above(screen, enemy_x, enemy_y, ENEMY_SIZE)
+
+            # Draw enemy bullets
+            for bullet in bullets:
+                pygame.draw.rect(
+                    screen,
+                    BULLET_COLOR,
+                    (bullet["x"], bullet["y"], BULLET_WIDTH, BULLET_HEIGHT),
+                )
 
-        # Draw player bullets
-        for bullet in player_bullets:
-            pygame.draw.rect(
-                screen,
-                PLAYER_BULLET_COLOR,
-                (bullet["x"], bullet["y"], PLAYER_BULLET_WIDTH, PLAYER_BULLET_HEIGHT),
-            )
+            # Draw player bullets
+            for bullet in player_bullets:
+                pygame.draw.rect(
+                    screen,
+                    PLAYER_BULLET_COLOR,
+                    (bullet["x"], bullet["y"], PLAYER_BULLET_WIDTH, PLAYER_BULLET_HEIGHT),
+                )
 
-        # Draw player 2 bullets
-        for bullet in player2_bullets:
-            pygame.draw.rect(
-                screen,
-                PLAYER2_BULLET_COLOR,
-                (bullet["x"], bullet["y"], PLAYER2_BULLET_WIDTH, PLAYER2_BULLET_HEIGHT),
-            )
+            # Draw player 2 bullets
+            for bullet in player2_bullets:
+                pygame.draw.rect(
+                    screen,
+                    PLAYER2_BULLET_COLOR,
+                    (bullet["x"], bullet["y"], PLAYER2_BULLET_WIDTH, PLAYER2_BULLET_HEIGHT),
+                )
 
-        # Draw health bars with dynamic color and labels
-        if two_player_mode:
-            draw_labeled_health_bar(
-                screen, 10, 10, player_health, PLAYER_MAX_HEALTH, "Player 1"
-            )
-            draw_labeled_health_bar(
-                screen,
-                WINDOW_WIDTH - 110,
-                10,
-                player2_health,
-                PLAYER2_MAX_HEALTH,
-                "Player 2",
-            )
-        else:
-            draw_labeled_health_bar(
-                screen, 10, 10, player_health, PLAYER_MAX_HEALTH, "Player"
-            )
-            draw_labeled_health_bar(
-                screen, WINDOW_WIDTH - 110, 10, enemy_health, ENEMY_MAX_HEALTH, "NPC"
-            )
+            # Draw health bars with dynamic color and labels
+            if two_player_mode:
+                draw_labeled_health_bar(
+                    screen, 10, 10, player_health, PLAYER_MAX_HEALTH, "Player 1"
+                )
+                draw_labeled_health_bar(
+                    screen,
+                    WINDOW_WIDTH - 110,
+                    10,
+                    player2_health,
+                    PLAYER2_MAX_HEALTH,
+                    "Player 2",
+                )
+            else:
+                draw_labeled_health_bar(
+                    screen, 10, 10, player_health, PLAYER_MAX_HEALTH, "Player"
+                )
+                draw_labeled_health_bar(
+                    screen, WINDOW_WIDTH - 110, 10, enemy_health, ENEMY_MAX_HEALTH, "NPC"
+                )
 
-        # Draw X above head if dead and break into pieces only once
-        if player_health <= 0 and not player_exploded:
-            break_into_pieces(player_x, player_y, PLAYER_SIZE, PLAYER_COLOR)
-            player_exploded = True
-        if not two_player_mode and enemy_health <= 0 and not enemy_exploded:
-            break_into_pieces(enemy_x, enemy_y, ENEMY_SIZE, ENEMY_COLOR)
-            enemy_exploded = True
-        if two_player_mode and player2_health <= 0 and not player2_exploded:
-            break_into_pieces(player2_x, player2_y, PLAYER2_SIZE, PLAYER2_COLOR)
-            player2_exploded = True
-
-        # Draw X above head if dead
-        if player_health <= 0:
-            draw_x_above(screen, player_x, player_y, PLAYER_SIZE)
-        if not two_player_mode and enemy_health <= 0:
-            draw_x_above(screen, enemy_x, enemy_y, ENEMY_SIZE)
-        if two_player_mode and player2_health <= 0:
-            draw_x_above(screen, player2_x, player2_y, PLAYER2_SIZE)
-
-        # Draw the second player in 2 player mode
-        if two_player_mode:
-            pygame.draw.rect(
-                screen,
-                PLAYER2_COLOR,
-                (player2_x, player2_y, PLAYER2_SIZE, PLAYER2_SIZE),
-            )
-            # Remove duplicate health bar for Player 1
-            # draw_health_bar(screen, 10, 30, player2_health, PLAYER2_MAX_HEALTH)
-            if player2_health <= 0:
+            # Draw X above head if dead and break into pieces only once
+            if player_health <= 0 and not player_exploded:
+                break_into_pieces(player_x, player_y, PLAYER_SIZE, PLAYER_COLOR)
+                player_exploded = True
+            if not two_player_mode and enemy_health <= 0 and not enemy_exploded:
+                break_into_pieces(enemy_x, enemy_y, ENEMY_SIZE, ENEMY_COLOR)
+                enemy_exploded = True
+            if two_player_mode and player2_health <= 0 and not player2_exploded:
+                break_into_pieces(player2_x, player2_y, PLAYER2_SIZE, PLAYER2_COLOR)
+                player2_exploded = True
+
+            # Draw X above head if dead
+            if player_health <= 0:
+                draw_x_above(screen, player_x, player_y, PLAYER_SIZE)
+            if not two_player_mode and enemy_health <= 0:
+                draw_x_above(screen, enemy_x, enemy_y, ENEMY_SIZE)
+            if two_player_mode and player2_health <= 0:
                 draw_x_above(screen, player2_x, player2_y, PLAYER2_SIZE)
 
-        # Draw reloading message, magazine count, and weapon type
-        font_reload = pygame.font.SysFont(None, 28)
-        weapon_text = font_reload.render(
-            f"Weapon: {'Rifle' if player_weapon == WEAPON_RIFLE else 'Shotgun'}",
-            True,
-            (0, 0, 0),
-        )
-        screen.blit(weapon_text, (player_x, player_y - 60))
-        if player_reloading:
-            reload_text = font_reload.render("Reloading...", True, (200, 0, 0))
-            screen.blit(reload_text, (player_x, player_y - 32))
-        else:
-            mag_text = font_reload.render(f"Ammo: {player_magazine}", True, (0, 0, 0))
-            screen.blit(mag_text, (player_x, player_y - 32))
-
-        if two_player_mode:
-            weapon_text2 = font_reload.render(
-                f"Weapon: {'Rifle' if player2_weapon == WEAPON_RIFLE else 'Shotgun'}",
+            # Draw the second player in 2 player mode
+            if two_player_mode:
+                pygame.draw.rect(
+                    screen,
+                    PLAYER2_COLOR,
+                    (player2_x, player2_y, PLAYER2_SIZE, PLAYER2_SIZE),
+                )
+                # Remove duplicate health bar for Player 1
+                # draw_health_bar(screen, 10, 30, player2_health, PLAYER2_MAX_HEALTH)
+                if player2_health <= 0:
+                    draw_x_above(screen, player2_x, player2_y, PLAYER2_SIZE)
+
+            # Draw reloading message, magazine count, and weapon type
+            font_reload = pygame.font.SysFont(None, 28)
+            weapon_text = font_reload.render(
+                f"Weapon: {'Rifle' if player_weapon == WEAPON_RIFLE else 'Shotgun'}",
                 True,
                 (0, 0, 0),
             )
-            screen.blit(weapon_text2, (player2_x, player2_y - 60))
-            if player2_reloading:
-                reload_text2 = font_reload.render("Reloading...", True, (200, 0, 0))
-                screen.blit(reload_text2, (player2_x, player2_y - 32))
+            screen.blit(weapon_text, (player_x, player_y - 60))
+            if player_reloading:
+                reload_text = font_reload.render("Reloading...", True, (200, 0, 0))
+                screen.blit(reload_text, (player_x, player_y - 32))
             else:
-                mag_text2 = font_reload.render(
-                    f"Ammo: {player2_magazine}", True, (0, 0, 0)
+                mag_text = font_reload.render(f"Ammo: {player_magazine}", True, (0, 0, 0))
+                screen.blit(mag_text, (player_x, player_y - 32))
+
+            if two_player_mode:
+                weapon_text2 = font_reload.render(
+                    f"Weapon: {'Rifle' if player2_weapon == WEAPON_RIFLE else 'Shotgun'}",
+                    True,
+                    (0, 0, 0),
                 )
-                screen.blit(mag_text2, (player2_x, player2_y - 32))
-
-        # Check for game over condition and set winner
-        if not game_over:
-            if player_health <= 0:
-                game_over = True
-                if two_player_mode:
-                    winner_title = "Player 2"
+                screen.blit(weapon_text2, (player2_x, player2_y - 60))
+                if player2_reloading:
+                    reload_text2 = font_reload.render("Reloading...", True, (200, 0, 0))
+                    screen.blit(reload_text2, (player2_x, player2_y - 32))
                 else:
-                    winner_title = "NPC"
-            elif not two_player_mode and enemy_health <= 0:
-                game_over = True
-                winner_title = "Player"
-            elif two_player_mode and player2_health <= 0:
-                game_over = True
-                winner_title = "Player 1"
-
-        # If game over, show game over screen and handle restart
-        if game_over:
-            restart_clicked = show_game_over(winner_title)
-            if restart_clicked:
-                # Reset all game state and return to battle directly
-                break
-            else:
-                running = False
-                continue
+                    mag_text2 = font_reload.render(
+                        f"Ammo: {player2_magazine}", True, (0, 0, 0)
+                    )
+                    screen.blit(mag_text2, (player2_x, player2_y - 32))
+
+            # Check for game over condition and set winner
+            if not game_over:
+                if player_health <= 0:
+                    game_over = True
+                    if two_player_mode:
+                        winner_title = "Player 2"
+                    else:
+                        winner_title = "NPC"
+                elif not two_player_mode and enemy_health <= 0:
+                    game_over = True
+                    winner_title = "Player"
+                elif two_player_mode and player2_health <= 0:
+                    game_over = True
+                    winner_title = "Player 1"
+
+            # If game over, show game over screen and handle restart
+            if game_over:
+                restart_clicked = show_game_over(winner_title)
+                if restart_clicked:
+                    # Reset all game state and return to battle directly
+                    break
+                else:
+                    running = False
+                    continue
+
+            pygame.display.flip()
+        if not running:
+            break
 
-        pygame.display.flip()
-    if not running:
-        break
 
-pygame.quit()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
+    pygame.quit()
@@ -165,7 +165,8 @@ def create_bricks():
 
 
 def main():
-    """Main game function"""
+    """Main game function. Returns when the window is closed (without
+    quitting pygame, so a launcher can run the game in-process)."""
     # Set up the display
     screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
     pygame.display.set_caption("Brick Breaker Game")
@@ -274,10 +275,9 @@ def main():
         # Update screen display
         pygame.display.flip()
 
-    pygame.quit()
-
 
 # ==================== PROGRAM ENTRY POINT ====================
 
 if __name__ == "__main__":
     main()
+    pygame.quit()
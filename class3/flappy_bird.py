@@ -1,5 +1,4 @@
 import pygame
-import sys
 import random
 
 # Initialize Pygame
@@ -27,9 +26,8 @@ PIPE_WIDTH = 60
 PIPE_GAP = 150
 PIPE_SPEED = 3
 
-# Set up the display
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption("Flappy Bird")
+# The display is set up by main() so importing the module opens no window
+screen = None
 
 clock = pygame.time.Clock()
 font = pygame.font.SysFont(None, 48)
@@ -85,59 +83,71 @@ def draw_text(surface, text, x, y):
 
 
 def main():
-    bird = Bird()
-    pipes = [Pipe(SCREEN_WIDTH + 100)]
-    score = 0
-    running = True
-    game_over = False
-
-    while running:
-        clock.tick(60)
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_SPACE and not game_over:
-                    bird.flap()
-                if event.key == pygame.K_r and game_over:
-                    main()
-
-        if not game_over:
-            bird.update()
-            if pipes[-1].x < SCREEN_WIDTH - 200:
-                pipes.append(Pipe(SCREEN_WIDTH))
-
-            for pipe in pipes:
-                pipe.update()
-                if pipe.off_screen():
-                    pipes.remove(pipe)
-                if pipe.x + PIPE_WIDTH < bird.x and not hasattr(pipe, "scored"):
-                    score += 1
-                    pipe.scored = True
-
-            # Collision detection
-            for pipe in pipes:
-                if bird.rect.colliderect(pipe.top_rect) or bird.rect.colliderect(
-                    pipe.bottom_rect
-                ):
+    """Run the game until the window is closed, then return (R restarts)."""
+    global screen
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption("Flappy Bird")
+
+    while True:
+        bird = Bird()
+        pipes = [Pipe(SCREEN_WIDTH + 100)]
+        score = 0
+        game_over = False
+        restart = False
+
+        while True:
+            clock.tick(60)
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    return
+                if event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_SPACE and not game_over:
+                        bird.flap()
+                    if event.key == pygame.K_r and game_over:
+                        restart = True
+
+            if restart:
+                break
+
+            if not game_over:
+                bird.update()
+                if pipes[-1].x < SCREEN_WIDTH - 200:
+                    pipes.append(Pipe(SCREEN_WIDTH))
+
+                for pipe in pipes:
+                    pipe.update()
+                    if pipe.off_screen():
+                        pipes.remove(pipe)
+                    if pipe.x + PIPE_WIDTH < bird.x and not hasattr(pipe, "scored"):
+                        score += 1
+                        pipe.scored = True
+
+                # Collision detection
+                for pipe in pipes:
+                    if bird.rect.colliderect(pipe.top_rect) or bird.rect.colliderect(
+                        pipe.bottom_rect
+                    ):
+                        game_over = True
+
+                if bird.y < 0 or bird.y + BIRD_HEIGHT > SCREEN_HEIGHT:
                     game_over = True
 
-            if bird.y < 0 or bird.y + BIRD_HEIGHT > SCREEN_HEIGHT:
-                game_over = True
-
-        # Draw everything
-        screen.fill(WHITE)
-        bird.draw(screen)
-        for pipe in pipes:
-            pipe.draw(screen)
-        draw_text(screen, f"Score: {score}", 10, 10)
-        if game_over:
-            draw_text(
-                screen, "Game Over! Press R to Restart", 20, SCREEN_HEIGHT // 2 - 40
-            )
-        pygame.display.flip()
+            # Draw everything
+            screen.fill(WHITE)
+            bird.draw(screen)
+            for pipe in pipes:
+                pipe.draw(screen)
+            draw_text(screen, f"Score: {score}", 10, 10)
+            if game_over:
+                draw_text(
+                    screen,
+                    "Game Over! Press R to Restart",
+                    20,
+                    SCREEN_HEIGHT // 2 - 40,
+                )
+            pygame.display.flip()
 
 
 if __name__ == "__main__":
     main()
+    pygame.quit()
@@ -0,0 +1,89 @@
+"""
+Self-Play Arena Runner
+
+Plays AI-vs-AI matches for every pairing of legendary characters in every
+game mode, spread over one worker process per core, and reports win rates,
+time to kill, damage by source and Force power usage.
+
+Usage:
+    python arena.py
+    python arena.py --matches 20 --modes classic lightsaber_duel --out arena.json
+"""
+
+import argparse
+import json
+import os
+import sys
+
+# Add the src directory to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+from config import (
+    ARENA_BATCH_SIZE,
+    ARENA_DIFFICULTY,
+    ARENA_MATCH_SECONDS,
+    ARENA_MATCHES_PER_PAIRING,
+    ARENA_SEED,
+)
+
+
+def main():
+    """Run the arena and print (and optionally save) the report."""
+    parser = argparse.ArgumentParser(description="Play AI-vs-AI arena matches")
+    parser.add_argument(
+        "--matches",
+        type=int,
+        default=ARENA_MATCHES_PER_PAIRING,
+        help="Matches per character pairing and game mode",
+    )
+    parser.add_argument(
+        "--workers", type=int, help="Worker processes (default: one per core)"
+    )
+    parser.add_argument("--modes", nargs="+", help="Game modes (default: all)")
+    parser.add_argument(
+        "--characters", nargs="+", help="Legendary character keys (default: all)"
+    )
+    parser.add_argument("--seed", type=int, default=ARENA_SEED, help="Master seed")
+    parser.add_argument(
+        "--difficulty", default=ARENA_DIFFICULTY, help="Enemy AI difficulty"
+    )
+    parser.add_argument(
+        "--seconds",
+        type=float,
+        default=ARENA_MATCH_SECONDS,
+        help="Simulated seconds before a match is a draw",
+    )
+    parser.add_argument(
+        "--batch",
+        type=int,
+        default=ARENA_BATCH_SIZE,
+        help="Matches per worker task",
+    )
+    parser.add_argument("--out", help="Write the full report to this JSON file")
+    args = parser.parse_args()
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    from self_play import run_arena, build_report, format_report
+
+    totals, wall_seconds = run_arena(
+        characters=args.characters,
+        modes=args.modes,
+        matches=args.matches,
+        workers=args.workers,
+        seed=args.seed,
+        difficulty=args.difficulty,
+        match_seconds=args.seconds,
+        batch_size=args.batch,
+    )
+    report = build_report(totals, wall_seconds)
+    print(format_report(report))
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
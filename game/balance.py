@@ -0,0 +1,156 @@
+"""
+Stat Balancer Runner
+
+Searches the legendary character stats for a table with pairwise win rates
+near 50%, playing each generation of candidates on the self-play arena's
+worker pool, and writes the best table as a proposed
+legendary_characters.py table with confidence intervals.
+
+Usage:
+    python balance.py
+    python balance.py --generations 30 --cache balance_cache.json
+    python balance.py --characters luke_skywalker darth_vader yoda --matches 4
+"""
+
+import argparse
+import os
+import sys
+
+# Add the src directory to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+from config import (
+    ARENA_DIFFICULTY,
+    ARENA_MATCH_SECONDS,
+    ARENA_SEED,
+    BALANCE_CONFIRM_MATCHES,
+    BALANCE_GENERATIONS,
+    BALANCE_MATCHES,
+    BALANCE_MODES,
+    BALANCE_POPULATION,
+    BALANCE_STEP_SIZE,
+)
+
+
+def main():
+    """Run the stat search and write the proposed table."""
+    parser = argparse.ArgumentParser(description="Balance legendary character stats")
+    parser.add_argument(
+        "--generations", type=int, default=BALANCE_GENERATIONS, help="Generations"
+    )
+    parser.add_argument(
+        "--population",
+        type=int,
+        default=BALANCE_POPULATION,
+        help="Candidate tables per generation",
+    )
+    parser.add_argument(
+        "--matches",
+        type=int,
+        default=BALANCE_MATCHES,
+        help="Matches per pairing, seat and mode while searching",
+    )
+    parser.add_argument(
+        "--confirm-matches",
+        type=int,
+        default=BALANCE_CONFIRM_MATCHES,
+        help="Matches per pairing, seat and mode for the final estimate",
+    )
+    parser.add_argument(
+        "--step", type=float, default=BALANCE_STEP_SIZE, help="Initial search step"
+    )
+    parser.add_argument(
+        "--modes", nargs="+", default=list(BALANCE_MODES), help="Game modes"
+    )
+    parser.add_argument(
+        "--characters", nargs="+", help="Legendary character keys (default: all)"
+    )
+    parser.add_argument(
+        "--workers", type=int, help="Worker processes (default: one per core)"
+    )
+    parser.add_argument("--seed", type=int, default=ARENA_SEED, help="Master seed")
+    parser.add_argument(
+        "--difficulty", default=ARENA_DIFFICULTY, help="Enemy AI difficulty"
+    )
+    parser.add_argument(
+        "--seconds",
+        type=float,
+        default=ARENA_MATCH_SECONDS,
+        help="Simulated seconds before a match is a draw",
+    )
+    parser.add_argument(
+        "--cache", help="JSON file of pairing results, reused across runs"
+    )
+    parser.add_argument(
+        "--out",
+        default="proposed_legendary_characters.py",
+        help="Where to write the proposed table",
+    )
+    args = parser.parse_args()
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    from self_play import open_pool
+    from stat_balancer import StatBalancer, load_cache, save_cache, render_table
+
+    cache = load_cache(args.cache) if args.cache else None
+    balancer = StatBalancer(
+        characters=args.characters,
+        modes=args.modes,
+        seed=args.seed,
+        difficulty=args.difficulty,
+        match_seconds=args.seconds,
+        cache=cache,
+    )
+
+    pool = open_pool(args.workers, args.difficulty, args.seconds)
+    try:
+        table, loss, original_loss = balancer.optimize(
+            generations=args.generations,
+            population=args.population,
+            matches=args.matches,
+            step_size=args.step,
+            pool=pool,
+            progress=print,
+        )
+        print(f"Search loss {loss:.4f} (current stats {original_loss:.4f})")
+
+        # Re-measure the winner and the current table with more matches
+        proposed, current = balancer.evaluate(
+            [table, balancer.original], args.confirm_matches, pool
+        )
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+        if args.cache:
+            save_cache(args.cache, balancer.cache)
+
+    summary = balancer.summarize(proposed)
+    original_summary = balancer.summarize(current)
+    note = (
+        f"Search: {args.generations} generations of {args.population} tables, "
+        f"{args.matches} matches per pairing and seat; estimate: "
+        f"{args.confirm_matches} matches per pairing and seat, seed {args.seed}."
+    )
+    with open(args.out, "w") as f:
+        f.write(render_table(balancer, table, summary, original_summary, note))
+
+    for key, entry in sorted(
+        summary["characters"].items(), key=lambda item: -item[1]["rate"]
+    ):
+        low, high = entry["interval"]
+        was = original_summary["characters"][key]["rate"]
+        print(
+            f"{key:<20}{entry['rate']:>7.1%}  [{low:.1%}, {high:.1%}]  "
+            f"(current {was:.1%})"
+        )
+    print(
+        f"Imbalance {summary['imbalance']:.4f} "
+        f"(current {original_summary['imbalance']:.4f})"
+    )
+    print(f"Proposed table written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Duel Environment Benchmark
+
+Measures the throughput of the reinforcement-learning environments: a
+single DuelEnv and a VectorDuelEnv of several engines in one process,
+driven by uniformly random actions. Reports environment steps and
+simulation ticks per second, and how the finished episodes ended.
+
+Usage:
+    python benchmarks/duel_env_benchmark.py [--envs N] [--steps N] [--frame-skip N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add the src directory to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+from duel_env import ACTION_COUNT, OBSERVATION_SIZE, DuelEnv, VectorDuelEnv
+
+
+def measure_single(steps, frame_skip, seed):
+    """Return (steps per second, ticks per second) of one DuelEnv."""
+    env = DuelEnv(seed=seed, frame_skip=frame_skip)
+    env.reset()
+    actions = np.random.default_rng(seed).integers(0, ACTION_COUNT, steps)
+    ticks = 0
+    start = time.perf_counter()
+    for action in actions:
+        _, _, done, info = env.step(action)
+        ticks += frame_skip
+        if done:
+            env.reset()
+    elapsed = time.perf_counter() - start
+    return steps / elapsed, ticks / elapsed
+
+
+def measure_vector(num_envs, steps, frame_skip, seed):
+    """Return (steps per second, ticks per second, env) of a VectorDuelEnv."""
+    env = VectorDuelEnv(num_envs, seed=seed, frame_skip=frame_skip)
+    env.reset()
+    actions = np.random.default_rng(seed).integers(0, ACTION_COUNT, (steps, num_envs))
+    start = time.perf_counter()
+    for batch in actions:
+        env.step(batch)
+    elapsed = time.perf_counter() - start
+    total = steps * num_envs
+    return total / elapsed, total * frame_skip / elapsed, env
+
+
+def main():
+    """Run the benchmark and print throughput."""
+    parser = argparse.ArgumentParser(description="Duel environment benchmark")
+    parser.add_argument("--envs", type=int, default=16)
+    parser.add_argument("--steps", type=int, default=2000)
+    parser.add_argument("--frame-skip", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(
+        f"Observation: {OBSERVATION_SIZE} floats, actions: {ACTION_COUNT}, "
+        f"frame skip: {args.frame_skip}"
+    )
+    print(f"{'Environment':<16}{'Steps/s':>12}{'Ticks/s':>12}")
+    steps_per_second, ticks_per_second = measure_single(
+        args.steps, args.frame_skip, args.seed
+    )
+    print(f"{'single':<16}{steps_per_second:>12.0f}{ticks_per_second:>12.0f}")
+    steps_per_second, ticks_per_second, env = measure_vector(
+        args.envs, args.steps, args.frame_skip, args.seed
+    )
+    name = f"vector x{args.envs}"
+    print(f"{name:<16}{steps_per_second:>12.0f}{ticks_per_second:>12.0f}")
+    print(f"Episodes finished: {env.episodes}, won by the random agent: {env.wins}")
+
+
+if __name__ == "__main__":
+    main()
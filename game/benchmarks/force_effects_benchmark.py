@@ -0,0 +1,223 @@
+"""
+Force Effects Benchmark
+
+Compares the slot-based Force effect records against the previous design,
+where every effect was a dict with a "type" key and updates went through
+string comparisons and dict lookups. Reports memory per effect and update
+throughput for a mix of force waves, lightning arcs, heal particles and
+thrown lightsabers.
+
+Usage:
+    python benchmarks/force_effects_benchmark.py [--effects N] [--ticks N]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+# Add the src directory to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from force_powers import (
+    ForceWave,
+    LightningArc,
+    HealParticle,
+    LightsaberProjectile,
+)
+
+
+class _Target:
+    """Stand-in entity far away from every projectile."""
+
+    def __init__(self):
+        self.x = -10000
+        self.y = -10000
+
+    def take_damage(self, damage, direction):
+        pass
+
+
+def make_dict_effects(count, owner):
+    """Build effects the way the dict-based design did."""
+    effects = []
+    projectiles = []
+    for i in range(count):
+        kind = i % 4
+        if kind == 0:
+            effects.append(
+                {
+                    "type": "force_wave",
+                    "x": i,
+                    "y": i,
+                    "target_x": i + 50,
+                    "target_y": i,
+                    "color": (100, 150, 255),
+                    "duration": 10**9,
+                }
+            )
+        elif kind == 1:
+            effects.append(
+                {
+                    "type": "lightning",
+                    "x": i,
+                    "y": i,
+                    "target_x": i + 50,
+                    "target_y": i,
+                    "color": (150, 150, 255),
+                    "duration": 10**9,
+                }
+            )
+        elif kind == 2:
+            effects.append(
+                {
+                    "type": "heal_particle",
+                    "x": i,
+                    "y": i,
+                    "color": (100, 255, 100),
+                    "duration": 10**9,
+                }
+            )
+        else:
+            projectiles.append(
+                {
+                    "type": "lightsaber_throw",
+                    "x": i,
+                    "y": i,
+                    "dx": 0.001,
+                    "dy": 0.0,
+                    "angle": 0,
+                    "rotation_speed": 0.3,
+                    "damage": 25,
+                    "owner": owner,
+                    "color": (100, 150, 255),
+                    "duration": 10**9,
+                    "returning": False,
+                }
+            )
+    return effects, projectiles
+
+
+def make_record_effects(count, owner):
+    """Build the same effects as slot-based records."""
+    effects = []
+    projectiles = []
+    for i in range(count):
+        kind = i % 4
+        if kind == 0:
+            effects.append(ForceWave(i, i, i + 50, i, (100, 150, 255), 10**9))
+        elif kind == 1:
+            effects.append(LightningArc(i, i, i + 50, i, (150, 150, 255), 10**9))
+        elif kind == 2:
+            effects.append(HealParticle(i, i, (100, 255, 100), 10**9))
+        else:
+            projectiles.append(
+                LightsaberProjectile(i, i, 0.001, 0.0, 25, owner, (100, 150, 255))
+            )
+            projectiles[-1].duration = 10**9
+    return effects, projectiles
+
+
+def update_dicts(effects, projectiles, entities):
+    """One tick of the dict-based update loop."""
+
+    def update_effect(effect):
+        effect["duration"] = effect.get("duration", 0) - 1
+        return effect["duration"] > 0
+
+    def update_projectile(proj):
+        if proj["type"] == "lightsaber_throw":
+            proj["x"] += proj["dx"]
+            proj["y"] += proj["dy"]
+            proj["angle"] += proj["rotation_speed"]
+            proj["duration"] -= 1
+            for entity in entities:
+                if entity != proj["owner"] and hasattr(entity, "take_damage"):
+                    distance = (
+                        (entity.x - proj["x"]) ** 2 + (entity.y - proj["y"]) ** 2
+                    ) ** 0.5
+                    if distance < 30:
+                        entity.take_damage(proj["damage"], proj["dx"])
+                        return False
+            return proj["duration"] > 0
+        return False
+
+    effects = [effect for effect in effects if update_effect(effect)]
+    projectiles = [proj for proj in projectiles if update_projectile(proj)]
+    return effects, projectiles
+
+
+def update_records(effects, projectiles, entities):
+    """One tick of the record-based update loop (as in ForceManager.update)."""
+    alive_count = 0
+    for effect in effects:
+        if effect.update():
+            effects[alive_count] = effect
+            alive_count += 1
+    del effects[alive_count:]
+
+    alive_count = 0
+    for proj in projectiles:
+        if proj.update(entities):
+            projectiles[alive_count] = proj
+            alive_count += 1
+    del projectiles[alive_count:]
+    return effects, projectiles
+
+
+def measure_memory(factory, count, owner):
+    """Return bytes allocated per effect by a factory."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    effects = factory(count, owner)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del effects
+    return (after - before) / count
+
+
+def measure_throughput(factory, update, count, ticks, owner, entities):
+    """Return effect updates per second."""
+    effects, projectiles = factory(count, owner)
+    start = time.perf_counter()
+    for _ in range(ticks):
+        effects, projectiles = update(effects, projectiles, entities)
+    elapsed = time.perf_counter() - start
+    return count * ticks / elapsed
+
+
+def main():
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description="Force effect storage benchmark")
+    parser.add_argument("--effects", type=int, default=2000)
+    parser.add_argument("--ticks", type=int, default=200)
+    args = parser.parse_args()
+
+    owner = object()
+    entities = [_Target(), _Target()]
+
+    print(f"Effects: {args.effects}, ticks: {args.ticks}")
+    print(f"{'Design':<10}{'Bytes/effect':>14}{'Updates/s':>14}")
+    results = {}
+    for name, factory, update in (
+        ("dict", make_dict_effects, update_dicts),
+        ("slots", make_record_effects, update_records),
+    ):
+        memory = measure_memory(factory, args.effects, owner)
+        throughput = measure_throughput(
+            factory, update, args.effects, args.ticks, owner, entities
+        )
+        results[name] = (memory, throughput)
+        print(f"{name:<10}{memory:>14.0f}{throughput:>14.0f}")
+
+    dict_memory, dict_throughput = results["dict"]
+    slot_memory, slot_throughput = results["slots"]
+    print(
+        f"slots use {slot_memory / dict_memory:.0%} of the memory "
+        f"at {slot_throughput / dict_throughput:.2f}x the throughput"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Pixel Observation Benchmark
+
+Measures the cost of turning a composed game frame into a downscaled pixel
+observation: the straightforward path (scale into a new Surface, copy it
+out with surfarray.array3d, average the channels in floating point) against
+PixelObserver, which scales into a preallocated surface viewed through
+surfarray.pixels3d and stacks frames in place. Also reports the cost of
+composing the frame itself, which both paths pay.
+
+Usage:
+    python benchmarks/pixel_observation_benchmark.py [--size WxH] [--repeat N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add the src directory to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+import pygame
+from duel_env import ACTION_COUNT, DuelEnv
+from pixel_observer import PixelObserver
+
+
+def naive_observation(surface, size, greyscale, smooth):
+    """Downscale surface the allocating way, returning a new array."""
+    scale = pygame.transform.smoothscale if smooth else pygame.transform.scale
+    small = scale(surface, size)
+    pixels = pygame.surfarray.array3d(small).transpose(1, 0, 2)
+    if greyscale:
+        return pixels.mean(axis=2).astype(np.uint8)
+    return pixels.copy()
+
+
+def per_call(function, repeat):
+    """Return microseconds per call of function."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main():
+    """Run the benchmark and print the cost of each path."""
+    parser = argparse.ArgumentParser(description="Pixel observation benchmark")
+    parser.add_argument("--size", default="84x84")
+    parser.add_argument("--repeat", type=int, default=500)
+    parser.add_argument("--warmup", type=int, default=120)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    size = tuple(int(value) for value in args.size.split("x"))
+
+    # A frame from the middle of a match
+    env = DuelEnv(seed=args.seed)
+    env.reset()
+    actions = np.random.default_rng(args.seed).integers(0, ACTION_COUNT, args.warmup)
+    for action in actions:
+        env.step(action)
+    surface = env.render()
+
+    print(f"Frame: {surface.get_size()} -> {size}")
+    print(f"{'Path':<28}{'us each':>10}")
+    print(f"{'compose frame':<28}{per_call(env.render, args.repeat // 5):>10.1f}")
+    for greyscale in (True, False):
+        for smooth in (False, True):
+            observer = PixelObserver(size, greyscale, smooth=smooth)
+            observer.reset(surface)
+            label = ("grey" if greyscale else "rgb") + (" smooth" if smooth else "")
+            naive = per_call(
+                lambda: naive_observation(surface, size, greyscale, smooth),
+                args.repeat,
+            )
+            viewed = per_call(lambda: observer.capture(surface), args.repeat)
+            print(f"{'naive ' + label:<28}{naive:>10.1f}")
+            print(f"{'observer ' + label:<28}{viewed:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+World Snapshot Benchmark
+
+Measures the binary world snapshot format on states taken from a real
+match (a scripted bot against the enemy AI, so bullets, Force effects and
+lightsaber attacks are in flight): snapshot size with and without the
+random streams and after zlib compression, compared with pickling the
+same objects, and encode, decode and zero-copy view throughput.
+
+Usage:
+    python benchmarks/world_snapshot_benchmark.py [--ticks N] [--mode MODE]
+"""
+
+import argparse
+import os
+import pickle
+import sys
+import time
+import zlib
+
+# Add the src directory to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from event_bus import frame_events
+from game_engine import GameEngine
+from random_streams import rng_streams
+from self_play import ArenaBot
+from world_snapshot import (
+    RANDOM_STREAMS,
+    WorldView,
+    decode_world,
+    encode_world,
+    fighter_table,
+)
+
+
+def play_states(engine, ticks, step):
+    """Play a match and return the snapshot taken every step ticks."""
+    bot = ArenaBot(7)
+    snapshots = []
+    for tick in range(ticks):
+        engine._simulate_tick(bot.frame(engine.player1, engine.enemy))
+        frame_events.clear()
+        if tick % step == 0:
+            snapshots.append(encode_world(engine))
+    return snapshots
+
+
+def pickle_world(engine):
+    """Pickle the objects a snapshot stores, for comparison."""
+    fighters = fighter_table(engine)
+    saved_keys = [fighter.last_keys for fighter in fighters[:2] if fighter]
+    for fighter in fighters[:2]:
+        if fighter:
+            fighter.last_keys = None  # Held keys are not part of a snapshot
+    force = engine.force_manager
+    combat = engine.lightsaber_combat
+    state = {
+        "fighters": fighters,
+        "bullets": engine.bullets,
+        "cooldowns": [
+            power.current_cooldown
+            for powers in (force.jedi_powers, force.sith_powers)
+            for power in powers.values()
+        ],
+        "effects": force.active_effects,
+        "projectiles": force.active_projectiles,
+        "attacks": combat.active_attacks,
+        "blocks": combat.active_blocks,
+        "clashes": combat.active_clashes,
+        "mode": engine.game_mode_manager.mode_data,
+        "random": [getattr(rng_streams, name).getstate() for name in RANDOM_STREAMS],
+    }
+    data = pickle.dumps(state, pickle.HIGHEST_PROTOCOL)
+    for fighter, keys in zip([f for f in fighters[:2] if f], saved_keys):
+        fighter.last_keys = keys
+    return data
+
+
+def rate(function, items, repeat):
+    """Return calls per second of function over items."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for item in items:
+            function(item)
+    return len(items) * repeat / (time.perf_counter() - start)
+
+
+def main():
+    """Run the benchmark and print sizes and throughput."""
+    parser = argparse.ArgumentParser(description="World snapshot benchmark")
+    parser.add_argument("--ticks", type=int, default=1800)
+    parser.add_argument("--step", type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--mode", default="force_arena")
+    args = parser.parse_args()
+
+    engine = GameEngine(seed=1, headless=True)
+    engine.two_player_mode = False
+    engine.current_game_mode = args.mode
+    engine.character_selections = {"player1": "luke_skywalker", "ai": "darth_vader"}
+    engine._initialize_game(11)
+    snapshots = play_states(engine, args.ticks, args.step)
+
+    # Sizes over the same states, restoring each in turn
+    sizes = {"snapshot": 0, "no random": 0, "zlib": 0, "pickle": 0}
+    for data in snapshots:
+        decode_world(data, engine)
+        sizes["snapshot"] += len(data)
+        sizes["no random"] += len(encode_world(engine, include_random=False))
+        sizes["zlib"] += len(zlib.compress(data))
+        sizes["pickle"] += len(pickle_world(engine))
+    print(f"Mode: {args.mode}, states: {len(snapshots)}")
+    print(f"{'Format':<12}{'Bytes/state':>14}")
+    for name, total in sizes.items():
+        print(f"{name:<12}{total / len(snapshots):>14.0f}")
+
+    print(f"{'Operation':<12}{'Per second':>14}{'us each':>10}")
+    results = (
+        ("encode", rate(lambda data: encode_world(engine), snapshots, args.repeat)),
+        (
+            "decode",
+            rate(lambda data: decode_world(data, engine), snapshots, args.repeat),
+        ),
+        (
+            "view",
+            rate(
+                lambda data: WorldView(data).fighter_positions(),
+                snapshots,
+                args.repeat,
+            ),
+        ),
+        ("pickle", rate(lambda data: pickle_world(engine), snapshots, args.repeat)),
+    )
+    for name, per_second in results:
+        print(f"{name:<12}{per_second:>14.0f}{1e6 / per_second:>10.1f}")
+    print(
+        f"snapshots are {sizes['snapshot'] / sizes['pickle']:.0%} of the pickle "
+        f"size ({sizes['no random'] / len(snapshots):.0f} bytes without the "
+        "random streams)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,30 @@
 #!/usr/bin/env python3
 """
-2D Platform Shooter Launcher
+Game Launcher Hub
 
-Simple launcher for the 2D Platform Shooter game.
+Runs every game in this process as a scene: the Star Wars platform shooter
+and the class3 arcade games (Flappy Bird, Brick Breaker and the class3-3
+shooter). pygame, the window and the font, sprite and sound caches stay
+warm between games, so after a title's first launch switching to it takes
+milliseconds instead of a fresh interpreter start.
+
+Closing a game's window returns to the hub; closing the hub exits.
 """
 
 import pygame
 import sys
 import os
-import subprocess
+import importlib.util
+
+# Pre-initialize mixer the same way main.py does
+pygame.mixer.pre_init(44100, -16, 2, 1024)
 
 # Initialize Pygame for the launcher
 pygame.init()
 
 # Screen dimensions
 SCREEN_WIDTH = 600
-SCREEN_HEIGHT = 400
+SCREEN_HEIGHT = 480
 
 # Colors
 WHITE = (255, 255, 255)
@@ -24,13 +33,17 @@ BLUE = (0, 100, 200)
 LIGHT_BLUE = (100, 150, 250)
 GRAY = (128, 128, 128)
 
+LAUNCHER_DIR = os.path.dirname(os.path.abspath(__file__))
+CLASS3_DIR = os.path.join(LAUNCHER_DIR, "..", "class3")
+
 # Set up the display
 screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption("2D Platform Shooter")
+pygame.display.set_caption("Game Launcher")
 
 clock = pygame.time.Clock()
 font_title = pygame.font.SysFont(None, 48)
 font_button = pygame.font.SysFont(None, 32)
+font_small = pygame.font.SysFont(None, 24)
 
 
 def draw_button(surface, text, x, y, width, height, color=LIGHT_BLUE):
@@ -47,96 +60,148 @@ def draw_button(surface, text, x, y, width, height, color=LIGHT_BLUE):
     return button_rect
 
 
-def run_game():
-    """Run the platform shooter game."""
+def load_module(name, path):
+    """
+    Import a game script by path, once.
+
+    The class3 file names contain hyphens, so they cannot be imported by
+    name. Modules stay in sys.modules, keeping their fonts and state warm
+    for the next launch.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+class Scene:
+    """A game the hub can run in-process."""
+
+    def __init__(self, title, start):
+        """
+        Args:
+            title (str): Button label
+            start (callable): Runs the game until its window is closed
+        """
+        self.title = title
+        self.start = start
+
+
+class StarWarsScene(Scene):
+    """The Star Wars platform shooter, keeping one engine across launches."""
+
+    def __init__(self):
+        super().__init__("Star Wars Battle", self.run)
+        self.engine = None
+
+    def run(self):
+        """Run the engine's menus and matches until its window is closed."""
+        star_wars = load_module("main", os.path.join(LAUNCHER_DIR, "main.py"))
+        if self.engine is None:
+            self.engine = star_wars.create_engine()
+        star_wars.start_music()
+        try:
+            self.engine.run()
+        finally:
+            pygame.mixer.music.stop()
+
+
+def class3_scene(title, filename):
+    """Create a scene for a class3 game whose main() returns on window close."""
+    module_name = "class3_" + os.path.splitext(filename)[0].replace("-", "_")
+    path = os.path.join(CLASS3_DIR, filename)
+    return Scene(title, lambda: load_module(module_name, path).main())
+
+
+SCENES = [
+    StarWarsScene(),
+    class3_scene("Flappy Bird", "flappy_bird.py"),
+    class3_scene("Brick Breaker", "class3-4.py"),
+    class3_scene("Arena Shooter", "class3-3.py"),
+]
+
+
+def run_scene(scene):
+    """Run a scene in this process, then restore the hub display."""
+    global screen
     try:
-        # Get the directory of this launcher script
-        launcher_dir = os.path.dirname(os.path.abspath(__file__))
-        game_path = os.path.join(launcher_dir, "main.py")
-
-        if os.path.exists(game_path):
-            # Close the launcher
-            pygame.quit()
-
-            # Run the game
-            subprocess.run([sys.executable, game_path])
-
-            # Restart the launcher after the game closes
-            main()
-        else:
-            print(f"Game not found: {game_path}")
+        scene.start()
     except Exception as e:
-        print(f"Error running game: {e}")
+        print(f"Error running {scene.title}: {e}")
+
+    # Back to the hub window
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption("Game Launcher")
+    pygame.event.clear()
 
 
 def main():
     """Main launcher loop."""
-    pygame.init()
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-    pygame.display.set_caption("2D Platform Shooter")
-
     running = True
 
     while running:
-        # Handle events
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                mouse_pos = pygame.mouse.get_pos()
-
-                # Check button clicks
-                if start_button.collidepoint(mouse_pos):
-                    run_game()
-                elif quit_button.collidepoint(mouse_pos):
-                    running = False
-
         # Clear screen
         screen.fill(WHITE)
 
         # Draw title
-        title_text = font_title.render("2D Platform Shooter", True, BLACK)
+        title_text = font_title.render("Game Launcher", True, BLACK)
         title_x = (SCREEN_WIDTH - title_text.get_width()) // 2
-        screen.blit(title_text, (title_x, 50))
+        screen.blit(title_text, (title_x, 40))
 
         # Draw subtitle
-        subtitle_text = font_button.render("Fast-paced action platformer", True, GRAY)
+        subtitle_text = font_button.render("Choose a game to play", True, GRAY)
         subtitle_x = (SCREEN_WIDTH - subtitle_text.get_width()) // 2
-        screen.blit(subtitle_text, (subtitle_x, 100))
+        screen.blit(subtitle_text, (subtitle_x, 90))
 
         # Draw buttons
-        button_width = 200
-        button_height = 50
+        button_width = 240
+        button_height = 44
         button_x = (SCREEN_WIDTH - button_width) // 2
 
-        start_button = draw_button(
-            screen, "Start Game", button_x, 180, button_width, button_height
-        )
+        scene_buttons = []
+        for i, scene in enumerate(SCENES):
+            button = draw_button(
+                screen, scene.title, button_x, 140 + i * 56, button_width, button_height
+            )
+            scene_buttons.append((button, scene))
 
         quit_button = draw_button(
-            screen, "Quit", button_x, 250, button_width, button_height, GRAY
+            screen,
+            "Quit",
+            button_x,
+            140 + len(SCENES) * 56,
+            button_width,
+            button_height,
+            GRAY,
         )
 
-        # Draw instructions
-        instructions = [
-            "Controls:",
-            "• WASD keys to move",
-            "• Space to jump",
-            "• Mouse to aim and shoot",
-            "• 1/2 keys to switch weapons",
-        ]
-
-        for i, instruction in enumerate(instructions):
-            color = BLACK if i == 0 else GRAY
-            text = (
-                font_button.render(instruction, True, color)
-                if i == 0
-                else pygame.font.SysFont(None, 24).render(instruction, True, color)
-            )
-            screen.blit(text, (20, 320 + i * 25))
+        # Draw hint
+        hint_text = font_small.render(
+            "Close a game's window to come back here", True, GRAY
+        )
+        screen.blit(hint_text, (20, SCREEN_HEIGHT - 36))
 
         pygame.display.flip()
+
+        # Handle events
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+
+            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                mouse_pos = pygame.mouse.get_pos()
+
+                # Check button clicks
+                if quit_button.collidepoint(mouse_pos):
+                    running = False
+                for button, scene in scene_buttons:
+                    if button.collidepoint(mouse_pos):
+                        run_scene(scene)
+                        break
+
         clock.tick(60)
 
     pygame.quit()
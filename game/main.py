@@ -13,6 +13,34 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
 
 from game_engine import GameEngine
+from config import RECORD_REPLAYS, REPLAY_DIRECTORY
+
+
+def start_music():
+    """Start the Imperial March background music, looping, if available."""
+    music_path = os.path.join(
+        os.path.dirname(__file__), "assets", "music", "imperial_march.mp3"
+    )
+    if os.path.exists(music_path):
+        try:
+            pygame.mixer.music.load(music_path)
+            pygame.mixer.music.set_volume(
+                1.0
+            )  # Set volume to 100% - MAXIMUM Imperial March power!
+            pygame.mixer.music.play(-1)  # Loop forever
+            print("Imperial March music started! ⚔️ The Empire Strikes Back! ⚔️")
+        except Exception as music_error:
+            print(f"Failed to play Imperial March: {music_error}")
+    else:
+        print("Imperial March music file not found")
+
+
+def create_engine():
+    """Create the game engine (recording every match for replay.py)."""
+    replay_dir = None
+    if RECORD_REPLAYS:
+        replay_dir = os.path.join(os.path.dirname(__file__), REPLAY_DIRECTORY)
+    return GameEngine(replay_dir=replay_dir)
 
 
 def main():
@@ -23,33 +51,16 @@ def main():
         pygame.init()
 
         try:
+            # Channels are allocated per sound category by the SoundManager
             pygame.mixer.init()
-            # Set mixer channels for sound effects
-            pygame.mixer.set_num_channels(8)
         except Exception as mixer_error:
             print(f"Failed to initialize mixer: {mixer_error}")
 
         # Load Imperial March background music
-        music_path = os.path.join(
-            os.path.dirname(__file__), "assets", "music", "imperial_march.mp3"
-        )
-        if os.path.exists(music_path):
-            try:
-                pygame.mixer.music.load(music_path)
-                pygame.mixer.music.set_volume(
-                    1.0
-                )  # Set volume to 100% - MAXIMUM Imperial March power!
-                pygame.mixer.music.play(-1)  # Loop forever
-                print("Imperial March music started! ⚔️ The Empire Strikes Back! ⚔️")
-            except Exception as music_error:
-                print(f"Failed to play Imperial March: {music_error}")
-        else:
-            print("Imperial March music file not found")
-
-        # Initialize the game engine
-        game = GameEngine()
-
-        # Start the game loop
+        start_music()
+
+        # Initialize the game engine and start the game loop
+        game = create_engine()
         game.run()
 
     except KeyboardInterrupt:
@@ -0,0 +1,164 @@
+"""
+Online Multiplayer
+
+Runs a networked two-player match: a server that simulates the match and
+streams snapshots, a windowed client that joins it, or a loopback session
+that plays a server and two scripted clients over 127.0.0.1 with simulated
+latency and packet loss and reports bandwidth and latency. The rollback
+command tests rollback netcode the same way with two peers.
+
+Usage:
+    python online.py server
+    python online.py client 192.168.1.20
+    python online.py loopback --latency 80 --loss 0.1 --seconds 60
+    python online.py rollback --latency 40 --loss 0.05
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+# Add the src directory to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+from config import (
+    NET_LOOPBACK_JITTER,
+    NET_LOOPBACK_LATENCY,
+    NET_LOOPBACK_LOSS,
+    NET_PORT,
+    NET_SNAPSHOT_HZ,
+    ROLLBACK_INPUT_DELAY,
+    ROLLBACK_MAX_FRAMES,
+)
+
+
+def main():
+    """Run a server, a client or a loopback session."""
+    parser = argparse.ArgumentParser(description="Play a match over the network")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    server = commands.add_parser("server", help="Host a match")
+    server.add_argument("--port", type=int, default=NET_PORT, help="UDP port")
+    server.add_argument("--mode", default="classic", help="Game mode")
+    server.add_argument(
+        "--characters",
+        nargs=2,
+        default=("jedi", "sith"),
+        metavar=("PLAYER1", "PLAYER2"),
+        help="Character of each seat (jedi, sith or a legendary key)",
+    )
+    server.add_argument("--seconds", type=float, help="Stop after this long")
+
+    client = commands.add_parser("client", help="Join a match")
+    client.add_argument("host", help="Server host name or address")
+    client.add_argument("--port", type=int, default=NET_PORT, help="UDP port")
+
+    loopback = commands.add_parser(
+        "loopback", help="Measure a session with simulated network conditions"
+    )
+    rollback = commands.add_parser(
+        "rollback", help="Test rollback netcode with simulated network conditions"
+    )
+    for command in (loopback, rollback):
+        command.add_argument(
+            "--seconds", type=float, default=30.0, help="Simulated session length"
+        )
+        command.add_argument(
+            "--latency",
+            type=float,
+            default=NET_LOOPBACK_LATENCY * 1000,
+            help="One-way latency in milliseconds",
+        )
+        command.add_argument(
+            "--jitter",
+            type=float,
+            default=NET_LOOPBACK_JITTER * 1000,
+            help="Random extra one-way delay in milliseconds",
+        )
+        command.add_argument(
+            "--loss",
+            type=float,
+            default=NET_LOOPBACK_LOSS,
+            help="Share of datagrams dropped in each direction",
+        )
+        command.add_argument("--seed", type=int, default=0, help="Seed")
+        command.add_argument("--out", help="Write the report to this JSON file")
+    loopback.add_argument(
+        "--rate", type=int, default=NET_SNAPSHOT_HZ, help="Snapshots per second"
+    )
+    rollback.add_argument(
+        "--delay",
+        type=int,
+        default=ROLLBACK_INPUT_DELAY,
+        help="Frames local input is held back",
+    )
+    rollback.add_argument(
+        "--max-rollback",
+        type=int,
+        default=ROLLBACK_MAX_FRAMES,
+        help="Most frames a peer runs ahead of the remote input",
+    )
+    args = parser.parse_args()
+
+    headless = args.command != "client"
+    from game_engine import GameEngine
+    import net_session
+
+    engine = GameEngine(headless=headless)
+
+    if args.command == "server":
+        player1, player2 = args.characters
+        print(f"Serving on UDP port {args.port}")
+        try:
+            net_session.serve(
+                engine,
+                args.port,
+                args.seconds,
+                args.mode,
+                {"player1": player1, "player2": player2},
+            )
+        except KeyboardInterrupt:
+            pass
+
+    elif args.command == "client":
+        started = time.perf_counter()
+        client = net_session.play_online(engine, args.host, args.port)
+        print(json.dumps(client.report(time.perf_counter() - started), indent=2))
+
+    elif args.command == "rollback":
+        from rollback import format_rollback_report, run_rollback_test
+
+        report = run_rollback_test(
+            (engine, GameEngine(headless=True)),
+            seconds=args.seconds,
+            latency=args.latency / 1000,
+            jitter=args.jitter / 1000,
+            loss=args.loss,
+            input_delay=args.delay,
+            max_rollback=args.max_rollback,
+            seed=args.seed,
+        )
+        print(format_rollback_report(report))
+
+    else:
+        report = net_session.run_loopback(
+            engine,
+            seconds=args.seconds,
+            latency=args.latency / 1000,
+            jitter=args.jitter / 1000,
+            loss=args.loss,
+            snapshot_hz=args.rate,
+            seed=args.seed,
+        )
+        print(net_session.format_loopback_report(report))
+
+    if args.command in ("loopback", "rollback") and args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Replay Runner
+
+Plays back a match recorded by the game. With --headless the match is
+simulated without a window or frame limit, which makes it a reproducible
+workload for profiling the simulation.
+
+Usage:
+    python replay.py replays/<file>.swr
+    python replay.py replays/<file>.swr --headless --profile
+"""
+
+import argparse
+import cProfile
+import pstats
+import sys
+import os
+import time
+
+# Add the src directory to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+from config import FPS
+
+
+def main():
+    """Replay a recorded match and report timing."""
+    parser = argparse.ArgumentParser(description="Replay a recorded match")
+    parser.add_argument("path", help="Replay file (.swr)")
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="Simulate without rendering, as fast as possible",
+    )
+    parser.add_argument(
+        "--profile", action="store_true", help="Profile the replay with cProfile"
+    )
+    args = parser.parse_args()
+
+    from game_engine import GameEngine
+
+    game = GameEngine(headless=args.headless)
+
+    profiler = cProfile.Profile() if args.profile else None
+    start = time.perf_counter()
+    if profiler:
+        profiler.enable()
+    winner, ticks = game.play_replay(args.path, render=not args.headless)
+    if profiler:
+        profiler.disable()
+    elapsed = time.perf_counter() - start
+
+    ticks_per_second = ticks / elapsed if elapsed > 0 else 0
+    print(f"Ticks:          {ticks}")
+    print(f"Wall time:      {elapsed:.3f}s")
+    print(f"Ticks/second:   {ticks_per_second:.0f}")
+    print(f"Realtime factor: {ticks_per_second / FPS:.1f}x")
+    print(f"Winner:         {winner or 'none (replay ended)'}")
+    print(f"Checksum:       {game.simulation_checksum():08x}")
+
+    if profiler:
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(25)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Asset Loader
+
+Runs slow asset work (sound decoding, sprite generation) on a background
+worker thread so the first menu is interactive straight away, and exposes
+per-job readiness and overall progress. Compressed sounds are decoded once
+and their PCM samples cached on disk, so later launches skip MP3 decoding.
+"""
+
+import os
+import queue
+import threading
+import pygame
+
+# Sound formats that are worth caching as decoded PCM
+COMPRESSED_SOUND_EXTENSIONS = (".mp3", ".ogg", ".flac")
+
+
+class AssetLoader:
+    """Background worker that runs named loading jobs in submission order."""
+
+    def __init__(self):
+        self.jobs = queue.Queue()
+        self.lock = threading.Lock()
+        self.done_events = {}  # job name -> threading.Event
+        self.results = {}
+        self.errors = {}
+        self.total = 0
+        self.completed = 0
+        self.worker = None
+
+    def start(self):
+        """Start the worker thread (once)."""
+        with self.lock:
+            if self.worker is None:
+                self.worker = threading.Thread(
+                    target=self._run, name="asset-loader", daemon=True
+                )
+                self.worker.start()
+
+    def submit(self, name, job):
+        """
+        Queue a job to run on the worker.
+
+        Args:
+            name (str): Name used to query readiness and the result
+            job (callable): Function taking no arguments
+        """
+        with self.lock:
+            self.done_events[name] = threading.Event()
+            self.total += 1
+        self.jobs.put((name, job))
+        self.start()
+
+    def _run(self):
+        """Worker loop: run jobs forever, recording results and errors."""
+        while True:
+            name, job = self.jobs.get()
+            try:
+                result = job()
+                with self.lock:
+                    self.results[name] = result
+            except Exception as e:
+                print(f"Asset job '{name}' failed: {e}")
+                with self.lock:
+                    self.errors[name] = e
+            with self.lock:
+                self.completed += 1
+            self.done_events[name].set()
+
+    def is_ready(self, name):
+        """Check whether a job has finished (successfully or not)."""
+        event = self.done_events.get(name)
+        return event is not None and event.is_set()
+
+    def wait(self, name, timeout=None):
+        """Block until a job has finished. Returns False on timeout."""
+        event = self.done_events.get(name)
+        return event is None or event.wait(timeout)
+
+    def result(self, name):
+        """Return a finished job's result, or None."""
+        return self.results.get(name)
+
+    def progress(self):
+        """Return the fraction of submitted jobs that have finished."""
+        with self.lock:
+            if self.total == 0:
+                return 1.0
+            return self.completed / self.total
+
+    def all_ready(self):
+        """Check whether every submitted job has finished."""
+        return self.progress() >= 1.0
+
+
+def _pcm_cache_path(path, cache_dir):
+    """Build the cache file name for a decoded sound.
+
+    The name includes the source file's size and modification time, so a
+    changed file is decoded again, and the mixer format, because raw
+    samples are only valid for the format they were decoded to.
+    """
+    stat = os.stat(path)
+    frequency, size, channels = pygame.mixer.get_init()
+    name = os.path.basename(path)
+    return os.path.join(
+        cache_dir,
+        f"{name}.{stat.st_size}.{int(stat.st_mtime)}"
+        f".{frequency}_{size}_{channels}.pcm",
+    )
+
+
+def load_sound(path, cache_dir=None):
+    """
+    Load a sound, using the decoded-PCM disk cache for compressed formats.
+
+    Args:
+        path (str): Sound file
+        cache_dir (str): Directory for decoded PCM, or None to not cache
+
+    Returns:
+        pygame.mixer.Sound: The loaded sound
+    """
+    if (
+        cache_dir is None
+        or not pygame.mixer.get_init()
+        or not path.lower().endswith(COMPRESSED_SOUND_EXTENSIONS)
+    ):
+        return pygame.mixer.Sound(path)
+
+    cache_path = _pcm_cache_path(path, cache_dir)
+    if os.path.exists(cache_path):
+        with open(cache_path, "rb") as cache_file:
+            return pygame.mixer.Sound(buffer=cache_file.read())
+
+    sound = pygame.mixer.Sound(path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write to a temporary name first so a crash never leaves a torn file
+        temp_path = cache_path + ".tmp"
+        with open(temp_path, "wb") as cache_file:
+            cache_file.write(sound.get_raw())
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        print(f"Could not cache decoded sound {path}: {e}")
+    return sound
+
+
+# Global asset loader instance
+asset_loader = AssetLoader()
@@ -0,0 +1,117 @@
+"""
+Continuous Collision
+
+Swept collision tests that find the time of impact of a moving box or point
+within a single tick. Fast bullets, thrown lightsabers and falling entities
+use them so they cannot tunnel through thin targets or platforms, whatever
+their speed, without sub-stepping the simulation.
+
+Times of impact are fractions of the tick's movement: 0.0 is the start
+position and 1.0 the end position.
+"""
+
+import math
+
+
+def _axis_times(start_min, start_max, delta, target_min, target_max):
+    """Return the entry and exit times of one axis of a swept box."""
+    if delta > 0:
+        return (target_min - start_max) / delta, (target_max - start_min) / delta
+    if delta < 0:
+        return (target_max - start_min) / delta, (target_min - start_max) / delta
+    if start_max <= target_min or start_min >= target_max:
+        return None
+    return -math.inf, math.inf
+
+
+def sweep_box(x, y, width, height, dx, dy, target):
+    """
+    Find when a box moving by (dx, dy) first touches a target rectangle.
+
+    Args:
+        x (float): Box left at the start of the move
+        y (float): Box top at the start of the move
+        width (float): Box width
+        height (float): Box height
+        dx (float): Horizontal movement this tick
+        dy (float): Vertical movement this tick
+        target (pygame.Rect): Stationary rectangle to test against
+
+    Returns:
+        float: Time of impact in [0, 1] (0 if already overlapping), or None
+    """
+    x_times = _axis_times(x, x + width, dx, target.left, target.right)
+    if x_times is None:
+        return None
+    y_times = _axis_times(y, y + height, dy, target.top, target.bottom)
+    if y_times is None:
+        return None
+
+    entry = max(x_times[0], y_times[0])
+    exit_time = min(x_times[1], y_times[1])
+    if entry >= exit_time or entry >= 1.0 or exit_time <= 0.0:
+        return None
+    return max(entry, 0.0)
+
+
+def sweep_point(x, y, dx, dy, center_x, center_y, radius):
+    """
+    Find when a point moving by (dx, dy) first comes within radius of a center.
+
+    Args:
+        x (float): Point x at the start of the move
+        y (float): Point y at the start of the move
+        dx (float): Horizontal movement this tick
+        dy (float): Vertical movement this tick
+        center_x (float): Target x
+        center_y (float): Target y
+        radius (float): Hit distance
+
+    Returns:
+        float: Time of impact in [0, 1] (0 if already inside), or None
+    """
+    offset_x = x - center_x
+    offset_y = y - center_y
+    c = offset_x * offset_x + offset_y * offset_y - radius * radius
+    if c < 0:
+        return 0.0
+
+    a = dx * dx + dy * dy
+    if a == 0:
+        return None
+    b = offset_x * dx + offset_y * dy
+    if b >= 0:
+        return None  # Moving away from the target
+
+    discriminant = b * b - a * c
+    if discriminant < 0:
+        return None
+    toi = (-b - math.sqrt(discriminant)) / a
+    return toi if toi <= 1.0 else None
+
+
+def first_platform_hit(x, y, size, dy, platforms):
+    """
+    Find the first platform a falling square lands on this tick.
+
+    Args:
+        x (float): Entity left
+        y (float): Entity top at the start of the tick
+        size (int): Entity size
+        dy (float): Vertical velocity (only downward movement lands)
+        platforms (list): pygame.Rect platforms
+
+    Returns:
+        pygame.Rect: The platform hit first, or None
+    """
+    if dy < 0:
+        return None
+
+    first_platform = None
+    first_toi = 2.0
+    for platform in platforms:
+        toi = sweep_box(x, y, size, size, 0, dy, platform)
+        if toi is not None and toi < first_toi:
+            first_toi = toi
+            first_platform = platform
+    return first_platform
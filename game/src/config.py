@@ -12,6 +12,65 @@ WINDOW_TITLE = "2D Platform Shooter"
 FPS = 60
 FULLSCREEN_ENABLED = False  # Default to windowed mode
 
+# === Timing Configuration ===
+# Speeds, cooldowns, reload timers and regen rates are all tuned per tick
+SIMULATION_HZ = 60  # Fixed simulation ticks per second
+RENDER_FPS = 144  # Render frame cap; frames between ticks are interpolated
+MAX_FRAME_TIME = 0.25  # Longest frame (seconds) fed to the simulation
+MAX_TICKS_PER_FRAME = 5  # Catch-up limit before owed simulation time is dropped
+FRAME_HISTOGRAM_BUCKETS_MS = (4, 8, 12, 17, 25, 33, 50, 100)
+FRAME_TIME_REPORT = False  # Print a frame-time histogram after each match
+
+# === Quality Governor Configuration ===
+QUALITY_GOVERNOR_ENABLED = True
+QUALITY_FRAME_BUDGET_MS = 1000 / FPS  # Work time allowed per rendered frame
+QUALITY_WINDOW_FRAMES = 30  # Rolling window of frame work times
+QUALITY_HEADROOM = 0.6  # Raise quality when the rolling mean is below this share
+QUALITY_UPGRADE_FRAMES = 180  # Frames of headroom needed before raising quality
+
+# Quality levels from best to cheapest. particles scales muzzle flash and
+# explosion particle counts, trail_particles is spawned per bullet per tick,
+# glow_layers caps lightsaber clash and block glow layers, and shake is
+# "layer" (shaken world layer), "scroll" (scroll the frame in place) or "off"
+QUALITY_LEVELS = (
+    {
+        "name": "high",
+        "particles": 1.0,
+        "trail_particles": 3,
+        "glow_layers": 8,
+        "environment_density": 1.0,
+        "smooth_scaling": True,
+        "shake": "layer",
+    },
+    {
+        "name": "medium",
+        "particles": 0.6,
+        "trail_particles": 2,
+        "glow_layers": 4,
+        "environment_density": 0.5,
+        "smooth_scaling": False,
+        "shake": "layer",
+    },
+    {
+        "name": "low",
+        "particles": 0.35,
+        "trail_particles": 1,
+        "glow_layers": 2,
+        "environment_density": 0.25,
+        "smooth_scaling": False,
+        "shake": "scroll",
+    },
+    {
+        "name": "minimal",
+        "particles": 0.15,
+        "trail_particles": 0,
+        "glow_layers": 1,
+        "environment_density": 0.0,
+        "smooth_scaling": False,
+        "shake": "off",
+    },
+)
+
 # === Player Configuration ===
 PLAYER_SIZE = 40
 PLAYER_COLOR = (0, 0, 0)  # Black
@@ -105,11 +164,117 @@ DIFFICULTY_LEVELS = {
     },
 }
 
+# === Replay Configuration ===
+RECORD_REPLAYS = True  # Record the input stream of every match
+REPLAY_DIRECTORY = "replays"  # Relative to the game directory
+REPLAY_KEEP_LAST = 20  # Older recordings are deleted
+
+# === Audio Configuration ===
+# Mixer channels reserved for each sound category
+AUDIO_CHANNEL_GROUPS = {
+    "weapons": 6,
+    "impacts": 6,
+    "ui": 2,
+    "voice": 2,
+}
+
+# Per-sound category, priority (higher steals from lower), maximum
+# simultaneous voices and base volume
+SOUND_SETTINGS = {
+    "shoot": {"category": "weapons", "priority": 2, "max_voices": 4, "volume": 0.2},
+    "damage": {"category": "impacts", "priority": 3, "max_voices": 3, "volume": 1.0},
+    "jump": {"category": "voice", "priority": 1, "max_voices": 2, "volume": 1.0},
+    "game_over": {"category": "ui", "priority": 5, "max_voices": 1, "volume": 1.0},
+}
+
+# === Effect Budget Configuration ===
+PARTICLE_BUDGET = 1200  # All particle_system particles together
+# Per-category particle budgets, and priorities (lowest is evicted first
+# when the global budget is full)
+PARTICLE_CATEGORY_BUDGETS = {"trail": 300, "smoke": 150, "debris": 250, "spark": 700}
+PARTICLE_PRIORITIES = {"trail": 0, "smoke": 1, "debris": 2, "spark": 3}
+AMBIENT_PARTICLE_BUDGET = 250  # Environment particles (sand, snow, leaves)
+FORCE_EFFECT_BUDGET = 64  # Visual Force effects (waves, arcs, heal sparkles)
+FLOATING_TEXT_BUDGET = 16  # Floating UI texts; the oldest make way
+DAMAGE_INDICATOR_BUDGET = 40  # Damage numbers; the oldest make way
+
+# === Arena Configuration ===
+ARENA_SEED = 1977  # Master seed; every match seed is derived from it
+ARENA_MATCHES_PER_PAIRING = 4  # Per character pairing and game mode
+ARENA_MATCH_SECONDS = 90  # Simulated time before a match counts as a draw
+ARENA_DIFFICULTY = "Medium"  # Enemy AI difficulty
+ARENA_BATCH_SIZE = 4  # Matches per worker task, returned as one merged result
+ARENA_BOT_REACTION = 0.25  # Chance per tick that the scripted bot acts
+
+# === Stat Balancer Configuration ===
+# Searched range and step of each legendary character stat
+BALANCE_STAT_BOUNDS = {
+    "health": (60, 200, 5),
+    "force_energy": (50, 200, 5),
+    "speed": (3, 9, 0.5),
+    "force_regen": (0.5, 4.0, 0.1),
+    "lightsaber_damage": (10, 45, 1),
+    "force_power_bonus": (0.6, 2.0, 0.05),
+}
+BALANCE_MODES = ("classic",)  # Game modes the win rates are measured in
+BALANCE_POPULATION = 8  # Candidate tables per generation
+BALANCE_GENERATIONS = 12
+BALANCE_MATCHES = 2  # Matches per pairing, seat and mode while searching
+BALANCE_CONFIRM_MATCHES = 8  # Matches per pairing for the final estimate
+BALANCE_STEP_SIZE = 0.15  # Initial search step, as a fraction of each range
+BALANCE_ANCHOR_WEIGHT = 0.05  # Penalty for moving away from the current stats
+BALANCE_CONFIDENCE_Z = 1.96  # 95% confidence intervals
+
+# === Network Configuration ===
+NET_PORT = 47777  # UDP port the match server listens on
+NET_PROTOCOL_VERSION = 1
+NET_SNAPSHOT_HZ = 20  # State snapshots sent to each client per second
+NET_SNAPSHOT_HISTORY = 32  # Sent snapshots kept as delta baselines
+NET_POSITION_SCALE = 4  # Positions are sent in 1/4 pixel steps
+NET_VELOCITY_SCALE = 16  # Velocities are sent in 1/16 pixel per tick steps
+NET_INPUT_REDUNDANCY = 4  # Unacknowledged inputs repeated in every input packet
+NET_INTERPOLATION_DELAY = 0.1  # Seconds clients render behind the newest snapshot
+NET_TIMEOUT = 5.0  # Seconds of silence before a peer is dropped
+NET_MAX_PACKET = 1200  # Largest datagram sent, below common path MTUs
+NET_LOOPBACK_LATENCY = 0.05  # One-way delay simulated on the loopback link
+NET_LOOPBACK_JITTER = 0.01  # Random extra one-way delay, up to this many seconds
+NET_LOOPBACK_LOSS = 0.05  # Share of datagrams the loopback link drops
+
+# === Rollback Configuration ===
+ROLLBACK_INPUT_DELAY = 2  # Frames local input is held back, hiding short trips
+ROLLBACK_MAX_FRAMES = 8  # Furthest a peer runs ahead of confirmed remote input
+ROLLBACK_CHECKSUM_INTERVAL = 30  # Frames between desync checks
+
+# === RL Environment Configuration ===
+RL_MODE = "classic"  # Game mode of training episodes
+RL_CHARACTERS = ("luke_skywalker", "darth_vader")  # Agent, scripted enemy AI
+RL_DIFFICULTY = "Medium"  # Enemy AI difficulty
+RL_EPISODE_SECONDS = 60  # Simulated time before an episode is cut off
+RL_FRAME_SKIP = 2  # Ticks each action is held for
+RL_OBSERVED_HAZARDS = 4  # Nearest enemy bullets and sabers in an observation
+RL_WIN_REWARD = 1.0  # Reward for winning (and penalty for losing) an episode
+
+# === Pixel Observation Configuration ===
+PIXEL_OBSERVATION_SIZE = (84, 84)  # Width, height of downscaled frames
+PIXEL_GREYSCALE = True  # One luminance channel instead of RGB
+PIXEL_FRAME_STACK = 4  # Most recent frames in an observation
+PIXEL_SMOOTH_SCALING = False  # Area-average when downscaling (slower)
+
+# === Asset Loading Configuration ===
+# Decoded PCM of compressed sounds, so later launches skip decoding
+ASSET_CACHE_DIRECTORY = "cache"  # Relative to the game directory
+
 # === UI Configuration ===
 UI_FONT_SIZE = 24
 UI_BUTTON_FONT_SIZE = 32
 UI_LABEL_FONT_SIZE = 20
 UI_RELOAD_FONT_SIZE = 28
+MENU_FPS = 30  # Frame cap while a menu is animating
+MENU_IDLE_TIMEOUT_MS = 500  # Longest an idle menu sleeps waiting for input
+TEXT_CACHE_MAX_ENTRIES = 512  # Per cache in text_layout (lines, surfaces, blocks)
+DIGIT_ATLAS_SIZES = (12, 14, 16, 18, 20, 22, 24)  # Pre-rendered number sizes
+DIGIT_ATLAS_GLYPHS = "0123456789+-/:.%xs "  # Characters in the number atlas
+MINI_MAP_SIZE = 120  # Mini-map width and height in pixels
 
 # === Colors ===
 WHITE = (255, 255, 255)
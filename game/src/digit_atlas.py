@@ -0,0 +1,148 @@
+"""
+Digit Atlas
+
+Damage numbers, ammo counters, scores and timers change every few frames,
+so caching whole strings does not help them. This module pre-renders the
+digits and a few symbols into one glyph sheet per size and colour, with the
+black outline baked in, and draws a number as a single blits() call that
+copies one sheet area per character. A batch of damage popups shares one
+blits() call.
+"""
+
+import pygame
+from config import *
+from text_layout import get_font, text_layout
+
+# Offsets of the four outline passes around the fill
+OUTLINE_OFFSETS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+
+class DigitAtlas:
+    """Pre-rendered number glyphs at several sizes, with optional outline."""
+
+    def __init__(self, sizes=DIGIT_ATLAS_SIZES, glyphs=DIGIT_ATLAS_GLYPHS):
+        """
+        Args:
+            sizes (tuple): Font sizes to pre-render; other sizes snap to
+                the nearest one
+            glyphs (str): Characters in each sheet
+        """
+        self.sizes = tuple(sorted(sizes))
+        self.glyphs = glyphs
+        self.sheets = {}  # (size, color, outline) -> (surface, glyph table)
+
+    def snap_size(self, size):
+        """Return the pre-rendered size closest to size."""
+        return min(self.sizes, key=lambda s: abs(s - size))
+
+    def _build_sheet(self, size, color, outline):
+        """
+        Render every glyph side by side onto one transparent sheet.
+
+        Returns:
+            tuple: (sheet surface, {char: (area rect, advance)})
+        """
+        font = get_font(size)
+        pad = 1 if outline else 0
+        rendered = []
+        for char in self.glyphs:
+            fill = font.render(char, True, color)
+            glyph = pygame.Surface(
+                (fill.get_width() + 2 * pad, fill.get_height() + 2 * pad),
+                pygame.SRCALPHA,
+            )
+            if outline:
+                shadow = font.render(char, True, BLACK)
+                for dx, dy in OUTLINE_OFFSETS:
+                    glyph.blit(shadow, (pad + dx, pad + dy))
+            glyph.blit(fill, (pad, pad))
+            rendered.append((char, glyph, font.size(char)[0]))
+
+        width = sum(glyph.get_width() for _, glyph, _ in rendered)
+        height = max(glyph.get_height() for _, glyph, _ in rendered)
+        sheet = pygame.Surface((width, height), pygame.SRCALPHA)
+
+        table = {}
+        x = 0
+        for char, glyph, advance in rendered:
+            sheet.blit(glyph, (x, 0))
+            table[char] = (pygame.Rect(x, 0, glyph.get_width(), height), advance)
+            x += glyph.get_width()
+        return sheet, table
+
+    def sheet(self, size, color, outline=True):
+        """Return (sheet, glyph table) for a size and colour, building it once."""
+        key = (self.snap_size(size), tuple(color), outline)
+        entry = self.sheets.get(key)
+        if entry is None:
+            entry = self._build_sheet(key[0], key[1], outline)
+            self.sheets[key] = entry
+        return entry
+
+    def number_blits(self, text, x, y, size, color, outline=True, blits=None):
+        """
+        Append the blits that draw text with its top-left corner at (x, y).
+
+        Characters outside the atlas are skipped.
+
+        Args:
+            text (str): Number text, e.g. "42" or "12/30"
+            x (int): Left edge of the first character's fill
+            y (int): Top of the text
+            size (int): Font size (snapped to a pre-rendered size)
+            color (tuple): Fill colour
+            outline (bool): Use the black-outlined glyphs
+            blits (list): List to append to, or None for a new one
+
+        Returns:
+            list: (sheet, position, area) tuples for Surface.blits()
+        """
+        if blits is None:
+            blits = []
+        sheet, table = self.sheet(size, color, outline)
+        pad = 1 if outline else 0
+        x -= pad
+        y -= pad
+        for char in text:
+            glyph = table.get(char)
+            if glyph is None:
+                continue
+            area, advance = glyph
+            blits.append((sheet, (x, y), area))
+            x += advance
+        return blits
+
+    def text_width(self, text, size):
+        """Return the advance width of text at a size."""
+        _, table = self.sheet(size, WHITE, False)
+        return sum(table[char][1] for char in text if char in table)
+
+    def draw(self, surface, text, x, y, size, color, outline=True):
+        """Draw a number onto surface with its top-left corner at (x, y)."""
+        surface.blits(self.number_blits(text, x, y, size, color, outline), False)
+
+    def draw_labeled(self, surface, label, value, x, y, size, color, outline=False):
+        """
+        Draw a cached text label followed by a number, e.g. "Score: 120".
+
+        Args:
+            label (str): Fixed label text, e.g. "Score: "
+            value (str): Number text from the atlas
+            x (int): Left edge
+            y (int): Top
+            size (int): Font size
+            color (tuple): Text colour
+            outline (bool): Outline the number glyphs
+
+        Returns:
+            int: x coordinate just after the number
+        """
+        label_surf = text_layout.render(label, get_font(size), color)
+        surface.blit(label_surf, (x, y))
+        x += label_surf.get_width()
+        self.draw(surface, value, x, y, size, color, outline)
+        return x + self.text_width(value, size)
+
+
+# Global digit atlas instance
+digit_atlas = DigitAtlas()
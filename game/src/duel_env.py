@@ -0,0 +1,453 @@
+"""
+Duel Environment
+
+Gym-style reinforcement-learning environments around the headless engine:
+an agent plays player 1 against the scripted enemy AI through a small
+discrete action set, and sees a compact feature vector built from the
+fighters, the bullets and thrown sabers coming its way, and its Force power
+cooldowns. With pixels=True it instead sees a stack of downscaled frames
+of the composed game view (see pixel_observer). DuelEnv runs one match;
+VectorDuelEnv steps several independent engines in one process and
+exchanges batched numpy arrays, resetting each engine as soon as its
+episode ends.
+
+Several engines can live in one process because each environment has its
+own Force manager, lightsaber combat system and random streams, which it
+swaps in for the module-level singletons (force_manager, lightsaber_combat,
+the streams of rng_streams) before it simulates: entities reach the
+singletons directly, not through their engine. The visual events of every
+tick are dropped, so pixel observations show no event-driven particles;
+otherwise nothing is drawn unless pixels are observed.
+"""
+
+import math
+
+import pygame
+from config import *
+from random_streams import RandomStreams, rng_streams, STREAM_NAMES
+from event_bus import frame_events
+from input_recorder import EVENT_KEYDOWN, EVENT_MOUSEDOWN, KEY_INDEX, InputFrame
+from game_engine import GameEngine
+import force_powers
+import lightsaber_combat
+from self_play import match_winner
+from pixel_observer import PixelObserver
+
+# numpy is optional for a single environment; the vectorized one needs it
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Held movement keys and the press that can accompany them; an action is
+# move index * len(PRESSES) + press index
+MOVES = (0, 1 << KEY_INDEX[pygame.K_a], 1 << KEY_INDEX[pygame.K_d])
+PRESSES = (
+    (),
+    ((EVENT_KEYDOWN, pygame.K_SPACE),),  # Jump
+    ((EVENT_MOUSEDOWN, 1),),  # Shoot
+    ((EVENT_KEYDOWN, pygame.K_f),),  # Lightsaber strike
+    ((EVENT_KEYDOWN, pygame.K_q),),  # Force Push
+    ((EVENT_KEYDOWN, pygame.K_t),),  # Force Lightning (Sith)
+    ((EVENT_KEYDOWN, pygame.K_g),),  # Lightsaber throw
+    ((EVENT_KEYDOWN, pygame.K_h),),  # Force Heal (Jedi)
+)
+ACTION_COUNT = len(MOVES) * len(PRESSES)
+
+# Features of one fighter, then those shared by both
+FIGHTER_FEATURES = (
+    "x",
+    "y",
+    "velocity_y",
+    "health",
+    "force_energy",
+    "facing_right",
+    "is_jumping",
+    "is_blocking",
+    "stunned",
+    "knocked_back",
+    "lightsaber_cooldown",
+    "jedi",
+)
+OBSERVATION_FIELDS = (
+    tuple("self_" + name for name in FIGHTER_FEATURES)
+    + ("magazine", "reloading", "power1_cooldown", "power2_cooldown")
+    + ("power3_cooldown",)
+    + tuple("enemy_" + name for name in FIGHTER_FEATURES)
+    + ("dx", "dy", "distance", "time_left")
+    + tuple(
+        f"hazard{index}_{name}"
+        for index in range(RL_OBSERVED_HAZARDS)
+        for name in ("dx", "dy", "vx", "vy")
+    )
+)
+OBSERVATION_SIZE = len(OBSERVATION_FIELDS)
+
+# Scale of velocities in observations (pixels per tick)
+_SPEED_SCALE = 20.0
+
+
+def _fighter_features(out, fighter):
+    """Append the normalised features of a Player or Enemy to out."""
+    out += (
+        fighter.x / WINDOW_WIDTH,
+        fighter.y / WINDOW_HEIGHT,
+        fighter.velocity_y / _SPEED_SCALE,
+        fighter.health / fighter.max_health,
+        fighter.force_energy / fighter.max_force_energy,
+        1.0 if getattr(fighter, "facing_right", True) else 0.0,
+        1.0 if fighter.is_jumping else 0.0,
+        1.0 if fighter.is_blocking else 0.0,
+        1.0 if fighter.stunned > 0 else 0.0,
+        1.0 if fighter.knockback_timer > 0 else 0.0,
+        min(fighter.lightsaber_cooldown / SIMULATION_HZ, 1.0),
+        1.0 if fighter.character_type == "jedi" else 0.0,
+    )
+
+
+class DuelEnv:
+    """One headless match of an agent (player 1) against the enemy AI."""
+
+    def __init__(
+        self,
+        seed=None,
+        mode=RL_MODE,
+        characters=RL_CHARACTERS,
+        difficulty=RL_DIFFICULTY,
+        frame_skip=RL_FRAME_SKIP,
+        max_seconds=RL_EPISODE_SECONDS,
+        pixels=False,
+        pixel_buffer=None,
+    ):
+        """
+        Args:
+            seed (int): Master seed of the episode seeds, or None for a
+                fresh one
+            mode (str): Game mode key
+            characters (tuple): Legendary characters of the agent and the AI
+            difficulty (str): Enemy AI difficulty
+            frame_skip (int): Ticks each action is held for
+            max_seconds (float): Simulated time before an episode is cut off
+            pixels (bool): Observe stacked downscaled frames (shaped by the
+                PIXEL_* settings) instead of the feature vector
+            pixel_buffer (numpy.ndarray): Array to keep the frame stack in,
+                or None to allocate one
+        """
+        # The engine seeds whichever streams are active, so activate ours first
+        self.streams = RandomStreams()
+        self._streams = [(name, getattr(self.streams, name)) for name in STREAM_NAMES]
+        self.force_manager = force_powers.ForceManager()
+        self.lightsaber_combat = lightsaber_combat.LightsaberCombat()
+        self.activate()
+        self.engine = GameEngine(seed=seed, headless=True)
+        self.engine.force_manager = self.force_manager
+        self.engine.lightsaber_combat = self.lightsaber_combat
+        self.engine.two_player_mode = False
+        self.engine.current_game_mode = mode
+        self.engine.difficulty = difficulty
+        self.engine.character_selections = {
+            "player1": characters[0],
+            "ai": characters[1],
+        }
+        self.frame_skip = frame_skip
+        self.max_ticks = int(max_seconds * SIMULATION_HZ)
+        self.episode_return = 0.0
+        self._health = (0, 0)  # Agent and enemy health after the last step
+        self.observer = PixelObserver(out=pixel_buffer) if pixels else None
+
+    def activate(self):
+        """Make this environment's systems and random streams the shared ones."""
+        force_powers.force_manager = self.force_manager
+        lightsaber_combat.lightsaber_combat = self.lightsaber_combat
+        for name, stream in self._streams:
+            setattr(rng_streams, name, stream)
+
+    def reset(self, seed=None):
+        """
+        Start a new episode.
+
+        Args:
+            seed (int): Reseed the episode sequence (the first episode then
+                always plays the same match), or None to play the next one
+
+        Returns:
+            Observation of the first tick (the frame stack, reused by later
+            steps, when observing pixels)
+        """
+        self.start_episode(seed)
+        if self.observer:
+            return self.observer.reset(self.render())
+        return self._wrap(self.observe([]))
+
+    def step(self, action):
+        """
+        Hold an action for frame_skip ticks.
+
+        Args:
+            action (int): Index below ACTION_COUNT (aim is automatic: shots,
+                pushes and throws target the enemy)
+
+        Returns:
+            tuple: (observation, reward, done, info), as in advance
+        """
+        reward, done, info = self.advance(action)
+        if self.observer:
+            return self.observer.capture(self.render()), reward, done, info
+        return self._wrap(self.observe([])), reward, done, info
+
+    def start_episode(self, seed=None):
+        """Set up a new match without building an observation (see reset)."""
+        self.activate()
+        engine = self.engine
+        if seed is not None:
+            engine.seed = seed
+            engine.match_index = 0
+        engine._reset_game_state()
+        engine._initialize_game()
+        self.episode_return = 0.0
+        self._health = (engine.player1.health, engine.enemy.health)
+
+    def advance(self, action):
+        """
+        Simulate an action without building an observation (see step).
+
+        Args:
+            action (int): Index below ACTION_COUNT
+
+        Returns:
+            tuple: (reward, done, info). The reward is the share of the
+                enemy's health the agent took away minus the share of its
+                own it lost, plus RL_WIN_REWARD for a win (or minus it for
+                a loss). info holds the tick, "winner" ("player1", "ai" or
+                "draw") once done, and "truncated" when the episode was
+                cut off.
+        """
+        self.activate()
+        engine = self.engine
+        player = engine.player1
+        enemy = engine.enemy
+        move, press = divmod(int(action), len(PRESSES))
+        mouse_pos = (
+            int(enemy.x + enemy.size // 2),
+            int(enemy.y + enemy.size // 2),
+        )
+        frame = InputFrame(MOVES[move], mouse_pos, PRESSES[press])
+        held = InputFrame(MOVES[move], mouse_pos, ())
+
+        winner_title = ""
+        for _ in range(self.frame_skip):
+            engine._simulate_tick(frame)
+            frame_events.clear()
+            frame = held
+            winner_title = engine._check_game_over()
+            if winner_title:
+                break
+
+        player_health, enemy_health = self._health
+        reward = (enemy_health - enemy.health) / enemy.max_health - (
+            player_health - player.health
+        ) / player.max_health
+        self._health = (player.health, enemy.health)
+
+        info = {"tick": engine.tick_count}
+        done = bool(winner_title)
+        if done:
+            info["winner"] = winner = match_winner(engine, winner_title)
+            if winner == "player1":
+                reward += RL_WIN_REWARD
+            elif winner == "ai":
+                reward -= RL_WIN_REWARD
+        elif engine.tick_count >= self.max_ticks:
+            done = True
+            info["winner"] = "draw"
+            info["truncated"] = True
+        self.episode_return += reward
+        return reward, done, info
+
+    def observe(self, out):
+        """
+        Append the current observation's features to out.
+
+        Returns:
+            list: out, now holding OBSERVATION_SIZE more floats
+        """
+        engine = self.engine
+        player = engine.player1
+        enemy = engine.enemy
+        _fighter_features(out, player)
+        out += (
+            player.magazine / MAGAZINE_SIZE,
+            1.0 if player.reloading else 0.0,
+        )
+        powers = engine.force_manager.get_powers(player.character_type)
+        cooldowns = [
+            power.current_cooldown / power.cooldown for power in powers.values()
+        ]
+        cooldowns += [1.0] * (3 - len(cooldowns))
+        out += cooldowns[:3]
+        _fighter_features(out, enemy)
+
+        player_x = player.x + player.size // 2
+        player_y = player.y + player.size // 2
+        dx = enemy.x + enemy.size // 2 - player_x
+        dy = enemy.y + enemy.size // 2 - player_y
+        out += (
+            dx / WINDOW_WIDTH,
+            dy / WINDOW_HEIGHT,
+            math.hypot(dx, dy) / WINDOW_WIDTH,
+            1.0 - engine.tick_count / self.max_ticks,
+        )
+
+        # Nearest bullets and thrown sabers that can hit the agent
+        hazards = [
+            (bullet.x - player_x, bullet.y - player_y, bullet.dx, 0.0)
+            for bullet in engine.bullets
+            if bullet.owner_id != 1
+        ]
+        hazards.extend(
+            (saber.x - player_x, saber.y - player_y, saber.dx, saber.dy)
+            for saber in engine.force_manager.active_projectiles
+            if saber.owner is not player
+        )
+        if len(hazards) > RL_OBSERVED_HAZARDS:
+            hazards.sort(
+                key=lambda hazard: hazard[0] * hazard[0] + hazard[1] * hazard[1]
+            )
+        for index in range(RL_OBSERVED_HAZARDS):
+            if index < len(hazards):
+                hazard_x, hazard_y, hazard_dx, hazard_dy = hazards[index]
+                out += (
+                    hazard_x / WINDOW_WIDTH,
+                    hazard_y / WINDOW_HEIGHT,
+                    hazard_dx / _SPEED_SCALE,
+                    hazard_dy / _SPEED_SCALE,
+                )
+            else:
+                out += (0.0, 0.0, 0.0, 0.0)
+        return out
+
+    def render(self):
+        """
+        Draw the current state at the original resolution, off-screen.
+
+        Returns:
+            pygame.Surface: The engine's game_surface
+        """
+        self.activate()
+        self.engine._compose_frame()
+        return self.engine.game_surface
+
+    def _wrap(self, features):
+        if np is None:
+            return features
+        return np.array(features, dtype=np.float32)
+
+
+class VectorDuelEnv:
+    """
+    Several independent duel environments stepped together, with batched
+    observations (num_envs x OBSERVATION_SIZE float32, or num_envs frame
+    stacks of uint8 when observing pixels), actions, rewards and done
+    flags. An environment whose episode ended is reset straight away, so
+    the observation returned for it is the first of its next episode.
+    """
+
+    def __init__(self, num_envs, seed=0, **options):
+        """
+        Args:
+            num_envs (int): Number of engines
+            seed (int): Environment i is seeded with seed + i
+            **options: Passed on to every DuelEnv
+
+        Raises:
+            ImportError: If numpy is not installed
+        """
+        if np is None:
+            raise ImportError("VectorDuelEnv needs numpy")
+        self.seed = seed
+        self.pixels = options.pop("pixels", False)
+        if self.pixels:
+            # Every environment stacks its frames straight into its row
+            width, height = PIXEL_OBSERVATION_SIZE
+            shape = (num_envs, PIXEL_FRAME_STACK, height, width)
+            if not PIXEL_GREYSCALE:
+                shape += (3,)
+            self.observations = np.zeros(shape, dtype=np.uint8)
+            self.envs = [
+                DuelEnv(
+                    seed=seed + index,
+                    pixels=True,
+                    pixel_buffer=self.observations[index],
+                    **options,
+                )
+                for index in range(num_envs)
+            ]
+        else:
+            self.observations = np.zeros((num_envs, OBSERVATION_SIZE), dtype=np.float32)
+            self.envs = [
+                DuelEnv(seed=seed + index, **options) for index in range(num_envs)
+            ]
+        self.num_envs = num_envs
+        self.rewards = np.zeros(num_envs, dtype=np.float32)
+        self.dones = np.zeros(num_envs, dtype=bool)
+        self.episodes = 0
+        self.wins = 0
+
+    def reset(self, seed=None):
+        """
+        Start a new episode in every environment.
+
+        Args:
+            seed (int): Reseed environment i with seed + i, or None
+
+        Returns:
+            numpy.ndarray: Batched observations
+        """
+        if seed is not None:
+            self.seed = seed
+        features = []
+        for index, env in enumerate(self.envs):
+            env.start_episode(None if seed is None else seed + index)
+            if self.pixels:
+                env.observer.reset(env.render())
+            else:
+                features.append(env.observe([]))
+        if not self.pixels:
+            self.observations[:] = features
+        return self.observations
+
+    def step(self, actions):
+        """
+        Step every environment with its action.
+
+        Args:
+            actions: Sequence or array of num_envs action indices
+
+        Returns:
+            tuple: (observations, rewards, dones, infos); the arrays are
+                reused by the next step, and infos holds one dict per
+                environment (with "episode_return" when an episode ended)
+        """
+        features = []
+        infos = []
+        rewards = self.rewards
+        dones = self.dones
+        for index, env in enumerate(self.envs):
+            reward, done, info = env.advance(actions[index])
+            rewards[index] = reward
+            dones[index] = done
+            if done:
+                info["episode_return"] = env.episode_return
+                self.episodes += 1
+                self.wins += info["winner"] == "player1"
+                env.start_episode()
+            infos.append(info)
+            if not self.pixels:
+                features.append(env.observe([]))
+            elif done:
+                env.observer.reset(env.render())
+            else:
+                env.observer.capture(env.render())
+        if not self.pixels:
+            self.observations[:] = features
+        return self.observations, rewards, dones, infos
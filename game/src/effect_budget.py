@@ -0,0 +1,65 @@
+"""
+Effect Budgets
+
+Hard caps for the visual effect containers (particles, ambient environment
+particles, Force effects, floating texts and damage numbers), so a burst
+of effects cannot grow them without bound. Containers either reject new
+entries when full or evict their oldest ones; budget_stats counts both per
+category, so it is visible how often the budgets are hit.
+"""
+
+from collections import Counter
+
+
+class BudgetStats:
+    """Counts rejected and evicted effect entries per category."""
+
+    def __init__(self):
+        self.rejected = Counter()
+        self.evicted = Counter()
+
+    def reset(self):
+        """Zero every counter."""
+        self.rejected.clear()
+        self.evicted.clear()
+
+    def report(self):
+        """Return the counters as plain dictionaries."""
+        return {"rejected": dict(self.rejected), "evicted": dict(self.evicted)}
+
+
+def admit(items, budget, category):
+    """
+    Check whether one more entry fits in a container, rejecting it if not.
+
+    Args:
+        items (list): The container
+        budget (int): Most entries allowed
+        category (str): Name used in the counters
+
+    Returns:
+        bool: True if the entry may be added
+    """
+    if len(items) < budget:
+        return True
+    budget_stats.rejected[category] += 1
+    return False
+
+
+def make_room(items, budget, category):
+    """
+    Evict the oldest entries of a container so one more fits.
+
+    Args:
+        items (list): The container, oldest entries first
+        budget (int): Most entries allowed
+        category (str): Name used in the counters
+    """
+    excess = len(items) - budget + 1
+    if excess > 0:
+        del items[:excess]
+        budget_stats.evicted[category] += excess
+
+
+# Global budget counters instance
+budget_stats = BudgetStats()
@@ -7,8 +7,12 @@ and improved visual feedback systems.
 
 import pygame
 import math
-import random
 from config import *
+from random_streams import rng_streams
+from event_bus import EVENT_HIT
+from text_layout import get_font, text_layout
+from digit_atlas import digit_atlas
+from effect_budget import make_room
 
 
 class BackgroundManager:
@@ -26,11 +30,11 @@ class BackgroundManager:
         """Generate animated stars for space background."""
         for _ in range(100):
             star = {
-                "x": random.randint(0, WINDOW_WIDTH),
-                "y": random.randint(0, WINDOW_HEIGHT),
-                "brightness": random.randint(100, 255),
-                "twinkle_speed": random.uniform(0.02, 0.1),
-                "size": random.randint(1, 3),
+                "x": rng_streams.effects.randint(0, WINDOW_WIDTH),
+                "y": rng_streams.effects.randint(0, WINDOW_HEIGHT),
+                "brightness": rng_streams.effects.randint(100, 255),
+                "twinkle_speed": rng_streams.effects.uniform(0.02, 0.1),
+                "size": rng_streams.effects.randint(1, 3),
             }
             self.stars.append(star)
 
@@ -38,11 +42,11 @@ class BackgroundManager:
         """Generate floating cloud particles."""
         for _ in range(20):
             cloud = {
-                "x": random.randint(-50, WINDOW_WIDTH + 50),
-                "y": random.randint(0, WINDOW_HEIGHT // 2),
-                "speed": random.uniform(0.2, 0.8),
-                "size": random.randint(30, 80),
-                "alpha": random.randint(30, 80),
+                "x": rng_streams.effects.randint(-50, WINDOW_WIDTH + 50),
+                "y": rng_streams.effects.randint(0, WINDOW_HEIGHT // 2),
+                "speed": rng_streams.effects.uniform(0.2, 0.8),
+                "size": rng_streams.effects.randint(30, 80),
+                "alpha": rng_streams.effects.randint(30, 80),
             }
             self.clouds.append(cloud)
 
@@ -60,7 +64,7 @@ class BackgroundManager:
             cloud["x"] += cloud["speed"]
             if cloud["x"] > WINDOW_WIDTH + 100:
                 cloud["x"] = -100
-                cloud["y"] = random.randint(0, WINDOW_HEIGHT // 2)
+                cloud["y"] = rng_streams.effects.randint(0, WINDOW_HEIGHT // 2)
 
     def draw_space_background(self, screen):
         """Draw animated space background."""
@@ -105,7 +109,7 @@ class BackgroundManager:
             for i in range(3):
                 circle_x = i * cloud["size"] // 3
                 circle_y = cloud["size"] // 4
-                radius = cloud["size"] // 4 + random.randint(-5, 5)
+                radius = cloud["size"] // 4 + rng_streams.effects.randint(-5, 5)
                 pygame.draw.circle(
                     cloud_surf, cloud_color, (circle_x, circle_y), radius
                 )
@@ -126,10 +130,10 @@ class BackgroundManager:
             # Building windows
             for window_y in range(y + 20, WINDOW_HEIGHT - 20, 25):
                 for window_x in range(x + 10, x + building_width - 10, 20):
-                    if random.random() > 0.3:  # Some windows are lit
+                    if rng_streams.effects.random() > 0.3:  # Some windows are lit
                         window_color = (
                             (255, 255, 100)
-                            if random.random() > 0.7
+                            if rng_streams.effects.random() > 0.7
                             else (100, 100, 150)
                         )
                         pygame.draw.rect(
@@ -145,6 +149,15 @@ class EnhancedUI:
         self.damage_indicators = []
         self.floating_text = []
 
+        # Mini-map: static layer cached per level, plus a reused overlay
+        self.mini_map_static = None
+        self.mini_map_platforms = None
+        self.mini_map_platform_count = 0
+        self.mini_map_overlay = pygame.Surface(
+            (MINI_MAP_SIZE, MINI_MAP_SIZE), pygame.SRCALPHA
+        )
+        self.mini_map_markers = {}
+
     def add_damage_indicator(self, x, y, damage, color=RED):
         """Add floating damage number."""
         indicator = {
@@ -156,6 +169,7 @@ class EnhancedUI:
             "velocity_y": -2,
             "scale": 1.0,
         }
+        make_room(self.damage_indicators, DAMAGE_INDICATOR_BUDGET, "damage_numbers")
         self.damage_indicators.append(indicator)
 
     def add_floating_text(self, x, y, text, color=WHITE, size=24):
@@ -170,8 +184,40 @@ class EnhancedUI:
             "velocity_y": -1,
             "alpha": 255,
         }
+        make_room(self.floating_text, FLOATING_TEXT_BUDGET, "ui_text")
         self.floating_text.append(text_obj)
 
+    def apply_frame_events(self, events):
+        """
+        Add damage numbers and floating text for this frame's events.
+
+        Hits on the same target are merged into one damage number showing
+        the total, and identical texts are shown once.
+        """
+        damage_by_target = {}
+        shown_texts = set()
+        for event in events:
+            if event.amount and event.kind == EVENT_HIT:
+                key = id(event.entity)
+                if key in damage_by_target:
+                    damage_by_target[key][2] += event.amount
+                else:
+                    damage_by_target[key] = [
+                        event.x,
+                        event.y,
+                        event.amount,
+                        event.color,
+                    ]
+
+            if event.text and event.text not in shown_texts:
+                shown_texts.add(event.text)
+                self.add_floating_text(
+                    event.x, event.y, event.text, event.color, event.text_size
+                )
+
+        for x, y, damage, color in damage_by_target.values():
+            self.add_damage_indicator(x, y, damage, color)
+
     def update(self):
         """Update UI animations."""
         self.crosshair_rotation += 1
@@ -217,7 +263,7 @@ class EnhancedUI:
 
     def draw_weapon_hud(self, screen, weapon_type, ammo, max_ammo, x, y):
         """Draw enhanced weapon HUD."""
-        font = pygame.font.Font(None, 24)
+        font = get_font(24)
 
         # Weapon background
         hud_rect = pygame.Rect(x, y, 150, 60)
@@ -225,12 +271,13 @@ class EnhancedUI:
         pygame.draw.rect(screen, WHITE, hud_rect, 2)
 
         # Weapon name
-        weapon_text = font.render(weapon_type.upper(), True, WHITE)
+        weapon_text = text_layout.render(weapon_type.upper(), font, WHITE)
         screen.blit(weapon_text, (x + 10, y + 5))
 
         # Ammo counter
-        ammo_text = font.render(f"{ammo}/{max_ammo}", True, WHITE)
-        screen.blit(ammo_text, (x + 10, y + 30))
+        digit_atlas.draw(
+            screen, f"{ammo}/{max_ammo}", x + 10, y + 30, 24, WHITE, outline=False
+        )
 
         # Ammo bar
         bar_width = 120
@@ -253,22 +300,19 @@ class EnhancedUI:
         pygame.draw.rect(screen, WHITE, (bar_x, bar_y, bar_width, bar_height), 1)
 
     def draw_damage_indicators(self, screen):
-        """Draw floating damage numbers."""
+        """Draw floating damage numbers (outlined atlas glyphs, one blits call)."""
+        blits = []
         for indicator in self.damage_indicators:
-            font_size = int(24 * indicator["scale"])
-            font = pygame.font.Font(None, font_size)
-
-            # Create text with outline
-            text = str(indicator["damage"])
-
-            # Outline
-            for dx, dy in [(-1, -1), (-1, 1), (1, -1), (1, 1)]:
-                outline_surf = font.render(text, True, BLACK)
-                screen.blit(outline_surf, (indicator["x"] + dx, indicator["y"] + dy))
-
-            # Main text
-            text_surf = font.render(text, True, indicator["color"])
-            screen.blit(text_surf, (indicator["x"], indicator["y"]))
+            digit_atlas.number_blits(
+                str(indicator["damage"]),
+                indicator["x"],
+                indicator["y"],
+                int(24 * indicator["scale"]),
+                indicator["color"],
+                blits=blits,
+            )
+        if blits:
+            screen.blits(blits, False)
 
     def draw_floating_text(self, screen):
         """Draw floating text effects."""
@@ -283,42 +327,85 @@ class EnhancedUI:
 
             screen.blit(alpha_surf, (text_obj["x"], text_obj["y"]))
 
-    def draw_mini_map(self, screen, players, enemies, platforms):
-        """Draw a mini-map in the corner."""
-        map_size = 120
-        map_x = (WINDOW_WIDTH - map_size) // 2  # Center horizontally
-        map_y = 10
+    def _build_mini_map(self, platforms):
+        """
+        Render the mini-map's static layer for a level.
 
-        # Map background
-        map_surf = pygame.Surface((map_size, map_size), pygame.SRCALPHA)
-        pygame.draw.rect(map_surf, (0, 0, 0, 150), (0, 0, map_size, map_size))
-        pygame.draw.rect(map_surf, WHITE, (0, 0, map_size, map_size), 2)
-
-        # Scale factor
+        The background, border and downscaled platforms do not change during
+        a match, so they are drawn once here and blitted every frame.
+        """
+        map_size = MINI_MAP_SIZE
         scale_x = map_size / WINDOW_WIDTH
         scale_y = map_size / WINDOW_HEIGHT
 
+        # Map background
+        static = pygame.Surface((map_size, map_size), pygame.SRCALPHA)
+        pygame.draw.rect(static, (0, 0, 0, 150), (0, 0, map_size, map_size))
+        pygame.draw.rect(static, WHITE, (0, 0, map_size, map_size), 2)
+
         # Draw platforms
         for platform in platforms:
             scaled_x = int(platform.x * scale_x)
             scaled_y = int(platform.y * scale_y)
             scaled_w = max(2, int(platform.width * scale_x))
             scaled_h = max(2, int(platform.height * scale_y))
-            pygame.draw.rect(map_surf, GRAY, (scaled_x, scaled_y, scaled_w, scaled_h))
+            pygame.draw.rect(static, GRAY, (scaled_x, scaled_y, scaled_w, scaled_h))
+
+        self.mini_map_static = static
+        # Keep the list itself (not its id) so a new level is always noticed
+        self.mini_map_platforms = platforms
+        self.mini_map_platform_count = len(platforms)
+
+    def _mini_map_marker(self, color, radius):
+        """Return a pre-drawn mini-map dot, creating it once."""
+        key = (color, radius)
+        marker = self.mini_map_markers.get(key)
+        if marker is None:
+            marker = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+            pygame.draw.circle(marker, color, (radius, radius), radius)
+            self.mini_map_markers[key] = marker
+        return marker
+
+    def invalidate_mini_map(self):
+        """Force the mini-map's static layer to be rebuilt on the next draw."""
+        self.mini_map_platforms = None
 
-        # Draw players
-        for player in players:
-            scaled_x = int(player.x * scale_x)
-            scaled_y = int(player.y * scale_y)
-            pygame.draw.circle(map_surf, GREEN, (scaled_x, scaled_y), 3)
+    def draw_mini_map(self, screen, players, enemies, platforms):
+        """Draw a mini-map in the corner."""
+        map_size = MINI_MAP_SIZE
+        map_x = (WINDOW_WIDTH - map_size) // 2  # Center horizontally
+        map_y = 10
+
+        if (
+            platforms is not self.mini_map_platforms
+            or len(platforms) != self.mini_map_platform_count
+        ):
+            self._build_mini_map(platforms)
+
+        # Reuse one overlay: copy the static layer, then add the markers
+        overlay = self.mini_map_overlay
+        overlay.fill((0, 0, 0, 0))
+        overlay.blit(self.mini_map_static, (0, 0))
 
-        # Draw enemies
+        # Scale factor
+        scale_x = map_size / WINDOW_WIDTH
+        scale_y = map_size / WINDOW_HEIGHT
+
+        # Players and enemies as pre-drawn dots, in one batched blits() call
+        blits = []
+        player_dot = self._mini_map_marker(GREEN, 3)
+        for player in players:
+            blits.append(
+                (player_dot, (int(player.x * scale_x) - 3, int(player.y * scale_y) - 3))
+            )
+        enemy_dot = self._mini_map_marker(RED, 2)
         for enemy in enemies:
-            scaled_x = int(enemy.x * scale_x)
-            scaled_y = int(enemy.y * scale_y)
-            pygame.draw.circle(map_surf, RED, (scaled_x, scaled_y), 2)
+            blits.append(
+                (enemy_dot, (int(enemy.x * scale_x) - 2, int(enemy.y * scale_y) - 2))
+            )
+        overlay.blits(blits, False)
 
-        screen.blit(map_surf, (map_x, map_y))
+        screen.blit(overlay, (map_x, map_y))
 
 
 # Global instances
@@ -7,10 +7,11 @@ Enhanced with Force powers, lightsaber combat, and legendary characters.
 """
 
 import pygame
-import random
 import os
 import math
 from config import *
+from random_streams import rng_streams
+from collision import first_platform_hit, sweep_box
 
 
 class Entity:
@@ -100,8 +101,13 @@ class Player(Entity):
         self.knockback_dx = 0
         self.knockback_dy = 0
 
+        # Held keys of the last simulated tick (drives the walk animation)
+        self.last_keys = None
+
     def update(self, keys, platforms):
         """Update player state including movement, gravity, weapons, and Force powers."""
+        self.last_keys = keys
+
         # Handle stunning
         if self.stunned > 0:
             self.stunned -= 1
@@ -132,8 +138,8 @@ class Player(Entity):
             self.knockback_dy += GRAVITY
 
             # Add shake effect
-            self.x += random.randint(-2, 2)
-            self.y += random.randint(-2, 2)
+            self.x += rng_streams.simulation.randint(-2, 2)
+            self.y += rng_streams.simulation.randint(-2, 2)
 
             # Constrain within window
             self.x = max(0, min(self.x, WINDOW_WIDTH - self.size))
@@ -181,15 +187,16 @@ class Player(Entity):
         """Apply gravity and handle platform collisions. Prevent landing glitch."""
         landed = False
         new_y = self.y + self.velocity_y
-        temp_rect = pygame.Rect(self.x, new_y, self.size, self.size)
 
-        for platform in platforms:
-            if temp_rect.colliderect(platform) and self.velocity_y >= 0:
-                # Snap player exactly on top of platform
-                self.y = platform.top - self.size
-                self.velocity_y = 0
-                landed = True
-                break
+        # Sweep the whole fall so fast drops cannot pass through a platform
+        platform = first_platform_hit(
+            self.x, self.y, self.size, self.velocity_y, platforms
+        )
+        if platform:
+            # Snap player exactly on top of platform
+            self.y = platform.top - self.size
+            self.velocity_y = 0
+            landed = True
 
         if not landed and new_y + self.size >= WINDOW_HEIGHT:
             # Snap player exactly on ground
@@ -363,7 +370,7 @@ class Player(Entity):
 
     def draw(self, surface):
         """Draw the animated player sprite based on movement state and character type."""
-        from src.sprite_system import sprite_manager, animation_manager
+        from sprite_system import sprite_manager, animation_manager
 
         # Determine animation state
         if self.knockback_timer > 0:
@@ -389,7 +396,7 @@ class Player(Entity):
             # Register animation if not already
             if anim_key not in animation_manager.animations:
                 frames = sprite_manager.animated_sprites[anim_key]
-                animation_manager.create_animation(anim_key, frames, frame_duration=6)
+                animation_manager.create_animation(anim_key, frames, frame_duration=3)
             # Set animation state
             animation_manager.set_animation_state(id(self), anim_key)
             # Get current frame
@@ -402,7 +409,9 @@ class Player(Entity):
 
     def _is_moving(self):
         # Simple check for movement (could be improved for diagonal)
-        keys = pygame.key.get_pressed()
+        keys = self.last_keys
+        if keys is None:
+            return False
         if self.player_id == 1:
             return keys[pygame.K_a] or keys[pygame.K_d] or keys[pygame.K_s]
         else:
@@ -431,7 +440,8 @@ class Enemy(Entity):
         self.is_blocking = False
         self.stunned = 0
 
-        # Legendary character support
+        # Legendary character support (movement scales with speed / PLAYER_SPEED)
+        self.speed = PLAYER_SPEED
         self.character_name = "Dark Warrior"
         self.character_description = "A powerful Force user"
         self.special_abilities = []
@@ -449,7 +459,7 @@ class Enemy(Entity):
 
     def draw(self, surface):
         """Draw the animated enemy sprite based on movement state and character type."""
-        from src.sprite_system import sprite_manager, animation_manager
+        from sprite_system import sprite_manager, animation_manager
 
         # Determine animation state
         if self.knockback_timer > 0:
@@ -477,7 +487,7 @@ class Enemy(Entity):
             anim_key = f"enemy_{pose}"
             if anim_key not in animation_manager.animations:
                 frames = sprite_manager.animated_sprites[anim_key]
-                animation_manager.create_animation(anim_key, frames, frame_duration=6)
+                animation_manager.create_animation(anim_key, frames, frame_duration=3)
             animation_manager.set_animation_state(id(self), anim_key)
             frame = animation_manager.get_current_frame(id(self))
             # Always use animated sprite, never fallback to block
@@ -507,8 +517,8 @@ class Enemy(Entity):
             self.knockback_dy += GRAVITY
 
             # Add shake effect
-            self.x += random.randint(-2, 2)
-            self.y += random.randint(-2, 2)
+            self.x += rng_streams.simulation.randint(-2, 2)
+            self.y += rng_streams.simulation.randint(-2, 2)
 
             # Constrain within window
             self.x = max(0, min(self.x, WINDOW_WIDTH - self.size))
@@ -549,7 +559,9 @@ class Enemy(Entity):
 
     def _melee_behavior(self, player, difficulty_config):
         """Melee combat behavior - move close and use lightsaber."""
-        enemy_speed = difficulty_config["enemy_speed"] * 1.5
+        enemy_speed = (
+            difficulty_config["enemy_speed"] * 1.5 * (self.speed / PLAYER_SPEED)
+        )
 
         # Move towards player aggressively
         if player.x > self.x + 10:
@@ -601,7 +613,7 @@ class Enemy(Entity):
 
     def _ranged_behavior(self, player, difficulty_config):
         """Ranged combat behavior - maintain distance and shoot."""
-        enemy_speed = difficulty_config["enemy_speed"]
+        enemy_speed = difficulty_config["enemy_speed"] * (self.speed / PLAYER_SPEED)
         distance_x = abs(player.x - self.x)
 
         # Maintain optimal distance (not too close, not too far)
@@ -625,14 +637,15 @@ class Enemy(Entity):
         """Apply gravity and handle platform collisions."""
         landed = False
         new_y = self.y + self.velocity_y
-        temp_rect = pygame.Rect(self.x, new_y, self.size, self.size)
 
-        for platform in platforms:
-            if temp_rect.colliderect(platform) and self.velocity_y >= 0:
-                new_y = platform.top - self.size
-                self.velocity_y = 0
-                landed = True
-                break
+        # Sweep the whole fall so fast drops cannot pass through a platform
+        platform = first_platform_hit(
+            self.x, self.y, self.size, self.velocity_y, platforms
+        )
+        if platform:
+            new_y = platform.top - self.size
+            self.velocity_y = 0
+            landed = True
 
         if new_y + self.size >= WINDOW_HEIGHT:
             new_y = WINDOW_HEIGHT - self.size
@@ -646,7 +659,7 @@ class Enemy(Entity):
         # AI jumping
         self.jump_timer += 1
         if landed and self.jump_timer >= self.jump_interval:
-            if random.random() < 0.7:  # 70% chance to jump
+            if rng_streams.ai.random() < 0.7:  # 70% chance to jump
                 self.velocity_y = -ENEMY_JUMP_STRENGTH
             self.jump_timer = 0
 
@@ -701,14 +714,43 @@ class Bullet:
 
         self.rect = pygame.Rect(x, y, self.width, self.height)
 
+        # Position at the start of the current tick, for swept collision
+        self.prev_x = x
+
     def update(self):
         """Update bullet position."""
+        self.prev_x = self.x
         self.x += self.dx
         self.rect.x = self.x
 
+    def sweep(self, target):
+        """
+        Test the bullet's movement this tick against a target rectangle.
+
+        Args:
+            target (pygame.Rect): Rectangle to test against
+
+        Returns:
+            float: Time of impact in [0, 1], or None if the path missed
+        """
+        return sweep_box(
+            self.prev_x,
+            self.y,
+            self.width,
+            self.height,
+            self.x - self.prev_x,
+            0,
+            target,
+        )
+
+    def move_to_impact(self, toi):
+        """Place the bullet where it hit, so effects spawn at the impact."""
+        self.x = self.prev_x + (self.x - self.prev_x) * toi
+        self.rect.x = self.x
+
     def draw(self, surface):
         """Draw the bullet using enhanced sprite only."""
-        from src.sprite_system import sprite_manager
+        from sprite_system import sprite_manager
 
         if self.owner_id == 1:
             sprite = sprite_manager.get_sprite("player_bullet")
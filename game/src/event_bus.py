@@ -0,0 +1,124 @@
+"""
+Frame Event Bus
+
+The simulation publishes typed gameplay events (hits, deaths, shots, jumps,
+Force powers) into a per-frame queue instead of firing effects inline.
+Once per frame the queue is handed to the effect, UI and audio systems,
+which coalesce duplicates: one screen shake at the strongest intensity,
+one sound per type, and merged damage numbers per target.
+"""
+
+from config import *
+
+# Event types
+EVENT_HIT = "hit"
+EVENT_DEATH = "death"
+EVENT_SHOT = "shot"
+EVENT_JUMP = "jump"
+EVENT_POWER_USED = "power_used"
+
+
+class GameEvent:
+    """One gameplay event and the feedback it asks for."""
+
+    __slots__ = (
+        "kind",
+        "x",
+        "y",
+        "entity",
+        "amount",
+        "color",
+        "text",
+        "text_size",
+        "angle",
+        "particles",
+        "particle_color",
+        "shake",
+        "flash",
+    )
+
+    def __init__(
+        self,
+        kind,
+        x,
+        y,
+        entity=None,
+        amount=0,
+        color=WHITE,
+        text=None,
+        text_size=24,
+        angle=0.0,
+        particles=None,
+        particle_color=None,
+        shake=None,
+        flash=None,
+    ):
+        """
+        Args:
+            kind (str): One of the EVENT_* types
+            x (float): Where the event happened
+            y (float): Where the event happened
+            entity: Entity the event is about (hit target, shooter, ...)
+            amount (int): Damage dealt, for hit events
+            color (tuple): Colour of the damage number, text or particles
+            text (str): Floating text to show, if any
+            text_size (int): Font size of the floating text
+            angle (float): Direction in radians (muzzle flashes)
+            particles (str): Particle preset: "blood", "sparks", "explosion",
+                "muzzle_flash" or "jump_dust"
+            particle_color (tuple): Particle colour, if different from color
+            shake (tuple): (intensity, duration) screen shake request
+            flash (tuple): (color, intensity, duration) screen flash request
+        """
+        self.kind = kind
+        self.x = x
+        self.y = y
+        self.entity = entity
+        self.amount = amount
+        self.color = color
+        self.text = text
+        self.text_size = text_size
+        self.angle = angle
+        self.particles = particles
+        self.particle_color = particle_color or color
+        self.shake = shake
+        self.flash = flash
+
+
+class FrameEventBus:
+    """Collects the events of one frame and hands them to subscribers."""
+
+    def __init__(self):
+        self.events = []
+        self.subscribers = []
+
+    def subscribe(self, handler):
+        """Register handler(events) to receive each frame's event list."""
+        if handler not in self.subscribers:
+            self.subscribers.append(handler)
+
+    def unsubscribe(self, handler):
+        """Stop delivering events to handler (no effect if not subscribed)."""
+        if handler in self.subscribers:
+            self.subscribers.remove(handler)
+
+    def publish(self, kind, x, y, **fields):
+        """Queue an event for this frame. See GameEvent for the fields."""
+        self.events.append(GameEvent(kind, x, y, **fields))
+
+    def dispatch(self):
+        """Deliver the queued events to every subscriber and start a new frame."""
+        events = self.events
+        self.events = []
+        if events:
+            for handler in self.subscribers:
+                handler(events)
+        return events
+
+    def clear(self):
+        """Drop queued events without delivering them (headless simulation)."""
+        self.events = []
+
+
+# Global frame event bus
+frame_events = FrameEventBus()
@@ -12,8 +12,149 @@ Implements Jedi and Sith Force abilities including:
 
 import pygame
 import math
-import random
+from collections import Counter
 from config import *
+from random_streams import rng_streams
+from collision import sweep_point
+from visual_effects import lightning_bolts
+from effect_budget import make_room
+
+
+class ForceEffect:
+    """Base record for a short-lived visual Force effect."""
+
+    __slots__ = ("x", "y", "color", "duration")
+
+    def __init__(self, x, y, color, duration):
+        self.x = x
+        self.y = y
+        self.color = color
+        self.duration = duration
+
+    def update(self):
+        """Advance one tick. Returns False once the effect has expired."""
+        self.duration -= 1
+        return self.duration > 0
+
+    def draw(self, surface):
+        """Override in subclasses."""
+        pass
+
+
+class ForceWave(ForceEffect):
+    """Expanding push wave between the user and a target."""
+
+    __slots__ = ("target_x", "target_y")
+
+    def __init__(self, x, y, target_x, target_y, color, duration=20):
+        super().__init__(x, y, color, duration)
+        self.target_x = target_x
+        self.target_y = target_y
+
+    def draw(self, surface):
+        alpha = min(255, self.duration * 8)
+        temp_surf = pygame.Surface((50, 50), pygame.SRCALPHA)
+        pygame.draw.circle(temp_surf, (*self.color, alpha // 4), (25, 25), 25)
+        surface.blit(temp_surf, (self.x - 25, self.y - 25))
+
+
+class LightningArc(ForceEffect):
+    """One jagged Force Lightning arc from the user to a target."""
+
+    __slots__ = ("target_x", "target_y")
+
+    def __init__(self, x, y, target_x, target_y, color, duration):
+        super().__init__(x, y, color, duration)
+        self.target_x = target_x
+        self.target_y = target_y
+
+    def draw(self, surface):
+        lightning_bolts.draw_bolt(
+            surface, (self.x, self.y), (self.target_x, self.target_y), self.color
+        )
+
+
+class HealParticle(ForceEffect):
+    """Fading particle around a healing Jedi."""
+
+    __slots__ = ()
+
+    def draw(self, surface):
+        alpha = min(255, self.duration * 4)
+        temp_surf = pygame.Surface((6, 6), pygame.SRCALPHA)
+        pygame.draw.circle(temp_surf, (*self.color, alpha), (3, 3), 3)
+        surface.blit(temp_surf, (self.x - 3, self.y - 3))
+
+
+class LightsaberProjectile:
+    """A thrown, spinning lightsaber."""
+
+    __slots__ = (
+        "x",
+        "y",
+        "dx",
+        "dy",
+        "angle",
+        "rotation_speed",
+        "damage",
+        "owner",
+        "color",
+        "duration",
+    )
+
+    def __init__(self, x, y, dx, dy, damage, owner, color, duration=120):
+        self.x = x
+        self.y = y
+        self.dx = dx
+        self.dy = dy
+        self.angle = 0
+        self.rotation_speed = 0.3
+        self.damage = damage
+        self.owner = owner
+        self.color = color
+        self.duration = duration
+
+    def update(self, entities):
+        """Move and spin the saber. Returns False once it hit or expired."""
+        self.angle += self.rotation_speed
+        self.duration -= 1
+
+        # Check collisions along the whole path travelled this tick
+        hit_entity = None
+        hit_toi = 2.0
+        for entity in entities:
+            if entity != self.owner and hasattr(entity, "take_damage"):
+                toi = sweep_point(
+                    self.x, self.y, self.dx, self.dy, entity.x, entity.y, 30
+                )
+                if toi is not None and toi < hit_toi:
+                    hit_entity = entity
+                    hit_toi = toi
+
+        if hit_entity:
+            self.x += self.dx * hit_toi
+            self.y += self.dy * hit_toi
+            hit_entity.take_damage(self.damage, self.dx)
+            return False  # Remove projectile
+
+        self.x += self.dx
+        self.y += self.dy
+
+        # Disappear after duration
+        return self.duration > 0
+
+    def draw(self, surface):
+        """Draw the spinning lightsaber."""
+        center_x, center_y = int(self.x), int(self.y)
+
+        # Lightsaber blade
+        blade_length = 30
+        end_x = center_x + math.cos(self.angle) * blade_length
+        end_y = center_y + math.sin(self.angle) * blade_length
+        pygame.draw.line(surface, self.color, (center_x, center_y), (end_x, end_y), 4)
+
+        # Draw lightsaber hilt
+        pygame.draw.circle(surface, (80, 80, 80), (center_x, center_y), 3)
 
 
 class ForcePower:
@@ -65,7 +206,7 @@ class ForcePush(ForcePower):
                 if distance <= self.range_limit:
                     # Calculate push direction
                     angle = math.atan2(entity.y - user.y, entity.x - user.x)
-                    push_force = max(20, 50 - distance / 10)
+                    push_force = max(20, 50 - distance / 10) * user.force_power_bonus
 
                     # Apply knockback
                     entity.knockback_dx = math.cos(angle) * push_force * 0.3
@@ -74,18 +215,17 @@ class ForcePush(ForcePower):
 
                     # Add visual effect
                     effects.append(
-                        {
-                            "type": "force_wave",
-                            "x": user.x + user.size // 2,
-                            "y": user.y + user.size // 2,
-                            "target_x": entity.x + entity.size // 2,
-                            "target_y": entity.y + entity.size // 2,
-                            "color": (
+                        ForceWave(
+                            user.x + user.size // 2,
+                            user.y + user.size // 2,
+                            entity.x + entity.size // 2,
+                            entity.y + entity.size // 2,
+                            (
                                 (100, 150, 255)
                                 if user.character_type == "jedi"
                                 else (255, 100, 100)
                             ),
-                        }
+                        )
                     )
 
         return effects
@@ -110,7 +250,7 @@ class ForceLightning(ForcePower):
                 )
                 if distance <= self.range_limit:
                     # Deal damage
-                    entity.take_damage(15, 0)
+                    entity.take_damage(round(15 * user.force_power_bonus), 0)
 
                     # Stun effect
                     if hasattr(entity, "stunned"):
@@ -119,19 +259,18 @@ class ForceLightning(ForcePower):
                     # Lightning effect
                     for i in range(5):
                         effects.append(
-                            {
-                                "type": "lightning",
-                                "x": user.x + user.size // 2,
-                                "y": user.y + user.size // 2,
-                                "target_x": entity.x
+                            LightningArc(
+                                user.x + user.size // 2,
+                                user.y + user.size // 2,
+                                entity.x
                                 + entity.size // 2
-                                + random.randint(-10, 10),
-                                "target_y": entity.y
+                                + rng_streams.effects.randint(-10, 10),
+                                entity.y
                                 + entity.size // 2
-                                + random.randint(-10, 10),
-                                "color": (150, 150, 255),
-                                "duration": 30 + i * 5,
-                            }
+                                + rng_streams.effects.randint(-10, 10),
+                                (150, 150, 255),
+                                30 + i * 5,
+                            )
                         )
 
         return effects
@@ -148,22 +287,15 @@ class LightsaberThrow(ForcePower):
         angle = math.atan2(target_y - user.y, target_x - user.x)
         speed = 8
 
-        lightsaber_projectile = {
-            "type": "lightsaber_throw",
-            "x": user.x + user.size // 2,
-            "y": user.y + user.size // 2,
-            "dx": math.cos(angle) * speed,
-            "dy": math.sin(angle) * speed,
-            "angle": 0,
-            "rotation_speed": 0.3,
-            "damage": 25,
-            "owner": user,
-            "color": (
-                (100, 150, 255) if user.character_type == "jedi" else (255, 100, 100)
-            ),
-            "duration": 120,
-            "returning": False,
-        }
+        lightsaber_projectile = LightsaberProjectile(
+            user.x + user.size // 2,
+            user.y + user.size // 2,
+            math.cos(angle) * speed,
+            math.sin(angle) * speed,
+            round(25 * user.force_power_bonus),
+            user,
+            (100, 150, 255) if user.character_type == "jedi" else (255, 100, 100),
+        )
 
         return [lightsaber_projectile]
 
@@ -179,20 +311,19 @@ class ForceHeal(ForcePower):
             return []
 
         # Heal user
-        heal_amount = 30
+        heal_amount = round(30 * user.force_power_bonus)
         user.health = min(user.max_health, user.health + heal_amount)
 
         # Visual effect
         effects = []
         for i in range(10):
             effects.append(
-                {
-                    "type": "heal_particle",
-                    "x": user.x + user.size // 2 + random.randint(-20, 20),
-                    "y": user.y + user.size // 2 + random.randint(-20, 20),
-                    "color": (100, 255, 100),
-                    "duration": 60 + i * 3,
-                }
+                HealParticle(
+                    user.x + user.size // 2 + rng_streams.effects.randint(-20, 20),
+                    user.y + user.size // 2 + rng_streams.effects.randint(-20, 20),
+                    (100, 255, 100),
+                    60 + i * 3,
+                )
             )
 
         return effects
@@ -216,6 +347,16 @@ class ForceManager:
 
         self.active_effects = []
         self.active_projectiles = []
+        self.usage = Counter()  # (user, power name) -> successful uses
+
+    def reset(self):
+        """Clear all effects, projectiles, cooldowns and usage counts for a new match."""
+        self.active_effects = []
+        self.active_projectiles = []
+        self.usage.clear()
+        for powers in [self.jedi_powers, self.sith_powers]:
+            for power in powers.values():
+                power.current_cooldown = 0
 
     def get_powers(self, character_type):
         """Get available powers for character type."""
@@ -230,11 +371,15 @@ class ForceManager:
         powers = self.get_powers(user.character_type)
         if power_name in powers:
             effects = powers[power_name].use(user, target_x, target_y, entities)
+            if effects is not None:
+                self.usage[user, power_name] += 1
             if effects:
                 for effect in effects:
-                    if effect.get("type") == "lightsaber_throw":
+                    if isinstance(effect, LightsaberProjectile):
                         self.active_projectiles.append(effect)
                     else:
+                        # Visual only: the oldest effects make way
+                        make_room(self.active_effects, FORCE_EFFECT_BUDGET, "force")
                         self.active_effects.append(effect)
                 return True
         return False
@@ -246,109 +391,31 @@ class ForceManager:
             for power in powers.values():
                 power.update()
 
-        # Update effects
-        self.active_effects = [
-            effect for effect in self.active_effects if self._update_effect(effect)
-        ]
-
-        # Update projectiles
-        self.active_projectiles = [
-            proj
-            for proj in self.active_projectiles
-            if self._update_projectile(proj, entities)
-        ]
-
-    def _update_effect(self, effect):
-        """Update individual effect."""
-        effect["duration"] = effect.get("duration", 0) - 1
-        return effect["duration"] > 0
-
-    def _update_projectile(self, proj, entities):
-        """Update lightsaber projectile."""
-        if proj["type"] == "lightsaber_throw":
-            proj["x"] += proj["dx"]
-            proj["y"] += proj["dy"]
-            proj["angle"] += proj["rotation_speed"]
-            proj["duration"] -= 1
-
-            # Check collisions
-            for entity in entities:
-                if entity != proj["owner"] and hasattr(entity, "take_damage"):
-                    distance = math.sqrt(
-                        (entity.x - proj["x"]) ** 2 + (entity.y - proj["y"]) ** 2
-                    )
-                    if distance < 30:
-                        entity.take_damage(proj["damage"], proj["dx"])
-                        return False  # Remove projectile
-
-            # Return to owner after duration
-            if proj["duration"] <= 0:
-                return False
-
-            return True
-
-        return False
+        # Update effects and projectiles through their own update methods,
+        # compacting survivors in place
+        effects = self.active_effects
+        alive_count = 0
+        for effect in effects:
+            if effect.update():
+                effects[alive_count] = effect
+                alive_count += 1
+        del effects[alive_count:]
+
+        projectiles = self.active_projectiles
+        alive_count = 0
+        for proj in projectiles:
+            if proj.update(entities):
+                projectiles[alive_count] = proj
+                alive_count += 1
+        del projectiles[alive_count:]
 
     def draw_effects(self, surface):
         """Draw all Force effects."""
         for effect in self.active_effects:
-            self._draw_effect(surface, effect)
+            effect.draw(surface)
 
         for proj in self.active_projectiles:
-            self._draw_projectile(surface, proj)
-
-    def _draw_effect(self, surface, effect):
-        """Draw individual effect."""
-        if effect["type"] == "force_wave":
-            # Draw force wave
-            alpha = min(255, effect["duration"] * 8)
-            temp_surf = pygame.Surface((50, 50), pygame.SRCALPHA)
-            pygame.draw.circle(temp_surf, (*effect["color"], alpha // 4), (25, 25), 25)
-            surface.blit(temp_surf, (effect["x"] - 25, effect["y"] - 25))
-
-        elif effect["type"] == "lightning":
-            # Draw lightning bolt
-            points = []
-            start_x, start_y = effect["x"], effect["y"]
-            end_x, end_y = effect["target_x"], effect["target_y"]
-
-            for i in range(5):
-                t = i / 4
-                x = start_x + (end_x - start_x) * t + random.randint(-5, 5)
-                y = start_y + (end_y - start_y) * t + random.randint(-5, 5)
-                points.append((x, y))
-
-            if len(points) > 1:
-                pygame.draw.lines(surface, effect["color"], False, points, 2)
-
-        elif effect["type"] == "heal_particle":
-            # Draw healing particle
-            alpha = min(255, effect["duration"] * 4)
-            temp_surf = pygame.Surface((6, 6), pygame.SRCALPHA)
-            pygame.draw.circle(temp_surf, (*effect["color"], alpha), (3, 3), 3)
-            surface.blit(temp_surf, (effect["x"] - 3, effect["y"] - 3))
-
-    def _draw_projectile(self, surface, proj):
-        """Draw lightsaber projectile."""
-        if proj["type"] == "lightsaber_throw":
-            # Draw spinning lightsaber
-            size = 20
-            center_x, center_y = int(proj["x"]), int(proj["y"])
-
-            # Lightsaber blade
-            blade_length = 30
-            angle = proj["angle"]
-
-            end_x = center_x + math.cos(angle) * blade_length
-            end_y = center_y + math.sin(angle) * blade_length
-
-            # Draw lightsaber blade
-            pygame.draw.line(
-                surface, proj["color"], (center_x, center_y), (end_x, end_y), 4
-            )
-
-            # Draw lightsaber hilt
-            pygame.draw.circle(surface, (80, 80, 80), (center_x, center_y), 3)
+            proj.draw(surface)
 
 
 # Global Force manager instance
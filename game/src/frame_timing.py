@@ -0,0 +1,110 @@
+"""
+Frame Timing
+
+Decouples the simulation rate from the render rate. FixedTimestep turns
+measured frame times into a whole number of fixed simulation ticks plus an
+interpolation factor for drawing between the last two ticks, so a slow
+frame no longer slows the game down and a fast display can draw more
+frames than the simulation runs. FrameTimeHistogram records frame times
+to check pacing.
+"""
+
+import bisect
+from config import *
+
+
+class FixedTimestep:
+    """Accumulator that converts real time into fixed simulation ticks."""
+
+    def __init__(
+        self,
+        hz=SIMULATION_HZ,
+        max_frame_time=MAX_FRAME_TIME,
+        max_ticks=MAX_TICKS_PER_FRAME,
+    ):
+        """
+        Args:
+            hz (int): Simulation ticks per second
+            max_frame_time (float): Longest frame (seconds) fed to the
+                accumulator, e.g. after a window drag or breakpoint
+            max_ticks (int): Most ticks run per frame; any time still owed
+                after that is dropped instead of snowballing
+        """
+        self.dt = 1.0 / hz
+        self.max_frame_time = max_frame_time
+        self.max_ticks = max_ticks
+        self.accumulator = 0.0
+        self.dropped_time = 0.0
+
+    def reset(self):
+        """Forget owed time (e.g. at the start of a match)."""
+        self.accumulator = 0.0
+
+    def advance(self, frame_time):
+        """
+        Add a frame's duration and return how many ticks to simulate.
+
+        Args:
+            frame_time (float): Seconds since the previous frame
+
+        Returns:
+            int: Number of simulation ticks due
+        """
+        self.accumulator += min(frame_time, self.max_frame_time)
+        ticks = int(self.accumulator / self.dt)
+        if ticks > self.max_ticks:
+            self.dropped_time += (ticks - self.max_ticks) * self.dt
+            ticks = self.max_ticks
+        self.accumulator -= ticks * self.dt
+        if ticks == self.max_ticks and self.accumulator >= self.dt:
+            self.accumulator %= self.dt
+        return ticks
+
+    @property
+    def alpha(self):
+        """Fraction of a tick elapsed since the last one, in [0, 1)."""
+        return self.accumulator / self.dt
+
+
+class FrameTimeHistogram:
+    """Counts frame times in fixed millisecond buckets."""
+
+    def __init__(self, bucket_edges_ms=FRAME_HISTOGRAM_BUCKETS_MS):
+        """
+        Args:
+            bucket_edges_ms (tuple): Upper bucket edges in milliseconds; a
+                final bucket collects everything slower
+        """
+        self.edges = tuple(bucket_edges_ms)
+        self.reset()
+
+    def reset(self):
+        """Clear every count."""
+        self.counts = [0] * (len(self.edges) + 1)
+        self.frames = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, frame_time):
+        """Record one frame duration in seconds."""
+        ms = frame_time * 1000.0
+        self.counts[bisect.bisect_left(self.edges, ms)] += 1
+        self.frames += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def report(self):
+        """Return the histogram as printable text."""
+        if not self.frames:
+            return "No frames recorded"
+        lines = [
+            f"{self.frames} frames, mean {self.total_ms / self.frames:.2f} ms, "
+            f"max {self.max_ms:.2f} ms"
+        ]
+        lower = 0
+        for edge, count in zip(self.edges + (None,), self.counts):
+            label = f"{lower:>4}-{edge:<4}ms" if edge else f"{lower:>4}+     ms"
+            share = count / self.frames
+            lines.append(f"{label} {count:7d} {share:6.1%} {'#' * int(share * 40)}")
+            lower = edge
+        return "\n".join(lines)
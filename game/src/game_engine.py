@@ -6,10 +6,26 @@ legendary characters, and epic environments.
 """
 
 import pygame
-import random
 import os
 import math
+import time
 from config import *
+from random_streams import rng_streams
+from event_bus import (
+    frame_events,
+    EVENT_HIT,
+    EVENT_DEATH,
+    EVENT_SHOT,
+    EVENT_JUMP,
+    EVENT_POWER_USED,
+)
+from input_recorder import (
+    EVENT_KEYDOWN,
+    EVENT_MOUSEDOWN,
+    InputRecorder,
+    InputReplay,
+    capture_input_frame,
+)
 from entities import Player, Enemy, Bullet
 from utils import (
     generate_random_platforms,
@@ -19,9 +35,16 @@ from utils import (
     draw_weapon_info,
 )
 from menus import MenuManager
-from visual_effects import particle_system, screen_effects, EnhancedRenderer
+from visual_effects import particle_system, screen_effects
 from sprite_system import sprite_manager, animation_manager
+from asset_loader import asset_loader
 from enhanced_ui import background_manager, enhanced_ui
+from hud import RetainedHud
+from frame_timing import FixedTimestep, FrameTimeHistogram
+from quality_governor import quality_governor
+from effect_budget import budget_stats
+from sim_state import SimulationState, state_checksum
+from world_snapshot import encode_world
 
 # Import Star Wars systems
 try:
@@ -40,34 +63,69 @@ except ImportError as e:
 class GameEngine:
     """Main game engine class that manages the entire game."""
 
-    def __init__(self):
-        """Initialize the enhanced Star Wars game engine."""
+    def __init__(self, seed=None, headless=False, replay_dir=None):
+        """
+        Initialize the enhanced Star Wars game engine.
+
+        Args:
+            seed (int): Master seed for every random stream, or None to pick
+                a fresh one. Each match is reseeded from it, so a seed plus
+                the player inputs fully reproduces a session.
+            headless (bool): Run without a window or audio device (replays,
+                benchmarks)
+            replay_dir (str): Directory to record every match into, or None
+                to disable recording
+        """
+        self.headless = headless
+        if headless:
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+            os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
         pygame.init()
         pygame.mixer.init()
 
+        # Deterministic random streams
+        self.seed = rng_streams.seed(seed)
+        self.match_index = 0
+        self.match_seed = self.seed
+
+        # Input recording
+        self.replay_dir = replay_dir
+        self.recorder = None
+        self.tick_count = 0
+        self.mouse_pos = (0, 0)
+
         # Display setup with fullscreen support
         self.fullscreen = FULLSCREEN_ENABLED
         self.original_size = (WINDOW_WIDTH, WINDOW_HEIGHT)
 
         # Create game surface (always the original game size)
         self.game_surface = pygame.Surface(self.original_size)
+        self.hud = RetainedHud()  # Retained HUD widgets drawn onto game_surface
+        # World layer that is offset as a whole while the screen shakes
+        self.shake_surface = pygame.Surface(self.original_size)
 
-        if self.fullscreen:
-            self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
-        else:
-            self.screen = pygame.display.set_mode(self.original_size)
-        pygame.display.set_caption("STAR WARS: ULTIMATE BATTLE")
+        self._apply_display_mode()
         self.clock = pygame.time.Clock()
+        self.timestep = FixedTimestep()
+        self.frame_histogram = FrameTimeHistogram()
+        self.previous_positions = {}  # entity -> (x, y) before the last tick
+        self.sessions_run = 0
 
-        # Calculate scaling and positioning for fullscreen
-        self._calculate_scaling()
-
-        # Sound manager
+        # Slow asset work runs on the loader's worker while the menu is up;
+        # headless runs load sounds inline and generate sprites on demand
         from sound_manager import SoundManager
 
+        loader = None if headless else asset_loader
         self.sound_manager = SoundManager(
-            os.path.join(os.path.dirname(__file__), "../assets")
+            os.path.join(os.path.dirname(__file__), "../assets"),
+            loader=loader,
+            cache_dir=os.path.join(
+                os.path.dirname(__file__), "..", ASSET_CACHE_DIRECTORY
+            ),
         )
+        if loader:
+            loader.submit("sprites", sprite_manager.ensure_generated)
 
         # Game state
         self.running = True
@@ -82,17 +140,28 @@ class GameEngine:
         self.enemy = None
         self.bullets = []
 
+        # Health lost per (fighter, damage source), or None when not tracked
+        self.damage_log = None
+        self.last_health = {}
+
         # Game systems
         self.menu_manager = MenuManager(self.game_surface, self)
 
+        # Effect, UI and audio feedback is driven by the frame event bus; this
+        # engine's sounds are subscribed only while it plays (see _play_sounds)
+        frame_events.subscribe(particle_system.apply_frame_events)
+        frame_events.subscribe(screen_effects.apply_frame_events)
+        frame_events.subscribe(enhanced_ui.apply_frame_events)
+
         # Enemy shooting system
         self.bullet_timer = 0
-        self.bullet_interval = random.randint(40, 120)
+        self.bullet_interval = rng_streams.ai.randint(40, 120)
 
         # Explosion tracking
         self.player1_exploded = False
         self.player2_exploded = False
         self.enemy_exploded = False
+        self.fresh_deaths = []  # Fighters that went down since the last render
 
         # Star Wars systems
         if STAR_WARS_ENABLED:
@@ -103,7 +172,19 @@ class GameEngine:
             self.game_mode_manager = create_game_mode_manager(self)
 
     def run(self):
-        """Main game loop with enhanced menu system and Star Wars character selection."""
+        """
+        Main game loop with enhanced menu system and Star Wars character selection.
+
+        Returns when the window is closed, without quitting pygame, and can
+        be called again afterwards (the launcher hub runs the engine as a
+        scene and keeps it, with its caches, between sessions).
+        """
+        self.running = True
+        if self.sessions_run:
+            # Another scene may have changed the display since the last session
+            self._apply_display_mode()
+        self.sessions_run += 1
+
         while self.running:
             # Reset game state before showing menu
             self._reset_game_state()
@@ -158,7 +239,14 @@ class GameEngine:
                 self._initialize_game()
 
                 # Run game loop
-                game_result = self._game_loop()
+                self._play_sounds(True)
+                try:
+                    game_result = self._game_loop()
+                except Exception:
+                    self._write_crash_dump()
+                    raise
+                finally:
+                    self._play_sounds(False)
 
                 # Handle game result
                 if game_result == "home":
@@ -188,7 +276,7 @@ class GameEngine:
 
         # Reset enemy shooting system
         self.bullet_timer = 0
-        self.bullet_interval = random.randint(40, 120)
+        self.bullet_interval = rng_streams.ai.randint(40, 120)
 
         # Clear platforms
         self.platforms = []
@@ -236,20 +324,22 @@ class GameEngine:
 
         pygame.display.flip()
 
-    def toggle_fullscreen(self):
-        """Toggle between fullscreen and windowed mode with proper scaling."""
-        self.fullscreen = not self.fullscreen
-
+    def _apply_display_mode(self):
+        """Set the window (or fullscreen) mode and recalculate scaling."""
         if self.fullscreen:
-            # Switch to fullscreen
             self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
         else:
-            # Switch to windowed mode
             self.screen = pygame.display.set_mode(self.original_size)
+        pygame.display.set_caption("STAR WARS: ULTIMATE BATTLE")
 
-        # Recalculate scaling for new mode
+        # Calculate scaling and positioning for fullscreen
         self._calculate_scaling()
 
+    def toggle_fullscreen(self):
+        """Toggle between fullscreen and windowed mode with proper scaling."""
+        self.fullscreen = not self.fullscreen
+        self._apply_display_mode()
+
         # Add visual feedback
         if self.fullscreen:
             enhanced_ui.add_floating_text(
@@ -260,8 +350,29 @@ class GameEngine:
                 WINDOW_WIDTH // 2 - 80, 50, "WINDOWED MODE", GREEN, 32
             )
 
-    def _initialize_game(self):
-        """Initialize game entities and state with character selections and game mode."""
+    def _initialize_game(self, match_seed=None):
+        """
+        Initialize game entities and state with character selections and game mode.
+
+        Args:
+            match_seed (int): Seed to play this match with (replays), or None
+                to derive the next one from the engine seed
+        """
+        # Reseed all random streams so every match is reproducible on its own
+        if match_seed is None:
+            match_seed = rng_streams.derive_seed(self.seed, self.match_index)
+            self.match_index += 1
+        self.match_seed = match_seed
+        rng_streams.seed(self.match_seed)
+        self.tick_count = 0
+
+        # Clear combat and mode state left over from the previous match
+        if STAR_WARS_ENABLED:
+            self.force_manager.reset()
+            self.lightsaber_combat.reset()
+            if hasattr(self, "game_mode_manager"):
+                self.game_mode_manager.set_mode(self.current_game_mode)
+
         # Generate platforms
         self.platforms = generate_random_platforms()
 
@@ -271,13 +382,13 @@ class GameEngine:
                 WINDOW_WIDTH // 8 - PLAYER_SIZE // 2,
                 WINDOW_HEIGHT // 2 - PLAYER_SIZE // 2,
                 1,
-                self.character_selections["player1"],
+                self._character_type(self.character_selections["player1"]),
             )
             self.player2 = Player(
                 7 * WINDOW_WIDTH // 8 - PLAYER2_SIZE // 2,
                 WINDOW_HEIGHT // 2 - PLAYER2_SIZE // 2,
                 2,
-                self.character_selections["player2"],
+                self._character_type(self.character_selections["player2"]),
             )
             self.enemy = None
         else:
@@ -286,7 +397,7 @@ class GameEngine:
                 WINDOW_WIDTH // 2 - PLAYER_SIZE // 2,
                 WINDOW_HEIGHT // 2 - PLAYER_SIZE // 2,
                 1,
-                self.character_selections["player1"],
+                self._character_type(self.character_selections["player1"]),
             )
             self.player2 = None
             # AI gets the opposite character type
@@ -294,9 +405,20 @@ class GameEngine:
             self.enemy = Enemy(
                 WINDOW_WIDTH // 4 - ENEMY_SIZE // 2,
                 WINDOW_HEIGHT // 2 - ENEMY_SIZE // 2,
-                ai_character,
+                self._character_type(ai_character),
             )
 
+        # Legendary characters bring their own health, Force and combat stats
+        if STAR_WARS_ENABLED:
+            for role, entity in (
+                ("player1", self.player1),
+                ("player2", self.player2),
+                ("ai", self.enemy),
+            ):
+                selection = self.character_selections.get(role)
+                if entity and selection in LEGENDARY_CHARACTERS:
+                    apply_character_profile(entity, selection)
+
         # Apply game mode restrictions and bonuses
         if STAR_WARS_ENABLED and hasattr(self, "game_mode_manager"):
             # Apply mode-specific restrictions to all entities
@@ -310,390 +432,583 @@ class GameEngine:
         # Reset game state
         self.bullets = []
         self.bullet_timer = 0
-        self.bullet_interval = random.randint(40, 120)
+        self.bullet_interval = rng_streams.ai.randint(40, 120)
         self.player1_exploded = False
         self.player2_exploded = False
         self.enemy_exploded = False
+        self.fresh_deaths = []
+        self.previous_positions = {}
+        self.last_health = {}
+        frame_events.clear()
+
+    def _character_type(self, selection):
+        """Return the entity type ("jedi"/"sith") of a selection or legendary key."""
+        if STAR_WARS_ENABLED and selection in LEGENDARY_CHARACTERS:
+            return LEGENDARY_CHARACTERS[selection].character_type
+        return selection
 
     def _game_loop(self):
-        """Main game loop with enhanced visual effects."""
+        """
+        Main game loop: fixed-rate simulation ticks, interpolated rendering.
+
+        Real time is fed to a fixed-timestep accumulator, so the simulation
+        always runs at SIMULATION_HZ however fast frames are drawn; each
+        frame runs the ticks that are due and then renders the entities
+        between their last two tick positions.
+        """
         game_over = False
         winner_title = ""
+        self._start_recording()
+        self.timestep.reset()
+        self.frame_histogram.reset()
+        pending_events = []
+        last_time = time.perf_counter()
 
         while not game_over and self.running:
-            # Handle events
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                    return "quit"
-
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_r:
-                        # Quick restart (rematch)
-                        return "rematch"
-
-                    if event.key == pygame.K_F11:
-                        # Toggle fullscreen
-                        self.toggle_fullscreen()
-                        enhanced_ui.add_floating_text(
-                            self.screen_width // 2 - 100,
-                            100,
-                            "Press F11 to toggle fullscreen",
-                            WHITE,
-                            24,
-                        )
+            now = time.perf_counter()
+            frame_time = now - last_time
+            last_time = now
+            self.frame_histogram.record(frame_time)
+
+            # Handle window and session controls (not part of the recording)
+            events = pygame.event.get()
+            for event in events:
+                control = self._handle_control_event(event)
+                if control:
+                    self._finish_recording()
+                    return control
+            # Presses wait for the next tick when a frame runs no tick
+            pending_events.extend(events)
+
+            for _ in range(self.timestep.advance(frame_time)):
+                # Capture this tick's gameplay input
+                frame = capture_input_frame(pending_events, self._game_mouse_pos())
+                pending_events = []
+                if self.recorder:
+                    self.recorder.record(frame)
+
+                self._store_previous_positions()
+                self._simulate_tick(frame)
+                self._update_visuals()
+
+                # Check for game over (including mode-specific win conditions)
+                winner_title = self._check_game_over()
+                if winner_title:
+                    game_over = True
+                    break
+
+            # Hand the events of this frame's ticks to the effect, UI and
+            # audio systems once, so they are coalesced across catch-up ticks
+            frame_events.dispatch()
+
+            # Render everything, between the last two ticks
+            self._render(self.timestep.alpha)
+
+            # Let the quality governor react to this frame's work time
+            quality_governor.record(time.perf_counter() - now)
+
+            self.clock.tick(RENDER_FPS)
+
+        if FRAME_TIME_REPORT:
+            print(self.frame_histogram.report())
+            print(f"Quality: {quality_governor.telemetry()}")
+            print(f"Effect budgets: {budget_stats.report()}")
+        self._finish_recording()
+
+        # Show game over screen if needed
+        if winner_title:
+            self.sound_manager.play("game_over")
+            menu_choice = self.menu_manager.show_game_over(winner_title)
+            return menu_choice
+
+        return "home"  # Default return to home if no winner
+
+    def _handle_control_event(self, event):
+        """
+        Handle quit, rematch and fullscreen requests.
+
+        Returns:
+            str: "quit" or "rematch" to leave the game loop, otherwise None
+        """
+        if event.type == pygame.QUIT:
+            self.running = False
+            return "quit"
+
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_r:
+                # Quick restart (rematch)
+                return "rematch"
+
+            if event.key == pygame.K_F11:
+                # Toggle fullscreen
+                self.toggle_fullscreen()
+                enhanced_ui.add_floating_text(
+                    self.screen_width // 2 - 100,
+                    100,
+                    "Press F11 to toggle fullscreen",
+                    WHITE,
+                    24,
+                )
+
+        return None
 
-                    # Weapon switching
-                    if event.key == pygame.K_1:
-                        self.player1.switch_weapon(WEAPON_BLASTER)
+    def _game_mouse_pos(self):
+        """Return the mouse position in game surface coordinates."""
+        mouse_x, mouse_y = pygame.mouse.get_pos()
+        if self.fullscreen:
+            mouse_x = int((mouse_x - self.offset_x) / self.scale_factor)
+            mouse_y = int((mouse_y - self.offset_y) / self.scale_factor)
+            mouse_x = max(0, min(WINDOW_WIDTH, mouse_x))
+            mouse_y = max(0, min(WINDOW_HEIGHT, mouse_y))
+        return mouse_x, mouse_y
+
+    def _combatants(self):
+        """Return every living entity taking part in the fight."""
+        return [
+            entity
+            for entity in (self.player1, self.player2, self.enemy)
+            if entity and entity.is_alive()
+        ]
+
+    def _simulate_tick(self, frame):
+        """
+        Advance the simulation by exactly one tick.
+
+        Everything that affects the outcome of a match happens here and only
+        depends on the InputFrame and the seeded random streams, so replaying
+        the same frames reproduces the match exactly.
+
+        Args:
+            frame (InputFrame): Player input for this tick
+        """
+        self.tick_count += 1
+        self.mouse_pos = frame.mouse_pos
+        self._process_input_events(frame)
+        self._record_damage("force_lightning")
+
+        # Update entities
+        keys = frame.keys
+
+        if self.player1.is_alive():
+            self.player1.update(keys, self.platforms)
+
+        if self.two_player_mode and self.player2 and self.player2.is_alive():
+            self.player2.update(keys, self.platforms)
+
+        if not self.two_player_mode and self.enemy and self.enemy.is_alive():
+            self.enemy.update(self.player1, self.platforms, self.difficulty)
+
+            # Enemy shooting
+            if self.player1.is_alive():
+                self.bullet_timer += 1
+                difficulty_config = DIFFICULTY_LEVELS[self.difficulty]
+                if self.bullet_timer >= rng_streams.ai.randint(
+                    difficulty_config["interval_min"],
+                    difficulty_config["interval_max"],
+                ):
+                    self.bullet_timer = 0
+                    direction = 1 if self.player1.x > self.enemy.x else -1
+                    enemy_bullet = Bullet(
+                        self.enemy.x + self.enemy.size // 2,
+                        self.enemy.y + self.enemy.size // 2,
+                        direction * difficulty_config["bullet_speed"],
+                        0,  # Enemy owner ID
+                    )
+                    self.bullets.append(enemy_bullet)
+
+                    # Add muzzle flash for enemy shooting
+                    dx = self.player1.x - self.enemy.x
+                    dy = self.player1.y - self.enemy.y
+                    angle = math.atan2(dy, dx)
+
+                    frame_events.publish(
+                        EVENT_SHOT,
+                        self.enemy.x + self.enemy.size // 2,
+                        self.enemy.y + self.enemy.size // 2,
+                        entity=self.enemy,
+                        angle=angle,
+                        particles="muzzle_flash",
+                        shake=(6, 10),
+                        flash=((255, 255, 200), 80, 4),
+                    )
+
+        self._record_damage("force_lightning")
+
+        # Update bullets
+        for bullet in self.bullets:
+            bullet.update()
+
+        # Update Star Wars systems
+        if STAR_WARS_ENABLED:
+            combatants = self._combatants()
+            self.force_manager.update(combatants)
+            self._record_damage("lightsaber_throw")
+            self.lightsaber_combat.update(combatants)
+            self._record_damage("lightsaber")
+
+            # Update game mode manager
+            if hasattr(self, "game_mode_manager"):
+                game_state = {
+                    "player1": self.player1,
+                    "player2": self.player2,
+                    "enemy": self.enemy,
+                    "bullets": self.bullets,
+                    "platforms": self.platforms,
+                }
+                self.game_mode_manager.update(game_state)
+
+        # Handle collisions (swept, so a bullet that crossed a target and left
+        # the screen in the same tick still hits), then drop missed bullets
+        self._handle_collisions()
+        self._record_damage("blaster")
+        self.bullets = [bullet for bullet in self.bullets if not bullet.is_off_screen()]
+
+        self._publish_deaths()
+
+    def _record_damage(self, source):
+        """
+        Attribute the health each fighter lost since the previous call to a
+        damage source. Only active when damage_log is set (arena runs); the
+        tick phases between calls each have a single way of dealing damage.
+
+        Args:
+            source (str): Damage source of the phase that just ran
+        """
+        log = self.damage_log
+        if log is None:
+            return
+        for role, entity in (
+            ("player1", self.player1),
+            ("player2", self.player2),
+            ("enemy", self.enemy),
+        ):
+            if entity is None:
+                continue
+            last = self.last_health.get(role, entity.health)
+            if entity.health < last:
+                log[role, source] += last - entity.health
+            self.last_health[role] = entity.health
+
+    def _publish_deaths(self):
+        """Publish a death event the tick each fighter goes down."""
+        fighters = [(self.player1, "player1_exploded", "JEDI DOWN!", RED, 32, (8, 15))]
+        if self.two_player_mode:
+            fighters.append(
+                (self.player2, "player2_exploded", "SITH DOWN!", BLUE, 32, (8, 15))
+            )
+        else:
+            fighters.append(
+                (self.enemy, "enemy_exploded", "ENEMY DESTROYED!", GREEN, 28, (6, 12))
+            )
+
+        for entity, exploded_flag, text, color, text_size, shake in fighters:
+            if entity and not entity.is_alive() and not getattr(self, exploded_flag):
+                setattr(self, exploded_flag, True)
+                self.fresh_deaths.append(entity)
+                frame_events.publish(
+                    EVENT_DEATH,
+                    entity.x + entity.size // 2,
+                    entity.y + entity.size // 2,
+                    entity=entity,
+                    color=color,
+                    text=text,
+                    text_size=text_size,
+                    particles="explosion",
+                    particle_color=entity.color,
+                    shake=shake,
+                )
+
+    def _process_input_events(self, frame):
+        """Apply the key and mouse presses recorded in an input frame."""
+        for kind, code in frame.events:
+            if kind == EVENT_KEYDOWN:
+                key = code
+
+                # Weapon switching
+                if key == pygame.K_1:
+                    self.player1.switch_weapon(WEAPON_BLASTER)
+                    enhanced_ui.add_floating_text(
+                        self.player1.x,
+                        self.player1.y - 30,
+                        "BLASTER EQUIPPED",
+                        GREEN,
+                        20,
+                    )
+                    if self.two_player_mode and self.player2:
+                        self.player2.switch_weapon(WEAPON_BLASTER)
                         enhanced_ui.add_floating_text(
-                            self.player1.x,
-                            self.player1.y - 30,
+                            self.player2.x,
+                            self.player2.y - 30,
                             "BLASTER EQUIPPED",
-                            GREEN,
+                            BLUE,
                             20,
                         )
+
+                # Force Powers (Star Wars Mode)
+                if STAR_WARS_ENABLED:
+                    # Force Push - Q key
+                    if key == pygame.K_q and self.player1.is_alive():
+                        mouse_x, mouse_y = frame.mouse_pos
+                        targets = []
                         if self.two_player_mode and self.player2:
-                            self.player2.switch_weapon(WEAPON_BLASTER)
-                            enhanced_ui.add_floating_text(
-                                self.player2.x,
-                                self.player2.y - 30,
-                                "BLASTER EQUIPPED",
-                                BLUE,
-                                20,
+                            targets.append(self.player2)
+                        elif self.enemy:
+                            targets.append(self.enemy)
+
+                        if self.force_manager.use_power(
+                            "force_push", self.player1, mouse_x, mouse_y, targets
+                        ):
+                            frame_events.publish(
+                                EVENT_POWER_USED,
+                                self.player1.x,
+                                self.player1.y - 40,
+                                entity=self.player1,
+                                text="FORCE PUSH!",
+                                color=BLUE,
                             )
 
-                    # Force Powers (Star Wars Mode)
-                    if STAR_WARS_ENABLED:
-                        # Force Push - Q key
-                        if event.key == pygame.K_q and self.player1.is_alive():
-                            mouse_x, mouse_y = pygame.mouse.get_pos()
-                            targets = []
-                            if self.two_player_mode and self.player2:
-                                targets.append(self.player2)
-                            elif self.enemy:
-                                targets.append(self.enemy)
-
-                            if self.force_manager.use_power(
-                                "force_push", self.player1, mouse_x, mouse_y, targets
-                            ):
-                                enhanced_ui.add_floating_text(
-                                    self.player1.x,
-                                    self.player1.y - 40,
-                                    "FORCE PUSH!",
-                                    BLUE,
-                                    24,
-                                )
-
-                        # Force Lightning - E key (in two-player mode, different from shooting)
-                        if event.key == pygame.K_t and self.player1.is_alive():
-                            mouse_x, mouse_y = pygame.mouse.get_pos()
-                            targets = []
-                            if self.two_player_mode and self.player2:
-                                targets.append(self.player2)
-                            elif self.enemy:
-                                targets.append(self.enemy)
-
-                            if self.force_manager.use_power(
-                                "force_lightning",
-                                self.player1,
-                                mouse_x,
-                                mouse_y,
-                                targets,
-                            ):
-                                enhanced_ui.add_floating_text(
-                                    self.player1.x,
-                                    self.player1.y - 40,
-                                    "FORCE LIGHTNING!",
-                                    (128, 0, 128),
-                                    24,
-                                )
-
-                        # Lightsaber Throw - G key
-                        if event.key == pygame.K_g and self.player1.is_alive():
-                            mouse_x, mouse_y = pygame.mouse.get_pos()
-                            targets = []
-                            if self.two_player_mode and self.player2:
-                                targets.append(self.player2)
-                            elif self.enemy:
-                                targets.append(self.enemy)
-
-                            if self.force_manager.use_power(
-                                "lightsaber_throw",
-                                self.player1,
-                                mouse_x,
-                                mouse_y,
-                                targets,
-                            ):
-                                enhanced_ui.add_floating_text(
-                                    self.player1.x,
-                                    self.player1.y - 40,
-                                    "LIGHTSABER THROW!",
-                                    (0, 255, 255),
-                                    24,
-                                )
-
-                        # Force Heal - H key
-                        if event.key == pygame.K_h and self.player1.is_alive():
-                            if self.force_manager.use_power(
-                                "force_heal",
-                                self.player1,
+                    # Force Lightning - E key (in two-player mode, different from shooting)
+                    if key == pygame.K_t and self.player1.is_alive():
+                        mouse_x, mouse_y = frame.mouse_pos
+                        targets = []
+                        if self.two_player_mode and self.player2:
+                            targets.append(self.player2)
+                        elif self.enemy:
+                            targets.append(self.enemy)
+
+                        if self.force_manager.use_power(
+                            "force_lightning",
+                            self.player1,
+                            mouse_x,
+                            mouse_y,
+                            targets,
+                        ):
+                            frame_events.publish(
+                                EVENT_POWER_USED,
                                 self.player1.x,
-                                self.player1.y,
-                                [self.player1],
-                            ):
-                                enhanced_ui.add_floating_text(
-                                    self.player1.x,
-                                    self.player1.y - 40,
-                                    "FORCE HEAL!",
-                                    GREEN,
-                                    24,
-                                )
-
-                        # Lightsaber Attack - F key
-                        if event.key == pygame.K_f and self.player1.is_alive():
-                            mouse_x, mouse_y = pygame.mouse.get_pos()
-                            if self.lightsaber_combat.start_attack(
-                                self.player1, mouse_x, mouse_y
-                            ):
-                                enhanced_ui.add_floating_text(
-                                    self.player1.x,
-                                    self.player1.y - 40,
-                                    "LIGHTSABER STRIKE!",
-                                    RED,
-                                    24,
-                                )
-
-                        # Environment Switching - Number keys 2-5
-                        if event.key == pygame.K_2:
-                            self.current_environment = "death_star"
-                            enhanced_ui.add_floating_text(
-                                WINDOW_WIDTH // 2, 50, "DEATH STAR", WHITE, 32
-                            )
-                        elif event.key == pygame.K_3:
-                            self.current_environment = "tatooine"
-                            enhanced_ui.add_floating_text(
-                                WINDOW_WIDTH // 2, 50, "TATOOINE", (255, 255, 0), 32
-                            )
-                        elif event.key == pygame.K_4:
-                            self.current_environment = "endor"
-                            enhanced_ui.add_floating_text(
-                                WINDOW_WIDTH // 2, 50, "ENDOR", GREEN, 32
-                            )
-                        elif event.key == pygame.K_5:
-                            self.current_environment = "hoth"
-                            enhanced_ui.add_floating_text(
-                                WINDOW_WIDTH // 2, 50, "HOTH", (0, 255, 255), 32
+                                self.player1.y - 40,
+                                entity=self.player1,
+                                text="FORCE LIGHTNING!",
+                                color=(128, 0, 128),
                             )
 
-                    # Jumping with dust effects
-                    if self.two_player_mode:
-                        if event.key == pygame.K_w and self.player1.is_alive():
-                            self.player1.jump()
-                            particle_system.add_jump_dust(
-                                self.player1.x + self.player1.size // 2,
-                                self.player1.y + self.player1.size,
+                    # Lightsaber Throw - G key
+                    if key == pygame.K_g and self.player1.is_alive():
+                        mouse_x, mouse_y = frame.mouse_pos
+                        targets = []
+                        if self.two_player_mode and self.player2:
+                            targets.append(self.player2)
+                        elif self.enemy:
+                            targets.append(self.enemy)
+
+                        if self.force_manager.use_power(
+                            "lightsaber_throw",
+                            self.player1,
+                            mouse_x,
+                            mouse_y,
+                            targets,
+                        ):
+                            frame_events.publish(
+                                EVENT_POWER_USED,
+                                self.player1.x,
+                                self.player1.y - 40,
+                                entity=self.player1,
+                                text="LIGHTSABER THROW!",
+                                color=(0, 255, 255),
                             )
-                            self.sound_manager.play("jump")
-                        if event.key == pygame.K_UP and self.player2.is_alive():
-                            self.player2.jump()
-                            particle_system.add_jump_dust(
-                                self.player2.x + self.player2.size // 2,
-                                self.player2.y + self.player2.size,
+
+                    # Force Heal - H key
+                    if key == pygame.K_h and self.player1.is_alive():
+                        if self.force_manager.use_power(
+                            "force_heal",
+                            self.player1,
+                            self.player1.x,
+                            self.player1.y,
+                            [self.player1],
+                        ):
+                            frame_events.publish(
+                                EVENT_POWER_USED,
+                                self.player1.x,
+                                self.player1.y - 40,
+                                entity=self.player1,
+                                text="FORCE HEAL!",
+                                color=GREEN,
                             )
-                            self.sound_manager.play("jump")
-                    else:
-                        if event.key == pygame.K_SPACE and self.player1.is_alive():
-                            self.player1.jump()
-                            particle_system.add_jump_dust(
-                                self.player1.x + self.player1.size // 2,
-                                self.player1.y + self.player1.size,
+
+                    # Lightsaber Attack - F key
+                    if key == pygame.K_f and self.player1.is_alive():
+                        mouse_x, mouse_y = frame.mouse_pos
+                        if self.lightsaber_combat.start_attack(
+                            self.player1, mouse_x, mouse_y
+                        ):
+                            frame_events.publish(
+                                EVENT_POWER_USED,
+                                self.player1.x,
+                                self.player1.y - 40,
+                                entity=self.player1,
+                                text="LIGHTSABER STRIKE!",
+                                color=RED,
                             )
-                            self.sound_manager.play("jump")
-
-                    # Shooting with muzzle flash effects
-                    if self.two_player_mode:
-                        if event.key == pygame.K_e and self.player1.is_alive():
-                            new_bullets = self.player1.shoot()
-                            if new_bullets:
-                                self.bullets.extend(new_bullets)
-                                # Add muzzle flash
-                                mouse_x, mouse_y = pygame.mouse.get_pos()
-                                angle = math.atan2(
-                                    mouse_y - self.player1.y, mouse_x - self.player1.x
-                                )
-                                particle_system.add_muzzle_flash(
-                                    self.player1.x + self.player1.size // 2,
-                                    self.player1.y + self.player1.size // 2,
-                                    angle,
-                                )
-                                screen_effects.add_screen_shake(8, 15)
-                                screen_effects.add_screen_flash((255, 255, 255), 120, 6)
-                                self.sound_manager.play("shoot")
-
-                        if event.key == pygame.K_KP0 and self.player2.is_alive():
-                            new_bullets = self.player2.shoot()
-                            if new_bullets:
-                                self.bullets.extend(new_bullets)
-                                # Add muzzle flash for player 2
-                                particle_system.add_muzzle_flash(
-                                    self.player2.x + self.player2.size // 2,
-                                    self.player2.y + self.player2.size // 2,
-                                    0,  # Facing right by default
-                                )
-                                screen_effects.add_screen_shake(8, 15)
-                                screen_effects.add_screen_flash((255, 255, 255), 120, 6)
-                                self.sound_manager.play("shoot")
-
-                # Shooting (mouse for single player)
-                if not self.two_player_mode and event.type == pygame.MOUSEBUTTONDOWN:
-                    if event.button == 1 and self.player1.is_alive():
-                        mouse_x, mouse_y = pygame.mouse.get_pos()
-                        # Set facing direction based on mouse position
-                        self.player1.facing_right = mouse_x > self.player1.x
+
+                    # Environment Switching - Number keys 2-5
+                    if key == pygame.K_2:
+                        self.current_environment = "death_star"
+                        enhanced_ui.add_floating_text(
+                            WINDOW_WIDTH // 2, 50, "DEATH STAR", WHITE, 32
+                        )
+                    elif key == pygame.K_3:
+                        self.current_environment = "tatooine"
+                        enhanced_ui.add_floating_text(
+                            WINDOW_WIDTH // 2, 50, "TATOOINE", (255, 255, 0), 32
+                        )
+                    elif key == pygame.K_4:
+                        self.current_environment = "endor"
+                        enhanced_ui.add_floating_text(
+                            WINDOW_WIDTH // 2, 50, "ENDOR", GREEN, 32
+                        )
+                    elif key == pygame.K_5:
+                        self.current_environment = "hoth"
+                        enhanced_ui.add_floating_text(
+                            WINDOW_WIDTH // 2, 50, "HOTH", (0, 255, 255), 32
+                        )
+
+                # Jumping with dust effects
+                if self.two_player_mode:
+                    if key == pygame.K_w and self.player1.is_alive():
+                        self.player1.jump()
+                        frame_events.publish(
+                            EVENT_JUMP,
+                            self.player1.x + self.player1.size // 2,
+                            self.player1.y + self.player1.size,
+                            entity=self.player1,
+                            particles="jump_dust",
+                        )
+                    if key == pygame.K_UP and self.player2.is_alive():
+                        self.player2.jump()
+                        frame_events.publish(
+                            EVENT_JUMP,
+                            self.player2.x + self.player2.size // 2,
+                            self.player2.y + self.player2.size,
+                            entity=self.player2,
+                            particles="jump_dust",
+                        )
+                else:
+                    if key == pygame.K_SPACE and self.player1.is_alive():
+                        self.player1.jump()
+                        frame_events.publish(
+                            EVENT_JUMP,
+                            self.player1.x + self.player1.size // 2,
+                            self.player1.y + self.player1.size,
+                            entity=self.player1,
+                            particles="jump_dust",
+                        )
+
+                # Shooting with muzzle flash effects
+                if self.two_player_mode:
+                    if key == pygame.K_e and self.player1.is_alive():
                         new_bullets = self.player1.shoot()
                         if new_bullets:
                             self.bullets.extend(new_bullets)
-                            # Calculate angle towards mouse for muzzle flash
-                            import math
-
-                            dx = mouse_x - (self.player1.x + self.player1.size // 2)
-                            dy = mouse_y - (self.player1.y + self.player1.size // 2)
-                            angle = math.atan2(dy, dx)
-
-                            # Add muzzle flash effect
-                            particle_system.add_muzzle_flash(
+                            # Add muzzle flash
+                            mouse_x, mouse_y = frame.mouse_pos
+                            angle = math.atan2(
+                                mouse_y - self.player1.y, mouse_x - self.player1.x
+                            )
+                            frame_events.publish(
+                                EVENT_SHOT,
                                 self.player1.x + self.player1.size // 2,
                                 self.player1.y + self.player1.size // 2,
-                                angle,
+                                entity=self.player1,
+                                angle=angle,
+                                particles="muzzle_flash",
+                                shake=(8, 15),
+                                flash=((255, 255, 255), 120, 6),
                             )
-                            screen_effects.add_screen_shake(
-                                8, 15
-                            )  # Much more intense shake
-                            screen_effects.add_screen_flash(
-                                (255, 255, 255), 120, 6
-                            )  # Brighter, longer flash
-                            self.sound_manager.play("shoot")
-
-            # Update entities
-            keys = pygame.key.get_pressed()
 
-            if self.player1.is_alive():
-                self.player1.update(keys, self.platforms)
-
-            if self.two_player_mode and self.player2 and self.player2.is_alive():
-                self.player2.update(keys, self.platforms)
-
-            if not self.two_player_mode and self.enemy and self.enemy.is_alive():
-                self.enemy.update(self.player1, self.platforms, self.difficulty)
-
-                # Enemy shooting
-                if self.player1.is_alive():
-                    self.bullet_timer += 1
-                    difficulty_config = DIFFICULTY_LEVELS[self.difficulty]
-                    if self.bullet_timer >= random.randint(
-                        difficulty_config["interval_min"],
-                        difficulty_config["interval_max"],
-                    ):
-                        self.bullet_timer = 0
-                        direction = 1 if self.player1.x > self.enemy.x else -1
-                        enemy_bullet = Bullet(
-                            self.enemy.x + self.enemy.size // 2,
-                            self.enemy.y + self.enemy.size // 2,
-                            direction * difficulty_config["bullet_speed"],
-                            0,  # Enemy owner ID
-                        )
-                        self.bullets.append(enemy_bullet)
+                    if key == pygame.K_KP0 and self.player2.is_alive():
+                        new_bullets = self.player2.shoot()
+                        if new_bullets:
+                            self.bullets.extend(new_bullets)
+                            # Add muzzle flash for player 2
+                            frame_events.publish(
+                                EVENT_SHOT,
+                                self.player2.x + self.player2.size // 2,
+                                self.player2.y + self.player2.size // 2,
+                                entity=self.player2,
+                                angle=0,  # Facing right by default
+                                particles="muzzle_flash",
+                                shake=(8, 15),
+                                flash=((255, 255, 255), 120, 6),
+                            )
 
-                        # Add muzzle flash for enemy shooting
-                        dx = self.player1.x - self.enemy.x
-                        dy = self.player1.y - self.enemy.y
+            # Shooting (mouse for single player)
+            if not self.two_player_mode and kind == EVENT_MOUSEDOWN:
+                if code == 1 and self.player1.is_alive():
+                    mouse_x, mouse_y = frame.mouse_pos
+                    # Set facing direction based on mouse position
+                    self.player1.facing_right = mouse_x > self.player1.x
+                    new_bullets = self.player1.shoot()
+                    if new_bullets:
+                        self.bullets.extend(new_bullets)
+                        # Calculate angle towards mouse for muzzle flash
+                        dx = mouse_x - (self.player1.x + self.player1.size // 2)
+                        dy = mouse_y - (self.player1.y + self.player1.size // 2)
                         angle = math.atan2(dy, dx)
 
-                        particle_system.add_muzzle_flash(
-                            self.enemy.x + self.enemy.size // 2,
-                            self.enemy.y + self.enemy.size // 2,
-                            angle,
+                        # Add muzzle flash effect
+                        frame_events.publish(
+                            EVENT_SHOT,
+                            self.player1.x + self.player1.size // 2,
+                            self.player1.y + self.player1.size // 2,
+                            entity=self.player1,
+                            angle=angle,
+                            particles="muzzle_flash",
+                            shake=(8, 15),
+                            flash=((255, 255, 255), 120, 6),
                         )
-                        screen_effects.add_screen_shake(6, 10)
-                        screen_effects.add_screen_flash((255, 255, 200), 80, 4)
-                        self.sound_manager.play("shoot")
-
-            # Update bullets
-            for bullet in self.bullets[:]:
-                bullet.update()
-                if bullet.is_off_screen():
-                    self.bullets.remove(bullet)
-
-            # Update Star Wars systems
-            if STAR_WARS_ENABLED:
-                self.force_manager.update()
-                self.lightsaber_combat.update()
-                if hasattr(self, "environment_manager"):
-                    self.environment_manager.update()
-
-                # Update game mode manager
-                if hasattr(self, "game_mode_manager"):
-                    game_state = {
-                        "player1": self.player1,
-                        "player2": self.player2,
-                        "enemy": self.enemy,
-                        "bullets": self.bullets,
-                        "platforms": self.platforms,
-                    }
-                    self.game_mode_manager.update(game_state)
-
-            # Handle collisions
-            self._handle_collisions()
-
-            # Update visual effects
-            particle_system.update()
-            screen_effects.update()
-            enhanced_ui.update()
-            animation_manager.update_animations()
-            background_manager.update()
-
-            # Render everything
-            self._render()
-
-            # Check for game over (including mode-specific win conditions)
-            winner_title = self._check_game_over()
-            if winner_title:
-                game_over = True
-
-            self.clock.tick(FPS)
 
-        # Show game over screen if needed
-        if winner_title:
-            self.sound_manager.play("game_over")
-            menu_choice = self.menu_manager.show_game_over(winner_title)
-            return menu_choice
+    def _update_visuals(self):
+        """Advance purely visual systems (particles, UI animation, backgrounds)."""
+        # Bullet trails
+        for bullet in self.bullets:
+            particle_system.add_bullet_trail(
+                bullet.x, bullet.y, bullet.dx, 0, bullet.color
+            )
 
-        return "home"  # Default return to home if no winner
+        particle_system.update()
+        screen_effects.update()
+        enhanced_ui.update()
+        animation_manager.update_animations()
+        background_manager.update()
+        if STAR_WARS_ENABLED and hasattr(self, "environment_manager"):
+            self.environment_manager.update()
 
     def _handle_collisions(self):
         """Handle all collision detection and responses."""
-        # Bullet vs Player collisions
+        # Bullet vs Player collisions, tested along each bullet's path this tick
         for bullet in self.bullets[:]:
             bullet_hit = False
 
             # Enemy bullets vs Player 1
             if bullet.owner_id == 0 and self.player1.is_alive():
-                if bullet.rect.colliderect(self.player1.rect):
+                toi = bullet.sweep(self.player1.rect)
+                if toi is not None:
+                    bullet.move_to_impact(toi)
                     self.player1.take_damage(bullet.damage, bullet.dx)
                     # Add visual effects
-                    enhanced_ui.add_damage_indicator(
-                        bullet.x, bullet.y, bullet.damage, RED
-                    )
-                    particle_system.add_blood_splatter(
-                        self.player1.x + self.player1.size // 2,
-                        self.player1.y + self.player1.size // 2,
+                    frame_events.publish(
+                        EVENT_HIT,
+                        bullet.x,
+                        bullet.y,
+                        entity=self.player1,
+                        amount=bullet.damage,
+                        color=RED,
+                        particles="blood",
+                        shake=(3, 8),
+                        flash=(RED, 80, 3),
                     )
-                    screen_effects.add_screen_shake(3, 8)
-                    screen_effects.add_screen_flash(RED, 80, 3)
                     self.bullets.remove(bullet)
                     bullet_hit = True
-                    self.sound_manager.play("damage")
 
             # Player 1 bullets vs Enemy (single player mode)
             elif (
@@ -702,22 +1017,23 @@ class GameEngine:
                 and self.enemy
                 and self.enemy.is_alive()
             ):
-                if bullet.rect.colliderect(self.enemy.rect):
+                toi = bullet.sweep(self.enemy.rect)
+                if toi is not None:
+                    bullet.move_to_impact(toi)
                     self.enemy.take_damage(bullet.damage, bullet.dx)
                     # Add visual effects
-                    enhanced_ui.add_damage_indicator(
-                        bullet.x, bullet.y, bullet.damage, ORANGE
+                    frame_events.publish(
+                        EVENT_HIT,
+                        bullet.x,
+                        bullet.y,
+                        entity=self.enemy,
+                        amount=bullet.damage,
+                        color=ORANGE,
+                        particles="sparks",
+                        shake=(2, 6),
                     )
-                    particle_system.add_explosion(
-                        self.enemy.x + self.enemy.size // 2,
-                        self.enemy.y + self.enemy.size // 2,
-                        (255, 150, 0),
-                        8,
-                    )
-                    screen_effects.add_screen_shake(2, 6)
                     self.bullets.remove(bullet)
                     bullet_hit = True
-                    self.sound_manager.play("damage")
 
             # Player 1 bullets vs Player 2 (two player mode)
             elif (
@@ -726,21 +1042,24 @@ class GameEngine:
                 and self.player2
                 and self.player2.is_alive()
             ):
-                if bullet.rect.colliderect(self.player2.rect):
+                toi = bullet.sweep(self.player2.rect)
+                if toi is not None:
+                    bullet.move_to_impact(toi)
                     self.player2.take_damage(bullet.damage, bullet.dx)
                     # Add visual effects
-                    enhanced_ui.add_damage_indicator(
-                        bullet.x, bullet.y, bullet.damage, RED
-                    )
-                    particle_system.add_blood_splatter(
-                        self.player2.x + self.player2.size // 2,
-                        self.player2.y + self.player2.size // 2,
+                    frame_events.publish(
+                        EVENT_HIT,
+                        bullet.x,
+                        bullet.y,
+                        entity=self.player2,
+                        amount=bullet.damage,
+                        color=RED,
+                        particles="blood",
+                        shake=(3, 8),
+                        flash=(RED, 80, 3),
                     )
-                    screen_effects.add_screen_shake(3, 8)
-                    screen_effects.add_screen_flash(RED, 80, 3)
                     self.bullets.remove(bullet)
                     bullet_hit = True
-                    self.sound_manager.play("damage")
 
             # Player 2 bullets vs Player 1 (two player mode)
             elif (
@@ -748,19 +1067,68 @@ class GameEngine:
                 and self.two_player_mode
                 and self.player1.is_alive()
             ):
-                if bullet.rect.colliderect(self.player1.rect):
+                toi = bullet.sweep(self.player1.rect)
+                if toi is not None:
+                    bullet.move_to_impact(toi)
                     self.player1.take_damage(bullet.damage, bullet.dx)
+                    frame_events.publish(
+                        EVENT_HIT, bullet.x, bullet.y, entity=self.player1
+                    )
                     self.bullets.remove(bullet)
                     bullet_hit = True
-                    self.sound_manager.play("damage")
 
-    def _render(self):
+    def _interpolated_entities(self):
+        """Return the moving entities that are drawn between ticks."""
+        entities = [e for e in (self.player1, self.player2, self.enemy) if e]
+        return entities + self.bullets
+
+    def _store_previous_positions(self):
+        """Remember where each entity is before a tick, for interpolation."""
+        self.previous_positions = {
+            entity: (entity.x, entity.y) for entity in self._interpolated_entities()
+        }
+
+    def _render(self, alpha=1.0):
+        """
+        Render the current state, drawing entities between ticks.
+
+        Args:
+            alpha (float): Position between the previous tick (0.0) and
+                the latest one (1.0)
+        """
+        moved = []
+        if alpha < 1.0:
+            for entity in self._interpolated_entities():
+                previous = self.previous_positions.get(entity)
+                if previous is None:
+                    continue  # Spawned this tick: draw where it is
+                moved.append((entity, entity.x, entity.y))
+                entity.x = previous[0] + (entity.x - previous[0]) * alpha
+                entity.y = previous[1] + (entity.y - previous[1]) * alpha
+        try:
+            self._draw_frame()
+        finally:
+            # Put the simulation positions back
+            for entity, x, y in moved:
+                entity.x = x
+                entity.y = y
+
+    def _draw_frame(self):
         """Render all game objects with enhanced Star Wars visuals and proper fullscreen scaling."""
-        # Update all entity animations before rendering
-        animation_manager.update_animations()
+        self._compose_frame()
+        self._present_frame()
 
+    def _compose_frame(self):
+        """
+        Draw the world, effects and UI onto game_surface (at the original
+        resolution), without touching the display. Pixel observations are
+        taken from the composed surface.
+        """
         # Apply screen shake offset
         shake_x, shake_y = screen_effects.get_screen_offset()
+        shake_mode = quality_governor.shake_mode
+        if shake_mode == "off":
+            shake_x = shake_y = 0
 
         # Clear and draw to the game surface (original resolution)
         self.game_surface.fill(WHITE)
@@ -773,11 +1141,11 @@ class GameEngine:
         else:
             background_manager.draw_space_background(self.game_surface)
 
-        # Create a temporary surface for shake effect
-        if shake_x != 0 or shake_y != 0:
-            temp_surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-            temp_surface.fill((0, 0, 0))
-            render_surface = temp_surface
+        # Draw the world to a separate layer while shaking, so it can be
+        # offset as a whole ("scroll" shakes the finished frame instead)
+        if (shake_x != 0 or shake_y != 0) and shake_mode == "layer":
+            self.shake_surface.fill((0, 0, 0))
+            render_surface = self.shake_surface
         else:
             render_surface = self.game_surface
 
@@ -791,7 +1159,7 @@ class GameEngine:
 
         # Draw Star Wars Force power effects
         if STAR_WARS_ENABLED:
-            self.force_manager.draw(render_surface)
+            self.force_manager.draw_effects(render_surface)
             self.lightsaber_combat.draw(render_surface)
 
         # Draw entities with sprites
@@ -801,16 +1169,7 @@ class GameEngine:
                 draw_x_above(
                     render_surface, self.player1.x, self.player1.y, self.player1.size
                 )
-                if not self.player1_exploded:
-                    particle_system.add_explosion(
-                        self.player1.x + self.player1.size // 2,
-                        self.player1.y + self.player1.size // 2,
-                        self.player1.color,
-                    )
-                    screen_effects.add_screen_shake(8, 15)
-                    enhanced_ui.add_floating_text(
-                        self.player1.x, self.player1.y - 20, "JEDI DOWN!", RED, 32
-                    )
+                if self.player1 in self.fresh_deaths:
                     break_into_pieces(
                         render_surface,
                         self.player1.x,
@@ -818,7 +1177,6 @@ class GameEngine:
                         self.player1.size,
                         self.player1.color,
                     )
-                    self.player1_exploded = True
 
         if self.two_player_mode and self.player2:
             self.player2.draw(render_surface)
@@ -826,16 +1184,7 @@ class GameEngine:
                 draw_x_above(
                     render_surface, self.player2.x, self.player2.y, self.player2.size
                 )
-                if not self.player2_exploded:
-                    particle_system.add_explosion(
-                        self.player2.x + self.player2.size // 2,
-                        self.player2.y + self.player2.size // 2,
-                        self.player2.color,
-                    )
-                    screen_effects.add_screen_shake(8, 15)
-                    enhanced_ui.add_floating_text(
-                        self.player2.x, self.player2.y - 20, "SITH DOWN!", BLUE, 32
-                    )
+                if self.player2 in self.fresh_deaths:
                     break_into_pieces(
                         render_surface,
                         self.player2.x,
@@ -843,7 +1192,6 @@ class GameEngine:
                         self.player2.size,
                         self.player2.color,
                     )
-                    self.player2_exploded = True
 
         if not self.two_player_mode and self.enemy:
             self.enemy.draw(render_surface)
@@ -851,16 +1199,7 @@ class GameEngine:
                 draw_x_above(
                     render_surface, self.enemy.x, self.enemy.y, self.enemy.size
                 )
-                if not self.enemy_exploded:
-                    particle_system.add_explosion(
-                        self.enemy.x + self.enemy.size // 2,
-                        self.enemy.y + self.enemy.size // 2,
-                        self.enemy.color,
-                    )
-                    screen_effects.add_screen_shake(6, 12)
-                    enhanced_ui.add_floating_text(
-                        self.enemy.x, self.enemy.y - 20, "ENEMY DESTROYED!", GREEN, 28
-                    )
+                if self.enemy in self.fresh_deaths:
                     break_into_pieces(
                         render_surface,
                         self.enemy.x,
@@ -868,23 +1207,23 @@ class GameEngine:
                         self.enemy.size,
                         self.enemy.color,
                     )
-                    self.enemy_exploded = True
+
+        self.fresh_deaths = []
 
         # Draw bullets with enhanced effects
         for bullet in self.bullets:
-            # Add bullet trails
-            particle_system.add_bullet_trail(
-                bullet.x, bullet.y, bullet.dx, 0, bullet.color
-            )
             # Draw bullet using its draw method (supports enhanced/animated sprites)
             bullet.draw(render_surface)
 
         # Draw particle effects
         particle_system.draw(render_surface)
 
-        # Apply screen shake by blitting the temp surface with offset
+        # Apply screen shake by blitting the world layer with offset
         if shake_x != 0 or shake_y != 0:
-            self.game_surface.blit(temp_surface, (shake_x, shake_y))
+            if shake_mode == "layer":
+                self.game_surface.blit(self.shake_surface, (shake_x, shake_y))
+            else:
+                self.game_surface.scroll(shake_x, shake_y)
 
         # Draw screen flash to game surface
         screen_effects.draw_flash(self.game_surface)
@@ -901,12 +1240,19 @@ class GameEngine:
         enemies = [self.enemy] if self.enemy and self.enemy.is_alive() else []
         enhanced_ui.draw_mini_map(self.game_surface, players, enemies, self.platforms)
 
-        # Now handle the final display with proper scaling
+    def _present_frame(self):
+        """Show the composed game_surface on the display, scaled to fit."""
         self.screen.fill(BLACK)  # Fill with black borders
 
         if self.fullscreen and self.scale_factor != 1.0:
-            # Scale and center the game surface for fullscreen
-            scaled_surface = pygame.transform.scale(
+            # Scale and center the game surface for fullscreen (filtered
+            # scaling unless the quality governor has dropped it)
+            scale = (
+                pygame.transform.smoothscale
+                if quality_governor.smooth_scaling
+                else pygame.transform.scale
+            )
+            scaled_surface = scale(
                 self.game_surface, (self.scaled_width, self.scaled_height)
             )
             self.screen.blit(scaled_surface, (self.offset_x, self.offset_y))
@@ -917,13 +1263,17 @@ class GameEngine:
         pygame.display.flip()
 
     def _draw_ui(self):
-        """Draw enhanced Star Wars user interface elements."""
-        font = pygame.font.Font(None, 24)
+        """
+        Draw enhanced Star Wars user interface elements.
 
+        Bars, weapon panels and the hints panel are retained HUD widgets,
+        re-rendered only when the values they show change.
+        """
         # Enhanced health bars
         if self.two_player_mode:
-            EnhancedRenderer.draw_health_bar_enhanced(
+            self.hud.draw_bar(
                 self.game_surface,
+                "p1_health",
                 10,
                 10,
                 200,
@@ -936,13 +1286,13 @@ class GameEngine:
                 label_text = f"{self.player1.character_name}"
             else:
                 label_text = "Player 1"
-            label = font.render(label_text, True, WHITE)
-            self.game_surface.blit(label, (10, 35))
+            self.hud.draw_label(self.game_surface, label_text, 10, 35)
 
             # Force energy bar for Player 1
             if STAR_WARS_ENABLED and hasattr(self.player1, "force_energy"):
-                EnhancedRenderer.draw_health_bar_enhanced(
+                self.hud.draw_bar(
                     self.game_surface,
+                    "p1_force",
                     10,
                     50,
                     200,
@@ -952,12 +1302,14 @@ class GameEngine:
                     bar_color=BLUE,
                     bg_color=(30, 30, 100),
                 )
-                force_label = font.render("Force Energy", True, BLUE)
-                self.game_surface.blit(force_label, (10, 70))
+                self.hud.draw_label(
+                    self.game_surface, "Force Energy", 10, 70, color=BLUE
+                )
 
             if self.player2:
-                EnhancedRenderer.draw_health_bar_enhanced(
+                self.hud.draw_bar(
                     self.game_surface,
+                    "right_health",
                     WINDOW_WIDTH - 210,
                     10,
                     200,
@@ -970,13 +1322,15 @@ class GameEngine:
                     label_text = f"{self.player2.character_name}"
                 else:
                     label_text = "Player 2"
-                label = font.render(label_text, True, WHITE)
-                self.game_surface.blit(label, (WINDOW_WIDTH - 210, 35))
+                self.hud.draw_label(
+                    self.game_surface, label_text, WINDOW_WIDTH - 210, 35
+                )
 
                 # Force energy bar for Player 2
                 if STAR_WARS_ENABLED and hasattr(self.player2, "force_energy"):
-                    EnhancedRenderer.draw_health_bar_enhanced(
+                    self.hud.draw_bar(
                         self.game_surface,
+                        "right_force",
                         WINDOW_WIDTH - 210,
                         50,
                         200,
@@ -986,13 +1340,19 @@ class GameEngine:
                         bar_color=RED,
                         bg_color=(100, 30, 30),
                     )
-                    force_label = font.render("Force Energy", True, RED)
-                    self.game_surface.blit(force_label, (WINDOW_WIDTH - 210, 70))
+                    self.hud.draw_label(
+                        self.game_surface,
+                        "Force Energy",
+                        WINDOW_WIDTH - 210,
+                        70,
+                        color=RED,
+                    )
 
             # Enhanced weapon HUD for both players
             if self.player1.is_alive():
-                enhanced_ui.draw_weapon_hud(
+                self.hud.draw_weapon_panel(
                     self.game_surface,
+                    "p1_weapon",
                     self.player1.weapon,
                     self.player1.magazine,
                     MAGAZINE_SIZE,
@@ -1001,8 +1361,9 @@ class GameEngine:
                 )
 
             if self.player2 and self.player2.is_alive():
-                enhanced_ui.draw_weapon_hud(
+                self.hud.draw_weapon_panel(
                     self.game_surface,
+                    "right_weapon",
                     self.player2.weapon,
                     self.player2.magazine,
                     MAGAZINE_SIZE,
@@ -1011,8 +1372,9 @@ class GameEngine:
                 )
         else:
             # Single player mode
-            EnhancedRenderer.draw_health_bar_enhanced(
+            self.hud.draw_bar(
                 self.game_surface,
+                "p1_health",
                 10,
                 10,
                 200,
@@ -1025,13 +1387,13 @@ class GameEngine:
                 label_text = f"{self.player1.character_name}"
             else:
                 label_text = "Player"
-            label = font.render(label_text, True, WHITE)
-            self.game_surface.blit(label, (10, 35))
+            self.hud.draw_label(self.game_surface, label_text, 10, 35)
 
             # Force energy bar for Player
             if STAR_WARS_ENABLED and hasattr(self.player1, "force_energy"):
-                EnhancedRenderer.draw_health_bar_enhanced(
+                self.hud.draw_bar(
                     self.game_surface,
+                    "p1_force",
                     10,
                     50,
                     200,
@@ -1041,12 +1403,14 @@ class GameEngine:
                     bar_color=BLUE,
                     bg_color=(30, 30, 100),
                 )
-                force_label = font.render("Force Energy", True, BLUE)
-                self.game_surface.blit(force_label, (10, 70))
+                self.hud.draw_label(
+                    self.game_surface, "Force Energy", 10, 70, color=BLUE
+                )
 
             if self.enemy and self.enemy.is_alive():
-                EnhancedRenderer.draw_health_bar_enhanced(
+                self.hud.draw_bar(
                     self.game_surface,
+                    "right_health",
                     WINDOW_WIDTH - 210,
                     10,
                     200,
@@ -1059,13 +1423,15 @@ class GameEngine:
                     label_text = f"{self.enemy.character_name}"
                 else:
                     label_text = "Enemy"
-                label = font.render(label_text, True, WHITE)
-                self.game_surface.blit(label, (WINDOW_WIDTH - 210, 35))
+                self.hud.draw_label(
+                    self.game_surface, label_text, WINDOW_WIDTH - 210, 35
+                )
 
                 # Force energy bar for Enemy
                 if STAR_WARS_ENABLED and hasattr(self.enemy, "force_energy"):
-                    EnhancedRenderer.draw_health_bar_enhanced(
+                    self.hud.draw_bar(
                         self.game_surface,
+                        "right_force",
                         WINDOW_WIDTH - 210,
                         50,
                         200,
@@ -1075,13 +1441,19 @@ class GameEngine:
                         bar_color=RED,
                         bg_color=(100, 30, 30),
                     )
-                    force_label = font.render("Force Energy", True, RED)
-                    self.game_surface.blit(force_label, (WINDOW_WIDTH - 210, 70))
+                    self.hud.draw_label(
+                        self.game_surface,
+                        "Force Energy",
+                        WINDOW_WIDTH - 210,
+                        70,
+                        color=RED,
+                    )
 
             # Enhanced weapon HUD
             if self.player1.is_alive():
-                enhanced_ui.draw_weapon_hud(
+                self.hud.draw_weapon_panel(
                     self.game_surface,
+                    "p1_weapon",
                     self.player1.weapon,
                     self.player1.magazine,
                     MAGAZINE_SIZE,
@@ -1091,45 +1463,27 @@ class GameEngine:
 
         # Draw crosshair for mouse aiming (single player mode)
         if not self.two_player_mode:
-            mouse_x, mouse_y = pygame.mouse.get_pos()
-            # Scale mouse position for the game surface if in fullscreen
-            if self.fullscreen:
-                # Convert screen mouse position to game surface coordinates
-                scaled_mouse_x = int((mouse_x - self.offset_x) / self.scale_factor)
-                scaled_mouse_y = int((mouse_y - self.offset_y) / self.scale_factor)
-                # Clamp to game surface bounds
-                scaled_mouse_x = max(0, min(WINDOW_WIDTH, scaled_mouse_x))
-                scaled_mouse_y = max(0, min(WINDOW_HEIGHT, scaled_mouse_y))
-                enhanced_ui.draw_enhanced_crosshair(
-                    self.game_surface, scaled_mouse_x, scaled_mouse_y
-                )
-            else:
-                enhanced_ui.draw_enhanced_crosshair(self.game_surface, mouse_x, mouse_y)
+            # Aim position of the current tick (already in game coordinates)
+            mouse_x, mouse_y = self.mouse_pos
+            enhanced_ui.draw_enhanced_crosshair(self.game_surface, mouse_x, mouse_y)
 
         # Star Wars control hints
         if STAR_WARS_ENABLED:
-            hints_font = pygame.font.Font(None, 20)
-            hints = [
-                "Q: Force Push",
-                "T: Force Lightning",
-                "G: Lightsaber Throw",
-                "H: Force Heal",
-                "F: Lightsaber Attack",
-                "2-5: Change Environment",
-            ]
-
-            for i, hint in enumerate(hints):
-                hint_surface = hints_font.render(hint, True, WHITE)
-                self.game_surface.blit(
-                    hint_surface, (WINDOW_WIDTH - 200, WINDOW_HEIGHT - 150 + i * 20)
-                )
+            self.hud.draw_hints(
+                self.game_surface, WINDOW_WIDTH - 200, WINDOW_HEIGHT - 150
+            )
 
         # Environment indicator
         if STAR_WARS_ENABLED and hasattr(self, "current_environment"):
-            env_font = pygame.font.Font(None, 32)
             env_name = self.current_environment.replace("_", " ").title()
-            env_surface = env_font.render(env_name, True, (255, 255, 0))
-            self.game_surface.blit(env_surface, (WINDOW_WIDTH // 2 - 100, 10))
+            self.hud.draw_label(
+                self.game_surface,
+                env_name,
+                WINDOW_WIDTH // 2 - 100,
+                10,
+                size=32,
+                color=(255, 255, 0),
+            )
 
         # Game mode UI
         if STAR_WARS_ENABLED and hasattr(self, "game_mode_manager"):
@@ -1174,3 +1528,157 @@ class GameEngine:
             return "Player"
 
         return ""
+
+    def _match_metadata(self):
+        """Describe the current match setup for a replay file."""
+        return {
+            "seed": self.match_seed,
+            "engine_seed": self.seed,
+            "two_player": self.two_player_mode,
+            "difficulty": self.difficulty,
+            "game_mode": self.current_game_mode,
+            "characters": self.character_selections,
+            "environment": getattr(self, "current_environment", None),
+        }
+
+    def _apply_match_metadata(self, metadata):
+        """Restore the match setup stored in a replay file."""
+        self.two_player_mode = metadata["two_player"]
+        self.difficulty = metadata["difficulty"]
+        self.current_game_mode = metadata["game_mode"]
+        self.character_selections = metadata["characters"]
+        if metadata.get("environment"):
+            self.current_environment = metadata["environment"]
+
+    def _start_recording(self):
+        """Begin recording the input stream of the match that is starting."""
+        if self.replay_dir:
+            self.recorder = InputRecorder(self._match_metadata())
+
+    def _finish_recording(self):
+        """Save the current recording and prune old replay files."""
+        recorder = self.recorder
+        self.recorder = None
+        if not recorder or recorder.tick_count == 0:
+            return
+
+        try:
+            os.makedirs(self.replay_dir, exist_ok=True)
+            filename = time.strftime("%Y%m%d-%H%M%S") + f"-{self.match_seed}.swr"
+            recorder.save(os.path.join(self.replay_dir, filename))
+
+            # Keep only the most recent recordings
+            replays = sorted(
+                name for name in os.listdir(self.replay_dir) if name.endswith(".swr")
+            )
+            for old_name in replays[:-REPLAY_KEEP_LAST]:
+                os.remove(os.path.join(self.replay_dir, old_name))
+        except OSError as e:
+            print(f"Could not save replay: {e}")
+
+    def _write_crash_dump(self):
+        """
+        Save a world snapshot and the recording of a match that crashed, so
+        the failure can be inspected and replayed up to the crash.
+        """
+        if not self.replay_dir or self.player1 is None:
+            return
+        self._finish_recording()
+        try:
+            os.makedirs(self.replay_dir, exist_ok=True)
+            filename = (
+                time.strftime("%Y%m%d-%H%M%S")
+                + f"-{self.match_seed}-{self.tick_count}-crash.sws"
+            )
+            path = os.path.join(self.replay_dir, filename)
+            with open(path, "wb") as f:
+                f.write(encode_world(self))
+            print(f"Crash dump written to {path}")
+        except Exception as e:
+            print(f"Could not write crash dump: {e}")
+
+    def play_replay(self, path, render=True):
+        """
+        Replay a recorded match tick by tick.
+
+        With render=False the simulation runs without drawing or frame
+        limiting, so a match replays much faster than real time.
+
+        Args:
+            path (str): Replay file written by a recorded match
+            render (bool): Draw the match at normal speed while replaying
+
+        Returns:
+            tuple: (winner title or "", number of ticks simulated)
+        """
+        replay = InputReplay.load(path)
+        self._reset_game_state()
+        self._apply_match_metadata(replay.metadata)
+        self._initialize_game(replay.metadata["seed"])
+
+        winner_title = ""
+        self._play_sounds(render)
+        try:
+            for frame in replay.frames():
+                if render:
+                    for event in pygame.event.get():
+                        if event.type == pygame.QUIT:
+                            return winner_title, self.tick_count
+
+                self._simulate_tick(frame)
+
+                if not render:
+                    frame_events.clear()
+                else:
+                    self._update_visuals()
+                    frame_events.dispatch()
+                    self._render()
+                    self.clock.tick(FPS)
+
+                winner_title = self._check_game_over()
+                if winner_title:
+                    break
+        finally:
+            self._play_sounds(False)
+
+        return winner_title, self.tick_count
+
+    def _play_sounds(self, enabled):
+        """
+        Subscribe or unsubscribe this engine's sounds to the frame events.
+
+        The bus is shared by every engine in the process (environments,
+        rollback peers), so only the one being played holds a subscription.
+        """
+        if enabled:
+            frame_events.subscribe(self.sound_manager.apply_frame_events)
+        else:
+            frame_events.unsubscribe(self.sound_manager.apply_frame_events)
+
+    def save_state(self, state=None):
+        """
+        Save the gameplay state between two ticks, for rolling back to.
+
+        Args:
+            state (SimulationState): State to overwrite (reused by ring
+                buffers), or None for a new one
+
+        Returns:
+            SimulationState: The saved state
+        """
+        if state is None:
+            state = SimulationState()
+        state.capture(self)
+        return state
+
+    def load_state(self, state):
+        """Return the simulation to a state saved by save_state."""
+        state.restore(self)
+
+    def simulation_checksum(self):
+        """
+        Return a CRC32 of the gameplay state (everything save_state saves),
+        used to verify that a replay reproduced the recorded match exactly
+        and to detect rollback desyncs.
+        """
+        return state_checksum(self)
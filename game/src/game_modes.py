@@ -6,12 +6,14 @@ Each mode has unique rules, objectives, and gameplay mechanics.
 """
 
 import pygame
-import random
 import math
 from config import *
+from random_streams import rng_streams
 from entities import Player, Enemy, Bullet
 from visual_effects import particle_system, screen_effects
 from enhanced_ui import enhanced_ui
+from text_layout import get_font, text_layout
+from digit_atlas import digit_atlas
 
 
 class GameModeManager:
@@ -201,16 +203,15 @@ class GameModeManager:
         """Update mode-specific logic."""
         self.mode_timer += 1
         mode = self.current_mode
-        is_two_player = getattr(self.game_engine, "two_player_mode", False)
 
         if mode == "survival_coop":
-            self._update_survival_coop(game_state, is_two_player)
+            self._update_survival(game_state)
         elif mode == "king_of_hill":
-            self._update_king_of_hill(game_state, is_two_player)
+            self._update_king_of_hill(game_state)
         elif mode == "capture_flag":
-            self._update_capture_flag(game_state, is_two_player)
+            self._update_capture_flag(game_state)
         elif mode == "force_race":
-            self._update_force_race(game_state, is_two_player)
+            self._update_force_race(game_state)
 
     def _update_survival(self, game_state):
         """Update survival mode logic."""
@@ -237,14 +238,14 @@ class GameModeManager:
     def _spawn_survival_enemy(self, game_state):
         """Spawn an enemy for survival mode."""
         # Random spawn position at edges
-        if random.choice([True, False]):
-            x = random.choice([0, WINDOW_WIDTH - ENEMY_SIZE])
-            y = random.randint(0, WINDOW_HEIGHT - ENEMY_SIZE)
+        if rng_streams.simulation.choice([True, False]):
+            x = rng_streams.simulation.choice([0, WINDOW_WIDTH - ENEMY_SIZE])
+            y = rng_streams.simulation.randint(0, WINDOW_HEIGHT - ENEMY_SIZE)
         else:
-            x = random.randint(0, WINDOW_WIDTH - ENEMY_SIZE)
-            y = random.choice([0, WINDOW_HEIGHT - ENEMY_SIZE])
+            x = rng_streams.simulation.randint(0, WINDOW_WIDTH - ENEMY_SIZE)
+            y = rng_streams.simulation.choice([0, WINDOW_HEIGHT - ENEMY_SIZE])
 
-        enemy = Enemy(x, y, random.choice(["sith", "jedi"]))
+        enemy = Enemy(x, y, rng_streams.simulation.choice(["sith", "jedi"]))
 
         # Apply difficulty scaling
         multiplier = self.mode_data["difficulty_multiplier"]
@@ -258,7 +259,8 @@ class GameModeManager:
         """Update King of the Hill mode."""
         data = self.mode_data
         player1 = game_state.get("player1")
-        player2 = game_state.get("player2")
+        # In single player the AI enemy contests as player 2
+        player2 = game_state.get("player2") or game_state.get("enemy")
 
         if not player1 or not player2:
             return
@@ -284,7 +286,8 @@ class GameModeManager:
         """Update Capture the Flag mode."""
         data = self.mode_data
         player1 = game_state.get("player1")
-        player2 = game_state.get("player2")
+        # In single player the AI enemy contests as player 2
+        player2 = game_state.get("player2") or game_state.get("enemy")
 
         if not player1 or not player2:
             return
@@ -331,7 +334,7 @@ class GameModeManager:
         """Check if win condition is met for current mode."""
         mode = self.current_mode
 
-        if mode == "survival":
+        if mode == "survival_coop":
             # Survival continues until player dies
             player1 = game_state.get("player1")
             if player1 and not player1.is_alive():
@@ -371,16 +374,16 @@ class GameModeManager:
     def draw_mode_ui(self, surface):
         """Draw mode-specific UI elements."""
         mode = self.current_mode
-        font = pygame.font.Font(None, 24)
+        font = get_font(24)
 
         # Mode name display
         mode_info = self.game_modes[mode]
-        mode_text = font.render(
-            f"{mode_info['icon']} {mode_info['name']}", True, mode_info["color"]
+        mode_text = text_layout.render(
+            f"{mode_info['icon']} {mode_info['name']}", font, mode_info["color"]
         )
         surface.blit(mode_text, (WINDOW_WIDTH // 2 - mode_text.get_width() // 2, 10))
 
-        if mode == "survival":
+        if mode == "survival_coop":
             self._draw_survival_ui(surface, font)
         elif mode == "king_of_hill":
             self._draw_king_of_hill_ui(surface, font)
@@ -392,17 +395,14 @@ class GameModeManager:
     def _draw_survival_ui(self, surface, font):
         """Draw survival mode UI."""
         data = self.mode_data
-        wave_text = font.render(f"Wave: {data['wave']}", True, WHITE)
-        enemies_text = font.render(
-            f"Enemies: {data['enemies_remaining'] + len(data['enemy_list'])}",
-            True,
-            WHITE,
+        enemies = data["enemies_remaining"] + len(data["enemy_list"])
+        digit_atlas.draw_labeled(
+            surface, "Wave: ", str(data["wave"]), 10, 100, 24, WHITE
+        )
+        digit_atlas.draw_labeled(surface, "Enemies: ", str(enemies), 10, 125, 24, WHITE)
+        digit_atlas.draw_labeled(
+            surface, "Score: ", str(data["score"]), 10, 150, 24, WHITE
         )
-        score_text = font.render(f"Score: {data['score']}", True, WHITE)
-
-        surface.blit(wave_text, (10, 100))
-        surface.blit(enemies_text, (10, 125))
-        surface.blit(score_text, (10, 150))
 
     def _draw_king_of_hill_ui(self, surface, font):
         """Draw King of the Hill UI."""
@@ -412,11 +412,18 @@ class GameModeManager:
         pygame.draw.rect(surface, (255, 215, 0, 100), data["king_zone"], 3)
 
         # Scores
-        p1_score = font.render(f"P1: {data['player1_score']}", True, BLUE)
-        p2_score = font.render(f"P2: {data['player2_score']}", True, RED)
-
-        surface.blit(p1_score, (10, 100))
-        surface.blit(p2_score, (WINDOW_WIDTH - 100, 100))
+        digit_atlas.draw_labeled(
+            surface, "P1: ", str(data["player1_score"]), 10, 100, 24, BLUE
+        )
+        digit_atlas.draw_labeled(
+            surface,
+            "P2: ",
+            str(data["player2_score"]),
+            WINDOW_WIDTH - 100,
+            100,
+            24,
+            RED,
+        )
 
     def _draw_capture_flag_ui(self, surface, font):
         """Draw Capture the Flag UI."""
@@ -452,17 +459,29 @@ class GameModeManager:
             )
 
             # Checkpoint number
-            num_text = font.render(str(i + 1), True, WHITE)
-            surface.blit(num_text, (checkpoint["pos"][0] - 8, checkpoint["pos"][1] - 8))
+            digit_atlas.draw(
+                surface,
+                str(i + 1),
+                checkpoint["pos"][0] - 8,
+                checkpoint["pos"][1] - 8,
+                24,
+                WHITE,
+                outline=False,
+            )
 
         # Race info
-        lap_text = font.render(
-            f"Lap: {data['current_lap']}/{data['laps_to_win']}", True, WHITE
+        digit_atlas.draw_labeled(
+            surface,
+            "Lap: ",
+            f"{data['current_lap']}/{data['laps_to_win']}",
+            10,
+            100,
+            24,
+            WHITE,
+        )
+        digit_atlas.draw_labeled(
+            surface, "Time: ", f"{data['race_time'] // 60}s", 10, 125, 24, WHITE
         )
-        time_text = font.render(f"Time: {data['race_time'] // 60}s", True, WHITE)
-
-        surface.blit(lap_text, (10, 100))
-        surface.blit(time_text, (10, 125))
 
 
 # Game mode instances
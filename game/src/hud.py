@@ -0,0 +1,166 @@
+"""
+Retained HUD
+
+The in-match HUD (health and Force bars, weapon panels, control hints) is
+drawn every frame, but its values change only a few times per second.
+Each widget here keeps its rendered surface and re-renders only when the
+key it is bound to changes, e.g. a bar's filled width or a panel's
+magazine count, so an unchanged HUD costs one blit per widget.
+"""
+
+import pygame
+from config import *
+from visual_effects import EnhancedRenderer
+from enhanced_ui import enhanced_ui
+from text_layout import get_font, text_layout
+
+# Star Wars control hints, baked into one panel
+CONTROL_HINTS = (
+    "Q: Force Push",
+    "T: Force Lightning",
+    "G: Lightsaber Throw",
+    "H: Force Heal",
+    "F: Lightsaber Attack",
+    "2-5: Change Environment",
+)
+
+
+class HudWidget:
+    """A HUD element that keeps its surface until its bound key changes."""
+
+    def __init__(self, render):
+        """
+        Args:
+            render (callable): Builds the widget's surface from the
+                arguments passed to draw()
+        """
+        self.render = render
+        self.key = None
+        self.surface = None
+        self.renders = 0
+
+    def draw(self, target, position, key, *args):
+        """
+        Blit the widget, re-rendering it first if key changed.
+
+        Args:
+            target (pygame.Surface): Surface to draw on
+            position (tuple): Top-left corner
+            key: Value that determines the widget's appearance
+            *args: Arguments for render, used only when re-rendering
+        """
+        if self.surface is None or key != self.key:
+            self.surface = self.render(*args)
+            self.key = key
+            self.renders += 1
+        target.blit(self.surface, position)
+
+
+def render_bar(width, height, value, max_value, bar_color, bg_color):
+    """Render an enhanced health bar, including its 2 pixel black frame."""
+    surface = pygame.Surface((width + 4, height + 4))
+    EnhancedRenderer.draw_health_bar_enhanced(
+        surface,
+        2,
+        2,
+        width,
+        height,
+        value,
+        max_value,
+        bar_color=bar_color,
+        bg_color=bg_color,
+    )
+    return surface
+
+
+def render_weapon_panel(weapon_type, ammo, max_ammo):
+    """Render the weapon HUD panel (150x60) at the origin of its own surface."""
+    surface = pygame.Surface((150, 60))
+    enhanced_ui.draw_weapon_hud(surface, weapon_type, ammo, max_ammo, 0, 0)
+    return surface
+
+
+def render_hints():
+    """Render the control hints panel."""
+    font = get_font(20)
+    surface = pygame.Surface((200, 20 * len(CONTROL_HINTS)), pygame.SRCALPHA)
+    surface.blits(
+        [
+            (text_layout.render(hint, font, WHITE), (0, i * 20))
+            for i, hint in enumerate(CONTROL_HINTS)
+        ],
+        False,
+    )
+    return surface
+
+
+class RetainedHud:
+    """Named HUD widgets, created on first use."""
+
+    def __init__(self):
+        self.widgets = {}
+
+    def widget(self, name, render):
+        """Return the widget called name, creating it with render if needed."""
+        widget = self.widgets.get(name)
+        if widget is None:
+            widget = HudWidget(render)
+            self.widgets[name] = widget
+        return widget
+
+    def draw_bar(
+        self,
+        target,
+        name,
+        x,
+        y,
+        width,
+        height,
+        value,
+        max_value,
+        bar_color=None,
+        bg_color=DARK_GRAY,
+    ):
+        """
+        Draw a health-style bar, re-rendering only when its look changes.
+
+        The bar is keyed by its filled width in pixels (and, for bars
+        coloured by health, the colour band), so a slowly refilling Force
+        bar re-renders once per pixel rather than every frame.
+        """
+        ratio = value / max_value
+        key = (int(width * ratio), ratio > 0.7, ratio > 0.3)
+        self.widget(name, render_bar).draw(
+            target,
+            (x - 2, y - 2),
+            key,
+            width,
+            height,
+            value,
+            max_value,
+            bar_color,
+            bg_color,
+        )
+
+    def draw_weapon_panel(self, target, name, weapon_type, ammo, max_ammo, x, y):
+        """Draw a weapon HUD panel, re-rendering when weapon or ammo changes."""
+        self.widget(name, render_weapon_panel).draw(
+            target,
+            (x, y),
+            (weapon_type, ammo, max_ammo),
+            weapon_type,
+            ammo,
+            max_ammo,
+        )
+
+    def draw_hints(self, target, x, y):
+        """Draw the control hints panel (baked on first use)."""
+        self.widget("hints", render_hints).draw(target, (x, y), CONTROL_HINTS)
+
+    def draw_label(self, target, text, x, y, size=24, color=WHITE):
+        """Draw a cached text label."""
+        target.blit(text_layout.render(text, get_font(size), color), (x, y))
+
+    def clear(self):
+        """Drop every widget (e.g. after a display change)."""
+        self.widgets.clear()
@@ -0,0 +1,223 @@
+"""
+Input Recording and Replay
+
+Captures the per-tick input stream of a match (held keys, mouse position and
+key/button presses) together with the match seed into a compact binary file,
+and reads it back so the engine can replay the match deterministically.
+
+File layout (little endian):
+    magic "SWRP" | version u16 | metadata length u32 | metadata (JSON)
+    zlib-compressed ticks, each: key mask u32 | mouse x i16 | mouse y i16 |
+    event count u8 | events (kind u8, code u8) * count
+"""
+
+import json
+import struct
+import zlib
+import pygame
+
+REPLAY_MAGIC = b"SWRP"
+REPLAY_VERSION = 1
+
+# Keys the simulation reads. They are stored as indices into this tuple so
+# the held-key state of a tick packs into a single 32-bit mask.
+TRACKED_KEYS = (
+    pygame.K_w,
+    pygame.K_a,
+    pygame.K_s,
+    pygame.K_d,
+    pygame.K_UP,
+    pygame.K_DOWN,
+    pygame.K_LEFT,
+    pygame.K_RIGHT,
+    pygame.K_SPACE,
+    pygame.K_e,
+    pygame.K_KP0,
+    pygame.K_q,
+    pygame.K_t,
+    pygame.K_g,
+    pygame.K_h,
+    pygame.K_f,
+    pygame.K_1,
+    pygame.K_KP1,
+    pygame.K_2,
+    pygame.K_3,
+    pygame.K_4,
+    pygame.K_5,
+)
+KEY_INDEX = {key: index for index, key in enumerate(TRACKED_KEYS)}
+
+# Input event kinds
+EVENT_KEYDOWN = 1
+EVENT_MOUSEDOWN = 2
+
+_HEADER = struct.Struct("<4sHI")
+_TICK = struct.Struct("<IhhB")
+_EVENT = struct.Struct("<BB")
+
+
+class KeyState:
+    """Held-key state of one tick, indexable like pygame.key.get_pressed()."""
+
+    __slots__ = ("mask",)
+
+    def __init__(self, mask=0):
+        self.mask = mask
+
+    def __getitem__(self, key):
+        index = KEY_INDEX.get(key)
+        if index is None:
+            return False
+        return bool(self.mask >> index & 1)
+
+
+class InputFrame:
+    """Everything the simulation reads from the player during one tick."""
+
+    __slots__ = ("keys", "mouse_pos", "events")
+
+    def __init__(self, key_mask=0, mouse_pos=(0, 0), events=()):
+        self.keys = KeyState(key_mask)
+        self.mouse_pos = mouse_pos
+        # Tuples of (EVENT_KEYDOWN, pygame key) or (EVENT_MOUSEDOWN, button)
+        self.events = events
+
+
+def capture_input_frame(events, mouse_pos):
+    """
+    Build an InputFrame from live pygame state.
+
+    Args:
+        events (list): pygame events polled this tick
+        mouse_pos (tuple): Mouse position in game surface coordinates
+
+    Returns:
+        InputFrame: The tick's input
+    """
+    pressed = pygame.key.get_pressed()
+    key_mask = 0
+    for index, key in enumerate(TRACKED_KEYS):
+        if pressed[key]:
+            key_mask |= 1 << index
+
+    frame_events = []
+    for event in events:
+        if event.type == pygame.KEYDOWN and event.key in KEY_INDEX:
+            frame_events.append((EVENT_KEYDOWN, event.key))
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button < 256:
+            frame_events.append((EVENT_MOUSEDOWN, event.button))
+
+    return InputFrame(key_mask, mouse_pos, tuple(frame_events))
+
+
+def pack_frame(frame, out):
+    """
+    Append an InputFrame's compact encoding to a bytearray.
+
+    Args:
+        frame (InputFrame): Frame to encode (at most 255 events are kept)
+        out (bytearray): Buffer to append to
+    """
+    events = frame.events[:255]
+    out += _TICK.pack(
+        frame.keys.mask,
+        int(frame.mouse_pos[0]),
+        int(frame.mouse_pos[1]),
+        len(events),
+    )
+    for kind, code in events:
+        if kind == EVENT_KEYDOWN:
+            code = KEY_INDEX[code]
+        out += _EVENT.pack(kind, code)
+
+
+def unpack_frame(data, offset):
+    """
+    Decode one InputFrame written by pack_frame.
+
+    Args:
+        data (bytes): Buffer holding the frame
+        offset (int): Where the frame starts
+
+    Returns:
+        tuple: (InputFrame, offset just past the frame)
+    """
+    key_mask, mouse_x, mouse_y, event_count = _TICK.unpack_from(data, offset)
+    offset += _TICK.size
+    events = []
+    for _ in range(event_count):
+        kind, code = _EVENT.unpack_from(data, offset)
+        offset += _EVENT.size
+        if kind == EVENT_KEYDOWN:
+            code = TRACKED_KEYS[code]
+        events.append((kind, code))
+    return InputFrame(key_mask, (mouse_x, mouse_y), tuple(events)), offset
+
+
+class InputRecorder:
+    """Packs the input stream of one match into memory and saves it."""
+
+    def __init__(self, metadata):
+        """
+        Args:
+            metadata (dict): Match setup (seed, mode, difficulty, characters)
+        """
+        self.metadata = metadata
+        self.data = bytearray()
+        self.tick_count = 0
+
+    def record(self, frame):
+        """Append one tick of input."""
+        pack_frame(frame, self.data)
+        self.tick_count += 1
+
+    def to_bytes(self):
+        """Serialize header, metadata and compressed tick stream."""
+        metadata = dict(self.metadata, ticks=self.tick_count)
+        meta_bytes = json.dumps(metadata, separators=(",", ":")).encode("utf-8")
+        return (
+            _HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, len(meta_bytes))
+            + meta_bytes
+            + zlib.compress(bytes(self.data), 9)
+        )
+
+    def save(self, path):
+        """Write the recording to disk."""
+        with open(path, "wb") as replay_file:
+            replay_file.write(self.to_bytes())
+
+
+class InputReplay:
+    """A recorded match loaded back into memory."""
+
+    def __init__(self, metadata, data):
+        self.metadata = metadata
+        self.data = data
+
+    @classmethod
+    def from_bytes(cls, blob):
+        """Parse a recording produced by InputRecorder.to_bytes()."""
+        magic, version, meta_length = _HEADER.unpack_from(blob, 0)
+        if magic != REPLAY_MAGIC:
+            raise ValueError("Not a replay file")
+        if version != REPLAY_VERSION:
+            raise ValueError(f"Unsupported replay version: {version}")
+        offset = _HEADER.size
+        metadata = json.loads(blob[offset : offset + meta_length].decode("utf-8"))
+        data = zlib.decompress(blob[offset + meta_length :])
+        return cls(metadata, data)
+
+    @classmethod
+    def load(cls, path):
+        """Load a recording from disk."""
+        with open(path, "rb") as replay_file:
+            return cls.from_bytes(replay_file.read())
+
+    def frames(self):
+        """Yield the recorded InputFrames in tick order."""
+        data = self.data
+        offset = 0
+        end = len(data)
+        while offset < end:
+            frame, offset = unpack_frame(data, offset)
+            yield frame
@@ -10,8 +10,23 @@ Advanced melee combat system featuring:
 
 import pygame
 import math
-import random
 from config import *
+from quality_governor import quality_governor
+
+# numpy is optional; without it the arc pass runs in pure Python
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Half-width of a swing's hit arc (~34 degrees) and a block's coverage
+ATTACK_ARC = 0.6
+BLOCK_ARC = 1.0
+ATTACK_ARC_COS_SQ = math.cos(ATTACK_ARC) ** 2
+BLOCK_ARC_COS = math.cos(BLOCK_ARC)
+
+# Below this many attack/target pairs the pure Python pass is faster
+VECTORIZE_MIN_PAIRS = 64
 
 
 class LightsaberAttack:
@@ -21,12 +36,16 @@ class LightsaberAttack:
         self.attacker = attacker
         self.direction = direction  # angle in radians
         self.attack_type = attack_type
-        self.damage = 20
+        self.damage = 20 + attacker.lightsaber_damage_bonus
         self.range = 60
         self.duration = 20
         self.current_frame = 0
         self.hit_entities = set()
 
+        # Unit vector of the swing direction, for angle-free arc tests
+        self.dir_x = math.cos(direction)
+        self.dir_y = math.sin(direction)
+
         # Visual properties
         self.color = (
             (100, 150, 255) if attacker.character_type == "jedi" else (255, 100, 100)
@@ -61,35 +80,6 @@ class LightsaberAttack:
 
         return self.current_frame < self.duration
 
-    def check_collision(self, target):
-        """Check if attack hits target."""
-        if target in self.hit_entities or target == self.attacker:
-            return False
-
-        # Calculate attack area
-        center_x = self.attacker.x + self.attacker.size // 2
-        center_y = self.attacker.y + self.attacker.size // 2
-        target_center_x = target.x + target.size // 2
-        target_center_y = target.y + target.size // 2
-
-        distance = math.sqrt(
-            (target_center_x - center_x) ** 2 + (target_center_y - center_y) ** 2
-        )
-
-        if distance <= self.range:
-            # Check if target is in swing arc
-            target_angle = math.atan2(
-                target_center_y - center_y, target_center_x - center_x
-            )
-            angle_diff = abs(target_angle - self.direction)
-            angle_diff = min(angle_diff, 2 * math.pi - angle_diff)
-
-            if angle_diff <= 0.6:  # ~34 degree arc
-                self.hit_entities.add(target)
-                return True
-
-        return False
-
     def draw(self, surface):
         """Draw lightsaber attack."""
         if self.current_frame >= self.duration:
@@ -134,6 +124,8 @@ class LightsaberBlock:
     def __init__(self, defender, direction):
         self.defender = defender
         self.direction = direction
+        self.dir_x = math.cos(direction)
+        self.dir_y = math.sin(direction)
         self.duration = 30
         self.current_frame = 0
         self.color = (
@@ -145,11 +137,12 @@ class LightsaberBlock:
         self.current_frame += 1
         return self.current_frame < self.duration
 
-    def can_block(self, attack_direction):
+    def can_block(self, attack):
         """Check if this block can defend against an attack."""
-        angle_diff = abs(self.direction - attack_direction)
-        angle_diff = min(angle_diff, 2 * math.pi - angle_diff)
-        return angle_diff <= 1.0  # ~57 degree coverage
+        # Angle between the two directions is within the coverage when the
+        # dot product of their unit vectors is at least cos(coverage)
+        dot = self.dir_x * attack.dir_x + self.dir_y * attack.dir_y
+        return dot >= BLOCK_ARC_COS  # ~57 degree coverage
 
     def draw(self, surface):
         """Draw blocking lightsaber."""
@@ -165,7 +158,7 @@ class LightsaberBlock:
         pygame.draw.line(surface, self.color, (center_x, center_y), (tip_x, tip_y), 8)
 
         # Draw defensive energy field
-        for i in range(3):
+        for i in range(min(3, quality_governor.glow_layers)):
             radius = 15 + i * 5
             alpha = 50 - i * 15
             temp_surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
@@ -208,7 +201,9 @@ class LightsaberClash:
 
         # Draw central energy burst
         burst_radius = int(15 + self.intensity * 10)
-        for radius in range(burst_radius, 0, -3):
+        # Keep the innermost (brightest) layers when glow is limited
+        radii = range(burst_radius, 0, -3)
+        for radius in radii[-quality_governor.glow_layers :]:
             alpha = (burst_radius - radius) * 20
             temp_surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
             pygame.draw.circle(
@@ -219,12 +214,90 @@ class LightsaberClash:
             )
 
 
+def _in_swing_arc(offset_x, offset_y, dir_x, dir_y, range_sq):
+    """
+    Check whether a target offset lies within a swing's range and arc.
+
+    Works on squared distances and dot products, so no sqrt or atan2 is
+    needed: the angle to the target is within ATTACK_ARC when the dot
+    product is positive and its square is at least |offset|^2 * cos^2.
+    """
+    distance_sq = offset_x * offset_x + offset_y * offset_y
+    if distance_sq > range_sq:
+        return False
+    dot = offset_x * dir_x + offset_y * dir_y
+    return dot >= 0 and dot * dot >= distance_sq * ATTACK_ARC_COS_SQ
+
+
+def _arc_hit_pairs(attacks, targets):
+    """
+    Find every (attack, target) pair where the target is inside the swing.
+
+    All pairs are evaluated in one vectorized pass when numpy is available
+    and there are enough of them to pay off.
+
+    Returns:
+        list: (attack index, target index) pairs in attack-major order
+    """
+    if np is not None and len(attacks) * len(targets) >= VECTORIZE_MIN_PAIRS:
+        attack_data = np.array(
+            [
+                (
+                    a.attacker.x + a.attacker.size // 2,
+                    a.attacker.y + a.attacker.size // 2,
+                    a.dir_x,
+                    a.dir_y,
+                    a.range * a.range,
+                )
+                for a in attacks
+            ],
+            dtype=np.float64,
+        )
+        target_data = np.array(
+            [(t.x + t.size // 2, t.y + t.size // 2) for t in targets],
+            dtype=np.float64,
+        )
+        offset_x = target_data[None, :, 0] - attack_data[:, 0, None]
+        offset_y = target_data[None, :, 1] - attack_data[:, 1, None]
+        distance_sq = offset_x * offset_x + offset_y * offset_y
+        dot = offset_x * attack_data[:, 2, None] + offset_y * attack_data[:, 3, None]
+        hits = (
+            (distance_sq <= attack_data[:, 4, None])
+            & (dot >= 0)
+            & (dot * dot >= distance_sq * ATTACK_ARC_COS_SQ)
+        )
+        return list(zip(*(indices.tolist() for indices in np.nonzero(hits))))
+
+    target_centers = [(t.x + t.size // 2, t.y + t.size // 2) for t in targets]
+    pairs = []
+    for attack_index, attack in enumerate(attacks):
+        center_x = attack.attacker.x + attack.attacker.size // 2
+        center_y = attack.attacker.y + attack.attacker.size // 2
+        range_sq = attack.range * attack.range
+        for target_index, (target_x, target_y) in enumerate(target_centers):
+            if _in_swing_arc(
+                target_x - center_x,
+                target_y - center_y,
+                attack.dir_x,
+                attack.dir_y,
+                range_sq,
+            ):
+                pairs.append((attack_index, target_index))
+    return pairs
+
+
 class LightsaberCombat:
     """Manages lightsaber combat system."""
 
     def __init__(self):
         self.active_attacks = []
-        self.active_blocks = []
+        self.active_blocks = {}  # defender -> LightsaberBlock
+        self.active_clashes = []
+
+    def reset(self):
+        """Clear all attacks, blocks and clashes for a new match."""
+        self.active_attacks = []
+        self.active_blocks = {}
         self.active_clashes = []
 
     def start_attack(self, attacker, target_x, target_y):
@@ -245,13 +318,9 @@ class LightsaberCombat:
 
     def start_block(self, defender, direction):
         """Start a defensive block."""
-        # Remove existing blocks from this defender
-        self.active_blocks = [
-            block for block in self.active_blocks if block.defender != defender
-        ]
-
-        block = LightsaberBlock(defender, direction)
-        self.active_blocks.append(block)
+        # A new block replaces any existing block from this defender
+        self.active_blocks.pop(defender, None)
+        self.active_blocks[defender] = LightsaberBlock(defender, direction)
         return True
 
     def update(self, entities):
@@ -264,49 +333,59 @@ class LightsaberCombat:
             ):
                 entity.lightsaber_cooldown -= 1
 
-        # Update attacks
-        for attack in self.active_attacks[:]:
-            if not attack.update():
-                self.active_attacks.remove(attack)
-                continue
-
-            # Check for hits
-            for entity in entities:
-                if hasattr(entity, "take_damage") and attack.check_collision(entity):
-                    # Check if target is blocking
-                    blocked = False
-                    for block in self.active_blocks:
-                        if block.defender == entity and block.can_block(
-                            attack.direction
-                        ):
-                            # Create clash effect
-                            clash_point = (
-                                (attack.attacker.x + entity.x) // 2 + 20,
-                                (attack.attacker.y + entity.y) // 2 + 20,
-                            )
-                            self.active_clashes.append(
-                                LightsaberClash(attack.attacker, entity, clash_point)
-                            )
-                            blocked = True
-                            break
-
-                    if not blocked:
-                        # Deal damage
-                        knockback_x = math.cos(attack.direction) * 15
-                        entity.take_damage(attack.damage, knockback_x)
+        # Advance attacks, compacting survivors in place instead of removing
+        attacks = self.active_attacks
+        alive_count = 0
+        for attack in attacks:
+            if attack.update():
+                attacks[alive_count] = attack
+                alive_count += 1
+        del attacks[alive_count:]
+
+        # Resolve hits for every attack/target pair in one pass
+        targets = [entity for entity in entities if hasattr(entity, "take_damage")]
+        if attacks and targets:
+            for attack_index, target_index in _arc_hit_pairs(attacks, targets):
+                attack = attacks[attack_index]
+                entity = targets[target_index]
+                if entity is attack.attacker or entity in attack.hit_entities:
+                    continue
+                attack.hit_entities.add(entity)
+                self._resolve_hit(attack, entity)
 
         # Update blocks
-        self.active_blocks = [block for block in self.active_blocks if block.update()]
+        self.active_blocks = {
+            defender: block
+            for defender, block in self.active_blocks.items()
+            if block.update()
+        }
 
         # Update clashes
         self.active_clashes = [clash for clash in self.active_clashes if clash.update()]
 
+    def _resolve_hit(self, attack, entity):
+        """Apply a landed swing: clash with the target's block or deal damage."""
+        block = self.active_blocks.get(entity)
+        if block and block.can_block(attack):
+            # Create clash effect
+            clash_point = (
+                (attack.attacker.x + entity.x) // 2 + 20,
+                (attack.attacker.y + entity.y) // 2 + 20,
+            )
+            self.active_clashes.append(
+                LightsaberClash(attack.attacker, entity, clash_point)
+            )
+        else:
+            # Deal damage
+            knockback_x = attack.dir_x * 15
+            entity.take_damage(attack.damage, knockback_x)
+
     def draw(self, surface):
         """Draw all combat effects."""
         for attack in self.active_attacks:
             attack.draw(surface)
 
-        for block in self.active_blocks:
+        for block in self.active_blocks.values():
             block.draw(surface)
 
         for clash in self.active_clashes:
@@ -0,0 +1,324 @@
+"""
+Network Protocol
+
+Datagram formats for snapshot-based multiplayer over UDP. Clients send
+their input stream to the authoritative server; the server sends back
+quantised snapshots of the entities, each delta-encoded against the newest
+snapshot the client has acknowledged (or sent in full when the client has
+none the server still remembers).
+
+Every datagram (little endian):
+    magic "SW" | version u8 | type u8 | body
+
+Bodies:
+    HELLO     -
+    WELCOME   slot u8 | match u16 | metadata (JSON)
+    INPUT     match u16 | snapshot ack u32 | count u8 |
+              (sequence u32 | input frame) * count, oldest first
+    SNAPSHOT  match u16 | tick u32 | baseline tick u32 (0 = full) |
+              input ack u32 | changed count u16 |
+              (id u16 | field mask u16 | changed fields) * count |
+              removed count u16 | id u16 * count
+    BYE       -
+    ROLLBACK  input ack u32 | checksum frame u32 | checksum u32 |
+              first frame u32 | count u8 | input frame * count
+
+Input frames use the replay encoding (input_recorder.pack_frame).
+"""
+
+import json
+import struct
+from config import *
+from input_recorder import pack_frame, unpack_frame
+
+NET_MAGIC = b"SW"
+
+# Datagram types
+MSG_HELLO = 1
+MSG_WELCOME = 2
+MSG_INPUT = 3
+MSG_SNAPSHOT = 4
+MSG_BYE = 5
+MSG_ROLLBACK = 6  # Peer-to-peer inputs of rollback sessions
+
+# Entity kinds; a bullet's kind is KIND_BULLET plus its owner id
+KIND_PLAYER1 = 1
+KIND_PLAYER2 = 2
+KIND_ENEMY = 3
+KIND_BULLET = 4
+
+# Fixed network ids of the fighters; bullets are numbered from FIRST_BULLET_ID
+PLAYER1_ID = 1
+PLAYER2_ID = 2
+ENEMY_ID = 3
+FIRST_BULLET_ID = 16
+
+# Quantised entity fields, in mask bit order
+ENTITY_FIELDS = (
+    ("kind", struct.Struct("<B")),
+    ("x", struct.Struct("<h")),
+    ("y", struct.Struct("<h")),
+    ("vx", struct.Struct("<h")),
+    ("vy", struct.Struct("<h")),
+    ("health", struct.Struct("<H")),
+    ("energy", struct.Struct("<B")),
+    ("ammo", struct.Struct("<B")),
+    ("flags", struct.Struct("<B")),
+)
+
+# Bits of the flags field
+FLAG_FACING_RIGHT = 1
+FLAG_RELOADING = 2
+FLAG_BLOCKING = 4
+
+_HEADER = struct.Struct("<2sBB")
+_WELCOME = struct.Struct("<BH")
+_INPUT = struct.Struct("<HIB")
+_SEQUENCE = struct.Struct("<I")
+_SNAPSHOT = struct.Struct("<HIIIH")
+_ROLLBACK = struct.Struct("<IIIIB")
+_ENTITY = struct.Struct("<HH")
+_COUNT = struct.Struct("<H")
+_ID = struct.Struct("<H")
+
+
+def _clamp(value, low, high):
+    return max(low, min(high, int(round(value))))
+
+
+def quantize_entity(kind, entity):
+    """
+    Quantise an entity into the tuple of ints that is sent.
+
+    Args:
+        kind (int): Entity kind (KIND_*)
+        entity: Player, Enemy or Bullet
+
+    Returns:
+        tuple: One value per ENTITY_FIELDS entry
+    """
+    if kind >= KIND_BULLET:
+        return (
+            kind,
+            _clamp(entity.x * NET_POSITION_SCALE, -32768, 32767),
+            _clamp(entity.y * NET_POSITION_SCALE, -32768, 32767),
+            _clamp(entity.dx * NET_VELOCITY_SCALE, -32768, 32767),
+            0,
+            0,
+            0,
+            0,
+            0,
+        )
+    flags = 0
+    if getattr(entity, "facing_right", True):
+        flags |= FLAG_FACING_RIGHT
+    if getattr(entity, "reloading", False):
+        flags |= FLAG_RELOADING
+    if getattr(entity, "is_blocking", False):
+        flags |= FLAG_BLOCKING
+    return (
+        kind,
+        _clamp(entity.x * NET_POSITION_SCALE, -32768, 32767),
+        _clamp(entity.y * NET_POSITION_SCALE, -32768, 32767),
+        0,
+        _clamp(entity.velocity_y * NET_VELOCITY_SCALE, -32768, 32767),
+        _clamp(entity.health, 0, 65535),
+        _clamp(getattr(entity, "force_energy", 0), 0, 255),
+        _clamp(getattr(entity, "magazine", 0), 0, 255),
+        flags,
+    )
+
+
+def _header(kind):
+    return bytearray(_HEADER.pack(NET_MAGIC, NET_PROTOCOL_VERSION, kind))
+
+
+def parse_header(data):
+    """
+    Return a datagram's type, or None if it is not one of ours.
+
+    Args:
+        data (bytes): Received datagram
+    """
+    if len(data) < _HEADER.size:
+        return None
+    magic, version, kind = _HEADER.unpack_from(data)
+    if magic != NET_MAGIC or version != NET_PROTOCOL_VERSION:
+        return None
+    return kind
+
+
+def encode_simple(kind):
+    """Encode a datagram without a body (HELLO, BYE)."""
+    return bytes(_header(kind))
+
+
+def encode_welcome(slot, match, metadata):
+    """
+    Encode the server's answer to HELLO, also sent when a match starts.
+
+    Args:
+        slot (int): Seat of the client (1 or 2)
+        match (int): Match number, wrapping at 16 bits
+        metadata (dict): Match setup (seed, mode, characters, rates)
+    """
+    out = _header(MSG_WELCOME)
+    out += _WELCOME.pack(slot, match & 0xFFFF)
+    out += json.dumps(metadata, sort_keys=True).encode("utf-8")
+    return bytes(out)
+
+
+def decode_welcome(data):
+    """Return (slot, match, metadata) of a WELCOME datagram."""
+    slot, match = _WELCOME.unpack_from(data, _HEADER.size)
+    metadata = json.loads(data[_HEADER.size + _WELCOME.size :].decode("utf-8"))
+    return slot, match, metadata
+
+
+def encode_input(match, snapshot_ack, inputs):
+    """
+    Encode a client's input packet.
+
+    Args:
+        match (int): Match the inputs are for
+        snapshot_ack (int): Newest snapshot tick the client has decoded
+        inputs (list): (sequence, InputFrame) pairs, oldest first
+
+    Returns:
+        bytes: The datagram
+    """
+    inputs = inputs[-255:]
+    out = _header(MSG_INPUT)
+    out += _INPUT.pack(match & 0xFFFF, snapshot_ack, len(inputs))
+    for sequence, frame in inputs:
+        out += _SEQUENCE.pack(sequence)
+        pack_frame(frame, out)
+    return bytes(out)
+
+
+def decode_input(data):
+    """Return (match, snapshot ack, [(sequence, InputFrame), ...])."""
+    offset = _HEADER.size
+    match, snapshot_ack, count = _INPUT.unpack_from(data, offset)
+    offset += _INPUT.size
+    inputs = []
+    for _ in range(count):
+        (sequence,) = _SEQUENCE.unpack_from(data, offset)
+        frame, offset = unpack_frame(data, offset + _SEQUENCE.size)
+        inputs.append((sequence, frame))
+    return match, snapshot_ack, inputs
+
+
+def encode_snapshot(match, tick, state, baseline_tick, baseline, input_ack):
+    """
+    Encode a snapshot as a delta against a baseline the client holds.
+
+    Args:
+        match (int): Match the snapshot belongs to
+        tick (int): Simulation tick of the state
+        state (dict): Network id -> quantised field tuple
+        baseline_tick (int): Tick of the baseline, 0 for a full snapshot
+        baseline (dict): Baseline state ({} for a full snapshot)
+        input_ack (int): Newest input sequence the server has applied
+
+    Returns:
+        bytes: The datagram
+    """
+    changed = bytearray()
+    changed_count = 0
+    for entity_id, values in state.items():
+        old = baseline.get(entity_id)
+        mask = 0
+        fields = bytearray()
+        for bit, (_, field) in enumerate(ENTITY_FIELDS):
+            if old is None or old[bit] != values[bit]:
+                mask |= 1 << bit
+                fields += field.pack(values[bit])
+        if mask:
+            changed += _ENTITY.pack(entity_id, mask)
+            changed += fields
+            changed_count += 1
+
+    removed = [entity_id for entity_id in baseline if entity_id not in state]
+    out = _header(MSG_SNAPSHOT)
+    out += _SNAPSHOT.pack(match & 0xFFFF, tick, baseline_tick, input_ack, changed_count)
+    out += changed
+    out += _COUNT.pack(len(removed))
+    for entity_id in removed:
+        out += _ID.pack(entity_id)
+    return bytes(out)
+
+
+def read_snapshot_header(data):
+    """Return (match, tick, baseline tick, input ack) of a SNAPSHOT datagram."""
+    return _SNAPSHOT.unpack_from(data, _HEADER.size)[:4]
+
+
+def decode_snapshot(data, baseline):
+    """
+    Rebuild the full state of a SNAPSHOT datagram.
+
+    Args:
+        data (bytes): The datagram
+        baseline (dict): State of the snapshot's baseline tick ({} when
+            the snapshot is full)
+
+    Returns:
+        dict: Network id -> quantised field tuple
+    """
+    offset = _HEADER.size
+    _, _, _, _, changed_count = _SNAPSHOT.unpack_from(data, offset)
+    offset += _SNAPSHOT.size
+    state = dict(baseline)
+    for _ in range(changed_count):
+        entity_id, mask = _ENTITY.unpack_from(data, offset)
+        offset += _ENTITY.size
+        values = list(state.get(entity_id, (0,) * len(ENTITY_FIELDS)))
+        for bit, (_, field) in enumerate(ENTITY_FIELDS):
+            if mask >> bit & 1:
+                (values[bit],) = field.unpack_from(data, offset)
+                offset += field.size
+        state[entity_id] = tuple(values)
+
+    (removed_count,) = _COUNT.unpack_from(data, offset)
+    offset += _COUNT.size
+    for _ in range(removed_count):
+        (entity_id,) = _ID.unpack_from(data, offset)
+        offset += _ID.size
+        state.pop(entity_id, None)
+    return state
+
+
+def encode_rollback(input_ack, checksum_frame, checksum, first_frame, frames):
+    """
+    Encode a rollback peer's input packet.
+
+    Args:
+        input_ack (int): Newest frame up to which every remote input arrived
+        checksum_frame (int): Frame of the newest confirmed checksum, or 0
+        checksum (int): CRC32 of the simulation after that frame
+        first_frame (int): Frame of the first input
+        frames (list): Local inputs of consecutive frames (at most 255)
+
+    Returns:
+        bytes: The datagram
+    """
+    out = _header(MSG_ROLLBACK)
+    out += _ROLLBACK.pack(input_ack, checksum_frame, checksum, first_frame, len(frames))
+    for frame in frames:
+        pack_frame(frame, out)
+    return bytes(out)
+
+
+def decode_rollback(data):
+    """Return (input ack, checksum frame, checksum, first frame, [InputFrame])."""
+    offset = _HEADER.size
+    input_ack, checksum_frame, checksum, first_frame, count = _ROLLBACK.unpack_from(
+        data, offset
+    )
+    offset += _ROLLBACK.size
+    frames = []
+    for _ in range(count):
+        frame, offset = unpack_frame(data, offset)
+        frames.append(frame)
+    return input_ack, checksum_frame, checksum, first_frame, frames
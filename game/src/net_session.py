@@ -0,0 +1,943 @@
+"""
+Networked Multiplayer
+
+Snapshot-based multiplayer over UDP. NetServer runs the authoritative
+simulation on a headless engine: two clients take the Player 1 and Player 2
+seats, send their input stream (each packet repeating the newest
+unacknowledged inputs, so a lost packet costs nothing) and receive quantised,
+delta-compressed snapshots at NET_SNAPSHOT_HZ. NetClient renders the world
+NET_INTERPOLATION_DELAY behind the newest snapshot, interpolating between
+the two snapshots around that time.
+
+Every socket write goes through a LossyLink, which can hold datagrams back
+and drop some of them; run_loopback uses that to play a whole session over
+127.0.0.1 with simulated latency, jitter and packet loss on a virtual clock,
+and reports the bandwidth of every client and the latency from sending an
+input to seeing its effect.
+"""
+
+import heapq
+import math
+import random
+import socket
+import time
+from collections import deque
+
+import pygame
+from config import *
+from event_bus import frame_events
+from entities import Bullet
+from frame_timing import FixedTimestep
+from input_recorder import EVENT_KEYDOWN, KEY_INDEX, InputFrame, capture_input_frame
+from net_protocol import (
+    ENEMY_ID,
+    ENTITY_FIELDS,
+    FIRST_BULLET_ID,
+    FLAG_BLOCKING,
+    FLAG_FACING_RIGHT,
+    FLAG_RELOADING,
+    KIND_BULLET,
+    KIND_ENEMY,
+    KIND_PLAYER1,
+    KIND_PLAYER2,
+    MSG_BYE,
+    MSG_HELLO,
+    MSG_INPUT,
+    MSG_SNAPSHOT,
+    MSG_WELCOME,
+    PLAYER1_ID,
+    PLAYER2_ID,
+    decode_input,
+    decode_snapshot,
+    decode_welcome,
+    encode_input,
+    encode_simple,
+    encode_snapshot,
+    encode_welcome,
+    parse_header,
+    quantize_entity,
+    read_snapshot_header,
+)
+
+# UDP and IPv4 header bytes of every datagram, for on-the-wire bandwidth
+UDP_OVERHEAD = 28
+
+# Player 2's clients play with the Player 1 layout; the server moves their
+# input over to the Player 2 keys
+SLOT2_KEYS = {
+    pygame.K_w: pygame.K_UP,
+    pygame.K_a: pygame.K_LEFT,
+    pygame.K_s: pygame.K_DOWN,
+    pygame.K_d: pygame.K_RIGHT,
+    pygame.K_e: pygame.K_KP0,
+}
+PLAYER2_KEYS = frozenset(SLOT2_KEYS.values())
+_PLAYER2_MASK = sum(1 << KEY_INDEX[key] for key in PLAYER2_KEYS)
+
+# Largest number of entities that fit in one snapshot datagram
+MAX_SNAPSHOT_ENTITIES = (NET_MAX_PACKET - 64) // (
+    4 + sum(field.size for _, field in ENTITY_FIELDS)
+)
+
+
+def seat_input(slot, key_mask, events):
+    """
+    Move one player's input (Player 1 layout) onto the keys of their seat.
+
+    Args:
+        slot (int): Seat, 1 or 2
+        key_mask (int): Held keys
+        events (list): (kind, code) presses
+
+    Returns:
+        tuple: (key mask, events) that only touch the seat's own fighter,
+            ready to be combined with the other seat's
+    """
+    if slot == 2:
+        moved = 0
+        for key, target in SLOT2_KEYS.items():
+            if key_mask >> KEY_INDEX[key] & 1:
+                moved |= 1 << KEY_INDEX[target]
+        events = [
+            (kind, SLOT2_KEYS[code])
+            for kind, code in events
+            if kind == EVENT_KEYDOWN and code in SLOT2_KEYS
+        ]
+        return moved, events
+    events = [
+        (kind, code)
+        for kind, code in events
+        if kind != EVENT_KEYDOWN or code not in PLAYER2_KEYS
+    ]
+    return key_mask & ~_PLAYER2_MASK, events
+
+
+def percentile(values, share):
+    """Return the value below which the given share of values fall."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(share * len(ordered)))]
+
+
+class LossyLink:
+    """Sends datagrams after a simulated delay, dropping some of them."""
+
+    def __init__(self, sock, latency=0.0, jitter=0.0, loss=0.0, seed=0):
+        """
+        Args:
+            sock (socket.socket): Socket to send through
+            latency (float): One-way delay in seconds
+            jitter (float): Random extra delay, up to this many seconds
+            loss (float): Share of datagrams dropped
+            seed (int): Seed for the drops and the jitter
+        """
+        self.sock = sock
+        self.latency = latency
+        self.jitter = jitter
+        self.loss = loss
+        self.rng = random.Random(seed)
+        self.queue = []  # (due time, order, datagram, address) heap
+        self.order = 0
+        self.dropped = 0
+
+    def send(self, data, address, now):
+        """Queue a datagram, sending it right away when there is no delay."""
+        if self.loss and self.rng.random() < self.loss:
+            self.dropped += 1
+            return
+        due = now + self.latency + self.rng.random() * self.jitter
+        heapq.heappush(self.queue, (due, self.order, data, address))
+        self.order += 1
+        self.flush(now)
+
+    def flush(self, now):
+        """Send every queued datagram that is due."""
+        while self.queue and self.queue[0][0] <= now:
+            _, _, data, address = heapq.heappop(self.queue)
+            try:
+                self.sock.sendto(data, address)
+            except OSError:
+                self.dropped += 1
+
+
+class NetStats:
+    """Datagram and byte counters of one peer."""
+
+    def __init__(self):
+        self.bytes_sent = 0
+        self.packets_sent = 0
+        self.bytes_received = 0
+        self.packets_received = 0
+
+    def sent(self, data):
+        self.bytes_sent += len(data)
+        self.packets_sent += 1
+
+    def received(self, data):
+        self.bytes_received += len(data)
+        self.packets_received += 1
+
+    def kbps(self, seconds):
+        """
+        Return (up, down) bandwidth in kilobits per second, counting the
+        UDP/IPv4 headers.
+        """
+        seconds = max(seconds, 1e-9)
+        up = self.bytes_sent + UDP_OVERHEAD * self.packets_sent
+        down = self.bytes_received + UDP_OVERHEAD * self.packets_received
+        return up * 8 / 1000 / seconds, down * 8 / 1000 / seconds
+
+
+def _receive_all(sock):
+    """Yield (datagram, address) for everything waiting on a socket."""
+    while True:
+        try:
+            data, address = sock.recvfrom(65536)
+        except (BlockingIOError, InterruptedError):
+            return
+        except ConnectionResetError:
+            continue  # ICMP port unreachable from an earlier send (Windows)
+        yield data, address
+
+
+def open_socket(address=("127.0.0.1", 0)):
+    """Return a non-blocking UDP socket bound to an address."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(address)
+    sock.setblocking(False)
+    return sock
+
+
+class RemotePlayer:
+    """Server-side state of one connected client."""
+
+    def __init__(self, slot, address, now):
+        self.slot = slot
+        self.address = address
+        self.last_heard = now
+        self.pending = []  # Inputs received since the last tick
+        self.input_sequence = 0  # Newest input received
+        self.snapshot_ack = 0  # Newest snapshot the client has decoded
+        self.held_mask = 0
+        self.mouse_pos = (0, 0)
+        self.stats = NetStats()
+
+
+class NetServer:
+    """Authoritative match server for two networked players."""
+
+    def __init__(
+        self,
+        engine,
+        sock,
+        link=None,
+        snapshot_hz=NET_SNAPSHOT_HZ,
+        mode="classic",
+        characters=None,
+    ):
+        """
+        Args:
+            engine (GameEngine): Headless engine that runs the matches
+            sock (socket.socket): Non-blocking bound UDP socket
+            link (LossyLink): Link to send through (default: no loss or delay)
+            snapshot_hz (int): Snapshots sent to each client per second
+            mode (str): Game mode key
+            characters (dict): Character selection of "player1" and "player2"
+        """
+        self.engine = engine
+        self.sock = sock
+        self.link = link or LossyLink(sock)
+        self.ticks_per_snapshot = max(1, round(SIMULATION_HZ / snapshot_hz))
+        self.snapshot_hz = SIMULATION_HZ / self.ticks_per_snapshot
+        self.mode = mode
+        self.characters = characters or {"player1": "jedi", "player2": "sith"}
+        self.players = {}  # Address -> RemotePlayer
+        self.match = 0
+        self.history = {}  # Tick -> sent state, the delta baselines
+        self.bullet_ids = {}  # Bullet -> network id
+        self.next_bullet_id = FIRST_BULLET_ID
+        self.results = []  # Winner title of every finished match
+        self.input_waits = []  # Ticks from each match's start to its first input
+        self.awaiting_input = False
+        self.full_snapshot_bytes = []
+        self.delta_snapshot_bytes = []
+
+    def metadata(self):
+        """Return the match setup clients need to mirror the match."""
+        return {
+            "seed": self.engine.match_seed,
+            "mode": self.mode,
+            "characters": self.characters,
+            "snapshot_hz": self.snapshot_hz,
+        }
+
+    def start_match(self, now):
+        """Start the next match and announce it to every client."""
+        engine = self.engine
+        engine._reset_game_state()
+        engine.two_player_mode = True
+        engine.current_game_mode = self.mode
+        engine.character_selections = dict(self.characters)
+        engine._initialize_game()
+        self.match = (self.match + 1) & 0xFFFF
+        self.history.clear()
+        self.bullet_ids.clear()
+        self.next_bullet_id = FIRST_BULLET_ID
+        self.awaiting_input = True
+        # Clients number their inputs from 1 again in every match
+        for player in self.players.values():
+            player.snapshot_ack = 0
+            player.input_sequence = 0
+            player.held_mask = 0
+            player.pending.clear()
+            self._send(
+                player, encode_welcome(player.slot, self.match, self.metadata()), now
+            )
+
+    def _send(self, player, data, now):
+        player.stats.sent(data)
+        self.link.send(data, player.address, now)
+
+    def receive(self, now):
+        """Handle every datagram waiting on the socket."""
+        for data, address in _receive_all(self.sock):
+            kind = parse_header(data)
+            if kind is None:
+                continue
+            player = self.players.get(address)
+            if player:
+                player.stats.received(data)
+                player.last_heard = now
+
+            if kind == MSG_HELLO:
+                if player is None:
+                    taken = {p.slot for p in self.players.values()}
+                    free = [slot for slot in (1, 2) if slot not in taken]
+                    if not free:
+                        continue  # Match is full
+                    player = RemotePlayer(free[0], address, now)
+                    player.stats.received(data)
+                    self.players[address] = player
+                welcome = encode_welcome(player.slot, self.match, self.metadata())
+                self._send(player, welcome, now)
+
+            elif kind == MSG_INPUT and player:
+                match, snapshot_ack, inputs = decode_input(data)
+                if match != self.match:
+                    # The client missed the start of this match
+                    welcome = encode_welcome(player.slot, self.match, self.metadata())
+                    self._send(player, welcome, now)
+                    continue
+                if snapshot_ack in self.history:
+                    player.snapshot_ack = max(player.snapshot_ack, snapshot_ack)
+                for sequence, frame in inputs:
+                    if sequence > player.input_sequence:
+                        player.input_sequence = sequence
+                        player.pending.append(frame)
+
+            elif kind == MSG_BYE and player:
+                del self.players[address]
+
+    def _player_input(self, player):
+        """Merge a client's inputs since the last tick into its seat's keys."""
+        events = []
+        for frame in player.pending:
+            player.held_mask = frame.keys.mask
+            player.mouse_pos = frame.mouse_pos
+            events.extend(frame.events)
+        player.pending.clear()
+
+        return seat_input(player.slot, player.held_mask, events)
+
+    def tick(self, now):
+        """
+        Run one simulation tick with the clients' input, send snapshots
+        when due and start a new match when one ends.
+        """
+        for address, player in list(self.players.items()):
+            if now - player.last_heard > NET_TIMEOUT:
+                del self.players[address]
+        if not self.players:
+            return
+        if self.engine.player1 is None:
+            self.start_match(now)
+
+        key_mask = 0
+        events = []
+        mouse_pos = (0, 0)
+        engine = self.engine
+        for player in sorted(self.players.values(), key=lambda p: p.slot):
+            if self.awaiting_input and player.pending:
+                self.awaiting_input = False
+                self.input_waits.append(engine.tick_count)
+            mask, player_events = self._player_input(player)
+            key_mask |= mask
+            events.extend(player_events)
+            if player.slot == 1:
+                mouse_pos = player.mouse_pos
+
+        engine._simulate_tick(InputFrame(key_mask, mouse_pos, tuple(events)))
+        # Nothing is drawn on the server, so the frame's visual events are dropped
+        frame_events.clear()
+        winner_title = engine._check_game_over()
+
+        if engine.tick_count % self.ticks_per_snapshot == 0 or winner_title:
+            self.send_snapshots(now)
+        if winner_title:
+            self.results.append(winner_title)
+            self.start_match(now)
+
+    def world_state(self):
+        """Return the quantised state of every entity, by network id."""
+        engine = self.engine
+        state = {}
+        for entity_id, kind, entity in (
+            (PLAYER1_ID, KIND_PLAYER1, engine.player1),
+            (PLAYER2_ID, KIND_PLAYER2, engine.player2),
+            (ENEMY_ID, KIND_ENEMY, engine.enemy),
+        ):
+            if entity:
+                state[entity_id] = quantize_entity(kind, entity)
+
+        bullet_ids = {}
+        for bullet in engine.bullets[: MAX_SNAPSHOT_ENTITIES - len(state)]:
+            entity_id = self.bullet_ids.get(bullet)
+            if entity_id is None:
+                entity_id = self.next_bullet_id
+                self.next_bullet_id += 1
+                if self.next_bullet_id > 0xFFFF:
+                    self.next_bullet_id = FIRST_BULLET_ID
+            bullet_ids[bullet] = entity_id
+            state[entity_id] = quantize_entity(KIND_BULLET + bullet.owner_id, bullet)
+        self.bullet_ids = bullet_ids
+        return state
+
+    def send_snapshots(self, now):
+        """Send every client the current state, delta-encoded for it."""
+        tick = self.engine.tick_count
+        state = self.world_state()
+        self.history[tick] = state
+        while len(self.history) > NET_SNAPSHOT_HISTORY:
+            del self.history[min(self.history)]
+
+        for player in self.players.values():
+            baseline = self.history.get(player.snapshot_ack)
+            baseline_tick = player.snapshot_ack if baseline is not None else 0
+            data = encode_snapshot(
+                self.match,
+                tick,
+                state,
+                baseline_tick,
+                baseline or {},
+                player.input_sequence,
+            )
+            if baseline_tick:
+                self.delta_snapshot_bytes.append(len(data))
+            else:
+                self.full_snapshot_bytes.append(len(data))
+            self._send(player, data, now)
+
+    def flush(self, now):
+        """Send the datagrams the link has held back that are now due."""
+        self.link.flush(now)
+
+
+class NetClient:
+    """Sends one player's input and interpolates the server's snapshots."""
+
+    def __init__(
+        self,
+        sock,
+        server_address,
+        link=None,
+        interpolation_delay=NET_INTERPOLATION_DELAY,
+        redundancy=NET_INPUT_REDUNDANCY,
+    ):
+        """
+        Args:
+            sock (socket.socket): Non-blocking bound UDP socket
+            server_address (tuple): (host, port) of the server
+            link (LossyLink): Link to send through (default: no loss or delay)
+            interpolation_delay (float): Seconds rendered behind the newest
+                snapshot, enough to bridge a lost snapshot or two
+            redundancy (int): Unacknowledged inputs repeated in every packet
+        """
+        self.sock = sock
+        self.server_address = server_address
+        self.link = link or LossyLink(sock)
+        self.interpolation_delay = interpolation_delay
+        self.redundancy = redundancy
+        self.stats = NetStats()
+        self.slot = None
+        self.match = None
+        self.metadata = None
+        self.next_hello = 0.0
+        self.engine_match = None  # Match the local engine was set up for
+        self._reset_match()
+
+        # Latency samples in seconds
+        self.input_latency = []  # Input sent -> first snapshot that applied it
+        self.display_latency = []  # Input sent -> that snapshot on screen
+        self.snapshots_received = 0
+        self.snapshots_unusable = 0  # Baseline no longer held
+        self.stalls = 0  # Renders with no newer snapshot to move towards
+
+    def _reset_match(self):
+        self.next_sequence = 1
+        self.unacked = deque()  # (sequence, InputFrame), oldest first
+        self.sent_at = {}  # Sequence -> send time
+        self.history = {}  # Tick -> decoded state
+        self.timeline = deque()  # (tick, state) of the newest snapshots
+        self.latest_tick = 0
+        self.clock_offsets = deque(maxlen=2 * NET_SNAPSHOT_HZ)
+
+    def _send(self, data, now):
+        self.stats.sent(data)
+        self.link.send(data, self.server_address, now)
+
+    def send_input(self, frame, now):
+        """
+        Send this tick's input (with the newest unacknowledged ones).
+
+        Until the server has given the client a seat this sends HELLO
+        twice a second instead.
+        """
+        if self.slot is None:
+            if now >= self.next_hello:
+                self._send(encode_simple(MSG_HELLO), now)
+                self.next_hello = now + 0.5
+            return
+        sequence = self.next_sequence
+        self.next_sequence += 1
+        self.unacked.append((sequence, frame))
+        self.sent_at[sequence] = now
+        inputs = list(self.unacked)[-self.redundancy :]
+        self._send(encode_input(self.match, self.latest_tick, inputs), now)
+
+    def receive(self, now):
+        """Handle every datagram waiting on the socket."""
+        for data, _ in _receive_all(self.sock):
+            kind = parse_header(data)
+            if kind is None:
+                continue
+            self.stats.received(data)
+            if kind == MSG_WELCOME:
+                self.slot, match, self.metadata = decode_welcome(data)
+                if match != self.match:
+                    self.match = match
+                    self._reset_match()
+            elif kind == MSG_SNAPSHOT:
+                self._receive_snapshot(data, now)
+
+    def _receive_snapshot(self, data, now):
+        match, tick, baseline_tick, input_ack = read_snapshot_header(data)
+        if match != self.match or tick <= self.latest_tick:
+            return  # Another match's, or older than one already shown
+        self.snapshots_received += 1
+        baseline = self.history.get(baseline_tick, {} if not baseline_tick else None)
+        if baseline is None:
+            self.snapshots_unusable += 1
+            return
+        state = decode_snapshot(data, baseline)
+
+        self.history[tick] = state
+        self.latest_tick = tick
+        while len(self.history) > NET_SNAPSHOT_HISTORY:
+            del self.history[min(self.history)]
+        self.timeline.append((tick, state))
+        while (
+            len(self.timeline) > 2
+            and self.timeline[1][0] < self.render_tick(now) - SIMULATION_HZ
+        ):
+            self.timeline.popleft()
+
+        # Server tick = (local time + offset) * rate; the least delayed
+        # snapshot of the last few seconds gives the best estimate
+        self.clock_offsets.append(tick / SIMULATION_HZ - now)
+        shown_at = tick / SIMULATION_HZ - self.clock_offset() + self.interpolation_delay
+
+        while self.unacked and self.unacked[0][0] <= input_ack:
+            self.unacked.popleft()
+        for sequence in [s for s in self.sent_at if s <= input_ack]:
+            sent = self.sent_at.pop(sequence)
+            self.input_latency.append(now - sent)
+            self.display_latency.append(max(now, shown_at) - sent)
+
+    def clock_offset(self):
+        """Return the estimated server time minus local time, in seconds."""
+        return max(self.clock_offsets) if self.clock_offsets else 0.0
+
+    def render_tick(self, now):
+        """Return the (fractional) server tick to draw at a local time."""
+        if not self.clock_offsets:
+            return 0.0
+        return (now + self.clock_offset() - self.interpolation_delay) * SIMULATION_HZ
+
+    def interpolated_state(self, now):
+        """
+        Return the world as it should be drawn now.
+
+        Positions are interpolated between the two snapshots around the
+        render time; other fields come from the older one. Without a newer
+        snapshot the newest one is held.
+
+        Returns:
+            dict: Network id -> (kind, x, y, vx, vy, health, energy, ammo,
+                flags) with positions and velocities in pixels, or None
+                before the first snapshot
+        """
+        if not self.timeline:
+            return None
+        target = self.render_tick(now)
+        older = newer = None
+        for tick, state in self.timeline:
+            if tick <= target:
+                older = (tick, state)
+            else:
+                newer = (tick, state)
+                break
+        if older is None:
+            older = self.timeline[0]
+        if newer is None:
+            self.stalls += 1
+            newer = older
+        span = newer[0] - older[0]
+        alpha = min(1.0, max(0.0, (target - older[0]) / span)) if span else 0.0
+
+        world = {}
+        for entity_id, values in older[1].items():
+            x, y = values[1], values[2]
+            following = newer[1].get(entity_id)
+            if following is not None and following[0] == values[0]:
+                x += (following[1] - x) * alpha
+                y += (following[2] - y) * alpha
+            world[entity_id] = (
+                values[0],
+                x / NET_POSITION_SCALE,
+                y / NET_POSITION_SCALE,
+                values[3] / NET_VELOCITY_SCALE,
+                values[4] / NET_VELOCITY_SCALE,
+            ) + values[5:]
+        return world
+
+    def apply_to_engine(self, engine, now):
+        """
+        Mirror the interpolated world into a local engine for drawing.
+
+        The engine is set up from the match metadata (the seed gives the
+        same platforms as the server's) whenever a new match starts.
+
+        Returns:
+            bool: False if there is nothing to draw yet
+        """
+        world = self.interpolated_state(now)
+        if world is None:
+            return False
+        if self.engine_match != self.match:
+            engine._reset_game_state()
+            engine.two_player_mode = True
+            engine.current_game_mode = self.metadata["mode"]
+            engine.character_selections = self.metadata["characters"]
+            engine._initialize_game(self.metadata["seed"])
+            self.engine_match = self.match
+
+        engine.bullets = []
+        for entity_id, kind, entity in (
+            (PLAYER1_ID, KIND_PLAYER1, engine.player1),
+            (PLAYER2_ID, KIND_PLAYER2, engine.player2),
+            (ENEMY_ID, KIND_ENEMY, engine.enemy),
+        ):
+            values = world.get(entity_id)
+            if entity is None or values is None:
+                continue
+            _, entity.x, entity.y, _, entity.velocity_y = values[:5]
+            health, energy, ammo, flags = values[5:]
+            entity.health = health
+            entity.force_energy = energy
+            entity.magazine = ammo
+            entity.facing_right = bool(flags & FLAG_FACING_RIGHT)
+            entity.reloading = bool(flags & FLAG_RELOADING)
+            entity.is_blocking = bool(flags & FLAG_BLOCKING)
+            entity.rect.x = int(entity.x)
+            entity.rect.y = int(entity.y)
+
+        for entity_id, values in world.items():
+            if values[0] >= KIND_BULLET:
+                bullet = Bullet(
+                    values[1], values[2], values[3], values[0] - KIND_BULLET
+                )
+                engine.bullets.append(bullet)
+        engine.previous_positions = {}
+        return True
+
+    def flush(self, now):
+        """Send the datagrams the link has held back that are now due."""
+        self.link.flush(now)
+
+    def close(self, now):
+        """Tell the server the client is leaving."""
+        self.link.latency = self.link.jitter = self.link.loss = 0
+        self._send(encode_simple(MSG_BYE), now)
+        self.link.flush(math.inf)
+
+    def report(self, seconds):
+        """
+        Return this client's traffic and latency figures.
+
+        Args:
+            seconds (float): Length of the session
+        """
+        up, down = self.stats.kbps(seconds)
+        return {
+            "slot": self.slot,
+            "up_kbps": round(up, 2),
+            "down_kbps": round(down, 2),
+            "packets_sent": self.stats.packets_sent,
+            "packets_received": self.stats.packets_received,
+            "snapshots": self.snapshots_received,
+            "snapshots_unusable": self.snapshots_unusable,
+            "input_latency_ms": _latency_summary(self.input_latency),
+            "end_to_end_ms": _latency_summary(self.display_latency),
+            "interpolation_stalls": self.stalls,
+        }
+
+
+def _latency_summary(samples):
+    if not samples:
+        return {"mean": 0.0, "p95": 0.0, "max": 0.0}
+    return {
+        "mean": round(1000 * sum(samples) / len(samples), 1),
+        "p95": round(1000 * percentile(samples, 0.95), 1),
+        "max": round(1000 * max(samples), 1),
+    }
+
+
+class ScriptedInput:
+    """Random but plausible input for a loopback client (Player 1 layout)."""
+
+    def __init__(self, seed):
+        self.rng = random.Random(seed)
+        self.direction = 0
+
+    def frame(self):
+        rng = self.rng
+        if rng.random() < 0.03:
+            self.direction = rng.choice((-1, 0, 1))
+        key_mask = 0
+        if self.direction:
+            key_mask |= 1 << KEY_INDEX[pygame.K_d if self.direction > 0 else pygame.K_a]
+        events = []
+        if rng.random() < 0.03:
+            events.append((EVENT_KEYDOWN, pygame.K_w))
+        if rng.random() < 0.06:
+            events.append((EVENT_KEYDOWN, pygame.K_e))
+        if rng.random() < 0.01:
+            events.append((EVENT_KEYDOWN, pygame.K_f))
+        if rng.random() < 0.01:
+            events.append((EVENT_KEYDOWN, pygame.K_q))
+        if rng.random() < 0.005:
+            events.append((EVENT_KEYDOWN, pygame.K_g))
+        return InputFrame(
+            key_mask, (WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2), tuple(events)
+        )
+
+
+def run_loopback(
+    engine,
+    seconds=30.0,
+    latency=NET_LOOPBACK_LATENCY,
+    jitter=NET_LOOPBACK_JITTER,
+    loss=NET_LOOPBACK_LOSS,
+    snapshot_hz=NET_SNAPSHOT_HZ,
+    seed=0,
+):
+    """
+    Play a networked session between a server and two scripted clients over
+    real UDP sockets on 127.0.0.1, on a virtual clock so it runs as fast
+    as the simulation allows.
+
+    Args:
+        engine (GameEngine): Headless engine for the server
+        seconds (float): Simulated session length
+        latency (float): One-way delay of every link
+        jitter (float): Random extra one-way delay, up to this many seconds
+        loss (float): Share of datagrams every link drops, in each direction
+        snapshot_hz (int): Snapshots per second
+        seed (int): Seed of the links and the scripted input
+
+    Returns:
+        dict: Session setup, server figures and one report per client
+    """
+    server_sock = open_socket()
+    server = NetServer(
+        engine,
+        server_sock,
+        LossyLink(server_sock, latency, jitter, loss, seed),
+        snapshot_hz=snapshot_hz,
+    )
+    clients = []
+    scripts = []
+    for index in (1, 2):
+        sock = open_socket()
+        link = LossyLink(sock, latency, jitter, loss, seed + index)
+        clients.append(NetClient(sock, server_sock.getsockname(), link))
+        scripts.append(ScriptedInput(seed + index))
+
+    # The network is pumped several times per tick, so the simulated
+    # delays are not rounded up to whole ticks
+    pumps = 4
+    dt = 1.0 / SIMULATION_HZ
+    ticks = int(seconds * SIMULATION_HZ)
+    started = time.perf_counter()
+    try:
+        for step in range(1, ticks * pumps + 1):
+            now = step * dt / pumps
+            for peer in [server] + clients:
+                peer.flush(now)
+            for client in clients:
+                client.receive(now)
+            server.receive(now)
+            if step % pumps:
+                continue
+
+            for client, script in zip(clients, scripts):
+                client.send_input(script.frame(), now)
+                client.interpolated_state(now)  # What would be drawn
+            server.tick(now)
+    finally:
+        for client in clients:
+            client.close(ticks * dt)
+            client.sock.close()
+        server_sock.close()
+
+    full = server.full_snapshot_bytes
+    # Input must reach every match, not only the first
+    waits = server.input_waits[1:]
+    if server.awaiting_input and server.input_waits:
+        waits.append(engine.tick_count)  # Still waiting when the session ended
+    delta = server.delta_snapshot_bytes
+    return {
+        "seconds": seconds,
+        "wall_seconds": round(time.perf_counter() - started, 2),
+        "latency_ms": latency * 1000,
+        "jitter_ms": jitter * 1000,
+        "loss": loss,
+        "snapshot_hz": server.snapshot_hz,
+        "interpolation_delay_ms": NET_INTERPOLATION_DELAY * 1000,
+        "server": {
+            "matches_finished": len(server.results),
+            "later_match_input_wait_ms": round(
+                1000 * max(waits) / SIMULATION_HZ if waits else 0.0, 1
+            ),
+            "full_snapshot_bytes": round(sum(full) / len(full), 1) if full else 0,
+            "delta_snapshot_bytes": round(sum(delta) / len(delta), 1) if delta else 0,
+            "full_snapshots": len(full),
+            "delta_snapshots": len(delta),
+            "datagrams_dropped": server.link.dropped,
+        },
+        "clients": [
+            dict(client.report(seconds), datagrams_dropped=client.link.dropped)
+            for client in clients
+        ],
+    }
+
+
+def format_loopback_report(report):
+    """Return a loopback report as printable text."""
+    server = report["server"]
+    lines = [
+        f"{report['seconds']:.0f} s over loopback in {report['wall_seconds']} s: "
+        f"{report['latency_ms']:.0f} ms latency, {report['jitter_ms']:.0f} ms "
+        f"jitter, {report['loss']:.0%} loss, {report['snapshot_hz']:.0f} Hz "
+        f"snapshots, {report['interpolation_delay_ms']:.0f} ms interpolation",
+        f"Snapshots: {server['delta_snapshots']} delta "
+        f"({server['delta_snapshot_bytes']} B mean), {server['full_snapshots']} "
+        f"full ({server['full_snapshot_bytes']} B mean); "
+        f"{server['matches_finished']} matches finished, input reached later "
+        f"matches within {server['later_match_input_wait_ms']:.0f} ms",
+    ]
+    for client in report["clients"]:
+        input_ms = client["input_latency_ms"]
+        display_ms = client["end_to_end_ms"]
+        lines.append(
+            f"Player {client['slot']}: up {client['up_kbps']:.1f} kbps, "
+            f"down {client['down_kbps']:.1f} kbps, "
+            f"{client['snapshots']} snapshots "
+            f"({client['snapshots_unusable']} unusable), "
+            f"input->server->client {input_ms['mean']:.0f} ms "
+            f"(p95 {input_ms['p95']:.0f}), end-to-end {display_ms['mean']:.0f} ms "
+            f"(p95 {display_ms['p95']:.0f}), {client['interpolation_stalls']} stalls"
+        )
+    return "\n".join(lines)
+
+
+def serve(engine, port=NET_PORT, seconds=None, mode="classic", characters=None):
+    """
+    Run a match server in real time until interrupted.
+
+    Args:
+        engine (GameEngine): Headless engine to simulate on
+        port (int): UDP port to listen on
+        seconds (float): Stop after this long, or None to run forever
+        mode (str): Game mode key
+        characters (dict): Character selection of "player1" and "player2"
+    """
+    sock = open_socket(("0.0.0.0", port))
+    server = NetServer(engine, sock, mode=mode, characters=characters)
+    timestep = FixedTimestep()
+    started = last_time = time.perf_counter()
+    try:
+        while seconds is None or last_time - started < seconds:
+            now = time.perf_counter()
+            frame_time = now - last_time
+            last_time = now
+            server.receive(now)
+            for _ in range(timestep.advance(frame_time)):
+                server.tick(now)
+            server.flush(now)
+            time.sleep(timestep.dt / 4)
+    finally:
+        sock.close()
+    return server
+
+
+def play_online(engine, host, port=NET_PORT):
+    """
+    Join a match server and play in a window until it is closed.
+
+    Args:
+        engine (GameEngine): Windowed engine to draw with
+        host (str): Server host name or address
+        port (int): Server UDP port
+    """
+    sock = open_socket(("0.0.0.0", 0))
+    client = NetClient(sock, (socket.gethostbyname(host), port))
+    timestep = FixedTimestep()
+    pending_events = []
+    last_time = time.perf_counter()
+    try:
+        while engine.running:
+            now = time.perf_counter()
+            frame_time = now - last_time
+            last_time = now
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT or (
+                    event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE
+                ):
+                    engine.running = False
+                pending_events.append(event)
+
+            for _ in range(timestep.advance(frame_time)):
+                frame = capture_input_frame(pending_events, engine._game_mouse_pos())
+                pending_events = []
+                client.send_input(frame, now)
+            client.receive(now)
+            client.flush(now)
+            if client.apply_to_engine(engine, now):
+                engine._render()
+            engine.clock.tick(RENDER_FPS)
+    finally:
+        client.close(time.perf_counter())
+        sock.close()
+    return client
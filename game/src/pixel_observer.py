@@ -0,0 +1,129 @@
+"""
+Pixel Observer
+
+Downscaled pixel observations of the composed game frame, for pixel-based
+agents and automated visual checks. The frame is scaled straight into a
+small preallocated surface whose pixels stay exposed as a numpy view
+(pygame.surfarray.pixels3d), then reduced to greyscale if asked and
+written into the newest slot of a preallocated frame stack. A capture
+allocates no surfaces and makes no full-resolution copies, and it works
+under the SDL dummy video driver, since only off-screen surfaces are
+touched.
+"""
+
+import pygame
+from config import *
+
+# numpy backs every buffer here, so it is required
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Integer luminance weights (ITU-R BT.601, out of 256)
+_LUMA_WEIGHTS = (77, 150, 29)
+
+
+class PixelObserver:
+    """
+    A stack of the most recent downscaled frames, oldest first: an array of
+    shape (stack, height, width) in greyscale or (stack, height, width, 3)
+    in RGB, dtype uint8.
+    """
+
+    def __init__(
+        self,
+        size=PIXEL_OBSERVATION_SIZE,
+        greyscale=PIXEL_GREYSCALE,
+        stack=PIXEL_FRAME_STACK,
+        smooth=PIXEL_SMOOTH_SCALING,
+        out=None,
+    ):
+        """
+        Args:
+            size (tuple): Width and height of an observed frame
+            greyscale (bool): Keep one luminance channel instead of RGB
+            stack (int): Number of frames kept
+            smooth (bool): Area-average when downscaling instead of
+                sampling the nearest pixel
+            out (numpy.ndarray): Array of the observation shape and dtype to
+                fill in place (e.g. one row of a batch), or None to
+                allocate one
+
+        Raises:
+            ImportError: If numpy is not installed
+            ValueError: If out has the wrong shape or dtype
+        """
+        if np is None:
+            raise ImportError("PixelObserver needs numpy")
+        width, height = size
+        self.size = (width, height)
+        self.greyscale = greyscale
+        self.smooth = smooth
+        self.shape = (stack, height, width) if greyscale else (stack, height, width, 3)
+        if out is None:
+            out = np.zeros(self.shape, dtype=np.uint8)
+        elif out.shape != self.shape or out.dtype != np.uint8:
+            raise ValueError(
+                f"out must be a uint8 array of shape {self.shape}, "
+                f"not {out.dtype} {out.shape}"
+            )
+        self.frames = out
+
+        # Scaling target; the view keeps it locked, which pygame.transform
+        # still writes through. Transposed to row-major (height, width, 3).
+        self.surface = pygame.Surface(self.size, 0, 32)
+        self._pixels = pygame.surfarray.pixels3d(self.surface).transpose(1, 0, 2)
+        if greyscale:
+            self._channels = [self._pixels[..., index] for index in range(3)]
+            self._luma = np.empty((height, width), dtype=np.uint16)
+            self._term = np.empty((height, width), dtype=np.uint16)
+
+    def capture(self, surface):
+        """
+        Push a downscaled copy of surface onto the stack, dropping the oldest.
+
+        Args:
+            surface (pygame.Surface): Full-resolution frame (game_surface)
+
+        Returns:
+            numpy.ndarray: The frame stack (the same array every call)
+        """
+        frames = self.frames
+        if len(frames) > 1:
+            frames[:-1] = frames[1:]
+        self._sample(surface, frames[-1])
+        return frames
+
+    def reset(self, surface):
+        """
+        Fill every slot of the stack with a downscaled copy of surface, as at
+        the start of an episode.
+
+        Returns:
+            numpy.ndarray: The frame stack
+        """
+        frames = self.frames
+        self._sample(surface, frames[0])
+        frames[1:] = frames[0]
+        return frames
+
+    def _sample(self, surface, target):
+        """Downscale surface into the view and write it to target."""
+        if self.smooth:
+            pygame.transform.smoothscale(surface, self.size, self.surface)
+        else:
+            pygame.transform.scale(surface, self.size, self.surface)
+        if not self.greyscale:
+            np.copyto(target, self._pixels)
+            return
+        red, green, blue = self._channels
+        luma = self._luma
+        term = self._term
+        np.multiply(red, _LUMA_WEIGHTS[0], out=luma, dtype=np.uint16)
+        np.multiply(green, _LUMA_WEIGHTS[1], out=term, dtype=np.uint16)
+        luma += term
+        np.multiply(blue, _LUMA_WEIGHTS[2], out=term, dtype=np.uint16)
+        luma += term
+        luma >>= 8
+        np.copyto(target, luma, casting="unsafe")
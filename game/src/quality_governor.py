@@ -0,0 +1,147 @@
+"""
+Quality Governor
+
+Watches the rolling frame work time against the frame budget and steps
+the visual quality down when frames run over (fewer muzzle flash,
+explosion and trail particles, fewer glow layers, thinner environment
+particles, a cheaper fullscreen scaler and shake composition), then
+steps it back up once there has been headroom for a while. Effects read
+the current settings from the global quality_governor; the current level
+and every change it made are available for telemetry.
+"""
+
+from collections import deque
+from config import *
+
+
+class QualityGovernor:
+    """Adjusts the visual quality level to keep frames within budget."""
+
+    def __init__(
+        self,
+        levels=QUALITY_LEVELS,
+        budget_ms=QUALITY_FRAME_BUDGET_MS,
+        window=QUALITY_WINDOW_FRAMES,
+        headroom=QUALITY_HEADROOM,
+        upgrade_frames=QUALITY_UPGRADE_FRAMES,
+    ):
+        """
+        Args:
+            levels (tuple): Settings per level, best first
+            budget_ms (float): Frame work time budget in milliseconds
+            window (int): Frames in the rolling mean
+            headroom (float): Raise quality when the mean is below
+                budget_ms * headroom
+            upgrade_frames (int): Consecutive frames of headroom needed
+                before raising quality
+        """
+        self.levels = levels
+        self.budget_ms = budget_ms
+        self.headroom = headroom
+        self.upgrade_frames = upgrade_frames
+        self.enabled = QUALITY_GOVERNOR_ENABLED
+        self.samples = deque(maxlen=window)
+        self.sample_total = 0.0
+        self.frames = 0
+        self.calm_frames = 0
+        self.changes = []  # Telemetry: one dict per level change
+        self.level = 0
+        self._apply(0)
+
+    def _apply(self, level):
+        """Copy a level's settings into attributes read by the effects."""
+        self.level = level
+        settings = self.levels[level]
+        self.name = settings["name"]
+        self.particle_scale = settings["particles"]
+        self.trail_particles = settings["trail_particles"]
+        self.glow_layers = settings["glow_layers"]
+        self.environment_density = settings["environment_density"]
+        self.smooth_scaling = settings["smooth_scaling"]
+        self.shake_mode = settings["shake"]
+
+    def set_level(self, level, reason="manual"):
+        """
+        Switch to a quality level and log the change.
+
+        Args:
+            level (int): Index into the levels, 0 being the best
+            reason (str): Why the level changed, kept in the telemetry
+        """
+        level = max(0, min(len(self.levels) - 1, level))
+        if level == self.level:
+            return
+        self.changes.append(
+            {
+                "frame": self.frames,
+                "from": self.name,
+                "to": self.levels[level]["name"],
+                "mean_ms": round(self.mean_ms(), 2),
+                "reason": reason,
+            }
+        )
+        self._apply(level)
+        # Judge the new level on its own frames
+        self.samples.clear()
+        self.sample_total = 0.0
+        self.calm_frames = 0
+
+    def mean_ms(self):
+        """Return the rolling mean frame work time in milliseconds."""
+        return self.sample_total / len(self.samples) if self.samples else 0.0
+
+    def record(self, work_time):
+        """
+        Record one frame's work time and adjust the quality if needed.
+
+        Args:
+            work_time (float): Seconds spent simulating and rendering the
+                frame, excluding the frame limiter's sleep
+        """
+        self.frames += 1
+        if not self.enabled:
+            return
+
+        ms = work_time * 1000.0
+        if len(self.samples) == self.samples.maxlen:
+            self.sample_total -= self.samples[0]
+        self.samples.append(ms)
+        self.sample_total += ms
+        if len(self.samples) < self.samples.maxlen:
+            return
+
+        mean = self.mean_ms()
+        if mean > self.budget_ms:
+            self.set_level(self.level + 1, "over budget")
+        elif mean < self.budget_ms * self.headroom:
+            self.calm_frames += 1
+            if self.calm_frames >= self.upgrade_frames:
+                self.set_level(self.level - 1, "headroom")
+        else:
+            self.calm_frames = 0
+
+    def scaled(self, count):
+        """Scale a particle count by the current particle setting."""
+        return int(count * self.particle_scale + 0.5)
+
+    def telemetry(self):
+        """
+        Return the current quality state and the changes made so far.
+
+        Returns:
+            dict: Level index and name, current settings, rolling mean,
+                frame count and the list of level changes
+        """
+        return {
+            "level": self.level,
+            "name": self.name,
+            "settings": dict(self.levels[self.level]),
+            "mean_ms": round(self.mean_ms(), 2),
+            "budget_ms": round(self.budget_ms, 2),
+            "frames": self.frames,
+            "changes": list(self.changes),
+        }
+
+
+# Global quality governor instance
+quality_governor = QualityGovernor()
@@ -0,0 +1,53 @@
+"""
+Random Streams
+
+Deterministic, independently seeded random number streams for each game
+subsystem. Gameplay code draws from the simulation and AI streams while
+purely visual code draws from the effects stream, so particles, screen
+shake and background decoration can never change the outcome of a match.
+"""
+
+import random
+
+# Every subsystem that needs randomness gets its own stream
+STREAM_NAMES = ("simulation", "ai", "effects", "level")
+
+
+class RandomStreams:
+    """Holds one seeded random.Random generator per subsystem."""
+
+    def __init__(self, seed=None):
+        """Create the streams and seed them from a single master seed."""
+        self.seed_value = None
+        self.simulation = random.Random()  # Physics, knockback, mode spawns
+        self.ai = random.Random()  # Enemy decisions and shooting intervals
+        self.effects = random.Random()  # Particles, shake, decoration
+        self.level = random.Random()  # Platform layout generation
+        self.seed(seed)
+
+    def seed(self, seed=None):
+        """
+        Reseed every stream from one master seed.
+
+        Args:
+            seed (int): Master seed, or None to pick a fresh one
+
+        Returns:
+            int: The master seed that was applied
+        """
+        if seed is None:
+            seed = random.SystemRandom().randrange(2**32)
+        self.seed_value = seed
+        for name in STREAM_NAMES:
+            # String seeds are hashed with SHA-512, so streams are independent
+            # and stable across Python versions and platforms
+            getattr(self, name).seed(f"{seed}:{name}")
+        return seed
+
+    def derive_seed(self, seed, index):
+        """Derive a stable child seed, e.g. one per match of a session."""
+        return random.Random(f"{seed}/{index}").randrange(2**32)
+
+
+# Global random streams instance
+rng_streams = RandomStreams()
@@ -0,0 +1,471 @@
+"""
+Rollback Netcode
+
+GGPO-style rollback for two-player duels over UDP. Each peer simulates a
+frame as soon as its own input for it is known (held back
+ROLLBACK_INPUT_DELAY frames), predicting the remote player's input as
+their last held keys without presses, and saves the simulation state
+before every frame into a ring buffer. When the remote input for a frame
+arrives and differs from the prediction, the peer loads the state saved
+before that frame and re-simulates up to the present within the same
+render frame. A peer never runs more than ROLLBACK_MAX_FRAMES ahead of the
+newest confirmed remote input, and the peers exchange checksums of
+confirmed frames to detect desyncs.
+
+run_rollback_test plays two peers in one process over 127.0.0.1 with
+simulated latency and packet loss, swapping each peer's state in and out
+of the shared simulation systems between steps, and checks the confirmed
+frames against a straight simulation of the same inputs.
+"""
+
+import gc
+import time
+
+from config import *
+from event_bus import frame_events
+from input_recorder import InputFrame
+from net_protocol import MSG_ROLLBACK, decode_rollback, encode_rollback, parse_header
+from net_session import (
+    LossyLink,
+    NetStats,
+    ScriptedInput,
+    _receive_all,
+    open_socket,
+    percentile,
+    seat_input,
+)
+from sim_state import SimulationState
+
+EMPTY_INPUT = InputFrame()
+
+
+def combine_inputs(slot1_frame, slot2_frame):
+    """
+    Combine both seats' input (each in the Player 1 layout) into the
+    input of one two-player tick.
+
+    Returns:
+        InputFrame: The tick's input; the mouse belongs to Player 1
+    """
+    mask1, events1 = seat_input(1, slot1_frame.keys.mask, slot1_frame.events)
+    mask2, events2 = seat_input(2, slot2_frame.keys.mask, slot2_frame.events)
+    return InputFrame(
+        mask1 | mask2, slot1_frame.mouse_pos, tuple(events1) + tuple(events2)
+    )
+
+
+def same_input(first, second):
+    """Return True if two input frames would simulate identically."""
+    return (
+        first.keys.mask == second.keys.mask
+        and first.events == second.events
+        and first.mouse_pos == second.mouse_pos
+    )
+
+
+class RollbackSession:
+    """One peer of a rollback duel: its engine, inputs and state ring."""
+
+    def __init__(
+        self,
+        engine,
+        slot,
+        sock,
+        peer_address,
+        link=None,
+        input_delay=ROLLBACK_INPUT_DELAY,
+        max_rollback=ROLLBACK_MAX_FRAMES,
+        checksum_interval=ROLLBACK_CHECKSUM_INTERVAL,
+    ):
+        """
+        Args:
+            engine (GameEngine): Engine with the two-player match set up
+                identically on both peers
+            slot (int): Seat of the local player, 1 or 2
+            sock (socket.socket): Non-blocking bound UDP socket
+            peer_address (tuple): (host, port) of the other peer
+            link (LossyLink): Link to send through (default: no loss or delay)
+            input_delay (int): Frames local input is held back
+            max_rollback (int): Furthest the simulation runs ahead of the
+                confirmed remote input
+            checksum_interval (int): Frames between checksums
+        """
+        self.engine = engine
+        self.slot = slot
+        self.sock = sock
+        self.peer_address = peer_address
+        self.link = link or LossyLink(sock)
+        self.input_delay = input_delay
+        self.max_rollback = max_rollback
+        self.checksum_interval = checksum_interval
+
+        # Saved state before each of the newest frames, reused in turn
+        self.ring = [SimulationState() for _ in range(max_rollback + 2)]
+        self.live = None  # Suspended state (several sessions in one process)
+
+        # The first input_delay frames have no input on either side
+        self.local_inputs = {frame: EMPTY_INPUT for frame in range(input_delay + 1)}
+        self.remote_inputs = dict(self.local_inputs)
+        self.predictions = {}  # Frame -> remote input assumed when simulated
+        self.confirmed = input_delay  # Every remote input up to here arrived
+        self.peer_ack = input_delay  # The peer has every local input up to here
+        self.prediction = (None, EMPTY_INPUT)  # (based on, predicted input)
+        self.rollback_to = None  # Earliest mispredicted frame
+
+        # Checksums of every checksum_interval-th frame; final once confirmed
+        self.checksums = {}
+        self.peer_checksums = {}
+        self.last_compared = 0
+
+        # Telemetry
+        self.stats = NetStats()
+        self.frames = 0
+        self.stalls = 0
+        self.mispredictions = 0
+        self.rollback_depths = []
+        self.rollback_times = []  # Seconds per load and re-simulation
+        self.save_times = []
+        self.load_times = []
+        self.checks = 0
+        self.desyncs = []  # Frames whose checksums differed
+
+    def suspend(self):
+        """Save the live state so another session can use the shared systems."""
+        self.live = self.engine.save_state(self.live)
+
+    def resume(self):
+        """Load the live state saved by suspend."""
+        self.engine.load_state(self.live)
+
+    def _predict(self):
+        """Predict the remote input of an unconfirmed frame."""
+        based_on, predicted = self.prediction
+        if based_on != self.confirmed:
+            last = self.remote_inputs[self.confirmed]
+            predicted = InputFrame(last.keys.mask, last.mouse_pos)
+            self.prediction = (self.confirmed, predicted)
+        return predicted
+
+    def _simulate(self, frame):
+        """Save the state, then simulate one frame with the best input known."""
+        engine = self.engine
+        started = time.perf_counter()
+        engine.save_state(self.ring[frame % len(self.ring)])
+        self.save_times.append(time.perf_counter() - started)
+
+        remote = self.remote_inputs.get(frame)
+        if remote is None:
+            remote = self._predict()
+            self.predictions[frame] = remote
+        else:
+            self.predictions.pop(frame, None)
+        local = self.local_inputs[frame]
+        if self.slot == 1:
+            engine._simulate_tick(combine_inputs(local, remote))
+        else:
+            engine._simulate_tick(combine_inputs(remote, local))
+        if frame % self.checksum_interval == 0:
+            self.checksums[frame] = engine.simulation_checksum()
+
+    def _roll_back(self):
+        """Reload the state before the earliest misprediction and catch up."""
+        start = self.rollback_to
+        self.rollback_to = None
+        current = self.engine.tick_count
+        if start > current:
+            return
+        started = time.perf_counter()
+        self.engine.load_state(self.ring[start % len(self.ring)])
+        self.load_times.append(time.perf_counter() - started)
+        for frame in range(start, current + 1):
+            self._simulate(frame)
+            # Effects and sounds of these frames were shown the first time
+            frame_events.clear()
+        self.rollback_depths.append(current - start + 1)
+        self.rollback_times.append(time.perf_counter() - started)
+
+    def receive(self, now):
+        """Handle every datagram from the peer."""
+        for data, _ in _receive_all(self.sock):
+            if parse_header(data) != MSG_ROLLBACK:
+                continue
+            self.stats.received(data)
+            input_ack, checksum_frame, checksum, first, frames = decode_rollback(data)
+            self.peer_ack = max(self.peer_ack, input_ack)
+            if checksum_frame > self.last_compared:
+                self.peer_checksums[checksum_frame] = checksum
+
+            for frame, remote in enumerate(frames, first):
+                if frame <= self.confirmed or frame in self.remote_inputs:
+                    continue
+                self.remote_inputs[frame] = remote
+                predicted = self.predictions.pop(frame, None)
+                if predicted is not None and not same_input(predicted, remote):
+                    self.mispredictions += 1
+                    if self.rollback_to is None or frame < self.rollback_to:
+                        self.rollback_to = frame
+            while self.confirmed + 1 in self.remote_inputs:
+                self.confirmed += 1
+
+    def advance(self, local_frame, now):
+        """
+        Take the peer's input, roll back if a prediction was wrong and
+        simulate the next frame.
+
+        Args:
+            local_frame (InputFrame): Local input, applied input_delay
+                frames from now
+            now (float): Current time in seconds
+
+        Returns:
+            bool: False if the session stalled waiting for remote input
+                (local_frame was not taken and should be offered again)
+        """
+        self.receive(now)
+        if self.rollback_to is not None:
+            self._roll_back()
+        self._compare_checksums()
+
+        frame = self.engine.tick_count + 1
+        if frame - self.confirmed > self.max_rollback:
+            self.stalls += 1
+            self._send(now)
+            return False
+        self.local_inputs[frame + self.input_delay] = local_frame
+        self._simulate(frame)
+        self.frames += 1
+        self._send(now)
+        self._prune()
+        return True
+
+    def _compare_checksums(self):
+        """Compare the peer's checksums of frames confirmed on both sides."""
+        for frame in sorted(self.peer_checksums):
+            if frame > self.confirmed:
+                break
+            checksum = self.peer_checksums.pop(frame)
+            own = self.checksums.get(frame)
+            if own is None:
+                continue
+            self.checks += 1
+            self.last_compared = frame
+            if own != checksum:
+                self.desyncs.append(frame)
+
+    def _send(self, now):
+        """Send every local input the peer may not have, and a checksum."""
+        checksum_frame = self.confirmed - self.confirmed % self.checksum_interval
+        checksum = self.checksums.get(checksum_frame)
+        if checksum is None or checksum_frame > self.engine.tick_count:
+            checksum_frame, checksum = 0, 0
+        first = self.peer_ack + 1
+        last = min(self.engine.tick_count + self.input_delay, first + 254)
+        frames = [self.local_inputs[frame] for frame in range(first, last + 1)]
+        data = encode_rollback(self.confirmed, checksum_frame, checksum, first, frames)
+        self.stats.sent(data)
+        self.link.send(data, self.peer_address, now)
+
+    def _prune(self):
+        """Forget inputs no longer needed for re-simulation or resending."""
+        oldest_local = min(self.peer_ack, self.confirmed) - 1
+        for frame in [f for f in self.local_inputs if f < oldest_local]:
+            del self.local_inputs[frame]
+        for frame in [f for f in self.remote_inputs if f < self.confirmed]:
+            del self.remote_inputs[frame]
+
+    def flush(self, now):
+        """Send the datagrams the link has held back that are now due."""
+        self.link.flush(now)
+
+    def report(self, seconds):
+        """
+        Return this peer's rollback, timing and traffic figures.
+
+        Args:
+            seconds (float): Length of the session
+        """
+        up, down = self.stats.kbps(seconds)
+        depths = self.rollback_depths
+
+        def micros(samples, share=None):
+            if not samples:
+                return 0.0
+            if share is None:
+                return round(1e6 * sum(samples) / len(samples), 1)
+            return round(1e6 * percentile(samples, share), 1)
+
+        return {
+            "slot": self.slot,
+            "frames": self.frames,
+            "confirmed_frame": self.confirmed,
+            "stalls": self.stalls,
+            "mispredictions": self.mispredictions,
+            "rollbacks": len(depths),
+            "resimulated_frames": sum(depths),
+            "mean_rollback_depth": round(sum(depths) / len(depths), 2) if depths else 0,
+            "max_rollback_depth": max(depths, default=0),
+            "max_rollback_ms": round(1000 * max(self.rollback_times, default=0), 2),
+            "save_state_us": micros(self.save_times),
+            "save_state_p99_us": micros(self.save_times, 0.99),
+            "load_state_us": micros(self.load_times),
+            "load_state_p99_us": micros(self.load_times, 0.99),
+            "checksums_compared": self.checks,
+            "desyncs": len(self.desyncs),
+            "up_kbps": round(up, 2),
+            "down_kbps": round(down, 2),
+        }
+
+
+def _start_duel(engine, match_seed, mode, characters):
+    """Set up the same two-player match on an engine."""
+    engine._reset_game_state()
+    engine.two_player_mode = True
+    engine.current_game_mode = mode
+    engine.character_selections = dict(characters)
+    engine._initialize_game(match_seed)
+
+
+def run_rollback_test(
+    engines,
+    seconds=30.0,
+    latency=NET_LOOPBACK_LATENCY,
+    jitter=NET_LOOPBACK_JITTER,
+    loss=NET_LOOPBACK_LOSS,
+    input_delay=ROLLBACK_INPUT_DELAY,
+    max_rollback=ROLLBACK_MAX_FRAMES,
+    mode="classic",
+    characters=None,
+    seed=0,
+):
+    """
+    Play a rollback duel between two peers with scripted input over
+    127.0.0.1, on a virtual clock, and verify it.
+
+    Both peers share the process's Force, lightsaber and random stream
+    systems, so each peer's state is loaded before its step and saved
+    after it. Every checksum both peers confirmed is compared, and the
+    confirmed frames are then simulated straight through (no prediction)
+    from the logged inputs to check the checksums against.
+
+    Args:
+        engines (tuple): Two headless engines, one per peer
+        seconds (float): Simulated session length
+        latency (float): One-way delay of the link
+        jitter (float): Random extra one-way delay, up to this many seconds
+        loss (float): Share of datagrams dropped, in each direction
+        input_delay (int): Frames local input is held back
+        max_rollback (int): Furthest a peer runs ahead of remote input
+        mode (str): Game mode key
+        characters (dict): Character selection of "player1" and "player2"
+        seed (int): Seed of the match, the links and the scripted input
+
+    Returns:
+        dict: Session setup, verification results and one report per peer
+    """
+    characters = characters or {"player1": "jedi", "player2": "sith"}
+    sockets = [open_socket(), open_socket()]
+    sessions = []
+    for index, engine in enumerate(engines):
+        _start_duel(engine, seed, mode, characters)
+        sock = sockets[index]
+        session = RollbackSession(
+            engine,
+            index + 1,
+            sock,
+            sockets[1 - index].getsockname(),
+            LossyLink(sock, latency, jitter, loss, seed + index + 1),
+            input_delay=input_delay,
+            max_rollback=max_rollback,
+        )
+        session.suspend()
+        sessions.append(session)
+    # Keep the long-lived objects (assets, menus, both engines) out of the
+    # collector's generations, so its pauses stay short during the duel
+    gc.collect()
+    gc.freeze()
+    scripts = [ScriptedInput(seed + 11), ScriptedInput(seed + 12)]
+    logged = [dict(sessions[0].local_inputs), dict(sessions[1].local_inputs)]
+    offered = [None, None]
+
+    pumps = 4  # Network pumps per frame, so delays are not rounded to frames
+    dt = 1.0 / SIMULATION_HZ
+    ticks = int(seconds * SIMULATION_HZ)
+    started = time.perf_counter()
+    try:
+        for step in range(1, ticks * pumps + 1):
+            now = step * dt / pumps
+            for session in sessions:
+                session.flush(now)
+            if step % pumps:
+                continue
+            for index, session in enumerate(sessions):
+                if offered[index] is None:
+                    offered[index] = scripts[index].frame()
+                session.resume()
+                frame = session.engine.tick_count + 1 + input_delay
+                if session.advance(offered[index], now):
+                    logged[index][frame] = offered[index]
+                    offered[index] = None
+                frame_events.clear()
+                session.suspend()
+    finally:
+        gc.unfreeze()
+        for sock in sockets:
+            sock.close()
+    wall_seconds = time.perf_counter() - started
+
+    # Simulate the frames both peers confirmed with the final inputs only
+    confirmed = min(
+        min(session.confirmed, session.engine.tick_count) for session in sessions
+    )
+    engine = engines[0]
+    _start_duel(engine, seed, mode, characters)
+    checked = mismatched = 0
+    for frame in range(1, confirmed + 1):
+        engine._simulate_tick(combine_inputs(logged[0][frame], logged[1][frame]))
+        frame_events.clear()
+        if frame % ROLLBACK_CHECKSUM_INTERVAL == 0:
+            reference = engine.simulation_checksum()
+            for session in sessions:
+                checked += 1
+                if session.checksums.get(frame) != reference:
+                    mismatched += 1
+
+    return {
+        "seconds": seconds,
+        "wall_seconds": round(wall_seconds, 2),
+        "latency_ms": latency * 1000,
+        "jitter_ms": jitter * 1000,
+        "loss": loss,
+        "input_delay": input_delay,
+        "max_rollback": max_rollback,
+        "verified_frames": confirmed,
+        "reference_checks": checked,
+        "reference_mismatches": mismatched,
+        "peers": [session.report(seconds) for session in sessions],
+    }
+
+
+def format_rollback_report(report):
+    """Return a rollback test report as printable text."""
+    lines = [
+        f"{report['seconds']:.0f} s rollback duel in {report['wall_seconds']} s: "
+        f"{report['latency_ms']:.0f} ms latency, {report['jitter_ms']:.0f} ms "
+        f"jitter, {report['loss']:.0%} loss, {report['input_delay']} frames input "
+        f"delay, up to {report['max_rollback']} frames of rollback",
+        f"Verified {report['verified_frames']} confirmed frames against a "
+        f"straight simulation: {report['reference_mismatches']} of "
+        f"{report['reference_checks']} checksums differed",
+    ]
+    for peer in report["peers"]:
+        lines.append(
+            f"Peer {peer['slot']}: {peer['frames']} frames, {peer['stalls']} "
+            f"stalls, {peer['rollbacks']} rollbacks "
+            f"(mean {peer['mean_rollback_depth']}, max "
+            f"{peer['max_rollback_depth']} frames, slowest "
+            f"{peer['max_rollback_ms']} ms), save_state {peer['save_state_us']} us "
+            f"(p99 {peer['save_state_p99_us']}), load_state "
+            f"{peer['load_state_us']} us, {peer['checksums_compared']} checksums "
+            f"compared, {peer['desyncs']} desyncs, up {peer['up_kbps']} kbps"
+        )
+    return "\n".join(lines)
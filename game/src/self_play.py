@@ -0,0 +1,536 @@
+"""
+Self-Play Arena
+
+Plays AI-vs-AI matches without a window to measure character balance.
+Player 1 is driven by ArenaBot, a scripted fighter that produces the same
+InputFrames a human would, and the enemy by the game's own AI. Every
+pairing of legendary characters is played in both seats and in every game
+mode, with fixed per-match seeds, over a process pool with one GameEngine
+per worker. Workers return one merged ArenaTotals per batch of matches, so
+the parent only merges a few small counters however many matches run, and
+the run scales with the number of cores.
+"""
+
+import math
+import multiprocessing
+import os
+import random
+import time
+from collections import Counter
+
+import pygame
+from config import *
+from random_streams import rng_streams
+from event_bus import frame_events
+from input_recorder import EVENT_KEYDOWN, EVENT_MOUSEDOWN, KEY_INDEX, InputFrame
+from game_engine import GameEngine
+from force_powers import force_manager
+from legendary_characters import LEGENDARY_CHARACTERS
+from game_modes import GameModeManager
+
+# Seats of a match: the scripted bot plays player1, the enemy AI plays ai
+SEATS = ("player1", "ai")
+
+# Fighter whose health loss the engine's damage log entry was dealt by
+DAMAGE_DEALER = {"player1": "ai", "enemy": "player1"}
+
+
+class ArenaBot:
+    """Scripted player 1: held keys, presses and aim derived from the fight."""
+
+    def __init__(self, seed, reaction=ARENA_BOT_REACTION):
+        """
+        Args:
+            seed (int): Seed for the bot's own decisions
+            reaction (float): Chance per tick to act on what it sees, so the
+                bot does not react with frame-perfect timing
+        """
+        self.rng = random.Random(seed)
+        self.reaction = reaction
+
+    def frame(self, player, enemy):
+        """
+        Decide this tick's input.
+
+        Jedi close in for lightsaber strikes and heal when hurt; Sith keep
+        to Force Lightning range. Both shoot from afar, push when pressed
+        and throw their lightsaber at mid range.
+
+        Args:
+            player (Player): The fighter the bot controls
+            enemy (Enemy): Its opponent
+
+        Returns:
+            InputFrame: Input for the simulation tick
+        """
+        player_x = player.x + player.size // 2
+        player_y = player.y + player.size // 2
+        enemy_x = enemy.x + enemy.size // 2
+        enemy_y = enemy.y + enemy.size // 2
+        dx = enemy_x - player_x
+        dy = enemy_y - player_y
+        distance = math.hypot(dx, dy)
+        jedi = player.character_type == "jedi"
+
+        # Hold a direction to stay at the preferred range
+        preferred = 50 if jedi else 180
+        key_mask = 0
+        if distance > preferred + 20:
+            key_mask |= 1 << KEY_INDEX[pygame.K_d if dx > 0 else pygame.K_a]
+        elif distance < preferred - 40:
+            key_mask |= 1 << KEY_INDEX[pygame.K_a if dx > 0 else pygame.K_d]
+
+        events = []
+        rng = self.rng
+        if rng.random() < self.reaction:
+            if dy < -60 or rng.random() < 0.02:
+                events.append((EVENT_KEYDOWN, pygame.K_SPACE))
+            if distance < 70:
+                events.append((EVENT_KEYDOWN, pygame.K_f))
+            if distance < 150:
+                events.append((EVENT_KEYDOWN, pygame.K_q))
+            if jedi and player.health < player.max_health // 2:
+                events.append((EVENT_KEYDOWN, pygame.K_h))
+            if not jedi and distance < 300:
+                events.append((EVENT_KEYDOWN, pygame.K_t))
+            if 150 < distance < 400:
+                events.append((EVENT_KEYDOWN, pygame.K_g))
+            if distance > 100:
+                events.append((EVENT_MOUSEDOWN, 1))
+
+        mouse_pos = (int(enemy_x), int(enemy_y))
+        return InputFrame(key_mask, mouse_pos, tuple(events))
+
+
+def match_winner(engine, winner_title):
+    """
+    Return the seat that won a finished match.
+
+    Returns:
+        str: "player1", "ai" or "draw"
+    """
+    if not engine.player1.is_alive():
+        return "ai"
+    if not engine.enemy.is_alive():
+        return "player1"
+    # Mode objectives (the enemy contests as player 2)
+    if winner_title.startswith("Player 1"):
+        return "player1"
+    if winner_title.startswith("Player 2"):
+        return "ai"
+    return "draw"
+
+
+def play_match(engine, mode, player1_key, ai_key, seed, difficulty, max_ticks):
+    """
+    Play one headless match between the bot and the enemy AI.
+
+    Args:
+        engine (GameEngine): Headless engine to play on
+        mode (str): Game mode key
+        player1_key (str): Legendary character of the bot
+        ai_key (str): Legendary character of the enemy AI
+        seed (int): Match seed
+        difficulty (str): Enemy AI difficulty
+        max_ticks (int): Ticks before the match counts as a draw
+
+    Returns:
+        dict: Winner seat, ticks played, whether it ended in a kill, damage
+            dealt per (seat, source) and Force power uses per (seat, power)
+    """
+    engine._reset_game_state()
+    engine.two_player_mode = False
+    engine.difficulty = difficulty
+    engine.current_game_mode = mode
+    engine.character_selections = {"player1": player1_key, "ai": ai_key}
+    engine.damage_log = Counter()
+    engine._initialize_game(seed)
+    bot = ArenaBot(seed)
+
+    winner_title = ""
+    while engine.tick_count < max_ticks:
+        engine._simulate_tick(bot.frame(engine.player1, engine.enemy))
+        # Nothing is drawn, so the frame's visual events are dropped
+        frame_events.clear()
+        winner_title = engine._check_game_over()
+        if winner_title:
+            break
+
+    seats = {engine.player1: "player1", engine.enemy: "ai"}
+    force_uses = Counter()
+    for (user, power), count in force_manager.usage.items():
+        if user in seats:
+            force_uses[seats[user], power] += count
+    damage = Counter()
+    for (victim, source), amount in engine.damage_log.items():
+        damage[DAMAGE_DEALER[victim], source] += amount
+
+    return {
+        "winner": match_winner(engine, winner_title),
+        "ticks": engine.tick_count,
+        "killed": not (engine.player1.is_alive() and engine.enemy.is_alive()),
+        "damage": damage,
+        "force_uses": force_uses,
+    }
+
+
+class ArenaTotals:
+    """Summed results of the matches of one pairing in one game mode."""
+
+    def __init__(self):
+        self.matches = 0
+        self.wins = Counter()  # "player1" / "ai" / "draw" -> matches
+        self.kills = Counter()  # Seat -> matches won by a kill
+        self.kill_ticks = Counter()  # Seat -> ticks those kills took
+        self.damage = Counter()  # (seat, source) -> damage dealt
+        self.force_uses = Counter()  # (seat, power) -> successful uses
+
+    def add_match(self, result):
+        """Add the result of play_match."""
+        self.matches += 1
+        winner = result["winner"]
+        self.wins[winner] += 1
+        if result["killed"] and winner != "draw":
+            self.kills[winner] += 1
+            self.kill_ticks[winner] += result["ticks"]
+        self.damage.update(result["damage"])
+        self.force_uses.update(result["force_uses"])
+
+    def merge(self, other):
+        """Add another ArenaTotals into this one."""
+        self.matches += other.matches
+        self.wins.update(other.wins)
+        self.kills.update(other.kills)
+        self.kill_ticks.update(other.kill_ticks)
+        self.damage.update(other.damage)
+        self.force_uses.update(other.force_uses)
+
+
+def make_batches(
+    characters, modes, matches, seed, batch_size, profiles=None, mirrors=True
+):
+    """
+    Split every match of a run into worker tasks.
+
+    Each pairing plays in both seats (the pairings are ordered), and match
+    seeds are derived from the master seed by position in the run, so a
+    run is reproducible whatever the worker count, and runs over the same
+    characters and modes replay the same seeds whatever the profiles.
+
+    Args:
+        characters (list): Legendary character keys
+        modes (list): Game mode keys
+        matches (int): Matches per pairing and mode
+        seed (int): Master seed
+        batch_size (int): Matches per task
+        profiles (dict): Character key -> CharacterProfile to play with
+            instead of the LEGENDARY_CHARACTERS entry, or None
+        mirrors (bool): Include mirror matches (a character against itself)
+
+    Returns:
+        list: (key, mode, player1 key, ai key, match seeds, profiles)
+            tasks, key being (mode, player1 key, ai key)
+    """
+    batches = []
+    index = 0
+    for mode in modes:
+        for player1_key in characters:
+            for ai_key in characters:
+                if ai_key == player1_key and not mirrors:
+                    continue
+                seeds = [
+                    rng_streams.derive_seed(seed, index + i) for i in range(matches)
+                ]
+                index += matches
+                for start in range(0, matches, batch_size):
+                    batches.append(
+                        (
+                            (mode, player1_key, ai_key),
+                            mode,
+                            player1_key,
+                            ai_key,
+                            tuple(seeds[start : start + batch_size]),
+                            profiles,
+                        )
+                    )
+    return batches
+
+
+# Per-process state: the worker's engine and match settings
+_worker = None
+
+
+def _init_worker(difficulty, max_ticks):
+    """Create the worker process's engine (one per worker, reused)."""
+    global _worker
+    # SDL turns SIGTERM into a quit event, which would stop Pool.terminate()
+    # from ending the worker
+    os.environ["SDL_NO_SIGNAL_HANDLERS"] = "1"
+    _worker = (GameEngine(seed=0, headless=True), difficulty, max_ticks)
+
+
+def _play_batch(batch):
+    """Play one batch of matches of a pairing and return its merged totals."""
+    key, mode, player1_key, ai_key, seeds, profiles = batch
+    engine, difficulty, max_ticks = _worker
+    saved = {}
+    if profiles:
+        saved = {name: LEGENDARY_CHARACTERS[name] for name in profiles}
+        LEGENDARY_CHARACTERS.update(profiles)
+    try:
+        totals = ArenaTotals()
+        for seed in seeds:
+            totals.add_match(
+                play_match(
+                    engine, mode, player1_key, ai_key, seed, difficulty, max_ticks
+                )
+            )
+    finally:
+        LEGENDARY_CHARACTERS.update(saved)
+    return key, totals
+
+
+def open_pool(
+    workers=None, difficulty=ARENA_DIFFICULTY, match_seconds=ARENA_MATCH_SECONDS
+):
+    """
+    Start the arena's worker processes, each with its own engine.
+
+    Args:
+        workers (int): Worker processes, or None for one per core
+        difficulty (str): Enemy AI difficulty
+        match_seconds (float): Simulated seconds before a match is a draw
+
+    Returns:
+        multiprocessing.Pool: The pool, or None for a single worker, in
+            which case matches play in this process
+    """
+    workers = workers or multiprocessing.cpu_count()
+    max_ticks = int(match_seconds * SIMULATION_HZ)
+    if workers == 1:
+        _init_worker(difficulty, max_ticks)
+        return None
+    return multiprocessing.Pool(workers, _init_worker, (difficulty, max_ticks))
+
+
+def play_batches(batches, pool=None):
+    """
+    Play batches from make_batches and merge their results per key.
+
+    Args:
+        batches (list): Tasks from make_batches
+        pool (multiprocessing.Pool): Pool from open_pool, or None to play
+            in this process
+
+    Returns:
+        dict: key -> ArenaTotals
+    """
+    results = (
+        pool.imap_unordered(_play_batch, batches) if pool else map(_play_batch, batches)
+    )
+    totals = {}
+    for key, batch_totals in results:
+        totals.setdefault(key, ArenaTotals()).merge(batch_totals)
+    return totals
+
+
+def run_arena(
+    characters=None,
+    modes=None,
+    matches=ARENA_MATCHES_PER_PAIRING,
+    workers=None,
+    seed=ARENA_SEED,
+    difficulty=ARENA_DIFFICULTY,
+    match_seconds=ARENA_MATCH_SECONDS,
+    batch_size=ARENA_BATCH_SIZE,
+):
+    """
+    Play every pairing of characters in every mode and aggregate the results.
+
+    Args:
+        characters (list): Legendary character keys, or None for all
+        modes (list): Game mode keys, or None for all
+        matches (int): Matches per pairing and mode
+        workers (int): Worker processes, or None for one per core; 1 plays
+            in this process
+        seed (int): Master seed
+        difficulty (str): Enemy AI difficulty
+        match_seconds (float): Simulated seconds before a match is a draw
+        batch_size (int): Matches per worker task
+
+    Returns:
+        tuple: ({(mode, player1 key, ai key): ArenaTotals}, wall seconds)
+    """
+    characters = list(characters or LEGENDARY_CHARACTERS)
+    modes = list(modes or GameModeManager(None).get_mode_list())
+    batches = make_batches(characters, modes, matches, seed, batch_size)
+
+    start = time.perf_counter()
+    pool = open_pool(workers, difficulty, match_seconds)
+    if pool is None:
+        totals = play_batches(batches)
+    else:
+        with pool:
+            totals = play_batches(batches, pool)
+    return totals, time.perf_counter() - start
+
+
+def _seconds_per_kill(kills, kill_ticks):
+    """Mean time to kill in seconds, or None without kills."""
+    return round(kill_ticks / kills / SIMULATION_HZ, 2) if kills else None
+
+
+def build_report(totals, wall_seconds):
+    """
+    Turn arena totals into a single JSON-ready report.
+
+    Characters are summarised over both seats, so each pairing counts once
+    from each side; modes report the seat win rates, which show how far
+    the bot and the enemy AI differ in strength.
+
+    Args:
+        totals (dict): First result of run_arena
+        wall_seconds (float): Second result of run_arena
+
+    Returns:
+        dict: Run summary, "characters", "modes" and "pairings" sections
+    """
+    characters = {}
+    modes = {}
+    pairings = []
+    match_count = 0
+
+    for (mode, player1_key, ai_key), t in sorted(totals.items()):
+        match_count += t.matches
+
+        for seat, key in zip(SEATS, (player1_key, ai_key)):
+            entry = characters.setdefault(
+                key,
+                {
+                    "matches": 0,
+                    "wins": 0,
+                    "draws": 0,
+                    "kills": 0,
+                    "kill_ticks": 0,
+                    "damage": Counter(),
+                    "force_uses": Counter(),
+                },
+            )
+            entry["matches"] += t.matches
+            entry["wins"] += t.wins[seat]
+            entry["draws"] += t.wins["draw"]
+            entry["kills"] += t.kills[seat]
+            entry["kill_ticks"] += t.kill_ticks[seat]
+            for (dealer, source), amount in t.damage.items():
+                if dealer == seat:
+                    entry["damage"][source] += amount
+            for (user, power), count in t.force_uses.items():
+                if user == seat:
+                    entry["force_uses"][power] += count
+
+        mode_entry = modes.setdefault(mode, ArenaTotals())
+        mode_entry.merge(t)
+
+        pairings.append(
+            {
+                "mode": mode,
+                "player1": player1_key,
+                "ai": ai_key,
+                "matches": t.matches,
+                "player1_wins": t.wins["player1"],
+                "ai_wins": t.wins["ai"],
+                "draws": t.wins["draw"],
+                "player1_ttk_seconds": _seconds_per_kill(
+                    t.kills["player1"], t.kill_ticks["player1"]
+                ),
+                "ai_ttk_seconds": _seconds_per_kill(t.kills["ai"], t.kill_ticks["ai"]),
+                "damage": {
+                    seat: {
+                        source: amount
+                        for (dealer, source), amount in sorted(t.damage.items())
+                        if dealer == seat
+                    }
+                    for seat in SEATS
+                },
+                "force_uses": {
+                    seat: {
+                        power: count
+                        for (user, power), count in sorted(t.force_uses.items())
+                        if user == seat
+                    }
+                    for seat in SEATS
+                },
+            }
+        )
+
+    character_report = {}
+    for key, entry in sorted(characters.items()):
+        matches = entry["matches"]
+        character_report[key] = {
+            "matches": matches,
+            "wins": entry["wins"],
+            "draws": entry["draws"],
+            "win_rate": round(entry["wins"] / matches, 4) if matches else 0.0,
+            "ttk_seconds": _seconds_per_kill(entry["kills"], entry["kill_ticks"]),
+            "damage_per_match": {
+                source: round(amount / matches, 2)
+                for source, amount in sorted(entry["damage"].items())
+            },
+            "force_uses_per_match": {
+                power: round(count / matches, 2)
+                for power, count in sorted(entry["force_uses"].items())
+            },
+        }
+
+    mode_report = {}
+    for mode, t in modes.items():
+        mode_report[mode] = {
+            "matches": t.matches,
+            "player1_win_rate": round(t.wins["player1"] / t.matches, 4),
+            "ai_win_rate": round(t.wins["ai"] / t.matches, 4),
+            "draw_rate": round(t.wins["draw"] / t.matches, 4),
+            "ttk_seconds": _seconds_per_kill(
+                sum(t.kills.values()), sum(t.kill_ticks.values())
+            ),
+        }
+
+    return {
+        "matches": match_count,
+        "wall_seconds": round(wall_seconds, 2),
+        "matches_per_second": (
+            round(match_count / wall_seconds, 2) if wall_seconds > 0 else 0.0
+        ),
+        "characters": character_report,
+        "modes": mode_report,
+        "pairings": pairings,
+    }
+
+
+def format_report(report):
+    """Return the character and mode sections of a report as a text table."""
+    lines = [
+        f"{report['matches']} matches in {report['wall_seconds']}s "
+        f"({report['matches_per_second']} matches/s)",
+        "",
+        f"{'Character':<20}{'Win rate':>9}{'Draws':>7}{'TTK s':>8}  Damage per match",
+    ]
+    ranked = sorted(report["characters"].items(), key=lambda item: -item[1]["win_rate"])
+    for key, entry in ranked:
+        ttk = entry["ttk_seconds"]
+        damage = ", ".join(
+            f"{source} {amount:g}"
+            for source, amount in entry["damage_per_match"].items()
+        )
+        lines.append(
+            f"{key:<20}{entry['win_rate']:>9.1%}{entry['draws']:>7}"
+            f"{ttk if ttk is not None else '-':>8}  {damage}"
+        )
+
+    lines += ["", f"{'Mode':<20}{'Bot wins':>9}{'AI wins':>9}{'Draws':>9}{'TTK s':>8}"]
+    for mode, entry in report["modes"].items():
+        ttk = entry["ttk_seconds"]
+        lines.append(
+            f"{mode:<20}{entry['player1_win_rate']:>9.1%}{entry['ai_win_rate']:>9.1%}"
+            f"{entry['draw_rate']:>9.1%}{ttk if ttk is not None else '-':>8}"
+        )
+    return "\n".join(lines)
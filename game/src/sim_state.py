@@ -0,0 +1,270 @@
+"""
+Simulation State
+
+Saves and restores the complete gameplay state of a GameEngine between
+ticks: fighters, bullets, Force power cooldowns, effects and thrown
+lightsabers, lightsaber attacks, blocks and clashes, game mode data and the
+gameplay random streams. Rollback netcode saves the state every tick, so
+nothing is pickled or deep-copied: objects are kept by reference, which
+restoring preserves (attacks, blocks and usage counters refer to the
+fighters by identity), and only their attribute dictionaries are copied,
+with rects, lists, sets and dicts copied one level deep (slotted records
+such as Force effects are saved as a tuple of their slot values). A
+SimulationState is reused from tick to tick, so saving into one allocates
+only those copies. state_checksum hashes the same state, for desync and
+replay verification.
+"""
+
+import numbers
+import operator
+import zlib
+from collections import Counter
+
+import pygame
+from random_streams import rng_streams
+
+# Attribute values copied rather than shared, since the simulation mutates
+# them in place
+_MUTABLE_TYPES = frozenset((list, dict, set, Counter, pygame.Rect))
+
+# GameEngine attributes that change during a match
+ENGINE_FIELDS = (
+    "tick_count",
+    "mouse_pos",
+    "player1",
+    "player2",
+    "enemy",
+    "bullets",
+    "bullet_timer",
+    "bullet_interval",
+    "current_environment",
+    "player1_exploded",
+    "player2_exploded",
+    "enemy_exploded",
+    "fresh_deaths",
+    "last_health",
+    "damage_log",
+)
+
+# Random streams drawn from during ticks (effects are visual only, and the
+# level stream is only used while a match is set up)
+GAMEPLAY_STREAMS = ("simulation", "ai")
+
+
+# (class, attribute count) -> names of the attributes holding mutable values
+_mutable_names = {}
+
+# Class -> getter of every slot value, for records declaring __slots__
+_slot_getters = {}
+
+
+def _slot_getter(cls):
+    """Return a getter of all slot values of a slotted class, or None."""
+    if cls not in _slot_getters:
+        names = []
+        for klass in reversed(cls.__mro__):
+            slots = klass.__dict__.get("__slots__", ())
+            names.extend([slots] if isinstance(slots, str) else slots)
+        if "__dict__" in names or not hasattr(cls, "__slots__"):
+            _slot_getters[cls] = None
+        else:
+            _slot_getters[cls] = (tuple(names), operator.attrgetter(*names))
+    return _slot_getters[cls]
+
+
+def _copy_attributes(obj, attributes):
+    """Copy an object's attribute dictionary, copying its mutable values."""
+    copied = attributes.copy()
+    key = (obj.__class__, len(copied))
+    names = _mutable_names.get(key)
+    if names is None:
+        names = _mutable_names[key] = tuple(
+            name for name, value in copied.items() if type(value) in _MUTABLE_TYPES
+        )
+    for name in names:
+        copied[name] = copied[name].copy()
+    return copied
+
+
+def _save_object(obj):
+    """Return a copy of an object's state (attributes or slot values)."""
+    slots = _slot_getter(obj.__class__)
+    if slots is not None:
+        return slots[1](obj)
+    return _copy_attributes(obj, obj.__dict__)
+
+
+def _restore_object(obj, saved):
+    """Put an object back into the state returned by _save_object."""
+    slots = _slot_getter(obj.__class__)
+    if slots is not None:
+        for name, value in zip(slots[0], saved):
+            setattr(obj, name, value)
+        return
+    current = obj.__dict__
+    current.clear()
+    current.update(_copy_attributes(obj, saved))
+
+
+def _tracked_objects(engine):
+    """Return the objects whose attributes make up the gameplay state."""
+    tracked = [engine.player1, engine.player2, engine.enemy]
+    tracked.extend(engine.bullets)
+    force_manager = getattr(engine, "force_manager", None)
+    if force_manager is not None:
+        tracked.append(force_manager)
+        for powers in (force_manager.jedi_powers, force_manager.sith_powers):
+            tracked.extend(powers.values())
+        tracked.extend(force_manager.active_effects)
+        tracked.extend(force_manager.active_projectiles)
+    combat = getattr(engine, "lightsaber_combat", None)
+    if combat is not None:
+        tracked.append(combat)
+        tracked.extend(combat.active_attacks)
+        tracked.extend(combat.active_blocks.values())
+        tracked.extend(combat.active_clashes)
+    return [obj for obj in tracked if obj is not None]
+
+
+def _plain(value, indices):
+    """
+    Return value as nested tuples of plain values, for hashing. References
+    to tracked objects become their index and other objects (surfaces,
+    sound managers) their class name, so the result is the same in any
+    process that played the same match.
+    """
+    if value is None or isinstance(value, (str, bool)):
+        return value
+    if isinstance(value, numbers.Number):
+        return float(value)
+    if isinstance(value, (list, tuple, pygame.Rect, pygame.math.Vector2)):
+        return tuple(_plain(item, indices) for item in value)
+    if isinstance(value, dict):
+        return tuple(
+            sorted(
+                (
+                    (_plain(key, indices), _plain(item, indices))
+                    for key, item in value.items()
+                ),
+                key=repr,
+            )
+        )
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted((_plain(item, indices) for item in value), key=repr))
+    index = indices.get(id(value))
+    return ("#", index) if index is not None else type(value).__name__
+
+
+def state_checksum(engine):
+    """
+    Return a CRC32 of everything a SimulationState saves: the engine
+    fields, every tracked object's attributes (fighters, bullets, Force
+    cooldowns, effects and thrown sabers, lightsaber attacks, blocks and
+    clashes), the game mode data and the gameplay random streams.
+
+    Args:
+        engine (GameEngine): Engine between two ticks
+
+    Returns:
+        int: The checksum
+    """
+    tracked = _tracked_objects(engine)
+    indices = {id(obj): index for index, obj in enumerate(tracked)}
+    state = [
+        _plain({name: getattr(engine, name, None) for name in ENGINE_FIELDS}, indices)
+    ]
+    for obj in tracked:
+        saved = _save_object(obj)
+        state.append((type(obj).__name__, _plain(saved, indices)))
+    state.extend(getattr(rng_streams, name).getstate() for name in GAMEPLAY_STREAMS)
+    manager = getattr(engine, "game_mode_manager", None)
+    if manager is not None:
+        state.append(
+            (
+                manager.current_mode,
+                manager.mode_timer,
+                _plain(manager.mode_data, indices),
+            )
+        )
+    return zlib.crc32(repr(state).encode("utf-8"))
+
+
+def _copy_data(value):
+    """Copy nested mode data; objects inside it are kept by reference."""
+    value_type = type(value)
+    if value_type is dict:
+        return {key: _copy_data(item) for key, item in value.items()}
+    if value_type is list:
+        return [_copy_data(item) for item in value]
+    if value_type is pygame.Rect:
+        return value.copy()
+    return value
+
+
+class SimulationState:
+    """The gameplay state of an engine at the start of one tick."""
+
+    __slots__ = ("tick", "engine", "objects", "streams", "mode", "checksum")
+
+    def __init__(self):
+        self.tick = -1  # Tick the state was saved after (-1: empty)
+        self.engine = {}
+        self.objects = []  # (object, attribute dictionary or slot values)
+        self.streams = []  # (stream, getstate())
+        self.mode = None  # (mode name, mode timer, mode data copy)
+        self.checksum = None
+
+    def capture(self, engine):
+        """
+        Save the engine's gameplay state into this state, replacing
+        whatever it held.
+
+        Args:
+            engine (GameEngine): Engine between two ticks
+        """
+        self.tick = engine.tick_count
+        self.checksum = None
+        fields = self.engine
+        for name in ENGINE_FIELDS:
+            value = getattr(engine, name, None)
+            fields[name] = value.copy() if type(value) in _MUTABLE_TYPES else value
+
+        objects = self.objects
+        objects.clear()
+        for obj in _tracked_objects(engine):
+            objects.append((obj, _save_object(obj)))
+
+        self.streams = [
+            (getattr(rng_streams, name), getattr(rng_streams, name).getstate())
+            for name in GAMEPLAY_STREAMS
+        ]
+
+        manager = getattr(engine, "game_mode_manager", None)
+        if manager is not None:
+            self.mode = (
+                manager.current_mode,
+                manager.mode_timer,
+                _copy_data(manager.mode_data),
+            )
+
+    def restore(self, engine):
+        """
+        Put the engine back into this state.
+
+        Args:
+            engine (GameEngine): The engine the state was captured from
+        """
+        for name, value in self.engine.items():
+            setattr(
+                engine,
+                name,
+                value.copy() if type(value) in _MUTABLE_TYPES else value,
+            )
+        for obj, saved in self.objects:
+            _restore_object(obj, saved)
+        for stream, state in self.streams:
+            stream.setstate(state)
+        if self.mode is not None:
+            manager = engine.game_mode_manager
+            manager.current_mode, manager.mode_timer, mode_data = self.mode
+            manager.mode_data = _copy_data(mode_data)
@@ -1,18 +1,147 @@
 """
 Sound Manager
 
-Handles loading and playing sound effects for the game.
+Handles loading and playing sound effects for the game. Playback goes
+through a ChannelManager that reserves mixer channels per category,
+limits simultaneous voices per sound and steals low-priority voices when a
+category is full, so heavy combat cannot starve or cut off other sounds.
+Sounds can be decoded on the asset loader's worker thread; until a sound
+is ready, playing it is silently skipped.
 """
 
 import pygame
 import os
+from config import AUDIO_CHANNEL_GROUPS, SOUND_SETTINGS
+from asset_loader import load_sound
+from event_bus import EVENT_HIT, EVENT_SHOT, EVENT_JUMP
+
+# Sound played for each frame event type
+EVENT_SOUNDS = {
+    EVENT_HIT: "damage",
+    EVENT_SHOT: "shoot",
+    EVENT_JUMP: "jump",
+}
+
+# Settings for sounds missing from SOUND_SETTINGS
+DEFAULT_SOUND_SETTINGS = {
+    "category": "impacts",
+    "priority": 1,
+    "max_voices": 2,
+    "volume": 1.0,
+}
+
+
+class ChannelManager:
+    """Allocates mixer channels to sounds by category, cap and priority."""
+
+    def __init__(self, channel_groups):
+        """
+        Args:
+            channel_groups (dict): Category name -> number of channels
+        """
+        self.groups = {}
+        # Per channel: (sound key, priority, play order) of the last play
+        self.voices = {}
+        self.play_counter = 0
+        self.stats = {
+            category: {"played": 0, "stolen": 0, "capped": 0, "dropped": 0}
+            for category in channel_groups
+        }
+
+        total = sum(channel_groups.values())
+        pygame.mixer.set_num_channels(total)
+        # Keep every channel away from pygame's automatic allocation
+        pygame.mixer.set_reserved(total)
+
+        index = 0
+        for category, count in channel_groups.items():
+            self.groups[category] = [
+                pygame.mixer.Channel(i) for i in range(index, index + count)
+            ]
+            index += count
+
+    def play(self, sound, sound_key, category, priority, max_voices, volume=1.0):
+        """
+        Play a sound on a channel of its category.
+
+        When the sound already has max_voices playing, its oldest voice is
+        replaced. When the category is full, the lowest-priority (then
+        oldest) voice is stolen if it is not more important than this one;
+        otherwise the play is dropped.
+
+        Returns:
+            pygame.mixer.Channel: The channel used, or None if dropped
+        """
+        channels = self.groups.get(category)
+        if not channels:
+            channels = next(iter(self.groups.values()))
+            category = next(iter(self.groups))
+        stats = self.stats[category]
+
+        free_channel = None
+        same_sound = []
+        victim = None
+        victim_rank = None
+        for channel in channels:
+            if not channel.get_busy():
+                if free_channel is None:
+                    free_channel = channel
+                continue
+            key, voice_priority, order = self.voices.get(channel, (None, 0, 0))
+            if key == sound_key:
+                same_sound.append((order, channel))
+            rank = (voice_priority, order)
+            if victim_rank is None or rank < victim_rank:
+                victim = channel
+                victim_rank = rank
+
+        if len(same_sound) >= max_voices:
+            # Per-sound cap: the newest play replaces the oldest voice
+            channel = min(same_sound, key=lambda voice: voice[0])[1]
+            stats["capped"] += 1
+        elif free_channel is not None:
+            channel = free_channel
+        elif victim is not None and victim_rank[0] <= priority:
+            channel = victim
+            stats["stolen"] += 1
+        else:
+            stats["dropped"] += 1
+            return None
+
+        self.play_counter += 1
+        channel.play(sound)
+        # Per-play volume lives on the channel, not on the shared Sound
+        channel.set_volume(volume)
+        self.voices[channel] = (sound_key, priority, self.play_counter)
+        stats["played"] += 1
+        return channel
+
+    def get_stats(self):
+        """Return per-category counts of played, stolen, capped and dropped voices."""
+        return {category: dict(counts) for category, counts in self.stats.items()}
 
 
 class SoundManager:
-    def __init__(self, assets_path):
+    def __init__(self, assets_path, loader=None, cache_dir=None):
+        """
+        Args:
+            assets_path (str): Folder containing the sounds folder
+            loader (AssetLoader): Decode sounds on this loader's worker
+                instead of blocking here
+            cache_dir (str): Folder for decoded PCM of compressed sounds
+        """
         self.assets_path = assets_path
+        self.cache_dir = cache_dir
         self.sounds = {}
-        self._load_sounds()
+        if loader:
+            loader.submit("sounds", self._load_sounds)
+        else:
+            self._load_sounds()
+
+        # Channel allocation (needs an initialised mixer)
+        self.channels = None
+        if pygame.mixer.get_init():
+            self.channels = ChannelManager(AUDIO_CHANNEL_GROUPS)
 
     def _load_sounds(self):
         # Look for sound files in the assets/sounds folder
@@ -26,23 +155,48 @@ class SoundManager:
         for key, filename in sound_files.items():
             path = os.path.join(sounds_path, filename)
             if os.path.exists(path):
-                self.sounds[key] = pygame.mixer.Sound(path)
-                # Set much quieter volume for gunshot sound
-                if key == "shoot":
-                    self.sounds[key].set_volume(
-                        0.2
-                    )  # 20% volume for very quiet gunshots
+                self.sounds[key] = load_sound(path, self.cache_dir)
                 print(f"Loaded sound: {key} from {path}")
             else:
                 self.sounds[key] = None  # Placeholder if file is missing
                 print(f"Sound file not found: {path}")
 
     def play(self, sound_key, volume=None):
+        """
+        Play a sound through the channel manager.
+
+        Args:
+            sound_key (str): Name of the sound
+            volume (float): Volume for this play only (0.0-1.0), scaled by
+                the sound's base volume; None plays at the base volume
+        """
         sound = self.sounds.get(sound_key)
-        if sound:
-            if volume is not None:
-                sound.set_volume(volume)
-            sound.play()
+        if not sound or not self.channels:
+            return None
+
+        settings = SOUND_SETTINGS.get(sound_key, DEFAULT_SOUND_SETTINGS)
+        play_volume = settings["volume"] * (1.0 if volume is None else volume)
+        return self.channels.play(
+            sound,
+            sound_key,
+            settings["category"],
+            settings["priority"],
+            settings["max_voices"],
+            play_volume,
+        )
+
+    def get_stats(self):
+        """Return per-category voice statistics (empty without a mixer)."""
+        return self.channels.get_stats() if self.channels else {}
+
+    def apply_frame_events(self, events):
+        """Play each sound triggered this frame once, however many events asked."""
+        played = set()
+        for event in events:
+            sound_key = EVENT_SOUNDS.get(event.kind)
+            if sound_key and sound_key not in played:
+                played.add(sound_key)
+                self.play(sound_key)
 
 
 # Usage:
@@ -3,11 +3,14 @@ Sprite System - Advanced Graphics Mod Pack
 
 This module provides a sprite management system that can use either
 actual image files or procedurally generated sprites for enhanced visuals.
+Procedural sprites are generated lazily on first use (or ahead of time on
+the asset loader's worker thread) rather than at import.
 """
 
 import pygame
 import math
 import os
+import threading
 from config import *
 
 
@@ -17,59 +20,85 @@ class SpriteManager:
     def __init__(self):
         self.sprites = {}
         self.animations = {}
-        self.generated_sprites = {}
-        self.animated_sprites = {}
-        self._generate_default_sprites()
-        self._generate_animated_sprites()
+        self._generated_sprites = {}
+        self._animated_sprites = {}
+        self._generated = False
+        self._generate_lock = threading.Lock()
+
+    def ensure_generated(self):
+        """Generate the procedural sprites if that has not happened yet.
+
+        Safe to call from the asset loader's worker and the main thread at
+        once: whoever comes second waits for the first to finish.
+        """
+        if self._generated:
+            return
+        with self._generate_lock:
+            if not self._generated:
+                self._generate_default_sprites()
+                self._generate_animated_sprites()
+                self._generated = True
+
+    @property
+    def generated_sprites(self):
+        """Static procedural sprites, generated on first access."""
+        self.ensure_generated()
+        return self._generated_sprites
+
+    @property
+    def animated_sprites(self):
+        """Animation frame lists, generated on first access."""
+        self.ensure_generated()
+        return self._animated_sprites
 
     def _generate_default_sprites(self):
         """Generate default static sprites for fallback and UI elements."""
         # Bullets
-        self.generated_sprites["bullet"] = self._create_bullet_sprite(
+        self._generated_sprites["bullet"] = self._create_bullet_sprite(
             BULLET_WIDTH, BULLET_HEIGHT, BULLET_COLOR
         )
-        self.generated_sprites["player_bullet"] = self._create_bullet_sprite(
+        self._generated_sprites["player_bullet"] = self._create_bullet_sprite(
             PLAYER_BULLET_WIDTH, PLAYER_BULLET_HEIGHT, PLAYER_BULLET_COLOR
         )
-        self.generated_sprites["player2_bullet"] = self._create_bullet_sprite(
+        self._generated_sprites["player2_bullet"] = self._create_bullet_sprite(
             PLAYER2_BULLET_WIDTH, PLAYER2_BULLET_HEIGHT, PLAYER2_BULLET_COLOR
         )
         # Platform
-        self.generated_sprites["platform"] = self._create_platform_texture(
+        self._generated_sprites["platform"] = self._create_platform_texture(
             PLATFORM_MIN_WIDTH, PLATFORM_HEIGHT
         )
         # UI
-        self.generated_sprites["crosshair"] = self._create_crosshair()
+        self._generated_sprites["crosshair"] = self._create_crosshair()
 
     def _generate_animated_sprites(self):
         """Generate animated sprite frame lists for player, player2, enemy, and weapons."""
         # Player animations: idle, walk, jump
-        self.animated_sprites["player_idle"] = [
+        self._animated_sprites["player_idle"] = [
             self._create_player_sprite(PLAYER_SIZE, PLAYER_COLOR, pose="idle", frame=i)
             for i in range(4)
         ]
-        self.animated_sprites["player_walk"] = [
+        self._animated_sprites["player_walk"] = [
             self._create_player_sprite(PLAYER_SIZE, PLAYER_COLOR, pose="walk", frame=i)
             for i in range(6)
         ]
-        self.animated_sprites["player_jump"] = [
+        self._animated_sprites["player_jump"] = [
             self._create_player_sprite(PLAYER_SIZE, PLAYER_COLOR, pose="jump", frame=i)
             for i in range(2)
         ]
 
-        self.animated_sprites["player2_idle"] = [
+        self._animated_sprites["player2_idle"] = [
             self._create_player_sprite(
                 PLAYER2_SIZE, PLAYER2_COLOR, pose="idle", frame=i
             )
             for i in range(4)
         ]
-        self.animated_sprites["player2_walk"] = [
+        self._animated_sprites["player2_walk"] = [
             self._create_player_sprite(
                 PLAYER2_SIZE, PLAYER2_COLOR, pose="walk", frame=i
             )
             for i in range(6)
         ]
-        self.animated_sprites["player2_jump"] = [
+        self._animated_sprites["player2_jump"] = [
             self._create_player_sprite(
                 PLAYER2_SIZE, PLAYER2_COLOR, pose="jump", frame=i
             )
@@ -77,22 +106,22 @@ class SpriteManager:
         ]
 
         # Enemy animations: idle, walk, attack
-        self.animated_sprites["enemy_idle"] = [
+        self._animated_sprites["enemy_idle"] = [
             self._create_enemy_sprite(ENEMY_SIZE, ENEMY_COLOR, pose="idle", frame=i)
             for i in range(4)
         ]
-        self.animated_sprites["enemy_walk"] = [
+        self._animated_sprites["enemy_walk"] = [
             self._create_enemy_sprite(ENEMY_SIZE, ENEMY_COLOR, pose="walk", frame=i)
             for i in range(6)
         ]
-        self.animated_sprites["enemy_attack"] = [
+        self._animated_sprites["enemy_attack"] = [
             self._create_enemy_sprite(ENEMY_SIZE, ENEMY_COLOR, pose="attack", frame=i)
             for i in range(4)
         ]
 
         # Weapons (static for now, could animate firing later)
-        self.animated_sprites["blaster"] = [self._create_blaster_sprite()]
-        self.animated_sprites["pistol"] = [self._create_pistol_sprite()]
+        self._animated_sprites["blaster"] = [self._create_blaster_sprite()]
+        self._animated_sprites["pistol"] = [self._create_pistol_sprite()]
 
     def _create_player_sprite(
         self, size, color, pose="idle", frame=0, facing_right=True
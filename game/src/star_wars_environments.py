@@ -6,9 +6,11 @@ hazards, and environmental interactions.
 """
 
 import pygame
-import random
 import math
 from config import *
+from random_streams import rng_streams
+from quality_governor import quality_governor
+from effect_budget import admit
 
 
 class Environment:
@@ -38,7 +40,9 @@ class Environment:
         return particle["life"] > 0
 
     def add_particle(self, x, y, dx, dy, color, life):
-        """Add environmental particle."""
+        """Add environmental particle (dropped when the ambient budget is full)."""
+        if not admit(self.particles, AMBIENT_PARTICLE_BUDGET, "ambient"):
+            return
         self.particles.append(
             {"x": x, "y": y, "dx": dx, "dy": dy, "color": color, "life": life}
         )
@@ -58,8 +62,11 @@ class Environment:
         self._draw_hazards(surface)
 
     def _draw_particles(self, surface):
-        """Draw environment particles."""
-        for particle in self.particles:
+        """Draw environment particles (every Nth at reduced density)."""
+        density = quality_governor.environment_density
+        if density <= 0:
+            return
+        for particle in self.particles[:: max(1, round(1 / density))]:
             alpha = min(255, particle["life"] * 3)
             if alpha > 0:
                 temp_surf = pygame.Surface((4, 4), pygame.SRCALPHA)
@@ -84,10 +91,12 @@ class DeathStarEnvironment(Environment):
         for _ in range(20):
             self.panel_lights.append(
                 {
-                    "x": random.randint(50, WINDOW_WIDTH - 50),
-                    "y": random.randint(50, WINDOW_HEIGHT - 50),
-                    "color": random.choice([(0, 255, 0), (255, 0, 0), (0, 0, 255)]),
-                    "blink_timer": random.randint(0, 120),
+                    "x": rng_streams.effects.randint(50, WINDOW_WIDTH - 50),
+                    "y": rng_streams.effects.randint(50, WINDOW_HEIGHT - 50),
+                    "color": rng_streams.effects.choice(
+                        [(0, 255, 0), (255, 0, 0), (0, 0, 255)]
+                    ),
+                    "blink_timer": rng_streams.effects.randint(0, 120),
                 }
             )
 
@@ -145,14 +154,16 @@ class TatooineEnvironment(Environment):
 
     def add_sand_particle(self):
         """Add blowing sand particle."""
+        if not admit(self.particles, AMBIENT_PARTICLE_BUDGET, "ambient"):
+            return
         self.particles.append(
             {
                 "x": -10,
-                "y": random.randint(0, WINDOW_HEIGHT),
-                "dx": random.uniform(1, 3),
-                "dy": random.uniform(-0.5, 0.5),
+                "y": rng_streams.effects.randint(0, WINDOW_HEIGHT),
+                "dx": rng_streams.effects.uniform(1, 3),
+                "dy": rng_streams.effects.uniform(-0.5, 0.5),
                 "color": (218, 165, 120),
-                "life": random.randint(200, 400),
+                "life": rng_streams.effects.randint(200, 400),
             }
         )
 
@@ -161,7 +172,7 @@ class TatooineEnvironment(Environment):
         self.twin_suns_angle += 0.01
 
         # Add new sand particles
-        if random.randint(1, 10) == 1:
+        if rng_streams.effects.randint(1, 10) == 1:
             self.add_sand_particle()
 
     def _draw_specific_background(self, surface):
@@ -206,25 +217,36 @@ class EndorEnvironment(Environment):
         for _ in range(15):
             self.trees.append(
                 {
-                    "x": random.randint(0, WINDOW_WIDTH),
-                    "y": random.randint(WINDOW_HEIGHT // 2, WINDOW_HEIGHT),
-                    "height": random.randint(100, 200),
-                    "width": random.randint(20, 40),
+                    "x": rng_streams.effects.randint(0, WINDOW_WIDTH),
+                    "y": rng_streams.effects.randint(WINDOW_HEIGHT // 2, WINDOW_HEIGHT),
+                    "height": rng_streams.effects.randint(100, 200),
+                    "width": rng_streams.effects.randint(20, 40),
                 }
             )
 
+        # Distant tree line heights are rolled once so the forest stays put
+        self.background_tree_heights = [
+            [
+                80 + layer * 40 + rng_streams.effects.randint(-20, 20)
+                for _ in range(0, WINDOW_WIDTH, 30)
+            ]
+            for layer in range(3)
+        ]
+
     def update(self):
         super().update()
 
         # Add forest ambiance particles (leaves, spores)
-        if random.randint(1, 30) == 1:
+        if rng_streams.effects.randint(1, 30) == 1:
             self.add_particle(
-                random.randint(0, WINDOW_WIDTH),
-                random.randint(0, WINDOW_HEIGHT // 2),
-                random.uniform(-1, 1),
-                random.uniform(0.5, 2),
-                random.choice([(100, 150, 50), (120, 180, 60), (80, 120, 40)]),
-                random.randint(120, 300),
+                rng_streams.effects.randint(0, WINDOW_WIDTH),
+                rng_streams.effects.randint(0, WINDOW_HEIGHT // 2),
+                rng_streams.effects.uniform(-1, 1),
+                rng_streams.effects.uniform(0.5, 2),
+                rng_streams.effects.choice(
+                    [(100, 150, 50), (120, 180, 60), (80, 120, 40)]
+                ),
+                rng_streams.effects.randint(120, 300),
             )
 
     def _draw_specific_background(self, surface):
@@ -232,8 +254,9 @@ class EndorEnvironment(Environment):
         # Draw distant forest background
         for layer in range(3):
             tree_color = (20 + layer * 15, 60 + layer * 20, 20 + layer * 15)
-            for i in range(0, WINDOW_WIDTH, 30):
-                tree_height = 80 + layer * 40 + random.randint(-20, 20)
+            layer_heights = self.background_tree_heights[layer]
+            for column, i in enumerate(range(0, WINDOW_WIDTH, 30)):
+                tree_height = layer_heights[column]
                 tree_y = WINDOW_HEIGHT - tree_height + layer * 50
                 pygame.draw.rect(surface, tree_color, (i, tree_y, 20, tree_height))
 
@@ -271,14 +294,16 @@ class HothEnvironment(Environment):
 
     def add_snowflake(self):
         """Add falling snowflake."""
+        if not admit(self.particles, AMBIENT_PARTICLE_BUDGET, "ambient"):
+            return
         self.particles.append(
             {
-                "x": random.randint(-50, WINDOW_WIDTH + 50),
+                "x": rng_streams.effects.randint(-50, WINDOW_WIDTH + 50),
                 "y": -10,
-                "dx": random.uniform(-1, 1),
-                "dy": random.uniform(1, 3),
+                "dx": rng_streams.effects.uniform(-1, 1),
+                "dy": rng_streams.effects.uniform(1, 3),
                 "color": (255, 255, 255),
-                "life": random.randint(200, 500),
+                "life": rng_streams.effects.randint(200, 500),
             }
         )
 
@@ -287,7 +312,7 @@ class HothEnvironment(Environment):
         self.wind_direction += 0.02
 
         # Add new snowflakes
-        if random.randint(1, 5) == 1:
+        if rng_streams.effects.randint(1, 5) == 1:
             self.add_snowflake()
 
         # Update existing snow with wind
@@ -311,13 +336,13 @@ class HothEnvironment(Environment):
             )
 
         # Draw blizzard effect
-        if random.randint(1, 20) == 1:
+        if rng_streams.effects.randint(1, 20) == 1:
             for _ in range(10):
                 self.add_particle(
-                    random.randint(0, WINDOW_WIDTH),
-                    random.randint(0, WINDOW_HEIGHT),
-                    random.uniform(-3, 3),
-                    random.uniform(-1, 1),
+                    rng_streams.effects.randint(0, WINDOW_WIDTH),
+                    rng_streams.effects.randint(0, WINDOW_HEIGHT),
+                    rng_streams.effects.uniform(-3, 3),
+                    rng_streams.effects.uniform(-1, 1),
                     (255, 255, 255),
                     30,
                 )
@@ -340,7 +365,7 @@ def create_environment(env_name):
 
 def get_random_environment():
     """Get a random environment."""
-    env_name = random.choice(list(ENVIRONMENTS.keys()))
+    env_name = rng_streams.level.choice(list(ENVIRONMENTS.keys()))
     return create_environment(env_name)
 
 
@@ -349,12 +374,14 @@ class EnvironmentManager:
 
     def __init__(self):
         self.current_environment = None
+        self.current_environment_name = None
         self.environments = ENVIRONMENTS
 
     def set_environment(self, env_name):
         """Set the current environment."""
         if env_name in self.environments:
             self.current_environment = create_environment(env_name)
+            self.current_environment_name = env_name
 
     def update(self):
         """Update current environment."""
@@ -363,10 +390,10 @@ class EnvironmentManager:
 
     def draw_environment(self, surface, env_name=None):
         """Draw the specified environment or current one."""
-        if env_name:
-            env = create_environment(env_name)
-            env.draw_background(surface)
-            env.draw_effects(surface)
-        elif self.current_environment:
+        if env_name and env_name != self.current_environment_name:
+            # Build the environment once instead of re-rolling it every frame
+            self.set_environment(env_name)
+
+        if self.current_environment:
             self.current_environment.draw_background(surface)
             self.current_environment.draw_effects(surface)
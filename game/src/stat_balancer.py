@@ -0,0 +1,557 @@
+"""
+Stat Balancer
+
+Searches the legendary character stats (health, Force energy, speed, Force
+regeneration, lightsaber damage and Force power bonus) for a table whose
+pairwise win rates are as close to 50% as possible. Candidate tables come
+from a separable CMA-ES (a covariance matrix adaptation evolution strategy
+with a diagonal covariance, in plain Python) and a whole generation is
+played at once on the self-play arena's worker pool. Results are cached
+per pairing by a hash of the two characters' stat vectors, so a pairing
+whose stats did not change is never simulated again. The best table is
+re-played with more matches and written out as a proposed
+legendary_characters.py table with Wilson confidence intervals.
+"""
+
+import hashlib
+import json
+import math
+import random
+import textwrap
+
+from config import *
+from legendary_characters import CharacterProfile, LEGENDARY_CHARACTERS
+from self_play import make_batches, play_batches
+
+# Searched stats, in stat vector order
+STAT_NAMES = (
+    "health",
+    "force_energy",
+    "speed",
+    "force_regen",
+    "lightsaber_damage",
+    "force_power_bonus",
+)
+
+
+def profile_vector(profile):
+    """Return a profile's searched stats as a tuple in STAT_NAMES order."""
+    return (profile.max_health, profile.max_force_energy) + tuple(
+        profile.stats[name] for name in STAT_NAMES[2:]
+    )
+
+
+def with_stats(profile, vector):
+    """Return a copy of a profile with the stats of a stat vector."""
+    stats = dict(profile.stats)
+    stats.update(zip(STAT_NAMES[2:], vector[2:]))
+    return CharacterProfile(
+        profile.name,
+        profile.character_type,
+        vector[0],
+        vector[1],
+        profile.special_abilities,
+        stats,
+    )
+
+
+def quantize(name, value):
+    """Clamp a stat to its bounds and snap it to its step."""
+    low, high, step = BALANCE_STAT_BOUNDS[name]
+    value = low + round((min(high, max(low, value)) - low) / step) * step
+    return int(round(value)) if isinstance(step, int) else round(value, 2)
+
+
+def wilson_interval(successes, trials, z=BALANCE_CONFIDENCE_Z):
+    """
+    Wilson score interval of a win rate.
+
+    Args:
+        successes (float): Wins (draws count as half a win)
+        trials (int): Matches played
+        z (float): Standard normal quantile, 1.96 for 95%
+
+    Returns:
+        tuple: (lower, upper) bounds of the rate
+    """
+    if trials == 0:
+        return 0.0, 1.0
+    rate = successes / trials
+    z2 = z * z
+    denominator = 1 + z2 / trials
+    centre = (rate + z2 / (2 * trials)) / denominator
+    half_width = (
+        z * math.sqrt(rate * (1 - rate) / trials + z2 / (4 * trials * trials))
+    ) / denominator
+    return max(0.0, centre - half_width), min(1.0, centre + half_width)
+
+
+class SeparableCMAES:
+    """
+    CMA-ES with a diagonal covariance matrix (sep-CMA-ES), minimising.
+
+    The diagonal keeps sampling and updates linear in the number of
+    dimensions, which suits a few dozen loosely coupled stats, and needs
+    no linear algebra library.
+    """
+
+    def __init__(self, mean, sigma, population, seed=0):
+        """
+        Args:
+            mean (list): Starting point, in [0, 1] per dimension
+            sigma (float): Initial step size
+            population (int): Candidates per generation
+            seed (int): Seed for the sampling
+        """
+        n = len(mean)
+        self.n = n
+        self.mean = list(mean)
+        self.sigma = sigma
+        self.population = max(4, population)
+        self.rng = random.Random(seed)
+        self.generation = 0
+
+        mu = self.population // 2
+        weights = [math.log(mu + 0.5) - math.log(i + 1) for i in range(mu)]
+        total = sum(weights)
+        self.weights = [w / total for w in weights]
+        self.mueff = 1 / sum(w * w for w in self.weights)
+
+        mueff = self.mueff
+        self.cs = (mueff + 2) / (n + mueff + 5)
+        self.damps = 1 + 2 * max(0, math.sqrt((mueff - 1) / (n + 1)) - 1) + self.cs
+        self.cc = (4 + mueff / n) / (n + 4 + 2 * mueff / n)
+        # Learning rates, raised by (n + 2) / 3 for the diagonal model
+        c1 = 2 / ((n + 1.3) ** 2 + mueff)
+        cmu = min(1 - c1, 2 * (mueff - 2 + 1 / mueff) / ((n + 2) ** 2 + mueff))
+        scale = (n + 2) / 3
+        self.c1 = min(0.5, c1 * scale)
+        self.cmu = min(1 - self.c1, cmu * scale)
+        self.chi_n = math.sqrt(n) * (1 - 1 / (4 * n) + 1 / (21 * n * n))
+
+        self.variances = [1.0] * n
+        self.path_sigma = [0.0] * n
+        self.path_c = [0.0] * n
+
+    def ask(self):
+        """Sample a generation of candidates, clipped to [0, 1]."""
+        candidates = []
+        for _ in range(self.population):
+            candidates.append(
+                [
+                    min(
+                        1.0,
+                        max(0.0, m + self.sigma * math.sqrt(v) * self.rng.gauss(0, 1)),
+                    )
+                    for m, v in zip(self.mean, self.variances)
+                ]
+            )
+        return candidates
+
+    def tell(self, candidates, losses):
+        """
+        Update the distribution from a generation's losses.
+
+        Args:
+            candidates (list): Points actually evaluated (after clipping or
+                quantizing), as returned by ask() or repaired from it
+            losses (list): Loss of each candidate, lower is better
+        """
+        self.generation += 1
+        ranked = [
+            candidates[i] for i in sorted(range(len(losses)), key=losses.__getitem__)
+        ]
+        n = self.n
+        steps = [
+            [(x[j] - self.mean[j]) / self.sigma for j in range(n)]
+            for x in ranked[: len(self.weights)]
+        ]
+        step_w = [
+            sum(w * step[j] for w, step in zip(self.weights, steps)) for j in range(n)
+        ]
+        self.mean = [m + self.sigma * s for m, s in zip(self.mean, step_w)]
+
+        cs, cc = self.cs, self.cc
+        norm_factor = math.sqrt(cs * (2 - cs) * self.mueff)
+        self.path_sigma = [
+            (1 - cs) * p + norm_factor * s / math.sqrt(v)
+            for p, s, v in zip(self.path_sigma, step_w, self.variances)
+        ]
+        path_norm = math.sqrt(sum(p * p for p in self.path_sigma))
+        stalled = path_norm / math.sqrt(1 - (1 - cs) ** (2 * self.generation))
+        h_sigma = 1.0 if stalled < (1.4 + 2 / (n + 1)) * self.chi_n else 0.0
+
+        path_factor = h_sigma * math.sqrt(cc * (2 - cc) * self.mueff)
+        self.path_c = [
+            (1 - cc) * p + path_factor * s for p, s in zip(self.path_c, step_w)
+        ]
+        c1, cmu = self.c1, self.cmu
+        self.variances = [
+            (1 - c1 - cmu) * self.variances[j]
+            + c1
+            * (self.path_c[j] ** 2 + (1 - h_sigma) * cc * (2 - cc) * self.variances[j])
+            + cmu * sum(w * step[j] ** 2 for w, step in zip(self.weights, steps))
+            for j in range(n)
+        ]
+        self.sigma *= math.exp((cs / self.damps) * (path_norm / self.chi_n - 1))
+
+
+class StatBalancer:
+    """Evaluates and searches stat tables for a set of legendary characters."""
+
+    def __init__(
+        self,
+        characters=None,
+        modes=BALANCE_MODES,
+        seed=ARENA_SEED,
+        difficulty=ARENA_DIFFICULTY,
+        match_seconds=ARENA_MATCH_SECONDS,
+        batch_size=ARENA_BATCH_SIZE,
+        anchor_weight=BALANCE_ANCHOR_WEIGHT,
+        cache=None,
+    ):
+        """
+        Args:
+            characters (list): Legendary character keys, or None for all
+            modes (tuple): Game modes the win rates are measured in
+            seed (int): Master seed of the matches
+            difficulty (str): Enemy AI difficulty
+            match_seconds (float): Simulated seconds before a draw
+            batch_size (int): Matches per worker task
+            anchor_weight (float): Weight of the penalty for moving away
+                from the current stats
+            cache (dict): Pairing hash -> [player1 wins, ai wins, draws],
+                e.g. loaded from an earlier run, or None
+        """
+        self.characters = list(characters or LEGENDARY_CHARACTERS)
+        self.modes = tuple(modes)
+        self.seed = seed
+        self.batch_size = batch_size
+        self.anchor_weight = anchor_weight
+        self.cache = {} if cache is None else cache
+        self.base = {key: LEGENDARY_CHARACTERS[key] for key in self.characters}
+        self.original = {
+            key: profile_vector(profile) for key, profile in self.base.items()
+        }
+        self.origin = self.encode(self.original)
+        # Everything besides the two stat vectors that decides a pairing's result
+        self.settings = [self.characters, self.modes, seed, difficulty, match_seconds]
+        self.simulated = 0  # Pairings played
+        self.cache_hits = 0  # Pairings taken from the cache
+
+    def encode(self, table):
+        """Map a stat table to a point in [0, 1] per character and stat."""
+        point = []
+        for key in self.characters:
+            for name, value in zip(STAT_NAMES, table[key]):
+                low, high, _ = BALANCE_STAT_BOUNDS[name]
+                point.append((value - low) / (high - low))
+        return point
+
+    def decode(self, point):
+        """Map a point back to a quantized stat table."""
+        table = {}
+        values = iter(point)
+        for key in self.characters:
+            vector = []
+            for name in STAT_NAMES:
+                low, high, _ = BALANCE_STAT_BOUNDS[name]
+                vector.append(quantize(name, low + next(values) * (high - low)))
+            table[key] = tuple(vector)
+        return table
+
+    def pairing_hash(self, mode, player1_key, ai_key, table, matches):
+        """Hash of everything that decides an ordered pairing's result."""
+        state = [
+            self.settings,
+            matches,
+            mode,
+            player1_key,
+            table[player1_key],
+            ai_key,
+            table[ai_key],
+        ]
+        return hashlib.sha1(json.dumps(state).encode()).hexdigest()
+
+    def evaluate(self, tables, matches, pool=None):
+        """
+        Play every pairing of several stat tables at once.
+
+        Pairings already in the cache, or shared with another table of the
+        same call, are played only once.
+
+        Args:
+            tables (list): Stat tables ({character key: stat vector})
+            matches (int): Matches per pairing, seat and mode
+            pool (multiprocessing.Pool): Arena pool, or None to play in
+                this process
+
+        Returns:
+            list: Per table, {(mode, player1 key, ai key): [player1 wins,
+                ai wins, draws]}
+        """
+        pending = []
+        claimed = set()
+        table_digests = []
+        for table in tables:
+            profiles = {
+                key: with_stats(self.base[key], vector) for key, vector in table.items()
+            }
+            digests = {}
+            own = set()  # Pairings this table plays for the whole call
+            for batch in make_batches(
+                self.characters,
+                self.modes,
+                matches,
+                self.seed,
+                self.batch_size,
+                profiles,
+                mirrors=False,
+            ):
+                key = batch[0]
+                if key not in digests:
+                    digest = self.pairing_hash(*key, table, matches)
+                    digests[key] = digest
+                    if digest in self.cache or digest in claimed:
+                        self.cache_hits += 1
+                    else:
+                        claimed.add(digest)
+                        own.add(digest)
+                        self.simulated += 1
+                if digests[key] in own:
+                    pending.append((digests[key],) + batch[1:])
+            table_digests.append(digests)
+
+        for digest, totals in play_batches(pending, pool).items():
+            self.cache[digest] = [
+                totals.wins["player1"],
+                totals.wins["ai"],
+                totals.wins["draw"],
+            ]
+        return [
+            {key: self.cache[digest] for key, digest in digests.items()}
+            for digests in table_digests
+        ]
+
+    def pair_scores(self, results):
+        """
+        Combine a table's ordered pairings into one score per character pair.
+
+        Returns:
+            dict: (a, b) -> (points of a, matches), a before b in the
+                character list; a win is one point, a draw half
+        """
+        scores = {}
+        for i, a in enumerate(self.characters):
+            for b in self.characters[i + 1 :]:
+                points = 0.0
+                played = 0
+                for mode in self.modes:
+                    a_wins, b_wins, draws = results[mode, a, b]
+                    points += a_wins + 0.5 * draws
+                    played += a_wins + b_wins + draws
+                    b_wins, a_wins, draws = results[mode, b, a]
+                    points += a_wins + 0.5 * draws
+                    played += a_wins + b_wins + draws
+                scores[a, b] = (points, played)
+        return scores
+
+    def imbalance(self, scores):
+        """Mean squared deviation of the pairwise win rates from 50%."""
+        deviations = [
+            (points / played - 0.5) ** 2 for points, played in scores.values() if played
+        ]
+        return sum(deviations) / len(deviations) if deviations else 0.0
+
+    def loss(self, table, results):
+        """Imbalance plus the penalty for moving away from the current stats."""
+        drift = [(x - o) ** 2 for x, o in zip(self.encode(table), self.origin)]
+        return self.imbalance(self.pair_scores(results)) + self.anchor_weight * (
+            sum(drift) / len(drift)
+        )
+
+    def optimize(
+        self,
+        generations=BALANCE_GENERATIONS,
+        population=BALANCE_POPULATION,
+        matches=BALANCE_MATCHES,
+        step_size=BALANCE_STEP_SIZE,
+        pool=None,
+        progress=None,
+    ):
+        """
+        Search for the stat table with the lowest loss.
+
+        Args:
+            generations (int): Generations to run
+            population (int): Candidate tables per generation
+            matches (int): Matches per pairing, seat and mode
+            step_size (float): Initial step, as a fraction of each range
+            pool (multiprocessing.Pool): Arena pool, or None
+            progress (callable): Called with a status line per generation
+
+        Returns:
+            tuple: (best stat table, its loss, loss of the current table)
+        """
+        (results,) = self.evaluate([self.original], matches, pool)
+        original_loss = self.loss(self.original, results)
+        best_table, best_loss = self.original, original_loss
+
+        strategy = SeparableCMAES(self.origin, step_size, population, self.seed)
+        for generation in range(generations):
+            tables = [self.decode(point) for point in strategy.ask()]
+            losses = [
+                self.loss(table, results)
+                for table, results in zip(tables, self.evaluate(tables, matches, pool))
+            ]
+            strategy.tell([self.encode(table) for table in tables], losses)
+
+            for table, loss in zip(tables, losses):
+                if loss < best_loss:
+                    best_table, best_loss = table, loss
+            if progress:
+                progress(
+                    f"Generation {generation + 1}: best {min(losses):.4f}, "
+                    f"overall best {best_loss:.4f} (current stats {original_loss:.4f}), "
+                    f"step {strategy.sigma:.3f}, {self.simulated} pairings played, "
+                    f"{self.cache_hits} cached"
+                )
+        return best_table, best_loss, original_loss
+
+    def summarize(self, results):
+        """
+        Win rates with Wilson intervals, per character and per pair.
+
+        Returns:
+            dict: "imbalance", "characters" (key -> points, matches, rate,
+                interval) and "pairs" ((a, b) -> the same for a against b)
+        """
+        scores = self.pair_scores(results)
+        totals = {key: [0.0, 0] for key in self.characters}
+        pairs = {}
+        for (a, b), (points, played) in scores.items():
+            totals[a][0] += points
+            totals[a][1] += played
+            totals[b][0] += played - points
+            totals[b][1] += played
+            pairs[a, b] = self._rate(points, played)
+        return {
+            "imbalance": self.imbalance(scores),
+            "characters": {
+                key: self._rate(points, played)
+                for key, (points, played) in totals.items()
+            },
+            "pairs": pairs,
+        }
+
+    @staticmethod
+    def _rate(points, played):
+        """Return a win rate entry with its Wilson interval."""
+        return {
+            "points": points,
+            "matches": played,
+            "rate": points / played if played else 0.5,
+            "interval": wilson_interval(points, played),
+        }
+
+
+def _format_value(value):
+    """Format a stat the way legendary_characters.py writes it."""
+    if isinstance(value, str):
+        return _quote(value)
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+def _quote(text):
+    """Quote a string with double quotes, as black writes them."""
+    return json.dumps(text, ensure_ascii=False)
+
+
+def render_table(balancer, table, summary, original_summary, note=""):
+    """
+    Render a stat table as a proposed legendary_characters.py table.
+
+    Each profile is preceded by its measured win rate and 95% interval
+    (and the win rate with the current stats), and the module docstring
+    records how the table was measured.
+
+    Args:
+        balancer (StatBalancer): Balancer the table was found with
+        table (dict): Proposed stat table
+        summary (dict): summarize() of the proposed table
+        original_summary (dict): summarize() of the current table
+        note (str): Extra docstring line, e.g. the search settings
+
+    Returns:
+        str: Python source
+    """
+    confidence = round(100 * (2 * _normal_cdf(BALANCE_CONFIDENCE_Z) - 1))
+    paragraphs = [
+        f"Generated by balance.py. Win rates are against every other character, "
+        f"in both seats, in {', '.join(balancer.modes)}; intervals are "
+        f"{confidence}% Wilson score intervals. Copy the profiles into "
+        f"legendary_characters.py to adopt them.",
+        f"Mean squared deviation of the pairwise win rates from 50%: "
+        f"{summary['imbalance']:.4f} (current stats: "
+        f"{original_summary['imbalance']:.4f}).",
+    ]
+    if note:
+        paragraphs.append(note)
+    lines = ['"""', "Proposed Legendary Character Stats"]
+    for paragraph in paragraphs:
+        lines += [""] + textwrap.wrap(paragraph, 76)
+    lines += [
+        '"""',
+        "",
+        "from legendary_characters import CharacterProfile",
+        "",
+        "LEGENDARY_CHARACTERS = {",
+    ]
+    for key in balancer.characters:
+        profile = with_stats(balancer.base[key], table[key])
+        entry = summary["characters"][key]
+        low, high = entry["interval"]
+        was = original_summary["characters"][key]["rate"]
+        lines += [
+            f"    # Win rate {entry['rate']:.1%} ({confidence}% CI {low:.1%} to "
+            f"{high:.1%}), current stats {was:.1%}",
+            f'    "{key}": CharacterProfile(',
+            f"        name={_quote(profile.name)},",
+            f"        character_type={_quote(profile.character_type)},",
+            f"        health={_format_value(profile.max_health)},",
+            f"        force_energy={_format_value(profile.max_force_energy)},",
+            "        special_abilities=[",
+        ]
+        lines += [
+            f"            {_quote(ability)}," for ability in profile.special_abilities
+        ]
+        lines += ["        ],", "        stats={"]
+        lines += [
+            f'            "{name}": {_format_value(value)},'
+            for name, value in profile.stats.items()
+        ]
+        lines += ["        },", "    ),"]
+    lines += ["}", ""]
+    return "\n".join(lines)
+
+
+def _normal_cdf(z):
+    """Standard normal cumulative distribution function."""
+    return 0.5 * (1 + math.erf(z / math.sqrt(2)))
+
+
+def load_cache(path):
+    """Load a pairing result cache written by save_cache, or start an empty one."""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(path, cache):
+    """Write the pairing result cache to a JSON file."""
+    with open(path, "w") as f:
+        json.dump(cache, f)
@@ -0,0 +1,148 @@
+"""
+Text Layout Cache
+
+Menus and HUD labels re-render the same strings every time they are drawn,
+and wrapping a paragraph measures it word by word with font.size(). This
+module caches fonts, wrapped line lists, rendered lines and composited
+multi-line blocks, so repeated text costs a dictionary lookup and a blit.
+"""
+
+import pygame
+from config import *
+
+_fonts = {}
+
+
+def get_font(size, bold=False):
+    """
+    Return the default font at a size, creating it only once.
+
+    Args:
+        size (int): Font size
+        bold (bool): Bold variant
+
+    Returns:
+        pygame.font.Font: The shared font object
+    """
+    key = (size, bold)
+    font = _fonts.get(key)
+    if font is None:
+        font = pygame.font.SysFont(None, size, bold=bold)
+        _fonts[key] = font
+    return font
+
+
+class TextLayoutCache:
+    """Caches wrapped lines and rendered text surfaces.
+
+    Entries are keyed by the font object itself, so use fonts from
+    get_font() (or otherwise long-lived fonts) to get cache hits.
+    """
+
+    def __init__(self, max_entries=TEXT_CACHE_MAX_ENTRIES):
+        """
+        Args:
+            max_entries (int): Entries kept per cache before the oldest
+                are dropped
+        """
+        self.max_entries = max_entries
+        self.lines = {}  # (text, font, max_width) -> tuple of lines
+        self.surfaces = {}  # (text, font, color) -> rendered line
+        self.blocks = {}  # (text, font, max_width, color, line_height) -> block
+        self.hits = 0
+        self.misses = 0
+
+    def _store(self, cache, key, value):
+        """Add an entry, dropping the oldest one when the cache is full."""
+        if len(cache) >= self.max_entries:
+            del cache[next(iter(cache))]
+        cache[key] = value
+        return value
+
+    def wrap(self, text, font, max_width):
+        """
+        Wrap text into lines no wider than max_width.
+
+        A single word wider than max_width gets a line of its own.
+
+        Returns:
+            tuple: The lines
+        """
+        key = (text, font, max_width)
+        lines = self.lines.get(key)
+        if lines is not None:
+            self.hits += 1
+            return lines
+        self.misses += 1
+
+        words = text.split(" ")
+        lines = []
+        current_line = []
+
+        for word in words:
+            test_line = " ".join(current_line + [word])
+            if font.size(test_line)[0] <= max_width:
+                current_line.append(word)
+            else:
+                if current_line:
+                    lines.append(" ".join(current_line))
+                    current_line = [word]
+                else:
+                    lines.append(word)  # Word too long, add anyway
+
+        if current_line:
+            lines.append(" ".join(current_line))
+
+        return self._store(self.lines, key, tuple(lines))
+
+    def render(self, text, font, color):
+        """Return text rendered on one line (antialiased)."""
+        key = (text, font, color)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+        self.misses += 1
+        return self._store(self.surfaces, key, font.render(text, True, color))
+
+    def render_block(self, text, font, max_width, color, line_height=None):
+        """
+        Return text wrapped to max_width and composited into one surface.
+
+        Args:
+            text (str): Text to lay out
+            font (pygame.font.Font): Font to render with
+            max_width (int): Wrap width in pixels
+            color (tuple): Text colour
+            line_height (int): Distance between line tops, or None for the
+                font's line size
+
+        Returns:
+            pygame.Surface: Transparent surface holding every line
+        """
+        key = (text, font, max_width, color, line_height)
+        block = self.blocks.get(key)
+        if block is not None:
+            self.hits += 1
+            return block
+        self.misses += 1
+
+        lines = self.wrap(text, font, max_width)
+        step = line_height or font.get_linesize()
+        rendered = [self.render(line, font, color) for line in lines]
+        width = max((line.get_width() for line in rendered), default=0)
+        height = step * (len(rendered) - 1) + font.get_height() if rendered else 0
+
+        block = pygame.Surface((max(width, 1), max(height, 1)), pygame.SRCALPHA)
+        block.blits([(line, (0, i * step)) for i, line in enumerate(rendered)], False)
+        return self._store(self.blocks, key, block)
+
+    def clear(self):
+        """Drop every cached entry."""
+        self.lines.clear()
+        self.surfaces.clear()
+        self.blocks.clear()
+
+
+# Global text layout cache instance
+text_layout = TextLayoutCache()
@@ -6,11 +6,12 @@ such as health bar rendering, platform generation, and UI elements.
 """
 
 import pygame
-import random
 import array
 import math
 import os
 from config import *
+from random_streams import rng_streams
+from text_layout import get_font, text_layout
 
 
 def get_health_color(health, max_health):
@@ -72,7 +73,7 @@ def draw_labeled_health_bar(surface, x, y, health, max_health, label):
         label (str): Label text
     """
     draw_health_bar(surface, x, y, health, max_health)
-    font_label = pygame.font.SysFont(None, UI_LABEL_FONT_SIZE)
+    font_label = get_font(UI_LABEL_FONT_SIZE)
     text = f"{label}: {health}/{max_health}"
     text_surface = font_label.render(text, True, WHITE)
     surface.blit(text_surface, (x, y - 18))
@@ -90,7 +91,7 @@ def draw_x_above(surface, x, y, size):
     """
     center_x = x + size // 2
     top_y = y - 18
-    font_x = pygame.font.SysFont(None, 32)
+    font_x = get_font(32)
     x_surface = font_x.render("X", True, DARK_RED)
     surface.blit(x_surface, (center_x - x_surface.get_width() // 2, top_y))
 
@@ -107,9 +108,9 @@ def break_into_pieces(surface, x, y, size, color):
         color (tuple): Entity color
     """
     for _ in range(12):
-        piece_x = x + random.randint(0, size)
-        piece_y = y + random.randint(0, size)
-        piece_size = random.randint(4, 10)
+        piece_x = x + rng_streams.effects.randint(0, size)
+        piece_y = y + rng_streams.effects.randint(0, size)
+        piece_size = rng_streams.effects.randint(4, 10)
         pygame.draw.rect(surface, color, (piece_x, piece_y, piece_size, piece_size))
 
 
@@ -145,7 +146,7 @@ def draw_button(
     pygame.draw.rect(surface, button_color, button_rect)
     pygame.draw.rect(surface, border_color, button_rect, 2)
 
-    font_btn = pygame.font.SysFont(None, UI_BUTTON_FONT_SIZE)
+    font_btn = get_font(UI_BUTTON_FONT_SIZE)
     text_surface = font_btn.render(text, True, text_color)
     text_x = x + (width - text_surface.get_width()) // 2
     text_y = y + (height - text_surface.get_height()) // 2
@@ -168,9 +169,9 @@ def generate_random_platforms():
     max_attempts = PLATFORM_COUNT * 30
 
     while len(platforms) < PLATFORM_COUNT and attempts < max_attempts:
-        width = random.randint(PLATFORM_MIN_WIDTH, PLATFORM_MAX_WIDTH)
-        x = random.randint(0, WINDOW_WIDTH - width)
-        y = random.randint(80, WINDOW_HEIGHT - 120)
+        width = rng_streams.level.randint(PLATFORM_MIN_WIDTH, PLATFORM_MAX_WIDTH)
+        x = rng_streams.level.randint(0, WINDOW_WIDTH - width)
+        y = rng_streams.level.randint(80, WINDOW_HEIGHT - 120)
         new_platform = pygame.Rect(x, y, width, PLATFORM_HEIGHT)
 
         # Check for overlaps and minimum vertical gap
@@ -190,8 +191,8 @@ def generate_random_platforms():
 
     # If we couldn't generate enough platforms, add some at the bottom
     while len(platforms) < PLATFORM_COUNT:
-        width = random.randint(PLATFORM_MIN_WIDTH, PLATFORM_MAX_WIDTH)
-        x = random.randint(0, WINDOW_WIDTH - width)
+        width = rng_streams.level.randint(PLATFORM_MIN_WIDTH, PLATFORM_MAX_WIDTH)
+        x = rng_streams.level.randint(0, WINDOW_WIDTH - width)
         y = WINDOW_HEIGHT - PLATFORM_HEIGHT - 10
         new_platform = pygame.Rect(x, y, width, PLATFORM_HEIGHT)
 
@@ -223,16 +224,16 @@ def draw_weapon_info(surface, player, x_offset, y_offset):
         x_offset (int): X offset from player position
         y_offset (int): Y offset from player position
     """
-    font_reload = pygame.font.SysFont(None, UI_RELOAD_FONT_SIZE)
+    font_reload = get_font(UI_RELOAD_FONT_SIZE)
 
     # Draw weapon type
-    weapon_text = font_reload.render("Weapon: Blaster", True, WHITE)
+    weapon_text = text_layout.render("Weapon: Blaster", font_reload, WHITE)
     surface.blit(weapon_text, (player.x + x_offset, player.y + y_offset - 60))
 
     # Draw reloading status or ammo count
     if player.reloading:
-        reload_text = font_reload.render("Reloading...", True, DARK_RED)
+        reload_text = text_layout.render("Reloading...", font_reload, DARK_RED)
         surface.blit(reload_text, (player.x + x_offset, player.y + y_offset - 32))
     else:
-        mag_text = font_reload.render(f"Ammo: {player.magazine}", True, WHITE)
+        mag_text = text_layout.render(f"Ammo: {player.magazine}", font_reload, WHITE)
         surface.blit(mag_text, (player.x + x_offset, player.y + y_offset - 32))
@@ -9,6 +9,9 @@ import pygame
 import math
 import random
 from config import *
+from random_streams import rng_streams
+from quality_governor import quality_governor
+from effect_budget import budget_stats
 
 
 class Particle:
@@ -51,33 +54,84 @@ class Particle:
 
 
 class ParticleSystem:
-    """Manages all particle effects in the game."""
+    """
+    Manages all particle effects in the game.
+
+    Particles are kept per category (trail, smoke, debris, spark), each with
+    its own budget and a shared global budget; see _admit().
+    """
 
     def __init__(self):
-        self.particles = []
+        # Drawn in this order, so sparks end up on top
+        self.groups = {category: [] for category in PARTICLE_CATEGORY_BUDGETS}
+        # Lowest priority first: the order in which categories are evicted
+        self.eviction_order = sorted(self.groups, key=PARTICLE_PRIORITIES.get)
+
+    @property
+    def particles(self):
+        """All live particles, as one list."""
+        return [particle for group in self.groups.values() for particle in group]
+
+    def count(self):
+        """Return the number of live particles."""
+        return sum(len(group) for group in self.groups.values())
+
+    def _admit(self, category, requested):
+        """
+        Reserve room for up to requested new particles of a category.
+
+        The category's own budget is never exceeded. When the global budget
+        is full, the oldest particles of the lowest-priority categories (up
+        to the new particles' own priority) are evicted; whatever still does
+        not fit is rejected.
+
+        Returns:
+            int: Number of particles that may be spawned
+        """
+        group = self.groups[category]
+        allowed = max(
+            0, min(requested, PARTICLE_CATEGORY_BUDGETS[category] - len(group))
+        )
+        over = self.count() + allowed - PARTICLE_BUDGET
+        if over > 0:
+            priority = PARTICLE_PRIORITIES[category]
+            for victim in self.eviction_order:
+                if over <= 0 or PARTICLE_PRIORITIES[victim] > priority:
+                    break
+                victims = self.groups[victim]
+                evicted = min(over, len(victims))
+                if evicted:
+                    del victims[:evicted]
+                    budget_stats.evicted[victim] += evicted
+                    over -= evicted
+            if over > 0:
+                allowed -= over
+        if allowed < requested:
+            budget_stats.rejected[category] += requested - allowed
+        return allowed
 
     def add_explosion(self, x, y, color=(255, 100, 0), count=15):
         """Add explosion particle effect."""
-        for _ in range(count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(2, 8)
+        sparks = self.groups["spark"]
+        for _ in range(self._admit("spark", quality_governor.scaled(count))):
+            angle = rng_streams.effects.uniform(0, 2 * math.pi)
+            speed = rng_streams.effects.uniform(2, 8)
             velocity_x = math.cos(angle) * speed
             velocity_y = math.sin(angle) * speed
-            life = random.randint(20, 40)
-            size = random.randint(2, 4)
-            self.particles.append(
-                Particle(x, y, velocity_x, velocity_y, color, life, size)
-            )
+            life = rng_streams.effects.randint(20, 40)
+            size = rng_streams.effects.randint(2, 4)
+            sparks.append(Particle(x, y, velocity_x, velocity_y, color, life, size))
 
     def add_bullet_trail(self, x, y, velocity_x, velocity_y, color=(255, 255, 100)):
         """Add bullet trail effect."""
-        for _ in range(3):
-            offset_x = random.uniform(-2, 2)
-            offset_y = random.uniform(-2, 2)
-            trail_velocity_x = velocity_x * 0.3 + random.uniform(-1, 1)
-            trail_velocity_y = velocity_y * 0.3 + random.uniform(-1, 1)
-            life = random.randint(5, 15)
-            self.particles.append(
+        trails = self.groups["trail"]
+        for _ in range(self._admit("trail", quality_governor.trail_particles)):
+            offset_x = rng_streams.effects.uniform(-2, 2)
+            offset_y = rng_streams.effects.uniform(-2, 2)
+            trail_velocity_x = velocity_x * 0.3 + rng_streams.effects.uniform(-1, 1)
+            trail_velocity_y = velocity_y * 0.3 + rng_streams.effects.uniform(-1, 1)
+            life = rng_streams.effects.randint(5, 15)
+            trails.append(
                 Particle(
                     x + offset_x,
                     y + offset_y,
@@ -91,14 +145,17 @@ class ParticleSystem:
 
     def add_muzzle_flash(self, x, y, direction, color=(255, 255, 150)):
         """Add EXPLOSIVE muzzle flash effect to match the BOOM sound."""
+        sparks = self.groups["spark"]
+
         # MASSIVE main flash burst - much bigger and more intense
-        for _ in range(20):  # Increased from 12
-            angle = direction + random.uniform(-1.2, 1.2)  # Wider spread
-            speed = random.uniform(8, 18)  # Much faster
+        flashes = self._admit("spark", quality_governor.scaled(20))
+        for _ in range(flashes):  # Increased from 12
+            angle = direction + rng_streams.effects.uniform(-1.2, 1.2)  # Wider spread
+            speed = rng_streams.effects.uniform(8, 18)  # Much faster
             velocity_x = math.cos(angle) * speed
             velocity_y = math.sin(angle) * speed
-            life = random.randint(12, 25)  # Longer lasting
-            size = random.randint(4, 8)  # Much bigger particles
+            life = rng_streams.effects.randint(12, 25)  # Longer lasting
+            size = rng_streams.effects.randint(4, 8)  # Much bigger particles
 
             # EXPLOSIVE flash colors - brighter and more intense
             flash_colors = [
@@ -108,20 +165,22 @@ class ParticleSystem:
                 (255, 180, 80),  # Orange-yellow
                 (255, 255, 200),  # Bright flash
             ]
-            flash_color = random.choice(flash_colors)
+            flash_color = rng_streams.effects.choice(flash_colors)
 
-            self.particles.append(
+            sparks.append(
                 Particle(x, y, velocity_x, velocity_y, flash_color, life, size)
             )
 
         # EXPLOSIVE sparks - more numerous and faster
-        for _ in range(15):  # Increased from 8
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(12, 20)  # Much faster sparks
+        # (two particles per spark)
+        spark_count = self._admit("spark", 2 * quality_governor.scaled(15)) // 2
+        for _ in range(spark_count):  # Increased from 8
+            angle = rng_streams.effects.uniform(0, 2 * math.pi)
+            speed = rng_streams.effects.uniform(12, 20)  # Much faster sparks
             velocity_x = math.cos(angle) * speed
             velocity_y = math.sin(angle) * speed
-            life = random.randint(8, 18)  # Longer lasting
-            size = random.randint(2, 4)  # Bigger sparks
+            life = rng_streams.effects.randint(8, 18)  # Longer lasting
+            size = rng_streams.effects.randint(2, 4)  # Bigger sparks
 
             # EXPLOSIVE spark colors - brighter and more varied
             spark_colors = [
@@ -131,25 +190,26 @@ class ParticleSystem:
                 (255, 80, 0),  # Deep orange
                 (255, 255, 100),  # Bright yellow
             ]
-            spark_color = random.choice(spark_colors)
+            spark_color = rng_streams.effects.choice(spark_colors)
 
-            self.particles.append(
+            sparks.append(
                 Particle(x, y, velocity_x, velocity_y, spark_color, life, size)
             )
-            spark_color = random.choice(spark_colors)
+            spark_color = rng_streams.effects.choice(spark_colors)
 
-            self.particles.append(
+            sparks.append(
                 Particle(x, y, velocity_x, velocity_y, spark_color, life, size)
             )
 
         # Add smoke particles for realism
-        for _ in range(6):
-            angle = direction + random.uniform(-0.5, 0.5)
-            speed = random.uniform(1, 3)
+        smoke = self.groups["smoke"]
+        for _ in range(self._admit("smoke", quality_governor.scaled(6))):
+            angle = direction + rng_streams.effects.uniform(-0.5, 0.5)
+            speed = rng_streams.effects.uniform(1, 3)
             velocity_x = math.cos(angle) * speed
             velocity_y = math.sin(angle) * speed - 1  # Slight upward drift
-            life = random.randint(20, 35)
-            size = random.randint(2, 4)
+            life = rng_streams.effects.randint(20, 35)
+            size = rng_streams.effects.randint(2, 4)
 
             # Smoke colors (grays)
             smoke_colors = [
@@ -157,46 +217,63 @@ class ParticleSystem:
                 (150, 150, 150),  # Medium gray
                 (80, 80, 80),  # Darker gray
             ]
-            smoke_color = random.choice(smoke_colors)
+            smoke_color = rng_streams.effects.choice(smoke_colors)
 
-            self.particles.append(
+            smoke.append(
                 Particle(x, y, velocity_x, velocity_y, smoke_color, life, size)
             )
 
     def add_blood_splatter(self, x, y, color=(150, 0, 0)):
         """Add blood splatter effect."""
-        for _ in range(8):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(1, 4)
+        debris = self.groups["debris"]
+        for _ in range(self._admit("debris", 8)):
+            angle = rng_streams.effects.uniform(0, 2 * math.pi)
+            speed = rng_streams.effects.uniform(1, 4)
             velocity_x = math.cos(angle) * speed
             velocity_y = math.sin(angle) * speed - 2  # Upward bias
-            life = random.randint(15, 30)
-            size = random.randint(1, 2)
-            self.particles.append(
-                Particle(x, y, velocity_x, velocity_y, color, life, size)
-            )
+            life = rng_streams.effects.randint(15, 30)
+            size = rng_streams.effects.randint(1, 2)
+            debris.append(Particle(x, y, velocity_x, velocity_y, color, life, size))
 
     def add_jump_dust(self, x, y, color=(200, 180, 120)):
         """Add dust effect when jumping/landing."""
-        for _ in range(6):
-            velocity_x = random.uniform(-3, 3)
-            velocity_y = random.uniform(-2, 0)
-            life = random.randint(10, 20)
-            size = random.randint(1, 2)
-            self.particles.append(
-                Particle(x, y, velocity_x, velocity_y, color, life, size)
-            )
+        debris = self.groups["debris"]
+        for _ in range(self._admit("debris", 6)):
+            velocity_x = rng_streams.effects.uniform(-3, 3)
+            velocity_y = rng_streams.effects.uniform(-2, 0)
+            life = rng_streams.effects.randint(10, 20)
+            size = rng_streams.effects.randint(1, 2)
+            debris.append(Particle(x, y, velocity_x, velocity_y, color, life, size))
+
+    def apply_frame_events(self, events):
+        """Spawn the particle presets requested by this frame's events."""
+        for event in events:
+            preset = event.particles
+            if preset is None:
+                continue
+            if preset == "blood":
+                self.add_blood_splatter(event.x, event.y)
+            elif preset == "sparks":
+                self.add_explosion(event.x, event.y, event.particle_color, 8)
+            elif preset == "explosion":
+                self.add_explosion(event.x, event.y, event.particle_color)
+            elif preset == "muzzle_flash":
+                self.add_muzzle_flash(event.x, event.y, event.angle)
+            elif preset == "jump_dust":
+                self.add_jump_dust(event.x, event.y)
 
     def update(self):
         """Update all particles and remove dead ones."""
-        self.particles = [p for p in self.particles if p.life > 0]
-        for particle in self.particles:
-            particle.update()
+        for group in self.groups.values():
+            group[:] = [p for p in group if p.life > 0]
+            for particle in group:
+                particle.update()
 
     def draw(self, screen):
         """Draw all particles."""
-        for particle in self.particles:
-            particle.draw(screen)
+        for group in self.groups.values():
+            for particle in group:
+                particle.draw(screen)
 
 
 class ScreenEffects:
@@ -220,11 +297,35 @@ class ScreenEffects:
         self.flash_intensity = max(self.flash_intensity, intensity)
         self.flash_duration = max(self.flash_duration, duration)
 
+    def apply_frame_events(self, events):
+        """
+        Apply this frame's shake and flash requests as a single shake at the
+        strongest intensity and the single strongest flash.
+        """
+        shake_intensity = 0
+        shake_duration = 0
+        flash = None
+        for event in events:
+            if event.shake:
+                shake_intensity = max(shake_intensity, event.shake[0])
+                shake_duration = max(shake_duration, event.shake[1])
+            if event.flash and (flash is None or event.flash[1] > flash[1]):
+                flash = event.flash
+
+        if shake_intensity:
+            self.add_screen_shake(shake_intensity, shake_duration)
+        if flash:
+            self.add_screen_flash(*flash)
+
     def get_screen_offset(self):
         """Get current screen shake offset."""
         if self.shake_duration > 0:
-            offset_x = random.randint(-self.shake_intensity, self.shake_intensity)
-            offset_y = random.randint(-self.shake_intensity, self.shake_intensity)
+            offset_x = rng_streams.effects.randint(
+                -self.shake_intensity, self.shake_intensity
+            )
+            offset_y = rng_streams.effects.randint(
+                -self.shake_intensity, self.shake_intensity
+            )
             return offset_x, offset_y
         return 0, 0
 
@@ -250,6 +351,178 @@ class ScreenEffects:
             screen.blit(flash_surface, (0, 0))
 
 
+class LightningBoltLibrary:
+    """
+    Pre-generated lightning bolt shapes rendered to glowing stamps.
+
+    Bolts are fractal (midpoint displacement) polylines normalised to unit
+    length, generated once for several segment counts. Drawing a bolt picks
+    one shape, and blits a stamp rotated and scaled to the bolt's endpoints;
+    transformed stamps are cached by quantised angle and length, so many
+    simultaneous bolts cost a handful of blits.
+    """
+
+    STAMP_LENGTH = 256  # Reference bolt length of the untransformed stamps
+    STAMP_PAD = 6  # Room for the glow around the bolt
+    ANGLE_STEPS = 64  # Rotation quantisation (~5.6 degrees)
+    LENGTH_STEP = 8  # Length quantisation in pixels
+    MAX_TRANSFORMS = 256  # Transformed stamps kept in the cache
+
+    def __init__(self, segment_counts=(4, 8, 16), variants=6, seed=1977):
+        """
+        Args:
+            segment_counts (tuple): Segment counts to generate (powers of 2)
+            variants (int): Shapes generated per segment count
+            seed (int): Seed for the shape generator, so the library is
+                identical every run and never touches gameplay randomness
+        """
+        self.segment_counts = segment_counts
+        self.variants = variants
+        self.seed = seed
+        self.shapes = None  # segment count -> list of (main points, branches)
+        self.stamps = {}  # (segments, variant, color) -> Surface
+        self.transforms = {}  # (segments, variant, color, angle, length) -> Surface
+
+    def _generate_shapes(self):
+        """Build every bolt shape in unit space, from (0, 0) to (1, 0)."""
+        rng = random.Random(self.seed)
+        self.shapes = {}
+        for segments in self.segment_counts:
+            shapes = []
+            for _ in range(self.variants):
+                points = self._fractal_polyline(rng, segments, 0.18)
+                branches = []
+                # Fork off a short branch from a couple of interior points
+                for _ in range(max(1, segments // 8)):
+                    index = rng.randint(1, segments - 1)
+                    start_x, start_y = points[index]
+                    length = rng.uniform(0.15, 0.3)
+                    angle = rng.choice((-1, 1)) * rng.uniform(0.4, 0.9)
+                    branch = self._fractal_polyline(rng, max(2, segments // 4), 0.2)
+                    branches.append(
+                        [
+                            (
+                                start_x
+                                + (x * math.cos(angle) - y * math.sin(angle)) * length,
+                                start_y
+                                + (x * math.sin(angle) + y * math.cos(angle)) * length,
+                            )
+                            for x, y in branch
+                        ]
+                    )
+                shapes.append((points, branches))
+            self.shapes[segments] = shapes
+
+    @staticmethod
+    def _fractal_polyline(rng, segments, roughness):
+        """Midpoint-displace a unit segment into the given number of segments."""
+        points = [(0.0, 0.0), (1.0, 0.0)]
+        displacement = roughness
+        while len(points) - 1 < segments:
+            refined = [points[0]]
+            for (x1, y1), (x2, y2) in zip(points, points[1:]):
+                mid_y = (y1 + y2) / 2 + rng.uniform(-displacement, displacement)
+                refined.append(((x1 + x2) / 2, mid_y))
+                refined.append((x2, y2))
+            points = refined
+            displacement /= 2
+        return points
+
+    def _get_stamp(self, segments, variant, color):
+        """Render (once) the glowing stamp of one shape in one colour."""
+        key = (segments, variant, color)
+        stamp = self.stamps.get(key)
+        if stamp is not None:
+            return stamp
+
+        length = self.STAMP_LENGTH
+        pad = self.STAMP_PAD
+        points, branches = self.shapes[segments][variant]
+        polylines = [points] + branches
+
+        # Size the stamp tightly but symmetric about the bolt's midpoint, so
+        # rotating it keeps the midpoint at the centre of the image
+        all_points = [point for polyline in polylines for point in polyline]
+        half_width = max(abs(x - 0.5) for x, _ in all_points) * length + pad
+        half_height = max(abs(y) for _, y in all_points) * length + pad
+        half_width = int(math.ceil(half_width))
+        half_height = int(math.ceil(half_height))
+        stamp = pygame.Surface((2 * half_width, 2 * half_height), pygame.SRCALPHA)
+        core_color = tuple(min(255, c + 80) for c in color)
+        # Wide faint glow, then a narrower brighter one, then the core
+        for width, line_color in (
+            (7, (*color, 50)),
+            (4, (*color, 110)),
+            (2, (*core_color, 255)),
+        ):
+            for polyline in polylines:
+                scaled = [
+                    (half_width + (x - 0.5) * length, half_height + y * length)
+                    for x, y in polyline
+                ]
+                pygame.draw.lines(stamp, line_color, False, scaled, width)
+
+        self.stamps[key] = stamp
+        return stamp
+
+    def draw_bolt(self, surface, start, end, color, variant=None):
+        """
+        Draw a lightning bolt between two points.
+
+        Args:
+            surface (pygame.Surface): Surface to draw on
+            start (tuple): Bolt start point
+            end (tuple): Bolt end point
+            color (tuple): RGB bolt colour
+            variant (int): Shape to use, or None to pick one at random so the
+                bolt flickers from frame to frame
+        """
+        if self.shapes is None:
+            self._generate_shapes()
+
+        dx = end[0] - start[0]
+        dy = end[1] - start[1]
+        length = math.hypot(dx, dy)
+        if length < 1:
+            return
+
+        # Longer bolts get more segments so their detail looks consistent
+        segments = self.segment_counts[0]
+        for count in self.segment_counts:
+            if length >= count * 12:
+                segments = count
+        if variant is None:
+            variant = rng_streams.effects.randrange(self.variants)
+        variant %= self.variants
+
+        angle_step = round(math.atan2(dy, dx) / (2 * math.pi) * self.ANGLE_STEPS)
+        angle_step %= self.ANGLE_STEPS
+        length_step = max(1, round(length / self.LENGTH_STEP))
+        key = (segments, variant, color, angle_step, length_step)
+
+        image = self.transforms.get(key)
+        if image is None:
+            stamp = self._get_stamp(segments, variant, color)
+            degrees = -angle_step * 360 / self.ANGLE_STEPS
+            scale = length_step * self.LENGTH_STEP / self.STAMP_LENGTH
+            image = pygame.transform.rotozoom(stamp, degrees, scale)
+            if len(self.transforms) >= self.MAX_TRANSFORMS:
+                # Drop the oldest entry
+                del self.transforms[next(iter(self.transforms))]
+            self.transforms[key] = image
+
+        # Stamps are centred on the bolt's midpoint
+        center_x = (start[0] + end[0]) / 2
+        center_y = (start[1] + end[1]) / 2
+        surface.blit(
+            image,
+            (
+                int(center_x - image.get_width() / 2),
+                int(center_y - image.get_height() / 2),
+            ),
+        )
+
+
 class EnhancedRenderer:
     """Enhanced rendering system with gradients, shadows, and improved visuals."""
 
@@ -300,14 +573,30 @@ class EnhancedRenderer:
         pygame.draw.rect(screen, color, rect)
 
     @staticmethod
-    def draw_health_bar_enhanced(screen, x, y, width, height, health, max_health):
-        """Draw an enhanced health bar with gradient and glow."""
+    def draw_health_bar_enhanced(
+        screen,
+        x,
+        y,
+        width,
+        height,
+        health,
+        max_health,
+        bar_color=None,
+        bg_color=DARK_GRAY,
+    ):
+        """
+        Draw an enhanced health bar with gradient and glow.
+
+        Args:
+            bar_color (tuple): Fixed fill colour, or None to colour by health
+            bg_color (tuple): Colour of the empty part of the bar
+        """
         # Background
         bg_rect = pygame.Rect(x - 2, y - 2, width + 4, height + 4)
         pygame.draw.rect(screen, BLACK, bg_rect)
 
         # Health bar background
-        pygame.draw.rect(screen, DARK_GRAY, (x, y, width, height))
+        pygame.draw.rect(screen, bg_color, (x, y, width, height))
 
         # Health bar fill
         health_width = int(width * (health / max_health))
@@ -315,7 +604,10 @@ class EnhancedRenderer:
             health_rect = pygame.Rect(x, y, health_width, height)
 
             # Choose color based on health
-            if health / max_health > 0.7:
+            if bar_color is not None:
+                top_color = bar_color
+                bottom_color = tuple(int(c * 0.8) for c in bar_color)
+            elif health / max_health > 0.7:
                 top_color = (0, 255, 0)
                 bottom_color = (0, 200, 0)
             elif health / max_health > 0.3:
@@ -336,3 +628,4 @@ class EnhancedRenderer:
 # Global instances for easy access
 particle_system = ParticleSystem()
 screen_effects = ScreenEffects()
+lightning_bolts = LightningBoltLibrary()
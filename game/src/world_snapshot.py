@@ -0,0 +1,946 @@
+"""
+World Snapshot
+
+Compact, versioned binary serialisation of the complete world state of a
+GameEngine: fighters, bullets, Force power cooldowns, effects and thrown
+lightsabers, lightsaber attacks, blocks and clashes, game mode data and
+(optionally) the random streams. Snapshots are plain bytes, so
+they can be written as crash dumps, kept alongside replays, or sent over
+the network; decode_world puts one back into an engine, either into the
+match it was taken from or into a freshly started one.
+
+Numbers are stored as doubles, so floats survive exactly; each record
+carries a mask of which of its numbers were ints, so restored values
+have the same type (and repr, which simulation checksums hash) as the
+saved ones. Strings that only take a few values (character types,
+weapons, AI combat modes) are stored as indices into fixed tables, and
+references between objects (the attacker of a lightsaber attack, the
+owner of a thrown saber) as indices into the fighter table. Profile text
+(names, descriptions, special abilities) and held keys are not stored:
+they come with the match setup and do not affect the simulation.
+
+WorldView reads a snapshot in place through memoryviews, for tools that
+only look at a few fields (e.g. fighter positions of a crash dump)
+without building any objects.
+
+Layout (little endian):
+    magic "SWWS" | version u16 | flags u16 | match seed u64 | tick u32
+    sections, each: id u8 | length u32 | body
+
+Sections:
+    SETUP       match setup (JSON, as stored in replay files)
+    ENGINE      tick u32 | mouse x, y i16 | bullet timer, interval i32 |
+                exploded bits u8 | fresh deaths, last health, damage log
+                (tagged values)
+    FIGHTERS    count u8 | fighter record * count (player1, player2,
+                enemy, then enemies living in the mode data)
+    BULLETS     count u16 | bullet record * count
+    FORCE       cooldown count u8 | (int flag u8, cooldown f64) * count |
+                usage count u16 | (fighter u8, power u8, uses u32) * count |
+                effect count u16 | effect record * count |
+                projectile count u16 | projectile record * count
+    LIGHTSABER  attack count u16 | (attack record | trail (x, y f64) *
+                trail count) * count | block count u8 | block record *
+                count | clash count u8 | clash record * count
+    MODE        mode name, mode timer, mode data (tagged values)
+    RANDOM      count u8 | (stream u8 | version u8 | gauss flag u8 |
+                gauss f64 | state u32 * 625) * count
+"""
+
+import json
+import struct
+from collections import Counter
+
+import pygame
+from config import *
+from entities import Player, Enemy, Bullet
+from random_streams import rng_streams, STREAM_NAMES
+from sim_state import GAMEPLAY_STREAMS
+
+# Force and lightsaber systems are optional, as in the engine
+try:
+    from force_powers import (
+        ForceEffect,
+        ForceWave,
+        LightningArc,
+        HealParticle,
+        LightsaberProjectile,
+    )
+    from lightsaber_combat import LightsaberAttack, LightsaberBlock, LightsaberClash
+except ImportError:
+    ForceEffect = None
+
+SNAPSHOT_MAGIC = b"SWWS"
+SNAPSHOT_VERSION = 1
+
+# Header flags
+FLAG_RANDOM_STATE = 1  # The RANDOM section is present
+
+# Section ids
+SECTION_SETUP = 1
+SECTION_ENGINE = 2
+SECTION_FIGHTERS = 3
+SECTION_BULLETS = 4
+SECTION_FORCE = 5
+SECTION_LIGHTSABER = 6
+SECTION_MODE = 7
+SECTION_RANDOM = 8
+
+# Fighter classes
+FIGHTER_NONE = 0
+FIGHTER_PLAYER = 1
+FIGHTER_ENEMY = 2
+
+# Reference to no fighter
+NO_FIGHTER = 255
+
+# Random streams stored in the RANDOM section: the gameplay streams, and the
+# effects stream so visual effects also continue as they would have (the
+# level stream is only drawn from while a match is set up)
+RANDOM_STREAMS = GAMEPLAY_STREAMS + ("effects",)
+
+# Tables of the strings stored as indices
+CHARACTER_TYPES = ("jedi", "sith", "soldier")
+FIGHTER_STYLES = (WEAPON_BLASTER, "ranged", "melee", "force")  # Weapon or AI mode
+ATTACK_TYPES = ("slash",)
+POWER_NAMES = ("force_push", "lightsaber_throw", "force_heal", "force_lightning")
+
+# Boolean fighter attributes, in flag bit order (the last three only exist
+# on fighters the game mode restricted)
+FIGHTER_FLAGS = (
+    "is_jumping",
+    "facing_right",
+    "is_blocking",
+    "reloading",
+    "blaster_disabled",
+    "force_disabled",
+    "weapons_disabled",
+)
+
+# Numeric fighter attributes, for players and enemies alike (the ones a
+# class lacks are stored as 0 and not restored)
+FIGHTER_NUMBERS = (
+    "x",
+    "y",
+    "size",
+    "velocity_y",
+    "health",
+    "max_health",
+    "speed",
+    "max_force_energy",
+    "force_energy",
+    "force_regen_rate",
+    "force_power_bonus",
+    "lightsaber_cooldown",
+    "lightsaber_damage_bonus",
+    "stunned",
+    "knockback_timer",
+    "knockback_dx",
+    "knockback_dy",
+    "player_id",
+    "magazine",
+    "reload_timer",
+    "blaster_cooldown",
+    "jump_timer",
+    "jump_interval",
+    "force_power_timer",
+)
+
+# Field names of the records WorldView yields
+FIGHTER_FIELDS = (
+    "fighter_class",
+    "character_type",
+    "style",
+    "flags",
+    "int_mask",
+    "red",
+    "green",
+    "blue",
+    "rect_x",
+    "rect_y",
+    "rect_width",
+    "rect_height",
+) + FIGHTER_NUMBERS
+BULLET_NUMBERS = ("x", "y", "dx", "prev_x", "width", "height", "damage")
+BULLET_FIELDS = (
+    "owner_id",
+    "int_mask",
+    "red",
+    "green",
+    "blue",
+    "rect_x",
+    "rect_y",
+    "rect_width",
+    "rect_height",
+) + BULLET_NUMBERS
+
+_HEADER = struct.Struct("<4sHHQI")
+_SECTION = struct.Struct("<BI")
+_COUNT8 = struct.Struct("<B")
+_COUNT16 = struct.Struct("<H")
+_ENGINE = struct.Struct("<IhhiiB")
+_FIGHTER = struct.Struct("<BBBBI3B4i%dd" % len(FIGHTER_NUMBERS))
+_BULLET = struct.Struct("<BB3B4i%dd" % len(BULLET_NUMBERS))
+_COOLDOWN = struct.Struct("<Bd")
+_USAGE = struct.Struct("<BBI")
+_EFFECT = struct.Struct("<BB3B5d")
+_PROJECTILE = struct.Struct("<BB3B8d")
+_ATTACK = struct.Struct("<BBIB3BB7d")
+_TRAIL_POINT = struct.Struct("<dd")
+_BLOCK = struct.Struct("<BB3B5d")
+_CLASH = struct.Struct("<BBB5d")
+_STREAM = struct.Struct("<BBBd")
+_STREAM_STATE = struct.Struct("<625I")  # Mersenne Twister words and index
+_EMPTY_FIGHTER = _FIGHTER.pack(FIGHTER_NONE, *([0] * (len(FIGHTER_FIELDS) - 1)))
+
+# Tags of the self-describing values used for mode data
+TAG_NONE = 0
+TAG_FALSE = 1
+TAG_TRUE = 2
+TAG_INT = 3
+TAG_FLOAT = 4
+TAG_STR = 5
+TAG_LIST = 6
+TAG_TUPLE = 7
+TAG_DICT = 8
+TAG_RECT = 9
+TAG_FIGHTER = 10
+
+_TAG = struct.Struct("<B")
+_INT = struct.Struct("<q")
+_FLOAT = struct.Struct("<d")
+_RECT = struct.Struct("<4i")
+
+# Force effect classes, stored as an index into this tuple
+if ForceEffect is not None:
+    EFFECT_CLASSES = (ForceEffect, ForceWave, LightningArc, HealParticle)
+else:
+    EFFECT_CLASSES = ()
+
+
+def _int_mask(values):
+    """Return a bit mask of which values are ints (restored as ints)."""
+    mask = 0
+    for bit, value in enumerate(values):
+        if type(value) is int:
+            mask |= 1 << bit
+    return mask
+
+
+def _typed(values, mask):
+    """Undo the double conversion for the values flagged in an int mask."""
+    return [
+        int(value) if mask >> bit & 1 else value for bit, value in enumerate(values)
+    ]
+
+
+def _ref(fighters, entity):
+    """Return the fighter table index of an entity (NO_FIGHTER for None)."""
+    if entity is None:
+        return NO_FIGHTER
+    for index, fighter in enumerate(fighters):
+        if fighter is entity:
+            return index
+    raise ValueError(f"{type(entity).__name__} is not in the fighter table")
+
+
+def _fighter(fighters, index):
+    return None if index == NO_FIGHTER else fighters[index]
+
+
+def _write_value(out, value, fighters):
+    """Append a self-describing (tagged) value to out."""
+    value_type = type(value)
+    if value is None:
+        out += _TAG.pack(TAG_NONE)
+    elif value_type is bool:
+        out += _TAG.pack(TAG_TRUE if value else TAG_FALSE)
+    elif value_type is int:
+        out += _TAG.pack(TAG_INT)
+        out += _INT.pack(value)
+    elif value_type is float:
+        out += _TAG.pack(TAG_FLOAT)
+        out += _FLOAT.pack(value)
+    elif value_type is str:
+        encoded = value.encode("utf-8")
+        out += _TAG.pack(TAG_STR)
+        out += _COUNT16.pack(len(encoded))
+        out += encoded
+    elif value_type is list or value_type is tuple:
+        out += _TAG.pack(TAG_LIST if value_type is list else TAG_TUPLE)
+        out += _COUNT16.pack(len(value))
+        for item in value:
+            _write_value(out, item, fighters)
+    elif value_type is dict or value_type is Counter:
+        out += _TAG.pack(TAG_DICT)
+        out += _COUNT16.pack(len(value))
+        for key, item in value.items():
+            _write_value(out, key, fighters)
+            _write_value(out, item, fighters)
+    elif value_type is pygame.Rect:
+        out += _TAG.pack(TAG_RECT)
+        out += _RECT.pack(value.x, value.y, value.width, value.height)
+    elif value_type is Player or value_type is Enemy:
+        out += _TAG.pack(TAG_FIGHTER)
+        out += _COUNT8.pack(_ref(fighters, value))
+    else:
+        raise TypeError(f"Cannot store {value_type.__name__} in a world snapshot")
+
+
+def _read_value(data, offset, fighters):
+    """Read a tagged value. Returns (value, offset after it)."""
+    (tag,) = _TAG.unpack_from(data, offset)
+    offset += _TAG.size
+    if tag == TAG_NONE:
+        return None, offset
+    if tag == TAG_FALSE or tag == TAG_TRUE:
+        return tag == TAG_TRUE, offset
+    if tag == TAG_INT:
+        return _INT.unpack_from(data, offset)[0], offset + _INT.size
+    if tag == TAG_FLOAT:
+        return _FLOAT.unpack_from(data, offset)[0], offset + _FLOAT.size
+    if tag == TAG_STR:
+        (length,) = _COUNT16.unpack_from(data, offset)
+        offset += _COUNT16.size
+        return str(data[offset : offset + length], "utf-8"), offset + length
+    if tag == TAG_LIST or tag == TAG_TUPLE:
+        (count,) = _COUNT16.unpack_from(data, offset)
+        offset += _COUNT16.size
+        items = []
+        for _ in range(count):
+            item, offset = _read_value(data, offset, fighters)
+            items.append(item)
+        return (items if tag == TAG_LIST else tuple(items)), offset
+    if tag == TAG_DICT:
+        (count,) = _COUNT16.unpack_from(data, offset)
+        offset += _COUNT16.size
+        items = {}
+        for _ in range(count):
+            key, offset = _read_value(data, offset, fighters)
+            items[key], offset = _read_value(data, offset, fighters)
+        return items, offset
+    if tag == TAG_RECT:
+        return pygame.Rect(_RECT.unpack_from(data, offset)), offset + _RECT.size
+    if tag == TAG_FIGHTER:
+        (index,) = _COUNT8.unpack_from(data, offset)
+        return _fighter(fighters, index), offset + _COUNT8.size
+    raise ValueError(f"Unknown world snapshot value tag: {tag}")
+
+
+def _mode_enemies(value, found):
+    """Collect the enemies living in (nested) mode data, in order."""
+    value_type = type(value)
+    if value_type is dict:
+        for item in value.values():
+            _mode_enemies(item, found)
+    elif value_type is list or value_type is tuple:
+        for item in value:
+            _mode_enemies(item, found)
+    elif value_type is Enemy and not any(value is enemy for enemy in found):
+        found.append(value)
+    return found
+
+
+def fighter_table(engine):
+    """
+    Return the fighters a snapshot of the engine stores, in record order.
+
+    Args:
+        engine (GameEngine): The engine
+
+    Returns:
+        list: player1, player2 and enemy (None when absent), then the
+            enemies held in the game mode data
+    """
+    fighters = [engine.player1, engine.player2, engine.enemy]
+    manager = getattr(engine, "game_mode_manager", None)
+    if manager is not None:
+        _mode_enemies(manager.mode_data, fighters)
+    return fighters
+
+
+def _pack_fighter(fighter):
+    """Pack a Player or Enemy (or None) into a fighter record."""
+    if fighter is None:
+        return _EMPTY_FIGHTER
+    flags = 0
+    for bit, name in enumerate(FIGHTER_FLAGS):
+        if getattr(fighter, name, False):
+            flags |= 1 << bit
+    if type(fighter) is Enemy:
+        fighter_class = FIGHTER_ENEMY
+        style = fighter.combat_mode
+    else:
+        fighter_class = FIGHTER_PLAYER
+        style = fighter.weapon
+    numbers = [getattr(fighter, name, 0) for name in FIGHTER_NUMBERS]
+    rect = fighter.rect
+    return _FIGHTER.pack(
+        fighter_class,
+        CHARACTER_TYPES.index(fighter.character_type),
+        FIGHTER_STYLES.index(style),
+        flags,
+        _int_mask(numbers),
+        *fighter.color,
+        rect.x,
+        rect.y,
+        rect.width,
+        rect.height,
+        *numbers,
+    )
+
+
+def _restore_fighter(fighter, record):
+    """Put the values of a fighter record into a Player or Enemy."""
+    flags, mask = record[3], record[4]
+    fighter.character_type = CHARACTER_TYPES[record[1]]
+    style = FIGHTER_STYLES[record[2]]
+    if type(fighter) is Enemy:
+        fighter.combat_mode = style
+    else:
+        fighter.weapon = style
+    for bit, name in enumerate(FIGHTER_FLAGS):
+        if flags >> bit & 1 or hasattr(fighter, name):
+            setattr(fighter, name, bool(flags >> bit & 1))
+    fighter.color = record[5:8]
+    fighter.rect = pygame.Rect(record[8:12])
+    numbers = _typed(record[12:], mask)
+    for name, value in zip(FIGHTER_NUMBERS, numbers):
+        if hasattr(fighter, name):
+            setattr(fighter, name, value)
+
+
+def _new_fighter(record):
+    """Create the Player or Enemy a fighter record describes."""
+    x, y = record[12], record[13]
+    character_type = CHARACTER_TYPES[record[1]]
+    if record[0] == FIGHTER_ENEMY:
+        return Enemy(x, y, character_type)
+    player_id = int(record[12 + FIGHTER_NUMBERS.index("player_id")])
+    return Player(x, y, player_id, character_type)
+
+
+def _pack_bullet(bullet):
+    numbers = (
+        bullet.x,
+        bullet.y,
+        bullet.dx,
+        bullet.prev_x,
+        bullet.width,
+        bullet.height,
+        bullet.damage,
+    )
+    rect = bullet.rect
+    return _BULLET.pack(
+        bullet.owner_id,
+        _int_mask(numbers),
+        *bullet.color,
+        rect.x,
+        rect.y,
+        rect.width,
+        rect.height,
+        *numbers,
+    )
+
+
+def _new_bullet(record):
+    x, y, dx, prev_x, width, height, damage = _typed(record[9:], record[1])
+    bullet = Bullet(x, y, dx, record[0])
+    bullet.prev_x = prev_x
+    bullet.width = width
+    bullet.height = height
+    bullet.damage = damage
+    bullet.color = record[2:5]
+    bullet.rect = pygame.Rect(record[5:9])
+    return bullet
+
+
+def _force_section(force_manager, fighters):
+    out = bytearray()
+    powers = [*force_manager.jedi_powers.values(), *force_manager.sith_powers.values()]
+    out += _COUNT8.pack(len(powers))
+    for power in powers:
+        cooldown = power.current_cooldown
+        out += _COOLDOWN.pack(type(cooldown) is int, cooldown)
+
+    out += _COUNT16.pack(len(force_manager.usage))
+    for (user, power_name), uses in force_manager.usage.items():
+        out += _USAGE.pack(_ref(fighters, user), POWER_NAMES.index(power_name), uses)
+
+    out += _COUNT16.pack(len(force_manager.active_effects))
+    for effect in force_manager.active_effects:
+        numbers = (
+            effect.x,
+            effect.y,
+            getattr(effect, "target_x", 0),
+            getattr(effect, "target_y", 0),
+            effect.duration,
+        )
+        out += _EFFECT.pack(
+            EFFECT_CLASSES.index(type(effect)),
+            _int_mask(numbers),
+            *effect.color,
+            *numbers,
+        )
+
+    out += _COUNT16.pack(len(force_manager.active_projectiles))
+    for projectile in force_manager.active_projectiles:
+        numbers = (
+            projectile.x,
+            projectile.y,
+            projectile.dx,
+            projectile.dy,
+            projectile.angle,
+            projectile.rotation_speed,
+            projectile.damage,
+            projectile.duration,
+        )
+        out += _PROJECTILE.pack(
+            _ref(fighters, projectile.owner),
+            _int_mask(numbers),
+            *projectile.color,
+            *numbers,
+        )
+    return out
+
+
+def _restore_force(force_manager, data, fighters):
+    offset = 0
+    (count,) = _COUNT8.unpack_from(data, offset)
+    offset += _COUNT8.size
+    powers = [*force_manager.jedi_powers.values(), *force_manager.sith_powers.values()]
+    for power in powers[:count]:
+        is_int, cooldown = _COOLDOWN.unpack_from(data, offset)
+        offset += _COOLDOWN.size
+        power.current_cooldown = int(cooldown) if is_int else cooldown
+
+    (count,) = _COUNT16.unpack_from(data, offset)
+    offset += _COUNT16.size
+    usage = force_manager.usage
+    usage.clear()
+    for _ in range(count):
+        user, power, uses = _USAGE.unpack_from(data, offset)
+        offset += _USAGE.size
+        usage[_fighter(fighters, user), POWER_NAMES[power]] = uses
+
+    (count,) = _COUNT16.unpack_from(data, offset)
+    offset += _COUNT16.size
+    effects = []
+    for _ in range(count):
+        record = _EFFECT.unpack_from(data, offset)
+        offset += _EFFECT.size
+        effect_class = EFFECT_CLASSES[record[0]]
+        x, y, target_x, target_y, duration = _typed(record[5:], record[1])
+        effect = effect_class.__new__(effect_class)
+        effect.x = x
+        effect.y = y
+        effect.color = record[2:5]
+        effect.duration = duration
+        if hasattr(effect_class, "target_x"):
+            effect.target_x = target_x
+            effect.target_y = target_y
+        effects.append(effect)
+    force_manager.active_effects = effects
+
+    (count,) = _COUNT16.unpack_from(data, offset)
+    offset += _COUNT16.size
+    projectiles = []
+    for _ in range(count):
+        record = _PROJECTILE.unpack_from(data, offset)
+        offset += _PROJECTILE.size
+        x, y, dx, dy, angle, rotation_speed, damage, duration = _typed(
+            record[5:], record[1]
+        )
+        projectile = LightsaberProjectile(
+            x, y, dx, dy, damage, _fighter(fighters, record[0]), record[2:5], duration
+        )
+        projectile.angle = angle
+        projectile.rotation_speed = rotation_speed
+        projectiles.append(projectile)
+    force_manager.active_projectiles = projectiles
+
+
+def _lightsaber_section(combat, fighters):
+    out = bytearray()
+    out += _COUNT16.pack(len(combat.active_attacks))
+    for attack in combat.active_attacks:
+        hit_mask = 0
+        for index, fighter in enumerate(fighters):
+            if fighter is not None and fighter in attack.hit_entities:
+                hit_mask |= 1 << index
+        numbers = (
+            attack.direction,
+            attack.damage,
+            attack.range,
+            attack.duration,
+            attack.current_frame,
+            attack.dir_x,
+            attack.dir_y,
+        )
+        out += _ATTACK.pack(
+            _ref(fighters, attack.attacker),
+            ATTACK_TYPES.index(attack.attack_type),
+            hit_mask,
+            _int_mask(numbers),
+            *attack.color,
+            len(attack.trail_points),
+            *numbers,
+        )
+        for point in attack.trail_points:
+            out += _TRAIL_POINT.pack(*point)
+
+    out += _COUNT8.pack(len(combat.active_blocks))
+    for block in combat.active_blocks.values():
+        numbers = (
+            block.direction,
+            block.dir_x,
+            block.dir_y,
+            block.duration,
+            block.current_frame,
+        )
+        out += _BLOCK.pack(
+            _ref(fighters, block.defender),
+            _int_mask(numbers),
+            *block.color,
+            *numbers,
+        )
+
+    out += _COUNT8.pack(len(combat.active_clashes))
+    for clash in combat.active_clashes:
+        numbers = (
+            *clash.clash_point,
+            clash.duration,
+            clash.current_frame,
+            clash.intensity,
+        )
+        out += _CLASH.pack(
+            _ref(fighters, clash.attacker),
+            _ref(fighters, clash.defender),
+            _int_mask(numbers),
+            *numbers,
+        )
+    return out
+
+
+def _restore_lightsaber(combat, data, fighters):
+    offset = 0
+    (count,) = _COUNT16.unpack_from(data, offset)
+    offset += _COUNT16.size
+    attacks = []
+    for _ in range(count):
+        record = _ATTACK.unpack_from(data, offset)
+        offset += _ATTACK.size
+        attacker, attack_type, hit_mask, mask = record[:4]
+        trail_count = record[7]
+        direction, damage, attack_range, duration, current_frame, dir_x, dir_y = _typed(
+            record[8:], mask
+        )
+        attack = LightsaberAttack.__new__(LightsaberAttack)
+        attack.attacker = _fighter(fighters, attacker)
+        attack.direction = direction
+        attack.attack_type = ATTACK_TYPES[attack_type]
+        attack.damage = damage
+        attack.range = attack_range
+        attack.duration = duration
+        attack.current_frame = current_frame
+        attack.hit_entities = {
+            fighter
+            for index, fighter in enumerate(fighters)
+            if hit_mask >> index & 1 and fighter is not None
+        }
+        attack.dir_x = dir_x
+        attack.dir_y = dir_y
+        attack.color = record[4:7]
+        attack.trail_points = []
+        for _ in range(trail_count):
+            attack.trail_points.append(_TRAIL_POINT.unpack_from(data, offset))
+            offset += _TRAIL_POINT.size
+        attacks.append(attack)
+    combat.active_attacks = attacks
+
+    (count,) = _COUNT8.unpack_from(data, offset)
+    offset += _COUNT8.size
+    blocks = {}
+    for _ in range(count):
+        record = _BLOCK.unpack_from(data, offset)
+        offset += _BLOCK.size
+        direction, dir_x, dir_y, duration, current_frame = _typed(record[5:], record[1])
+        block = LightsaberBlock.__new__(LightsaberBlock)
+        block.defender = _fighter(fighters, record[0])
+        block.direction = direction
+        block.dir_x = dir_x
+        block.dir_y = dir_y
+        block.duration = duration
+        block.current_frame = current_frame
+        block.color = record[2:5]
+        blocks[block.defender] = block
+    combat.active_blocks = blocks
+
+    (count,) = _COUNT8.unpack_from(data, offset)
+    offset += _COUNT8.size
+    clashes = []
+    for _ in range(count):
+        record = _CLASH.unpack_from(data, offset)
+        offset += _CLASH.size
+        clash_x, clash_y, duration, current_frame, intensity = _typed(
+            record[3:], record[2]
+        )
+        clash = LightsaberClash(
+            _fighter(fighters, record[0]),
+            _fighter(fighters, record[1]),
+            (clash_x, clash_y),
+        )
+        clash.duration = duration
+        clash.current_frame = current_frame
+        clash.intensity = intensity
+        clashes.append(clash)
+    combat.active_clashes = clashes
+
+
+def _random_section(streams):
+    out = bytearray(_COUNT8.pack(len(streams)))
+    for name in streams:
+        version, internal, gauss = getattr(rng_streams, name).getstate()
+        out += _STREAM.pack(
+            STREAM_NAMES.index(name),
+            version,
+            gauss is not None,
+            0.0 if gauss is None else gauss,
+        )
+        out += _STREAM_STATE.pack(*internal)
+    return out
+
+
+def _restore_random(data):
+    offset = 0
+    (count,) = _COUNT8.unpack_from(data, offset)
+    offset += _COUNT8.size
+    for _ in range(count):
+        stream, version, has_gauss, gauss = _STREAM.unpack_from(data, offset)
+        offset += _STREAM.size
+        internal = _STREAM_STATE.unpack_from(data, offset)
+        offset += _STREAM_STATE.size
+        getattr(rng_streams, STREAM_NAMES[stream]).setstate(
+            (version, internal, gauss if has_gauss else None)
+        )
+
+
+def _section(section_id, body):
+    return _SECTION.pack(section_id, len(body)) + body
+
+
+def encode_world(engine, include_random=True):
+    """
+    Serialise the world state of an engine between two ticks.
+
+    Args:
+        engine (GameEngine): Engine with a match in progress
+        include_random (bool): Also store the random streams (about
+            7.5 KB), so the match continues exactly as it would have
+
+    Returns:
+        bytes: The snapshot
+    """
+    fighters = fighter_table(engine)
+    flags = FLAG_RANDOM_STATE if include_random else 0
+    parts = [
+        _HEADER.pack(
+            SNAPSHOT_MAGIC,
+            SNAPSHOT_VERSION,
+            flags,
+            engine.match_seed,
+            engine.tick_count,
+        ),
+        _section(
+            SECTION_SETUP,
+            json.dumps(engine._match_metadata(), sort_keys=True).encode("utf-8"),
+        ),
+    ]
+
+    mouse_x, mouse_y = engine.mouse_pos
+    body = bytearray(
+        _ENGINE.pack(
+            engine.tick_count,
+            mouse_x,
+            mouse_y,
+            engine.bullet_timer,
+            engine.bullet_interval,
+            engine.player1_exploded
+            | engine.player2_exploded << 1
+            | engine.enemy_exploded << 2,
+        )
+    )
+    _write_value(body, engine.fresh_deaths, fighters)
+    _write_value(body, engine.last_health, fighters)
+    _write_value(body, engine.damage_log, fighters)
+    parts.append(_section(SECTION_ENGINE, body))
+
+    body = bytearray(_COUNT8.pack(len(fighters)))
+    for fighter in fighters:
+        body += _pack_fighter(fighter)
+    parts.append(_section(SECTION_FIGHTERS, body))
+
+    body = bytearray(_COUNT16.pack(len(engine.bullets)))
+    for bullet in engine.bullets:
+        body += _pack_bullet(bullet)
+    parts.append(_section(SECTION_BULLETS, body))
+
+    force_manager = getattr(engine, "force_manager", None)
+    if force_manager is not None:
+        parts.append(_section(SECTION_FORCE, _force_section(force_manager, fighters)))
+    combat = getattr(engine, "lightsaber_combat", None)
+    if combat is not None:
+        parts.append(
+            _section(SECTION_LIGHTSABER, _lightsaber_section(combat, fighters))
+        )
+    manager = getattr(engine, "game_mode_manager", None)
+    if manager is not None:
+        body = bytearray()
+        _write_value(body, manager.current_mode, fighters)
+        _write_value(body, manager.mode_timer, fighters)
+        _write_value(body, manager.mode_data, fighters)
+        parts.append(_section(SECTION_MODE, body))
+    if include_random:
+        parts.append(_section(SECTION_RANDOM, _random_section(RANDOM_STREAMS)))
+    return b"".join(parts)
+
+
+def decode_world(data, engine, start_match=False):
+    """
+    Put the world state of a snapshot into an engine.
+
+    Fighters the engine already has are updated in place, so references
+    held elsewhere stay valid.
+
+    Args:
+        data (bytes): Snapshot written by encode_world (any buffer)
+        engine (GameEngine): Engine to restore into
+        start_match (bool): First set the engine up for the snapshot's
+            match (setup, seed, platforms), e.g. to load a crash dump into
+            a new engine; otherwise the engine must be playing that match
+
+    Returns:
+        WorldView: The parsed snapshot
+    """
+    view = WorldView(data)
+    if start_match:
+        engine._apply_match_metadata(view.metadata)
+        engine._initialize_game(view.match_seed)
+
+    # Fighters first, since everything else refers to them
+    current = fighter_table(engine)
+    fighters = []
+    for index, record in enumerate(view.fighters()):
+        fighter = current[index] if index < len(current) else None
+        if record[0] == FIGHTER_NONE:
+            fighter = None
+        else:
+            wanted = Enemy if record[0] == FIGHTER_ENEMY else Player
+            if type(fighter) is not wanted:
+                fighter = _new_fighter(record)
+            _restore_fighter(fighter, record)
+        fighters.append(fighter)
+    engine.player1, engine.player2, engine.enemy = fighters[:3]
+
+    section = view.section(SECTION_ENGINE)
+    (
+        engine.tick_count,
+        mouse_x,
+        mouse_y,
+        engine.bullet_timer,
+        engine.bullet_interval,
+        exploded,
+    ) = _ENGINE.unpack_from(section)
+    engine.mouse_pos = (mouse_x, mouse_y)
+    engine.player1_exploded = bool(exploded & 1)
+    engine.player2_exploded = bool(exploded & 2)
+    engine.enemy_exploded = bool(exploded & 4)
+    offset = _ENGINE.size
+    engine.fresh_deaths, offset = _read_value(section, offset, fighters)
+    engine.last_health, offset = _read_value(section, offset, fighters)
+    damage_log, offset = _read_value(section, offset, fighters)
+    engine.damage_log = None if damage_log is None else Counter(damage_log)
+
+    engine.bullets = [_new_bullet(record) for record in view.bullets()]
+
+    section = view.section(SECTION_FORCE)
+    if section is not None and getattr(engine, "force_manager", None) is not None:
+        _restore_force(engine.force_manager, section, fighters)
+    section = view.section(SECTION_LIGHTSABER)
+    if section is not None and getattr(engine, "lightsaber_combat", None) is not None:
+        _restore_lightsaber(engine.lightsaber_combat, section, fighters)
+    section = view.section(SECTION_MODE)
+    manager = getattr(engine, "game_mode_manager", None)
+    if section is not None and manager is not None:
+        manager.current_mode, offset = _read_value(section, 0, fighters)
+        manager.mode_timer, offset = _read_value(section, offset, fighters)
+        manager.mode_data, offset = _read_value(section, offset, fighters)
+    section = view.section(SECTION_RANDOM)
+    if section is not None:
+        _restore_random(section)
+    return view
+
+
+class WorldView:
+    """
+    Zero-copy reader of a world snapshot.
+
+    Sections are memoryview slices of the snapshot buffer; fighter and
+    bullet records are unpacked straight from them, one tuple at a time
+    (field names in FIGHTER_FIELDS and BULLET_FIELDS).
+    """
+
+    def __init__(self, data):
+        """
+        Args:
+            data: Snapshot bytes, bytearray, mmap or other buffer
+
+        Raises:
+            ValueError: If the buffer is not a supported world snapshot
+        """
+        buffer = memoryview(data)
+        if len(buffer) < _HEADER.size:
+            raise ValueError("Not a world snapshot")
+        magic, version, flags, match_seed, tick = _HEADER.unpack_from(buffer)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError("Not a world snapshot")
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported world snapshot version: {version}")
+        self.buffer = buffer
+        self.version = version
+        self.flags = flags
+        self.match_seed = match_seed
+        self.tick = tick
+        self.sections = {}  # Section id -> memoryview of its body
+
+        offset = _HEADER.size
+        while offset < len(buffer):
+            section_id, length = _SECTION.unpack_from(buffer, offset)
+            offset += _SECTION.size
+            self.sections[section_id] = buffer[offset : offset + length]
+            offset += length
+
+    def section(self, section_id):
+        """Return the body of a section, or None if the snapshot lacks it."""
+        return self.sections.get(section_id)
+
+    @property
+    def metadata(self):
+        """Match setup (seed, mode, characters) the snapshot was taken in."""
+        return json.loads(bytes(self.sections[SECTION_SETUP]))
+
+    def fighters(self):
+        """Iterate over the fighter records (FIGHTER_FIELDS tuples)."""
+        return _FIGHTER.iter_unpack(self.sections[SECTION_FIGHTERS][_COUNT8.size :])
+
+    def bullets(self):
+        """Iterate over the bullet records (BULLET_FIELDS tuples)."""
+        return _BULLET.iter_unpack(self.sections[SECTION_BULLETS][_COUNT16.size :])
+
+    def fighter_positions(self):
+        """Return (x, y) of every fighter present, in fighter table order."""
+        return [
+            (record[12], record[13])
+            for record in self.fighters()
+            if record[0] != FIGHTER_NONE
+        ]